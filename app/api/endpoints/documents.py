@@ -16,6 +16,7 @@ from app.models.approval import DocumentChangeRequest
 from app.core.database import get_db
 from app.core.config import settings
 from app.dependencies import get_principal
+from app.services import document_search
 from app.services.storage import StorageService
 from app.services.vector_store import VectorStoreService
 from cerbos.sdk.model import Principal
@@ -62,11 +63,8 @@ async def list_documents(
         query = query.filter(Document.document_type == document_type)
     if status:
         query = query.filter(Document.status == status)
-    if search:
-        query = query.filter(
-            (Document.title.contains(search)) |
-            (Document.content.contains(search))
-        )
+    if search and search.strip():
+        query = query.filter(document_search.build_search_filter(search))
 
     # 총 개수
     count_query = select(func.count()).select_from(query.subquery())
@@ -751,22 +749,15 @@ async def search_documents(
     """
     문서 검색 (텍스트 기반)
 
-    - PostgreSQL에서 제목/내용 검색
+    - PostgreSQL 전문 검색 (search_vector GIN 인덱스) + 제목/파일명 부분 일치 (pg_trgm)
+    - 관련도 순 정렬, 검색어를 <mark>로 강조한 본문 스니펫 포함
     - 향후 Qdrant 벡터 검색 추가 예정
     """
-    # 텍스트 검색
-    search_query = select(Document).filter(
-        (Document.title.contains(query)) |
-        (Document.content.contains(query)) |
-        (Document.file_name.contains(query))
-    ).limit(limit)
-
-    result = await db.execute(search_query)
-    documents = result.scalars().all()
+    results = await document_search.search_documents(db, query, limit=limit)
 
     return {
         "query": query,
-        "total": len(documents),
+        "total": len(results),
         "items": [
             {
                 "id": doc.id,
@@ -775,8 +766,10 @@ async def search_documents(
                 "file_name": doc.file_name,
                 "document_type": doc.document_type,
                 "status": doc.status,
-                "created_at": doc.created_at.isoformat() if doc.created_at else None
+                "created_at": doc.created_at.isoformat() if doc.created_at else None,
+                "rank": rank,
+                "snippet": snippet
             }
-            for doc in documents
+            for doc, rank, snippet in results
         ]
     }
@@ -1,12 +1,171 @@
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
+"""
+데이터베이스 엔진 / 세션
+
+- 환경별 커넥션 풀 크기 (ENVIRONMENT, DB_POOL_SIZE / DB_MAX_OVERFLOW로 재정의)
+- asyncpg server_settings로 statement_timeout / lock_timeout 설정
+- prepared statement 캐시 크기 설정
+- OLTP 엔진(engine)과 장시간 통계/내보내기 엔진(analytics_engine) 분리
+- 풀 사용량 / 대기 시간 메트릭 (pool_stats)
+"""
+import time
+from typing import Any, Dict, Optional, Tuple
+
+from sqlalchemy import exc
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine, AsyncSession
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 from app.core.config import settings
 
-# 비동기 엔진 생성
-engine = create_async_engine(
+# 환경별 기본 (pool_size, max_overflow)
+POOL_PRESETS: Dict[str, Tuple[int, int]] = {
+    "development": (5, 5),
+    "test": (2, 2),
+    "production": (20, 10),
+}
+
+
+class PoolStats:
+    """커넥션 풀 대기 시간 카운터"""
+
+    def __init__(self):
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+
+    def record(self, waited: float) -> None:
+        self.checkouts += 1
+        self.wait_seconds += waited
+        if waited > self.max_wait_seconds:
+            self.max_wait_seconds = waited
+
+
+# 엔진 이름 -> 풀 대기 시간 카운터 (풀 재생성 시에도 유지되도록 logging_name 기준)
+_pool_stats: Dict[str, PoolStats] = {}
+
+
+class TimedQueuePool(AsyncAdaptedQueuePool):
+    """커넥션을 얻기까지 기다린 시간을 기록하는 풀"""
+
+    def _do_get(self):
+        started = time.perf_counter()
+        stats = _pool_stats.setdefault(self._orig_logging_name or "default", PoolStats())
+        try:
+            connection = super()._do_get()
+        except exc.TimeoutError:
+            stats.timeouts += 1
+            raise
+        stats.record(time.perf_counter() - started)
+        return connection
+
+
+def create_engine(
+    url: str,
+    name: str,
+    pool_size: int,
+    max_overflow: int,
+    pool_timeout: float = 10.0,
+    pool_recycle: int = 1800,
+    statement_timeout_ms: int = 30000,
+    lock_timeout_ms: int = 5000,
+    prepared_statement_cache_size: int = 500,
+    echo: bool = False,
+) -> AsyncEngine:
+    """
+    비동기 엔진 생성
+
+    Args:
+        url: 데이터베이스 URL
+        name: 엔진 이름 (풀 메트릭 / application_name)
+        pool_size: 유지할 커넥션 수
+        max_overflow: pool_size 초과 시 추가로 열 수 있는 커넥션 수
+        pool_timeout: 커넥션 대기 최대 시간 (초)
+        pool_recycle: 커넥션 재생성 주기 (초)
+        statement_timeout_ms: 쿼리 실행 제한 시간 (0이면 제한 없음)
+        lock_timeout_ms: 락 대기 제한 시간 (0이면 제한 없음)
+        prepared_statement_cache_size: 커넥션당 prepared statement 캐시 크기
+        echo: SQL 로그 출력 여부
+
+    Returns:
+        AsyncEngine
+    """
+    _pool_stats[name] = PoolStats()
+    connect_args: Dict[str, Any] = {}
+    if url.startswith("postgresql+asyncpg"):
+        connect_args = {
+            "server_settings": {
+                "application_name": f"admin-api-{name}",
+                "statement_timeout": str(statement_timeout_ms),
+                "lock_timeout": str(lock_timeout_ms),
+            },
+            "prepared_statement_cache_size": prepared_statement_cache_size,
+        }
+    return create_async_engine(
+        url,
+        echo=echo,
+        poolclass=TimedQueuePool,
+        pool_size=pool_size,
+        max_overflow=max_overflow,
+        pool_timeout=pool_timeout,
+        pool_recycle=pool_recycle,
+        pool_pre_ping=True,
+        pool_logging_name=name,
+        connect_args=connect_args,
+    )
+
+
+def _pool_size(size: Optional[int], overflow: Optional[int]) -> Tuple[int, int]:
+    preset_size, preset_overflow = POOL_PRESETS.get(settings.ENVIRONMENT, POOL_PRESETS["production"])
+    return (
+        preset_size if size is None else size,
+        preset_overflow if overflow is None else overflow,
+    )
+
+
+def pool_stats(target: AsyncEngine, name: str) -> Dict[str, Any]:
+    """엔진 풀 사용량 (checked out / overflow / 대기 시간)"""
+    pool = target.pool
+    stats = _pool_stats.get(name, PoolStats())
+    return {
+        "size": pool.size(),
+        "checked_in": pool.checkedin(),
+        "checked_out": pool.checkedout(),
+        "overflow": max(pool.overflow(), 0),
+        "max_overflow": pool._max_overflow,
+        "checkouts": stats.checkouts,
+        "timeouts": stats.timeouts,
+        "avg_wait_ms": round(stats.wait_seconds / stats.checkouts * 1000, 3) if stats.checkouts else 0.0,
+        "max_wait_ms": round(stats.max_wait_seconds * 1000, 3),
+    }
+
+
+# OLTP 엔진 (일반 API)
+_oltp_size, _oltp_overflow = _pool_size(settings.DB_POOL_SIZE, settings.DB_MAX_OVERFLOW)
+engine = create_engine(
     settings.DATABASE_URL,
-    echo=True,
-    future=True
+    name="oltp",
+    pool_size=_oltp_size,
+    max_overflow=_oltp_overflow,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    statement_timeout_ms=settings.DB_STATEMENT_TIMEOUT_MS,
+    lock_timeout_ms=settings.DB_LOCK_TIMEOUT_MS,
+    prepared_statement_cache_size=settings.DB_PREPARED_STATEMENT_CACHE_SIZE,
+    echo=settings.DB_ECHO,
+)
+
+# 통계 / 내보내기 엔진 (긴 쿼리가 OLTP 풀을 점유하지 않도록 분리)
+analytics_engine = create_engine(
+    settings.ANALYTICS_DB_URL or settings.DATABASE_URL,
+    name="analytics",
+    pool_size=settings.ANALYTICS_DB_POOL_SIZE,
+    max_overflow=settings.ANALYTICS_DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    statement_timeout_ms=settings.ANALYTICS_DB_STATEMENT_TIMEOUT_MS,
+    lock_timeout_ms=settings.DB_LOCK_TIMEOUT_MS,
+    prepared_statement_cache_size=settings.DB_PREPARED_STATEMENT_CACHE_SIZE,
+    echo=settings.DB_ECHO,
 )
 
 # 비동기 세션 팩토리
@@ -16,6 +175,12 @@ AsyncSessionLocal = sessionmaker(
     expire_on_commit=False
 )
 
+AnalyticsSessionLocal = sessionmaker(
+    analytics_engine,
+    class_=AsyncSession,
+    expire_on_commit=False
+)
+
 
 async def get_db() -> AsyncSession:
     """데이터베이스 세션 의존성"""
@@ -28,3 +193,26 @@ async def get_db() -> AsyncSession:
             raise
         finally:
             await session.close()
+
+
+async def get_analytics_db() -> AsyncSession:
+    """통계 / 내보내기용 세션 의존성 (읽기 전용 쿼리)"""
+    async with AnalyticsSessionLocal() as session:
+        try:
+            yield session
+        finally:
+            await session.close()
+
+
+def all_pool_stats() -> Dict[str, Dict[str, Any]]:
+    """전체 엔진 풀 사용량"""
+    return {
+        "oltp": pool_stats(engine, "oltp"),
+        "analytics": pool_stats(analytics_engine, "analytics"),
+    }
+
+
+async def dispose_engines() -> None:
+    """앱 종료 시 커넥션 풀 정리"""
+    await engine.dispose()
+    await analytics_engine.dispose()
@@ -0,0 +1,255 @@
+"""
+EDB (wisenut) 커넥션 풀
+
+벡터 문서/카테고리/업로드 라우터와 통계 대시보드가 공유하는 EDB 접근 계층입니다.
+- 요청마다 asyncpg.connect 하지 않고 앱 전체에서 asyncpg.Pool 하나를 재사용
+  (처음 사용할 때 생성, 앱 lifespan 종료 시 close)
+- 자주 쓰는 쿼리는 고정 SQL 상수로 정의 → asyncpg의 커넥션별 prepared statement
+  캐시(statement_cache_size)에 적중하여 커넥션 재사용 시 다시 prepare하지 않음
+- 커넥션 획득 대기 시간 메트릭
+- 요청 의존성(get_edb)은 첫 쿼리 시점에 커넥션을 획득 (입력 검증 실패 요청은 EDB를 쓰지 않음)
+"""
+import asyncio
+import logging
+import time
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, Optional
+
+import asyncpg
+from fastapi import HTTPException
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# 활성 문서 수
+DOC_COUNT_SQL = "SELECT COUNT(*) FROM wisenut.doc_bas_lst WHERE use_yn = 'Y'"
+
+# 카테고리별 활성 문서 수 (com_cd_lv2 카테고리명 포함)
+DOC_COUNT_BY_CATEGORY_SQL = """
+    SELECT
+        d.doc_cat_cd as category_code,
+        COALESCE(c.level_n2_nm, d.doc_cat_cd, '기타') as category_name,
+        COUNT(*) as count
+    FROM wisenut.doc_bas_lst d
+    LEFT JOIN wisenut.com_cd_lv2 c
+        ON c.level_n1_cd = 'DOC_CAT_CD'
+        AND c.level_n2_cd = d.doc_cat_cd
+    WHERE d.use_yn = 'Y'
+    GROUP BY d.doc_cat_cd, c.level_n2_nm
+    ORDER BY count DESC
+"""
+
+# 문서 상세 (com_cd_lv2 카테고리명 포함)
+DOC_DETAIL_SQL = """
+    SELECT
+        d.doc_id,
+        COALESCE(d.doc_rep_title_nm, d.doc_title_nm, '제목 없음') as title,
+        d.doc_cat_cd as doctype,
+        COALESCE(c.level_n2_nm, d.doc_cat_cd, '기타') as doctype_name,
+        d.doc_det_level_n1_cd,
+        d.doc_det_level_n2_cd,
+        d.doc_det_level_n3_cd,
+        COALESCE(LENGTH(d.doc_txt), 0) as token_count,
+        d.use_yn,
+        d.reg_dt as created_at,
+        d.doc_txt
+    FROM wisenut.doc_bas_lst d
+    LEFT JOIN wisenut.com_cd_lv2 c
+        ON c.level_n1_cd = 'DOC_CAT_CD'
+        AND c.level_n2_cd = d.doc_cat_cd
+    WHERE d.doc_id = $1
+"""
+
+
+class EDBPoolStats:
+    """커넥션 획득 대기 시간 카운터"""
+
+    def __init__(self):
+        self.acquisitions = 0
+        self.failures = 0
+        self.wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+
+    def record(self, waited: float) -> None:
+        self.acquisitions += 1
+        self.wait_seconds += waited
+        if waited > self.max_wait_seconds:
+            self.max_wait_seconds = waited
+
+
+class EDBPool:
+    """EDB asyncpg 커넥션 풀"""
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        database: str,
+        user: str,
+        password: str,
+        min_size: int = 2,
+        max_size: int = 10,
+        acquire_timeout: float = 5.0,
+        command_timeout: float = 60.0,
+        max_inactive_lifetime: float = 300.0,
+        statement_cache_size: int = 200,
+    ):
+        """
+        Args:
+            host, port, database, user, password: EDB 접속 정보
+            min_size: 유지할 최소 커넥션 수
+            max_size: 최대 커넥션 수
+            acquire_timeout: 커넥션 획득 대기 최대 시간 (초)
+            command_timeout: 쿼리 실행 제한 시간 (초)
+            max_inactive_lifetime: 유휴 커넥션 정리 시간 (초)
+            statement_cache_size: 커넥션당 prepared statement 캐시 크기
+        """
+        self.connect_kwargs = dict(host=host, port=port, database=database, user=user, password=password)
+        self.min_size = min_size
+        self.max_size = max_size
+        self.acquire_timeout = acquire_timeout
+        self.command_timeout = command_timeout
+        self.max_inactive_lifetime = max_inactive_lifetime
+        self.statement_cache_size = statement_cache_size
+        self.stats = EDBPoolStats()
+        self._pool: Optional[asyncpg.Pool] = None
+        self._lock = asyncio.Lock()
+
+    async def get_pool(self) -> asyncpg.Pool:
+        """커넥션 풀 (처음 호출 시 생성)"""
+        if self._pool is None:
+            async with self._lock:
+                if self._pool is None:
+                    self._pool = await asyncpg.create_pool(
+                        **self.connect_kwargs,
+                        min_size=self.min_size,
+                        max_size=self.max_size,
+                        command_timeout=self.command_timeout,
+                        max_inactive_connection_lifetime=self.max_inactive_lifetime,
+                        statement_cache_size=self.statement_cache_size,
+                    )
+                    logger.info(
+                        f"EDB pool created ({self.connect_kwargs['host']}:{self.connect_kwargs['port']}, "
+                        f"min={self.min_size}, max={self.max_size})"
+                    )
+        return self._pool
+
+    async def acquire_connection(self) -> asyncpg.Connection:
+        """커넥션 획득 (획득 대기 시간 기록) - release()로 반환"""
+        started = time.perf_counter()
+        try:
+            pool = await self.get_pool()
+            conn = await pool.acquire(timeout=self.acquire_timeout)
+        except Exception:
+            self.stats.failures += 1
+            raise
+        self.stats.record(time.perf_counter() - started)
+        return conn
+
+    async def release(self, conn: asyncpg.Connection) -> None:
+        """커넥션 반환"""
+        if self._pool is not None:
+            await self._pool.release(conn)
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[asyncpg.Connection]:
+        """커넥션 획득 컨텍스트"""
+        conn = await self.acquire_connection()
+        try:
+            yield conn
+        finally:
+            await self.release(conn)
+
+    async def health_check(self) -> Dict[str, Any]:
+        """SELECT 1 왕복 시간"""
+        started = time.perf_counter()
+        async with self.acquire() as conn:
+            await conn.fetchval("SELECT 1")
+        return {"status": "healthy", "latency_ms": round((time.perf_counter() - started) * 1000, 3)}
+
+    async def close(self) -> None:
+        """커넥션 풀 종료"""
+        if self._pool is not None:
+            await self._pool.close()
+            self._pool = None
+
+    def metrics(self) -> Dict[str, Any]:
+        stats = self.stats
+        data: Dict[str, Any] = {
+            "min_size": self.min_size,
+            "max_size": self.max_size,
+            "acquisitions": stats.acquisitions,
+            "failures": stats.failures,
+            "avg_wait_ms": round(stats.wait_seconds / stats.acquisitions * 1000, 3) if stats.acquisitions else 0.0,
+            "max_wait_ms": round(stats.max_wait_seconds * 1000, 3),
+        }
+        if self._pool is not None:
+            data["size"] = self._pool.get_size()
+            data["idle"] = self._pool.get_idle_size()
+        return data
+
+
+# 싱글톤 인스턴스
+edb_pool = EDBPool(
+    host=settings.EDB_HOST,
+    port=settings.EDB_PORT,
+    database=settings.EDB_DATABASE,
+    user=settings.EDB_USER,
+    password=settings.EDB_PASSWORD,
+    min_size=settings.EDB_POOL_MIN_SIZE,
+    max_size=settings.EDB_POOL_MAX_SIZE,
+    acquire_timeout=settings.EDB_POOL_ACQUIRE_TIMEOUT,
+)
+
+
+class EDBConnection:
+    """
+    요청용 EDB 커넥션 핸들 (첫 쿼리 시 풀에서 획득)
+
+    FastAPI는 본문 검증 전에 의존성을 실행하므로 의존성에서 바로 커넥션을 잡으면
+    EDB 장애 시 잘못된 요청도 422 대신 연결 오류를 받습니다.
+    """
+
+    def __init__(self, pool: EDBPool):
+        self._pool = pool
+        self._conn: Optional[asyncpg.Connection] = None
+
+    async def _connection(self) -> asyncpg.Connection:
+        if self._conn is None:
+            try:
+                self._conn = await self._pool.acquire_connection()
+            except Exception as e:
+                logger.error(f"Failed to connect to EDB: {e}")
+                raise HTTPException(
+                    status_code=503,
+                    detail=f"데이터베이스 연결 실패: {str(e)}"
+                )
+        return self._conn
+
+    async def fetch(self, query: str, *args, **kwargs):
+        return await (await self._connection()).fetch(query, *args, **kwargs)
+
+    async def fetchrow(self, query: str, *args, **kwargs):
+        return await (await self._connection()).fetchrow(query, *args, **kwargs)
+
+    async def fetchval(self, query: str, *args, **kwargs):
+        return await (await self._connection()).fetchval(query, *args, **kwargs)
+
+    async def execute(self, query: str, *args, **kwargs):
+        return await (await self._connection()).execute(query, *args, **kwargs)
+
+    async def release(self) -> None:
+        """획득한 커넥션 반환 (획득 전이면 아무것도 하지 않음)"""
+        if self._conn is not None:
+            conn, self._conn = self._conn, None
+            await self._pool.release(conn)
+
+
+async def get_edb() -> AsyncIterator[EDBConnection]:
+    """EDB 커넥션 의존성 (첫 쿼리 시 획득, 요청 종료 시 풀에 반환, 획득 실패 시 503)"""
+    conn = EDBConnection(edb_pool)
+    try:
+        yield conn
+    finally:
+        await conn.release()
@@ -0,0 +1,239 @@
+"""
+Upstream HTTP Client Registry
+업스트림(ds-api, vLLM, 임베딩, Qdrant, Cerbos, STT)별 공유 httpx.AsyncClient 관리
+
+- 요청마다 AsyncClient를 새로 만들지 않고 업스트림별 커넥션 풀을 재사용 (keep-alive)
+- 업스트림별 연결 수 제한 / keep-alive 풀 크기 / HTTP/2 옵션
+- 풀 포화도 메트릭 (in-flight, peak, 포화 상태에서 대기한 요청 수)
+- 앱 lifespan 종료 시 일괄 close
+"""
+import logging
+import time
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+import httpx
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class UpstreamConfig:
+    """업스트림별 커넥션 풀 설정"""
+    max_connections: int
+    max_keepalive_connections: int
+    keepalive_expiry: float = 30.0
+    timeout: float = 30.0
+    connect_timeout: float = 5.0
+    http2: bool = False
+
+
+def _default_upstreams() -> Dict[str, UpstreamConfig]:
+    """설정값 기반 기본 업스트림 목록"""
+    return {
+        # 채팅 스트리밍 - 피크 시 수백 개 동시 스트림
+        "ds_api": UpstreamConfig(
+            max_connections=settings.DS_API_MAX_CONNECTIONS,
+            max_keepalive_connections=settings.DS_API_MAX_KEEPALIVE,
+            timeout=settings.CHAT_TIMEOUT,
+            http2=settings.UPSTREAM_HTTP2,
+        ),
+        "vllm": UpstreamConfig(
+            max_connections=settings.VLLM_MAX_CONNECTIONS,
+            max_keepalive_connections=settings.VLLM_MAX_KEEPALIVE,
+            timeout=300.0,
+            http2=settings.UPSTREAM_HTTP2,
+        ),
+        "embedding": UpstreamConfig(
+            max_connections=settings.EMBEDDING_MAX_CONNECTIONS,
+            max_keepalive_connections=settings.EMBEDDING_MAX_KEEPALIVE,
+            timeout=60.0,
+            http2=settings.UPSTREAM_HTTP2,
+        ),
+        "qdrant": UpstreamConfig(
+            max_connections=settings.QDRANT_MAX_CONNECTIONS,
+            max_keepalive_connections=settings.QDRANT_MAX_KEEPALIVE,
+            timeout=30.0,
+        ),
+        "cerbos": UpstreamConfig(
+            max_connections=50,
+            max_keepalive_connections=20,
+            timeout=5.0,
+        ),
+        "stt": UpstreamConfig(
+            max_connections=20,
+            max_keepalive_connections=10,
+            timeout=120.0,
+        ),
+        "spring": UpstreamConfig(
+            max_connections=50,
+            max_keepalive_connections=20,
+            timeout=5.0,
+        ),
+    }
+
+
+class UpstreamStats:
+    """업스트림별 풀 사용량 카운터"""
+
+    def __init__(self, max_connections: int):
+        self.max_connections = max_connections
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.total_requests = 0
+        self.saturated_requests = 0  # 풀이 가득 찬 상태에서 들어온 요청 수
+        self.errors = 0
+        self.total_ttfb = 0.0  # 응답 헤더 수신까지 걸린 시간 합계 (초)
+
+    def snapshot(self) -> Dict[str, float]:
+        avg_ttfb = self.total_ttfb / self.total_requests if self.total_requests else 0.0
+        return {
+            "max_connections": self.max_connections,
+            "in_flight": self.in_flight,
+            "peak_in_flight": self.peak_in_flight,
+            "saturation": round(self.in_flight / self.max_connections, 4) if self.max_connections else 0.0,
+            "total_requests": self.total_requests,
+            "saturated_requests": self.saturated_requests,
+            "errors": self.errors,
+            "avg_ttfb_ms": round(avg_ttfb * 1000, 2),
+        }
+
+
+class _TrackedStream(httpx.AsyncByteStream):
+    """응답 본문 스트림이 닫힐 때 in-flight 카운트를 감소시키는 래퍼"""
+
+    def __init__(self, stream: httpx.AsyncByteStream, stats: UpstreamStats):
+        self._stream = stream
+        self._stats = stats
+        self._closed = False
+
+    async def __aiter__(self):
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self) -> None:
+        if not self._closed:
+            self._closed = True
+            self._stats.in_flight -= 1
+        await self._stream.aclose()
+
+
+class InstrumentedTransport(httpx.AsyncHTTPTransport):
+    """풀 포화도 측정용 AsyncHTTPTransport"""
+
+    def __init__(self, stats: UpstreamStats, **kwargs):
+        super().__init__(**kwargs)
+        self.stats = stats
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        stats = self.stats
+        stats.total_requests += 1
+        if stats.in_flight >= stats.max_connections:
+            stats.saturated_requests += 1
+        stats.in_flight += 1
+        stats.peak_in_flight = max(stats.peak_in_flight, stats.in_flight)
+
+        started = time.perf_counter()
+        try:
+            response = await super().handle_async_request(request)
+        except BaseException:
+            stats.in_flight -= 1
+            stats.errors += 1
+            raise
+
+        stats.total_ttfb += time.perf_counter() - started
+        response.stream = _TrackedStream(response.stream, stats)
+        return response
+
+
+def _http2_available() -> bool:
+    try:
+        import h2  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+class UpstreamClientRegistry:
+    """
+    업스트림 이름 → 공유 httpx.AsyncClient 레지스트리
+
+    클라이언트는 최초 요청 시 생성되며(lazy), 앱 종료 시 aclose()로 일괄 정리합니다.
+    URL은 호출 측에서 절대 경로로 전달하므로 클라이언트에 base_url을 두지 않습니다.
+    """
+
+    def __init__(self, upstreams: Optional[Dict[str, UpstreamConfig]] = None):
+        self._configs = upstreams
+        self._clients: Dict[str, httpx.AsyncClient] = {}
+        self._stats: Dict[str, UpstreamStats] = {}
+
+    @property
+    def configs(self) -> Dict[str, UpstreamConfig]:
+        if self._configs is None:
+            self._configs = _default_upstreams()
+        return self._configs
+
+    def _build_client(self, name: str) -> httpx.AsyncClient:
+        config = self.configs.get(name)
+        if config is None:
+            raise KeyError(f"Unknown upstream: {name}")
+
+        http2 = config.http2
+        if http2 and not _http2_available():
+            logger.warning(f"HTTP/2 requested for upstream '{name}' but 'h2' is not installed - using HTTP/1.1")
+            http2 = False
+
+        stats = UpstreamStats(config.max_connections)
+        limits = httpx.Limits(
+            max_connections=config.max_connections,
+            max_keepalive_connections=config.max_keepalive_connections,
+            keepalive_expiry=config.keepalive_expiry,
+        )
+        transport = InstrumentedTransport(stats, limits=limits, http2=http2)
+        client = httpx.AsyncClient(
+            transport=transport,
+            timeout=httpx.Timeout(config.timeout, connect=config.connect_timeout),
+        )
+        self._stats[name] = stats
+        logger.info(
+            f"Upstream client created: {name} "
+            f"(max_connections={config.max_connections}, keepalive={config.max_keepalive_connections}, http2={http2})"
+        )
+        return client
+
+    def get(self, name: str) -> httpx.AsyncClient:
+        """
+        업스트림 공유 클라이언트 조회 (없으면 생성)
+
+        Args:
+            name: 업스트림 이름 (ds_api, vllm, embedding, qdrant, cerbos, stt, spring)
+
+        Returns:
+            httpx.AsyncClient: 커넥션 풀을 공유하는 클라이언트
+        """
+        client = self._clients.get(name)
+        if client is None or client.is_closed:
+            client = self._build_client(name)
+            self._clients[name] = client
+        return client
+
+    def metrics(self) -> Dict[str, Dict[str, float]]:
+        """업스트림별 풀 메트릭 스냅샷"""
+        return {name: stats.snapshot() for name, stats in self._stats.items()}
+
+    async def aclose(self) -> None:
+        """모든 업스트림 클라이언트 종료 (앱 lifespan 종료 시 호출)"""
+        clients, self._clients = self._clients, {}
+        for name, client in clients.items():
+            try:
+                await client.aclose()
+            except Exception as e:
+                logger.warning(f"Failed to close upstream client '{name}': {e}")
+        if clients:
+            logger.info(f"Upstream clients closed: {', '.join(clients)}")
+
+
+# 싱글톤 인스턴스
+http_clients = UpstreamClientRegistry()
@@ -0,0 +1,97 @@
+"""
+Optional Redis Client
+캐시 공유 / 버전 카운터 / pub-sub 무효화용 지연 생성 Redis 클라이언트
+
+- URL이 없거나 redis 패키지가 없으면 None을 반환 (호출자는 프로세스 내 동작으로 대체)
+- 오류 후 retry_after 동안은 None을 반환해 장애 중 요청마다 연결을 시도하지 않음
+- 사용처: 사전 / IP 허용 목록 버전, 임베딩 캐시, Spring Session 조회
+"""
+import logging
+import time
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+# Redis 오류 후 재시도까지 대기 시간 (초)
+REDIS_RETRY_AFTER = 30.0
+
+
+class OptionalRedis:
+    """
+    선택 기능용 Redis 클라이언트 래퍼
+
+    client()가 None이면 Redis 없이 동작하고, 명령이 실패하면 failed()로 알려
+    retry_after 동안 Redis를 건너뜁니다.
+    """
+
+    def __init__(
+        self,
+        url: Optional[str],
+        name: str,
+        fallback: str,
+        decode_responses: bool = True,
+        retry_after: float = REDIS_RETRY_AFTER,
+    ):
+        """
+        Args:
+            url: Redis URL (None이면 비활성화)
+            name: 로그에 표시할 사용처 이름 (예: "Dictionary")
+            fallback: Redis 장애 시 대체 동작 설명 (로그용)
+            decode_responses: 응답을 str로 디코딩 (바이너리 값이면 False)
+            retry_after: 오류 후 재시도까지 대기 시간 (초)
+        """
+        self.url = url
+        self.name = name
+        self.fallback = fallback
+        self.decode_responses = decode_responses
+        self.retry_after = retry_after
+        self.errors = 0
+        self._client = None
+        self._retry_at = 0.0
+
+    @property
+    def enabled(self) -> bool:
+        """Redis URL이 설정되어 있고 redis 패키지를 사용할 수 있음"""
+        return bool(self.url)
+
+    async def client(self):
+        """Redis 클라이언트 (미설정 / 최근 오류 시 None)"""
+        if not self.url or time.monotonic() < self._retry_at:
+            return None
+        if self._client is None:
+            try:
+                import redis.asyncio as aioredis
+            except ImportError:
+                logger.error("redis not installed. Install with: pip install redis")
+                self.url = None
+                return None
+            self._client = aioredis.from_url(self.url, decode_responses=self.decode_responses)
+        return self._client
+
+    def failed(self, error: Exception) -> None:
+        """명령 실패 기록 - retry_after 동안 client()가 None 반환"""
+        self.errors += 1
+        self._retry_at = time.monotonic() + self.retry_after
+        logger.warning(f"{self.name} Redis unavailable, {self.fallback} for {self.retry_after:.0f}s: {error}")
+
+    async def get_int(self, key: str) -> Optional[int]:
+        """
+        정수 카운터 조회 (버전 키 등)
+
+        Returns:
+            키 값 (키가 없으면 0), Redis를 쓸 수 없으면 None
+        """
+        client = await self.client()
+        if client is None:
+            return None
+        try:
+            value = await client.get(key)
+        except Exception as e:
+            self.failed(e)
+            return None
+        return int(value) if value is not None else 0
+
+    async def close(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
@@ -0,0 +1,37 @@
+"""
+Worker Session Factory
+백그라운드 워커용 지연 AsyncSession 팩토리
+
+- app.core.database는 import 시 엔진을 생성하므로 처음 사용할 때 import
+- 테스트는 생성자에 가짜 팩토리를 넘겨 DB 없이 실행
+"""
+
+
+class LazySessionFactory:
+    """
+    session_factory 속성 descriptor
+
+    None이 설정되어 있으면 처음 조회할 때 app.core.database.AsyncSessionLocal을 사용합니다.
+
+    사용 예:
+        class Worker:
+            session_factory = LazySessionFactory()
+
+            def __init__(self, session_factory=None):
+                self.session_factory = session_factory
+    """
+
+    def __set_name__(self, owner, name: str):
+        self.attr = f"_{name}"
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        factory = obj.__dict__.get(self.attr)
+        if factory is None:
+            from app.core.database import AsyncSessionLocal
+            factory = obj.__dict__[self.attr] = AsyncSessionLocal
+        return factory
+
+    def __set__(self, obj, value) -> None:
+        obj.__dict__[self.attr] = value
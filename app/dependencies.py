@@ -1,23 +1,275 @@
 """
 FastAPI Dependencies - Cerbos 권한 관리 및 공통 의존성
 """
+import asyncio
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
 from fastapi import Depends, HTTPException, Request, Cookie
 from cerbos.sdk.client import AsyncCerbosClient
-from cerbos.sdk.model import Principal, Resource, ResourceAction, ResourceList
+from cerbos.sdk.model import (
+    CheckResourcesResponse,
+    CheckResourcesResult,
+    Effect,
+    Principal,
+    Resource,
+    ResourceAction,
+    ResourceList,
+)
 from app.core.config import settings
 from app.middleware.spring_session_auth import spring_auth
-from typing import Callable, Optional
+
+DecisionKey = Tuple[str, str, str, str]
+
+
+def _digest(value: Dict[str, Any]) -> str:
+    data = json.dumps(value, sort_keys=True, default=str, ensure_ascii=False)
+    return hashlib.blake2b(data.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def principal_key(principal: Principal) -> str:
+    """판정 캐시용 Principal 해시 (id, 역할, 속성) - 정책 조건이 principal.id를 참조하므로 id 포함"""
+    return _digest({
+        "id": principal.id,
+        "roles": sorted(principal.roles),
+        "attr": principal.attr,
+        "policy_version": principal.policy_version,
+        "scope": principal.scope,
+    })
+
+
+def resource_key(resource: Resource) -> str:
+    """판정 캐시용 Resource 해시 (id, 속성) - 정책 조건이 resource.id를 참조하므로 id 포함"""
+    return _digest({
+        "id": resource.id,
+        "attr": resource.attr,
+        "policy_version": resource.policy_version,
+        "scope": resource.scope,
+    })
+
+
+def policy_fingerprint(policy_dir: str) -> Optional[str]:
+    """정책 디렉터리 지문 (파일명 / 수정 시각 / 크기), 디렉터리가 없으면 None"""
+    directory = Path(policy_dir)
+    if not directory.is_dir():
+        return None
+    entries = [
+        (path.name, path.stat().st_mtime_ns, path.stat().st_size)
+        for path in sorted(directory.glob("*.yaml"))
+    ]
+    return _digest({"files": entries})
+
+
+class DecisionCache:
+    """
+    Cerbos 판정 캐시
+
+    (Principal 해시, 리소스 종류, 리소스 해시, 액션) → 허용 여부를 짧은 TTL 동안 보관합니다.
+    정책 버전(CERBOS_POLICY_VERSION 또는 정책 디렉터리 지문)이 바뀌면 전체를 비웁니다.
+    """
+
+    def __init__(
+        self,
+        ttl: float = 30.0,
+        max_size: int = 50000,
+        policy_version: Optional[str] = None,
+        policy_dir: Optional[str] = None,
+        check_interval: float = 10.0,
+    ):
+        """
+        Args:
+            ttl: 판정 유지 시간 (초, 0이면 캐시 비활성화)
+            max_size: 최대 판정 수 (초과 시 오래된 항목부터 제거)
+            policy_version: 고정 정책 버전 (배포 시 지정, 지정하면 디렉터리 지문 대신 사용)
+            policy_dir: 정책 디렉터리 (지문 변경 시 무효화)
+            check_interval: 정책 디렉터리 지문 확인 주기 (초)
+        """
+        self.ttl = ttl
+        self.max_size = max_size
+        self.policy_dir = policy_dir
+        self.check_interval = check_interval
+        self.policy_version = policy_version
+        self._fixed_version = policy_version is not None
+        self._checked_at = float("-inf")
+        self._entries: "OrderedDict[DecisionKey, Tuple[bool, float]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def get(self, key: DecisionKey) -> Optional[bool]:
+        if self.ttl <= 0:
+            return None
+        self._check_policy_version()
+        entry = self._entries.get(key)
+        if entry is None or entry[1] <= time.monotonic():
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return None
+        self.hits += 1
+        return entry[0]
+
+    def set(self, key: DecisionKey, allowed: bool) -> None:
+        if self.ttl <= 0:
+            return
+        self._entries[key] = (allowed, time.monotonic() + self.ttl)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def set_policy_version(self, version: Optional[str]) -> None:
+        """정책 버전 갱신 (바뀌면 전체 무효화)"""
+        if version != self.policy_version:
+            self.policy_version = version
+            self.clear()
+
+    def clear(self) -> None:
+        if self._entries:
+            self.invalidations += 1
+        self._entries.clear()
+
+    def _check_policy_version(self) -> None:
+        if self._fixed_version or not self.policy_dir:
+            return
+        now = time.monotonic()
+        if now - self._checked_at < self.check_interval:
+            return
+        self._checked_at = now
+        self.set_policy_version(policy_fingerprint(self.policy_dir))
+
+    def metrics(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "max_size": self.max_size,
+            "ttl": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+            "invalidations": self.invalidations,
+            "policy_version": self.policy_version,
+        }
+
+
+class CachedCerbosClient:
+    """
+    판정 캐시 + 일괄 요청 Cerbos 클라이언트
+
+    check_resources는 AsyncCerbosClient와 같은 형태로 동작하되
+    - 캐시에 있는 (리소스, 액션)은 PDP를 호출하지 않고
+    - 나머지는 batch_size 단위 CheckResources 요청으로 모아 동시에 보냅니다.
+    """
+
+    def __init__(self, client, cache: DecisionCache, batch_size: int = 50):
+        """
+        Args:
+            client: AsyncCerbosClient (또는 같은 check_resources를 가진 평가기)
+            cache: 판정 캐시
+            batch_size: CheckResources 1회당 최대 리소스 수 (PDP maxResourcesPerRequest 이하)
+        """
+        self.client = client
+        self.cache = cache
+        self.batch_size = batch_size
+
+    async def check_resources(
+        self,
+        principal: Principal,
+        resources: ResourceList,
+        request_id: Optional[str] = None,
+        aux_data: Optional[Any] = None,
+    ) -> CheckResourcesResponse:
+        """
+        CheckResources (캐시 적중은 PDP 호출 없음)
+
+        Args:
+            principal: 사용자
+            resources: (리소스, 액션 목록) 목록
+            request_id: 요청 ID (PDP 감사 로그용)
+            aux_data: 보조 데이터 (JWT 등, 지정 시 캐시를 거치지 않음)
+
+        Returns:
+            CheckResourcesResponse: 요청 순서와 같은 리소스별 결과
+        """
+        if aux_data is not None:
+            return await self.client.check_resources(
+                principal=principal, resources=resources, request_id=request_id, aux_data=aux_data
+            )
+
+        p_key = principal_key(principal)
+        decisions: List[Dict[str, Effect]] = []
+        pending: List[Tuple[int, ResourceAction]] = []
+        for index, item in enumerate(resources.resources):
+            r_key = resource_key(item.resource)
+            effects: Dict[str, Effect] = {}
+            missing = set()
+            for action in item.actions:
+                allowed = self.cache.get((p_key, item.resource.kind, r_key, action))
+                if allowed is None:
+                    missing.add(action)
+                else:
+                    effects[action] = Effect.ALLOW if allowed else Effect.DENY
+            decisions.append(effects)
+            if missing:
+                pending.append((index, ResourceAction(resource=item.resource, actions=sorted(missing))))
+
+        if pending:
+            chunks = [pending[i:i + self.batch_size] for i in range(0, len(pending), self.batch_size)]
+            responses = await asyncio.gather(*(
+                self.client.check_resources(
+                    principal=principal,
+                    resources=ResourceList(resources=[item for _, item in chunk]),
+                    request_id=request_id
+                )
+                for chunk in chunks
+            ))
+            for chunk, response in zip(chunks, responses):
+                response.raise_if_failed()
+                # 결과는 요청한 리소스 순서대로 반환됨
+                for (index, item), result in zip(chunk, response.results):
+                    r_key = resource_key(item.resource)
+                    for action in item.actions:
+                        allowed = result.is_allowed(action)
+                        decisions[index][action] = Effect.ALLOW if allowed else Effect.DENY
+                        self.cache.set((p_key, item.resource.kind, r_key, action), allowed)
+
+        return CheckResourcesResponse(
+            request_id=request_id or "cached",
+            results=[
+                CheckResourcesResult(resource=item.resource, actions=effects)
+                for item, effects in zip(resources.resources, decisions)
+            ]
+        )
+
+    def __getattr__(self, name):
+        # 그 외 API (is_allowed, plan_resources 등)는 원래 클라이언트로 위임
+        return getattr(self.client, name)
+
+
+# 판정 캐시 싱글톤
+decision_cache = DecisionCache(
+    ttl=settings.CERBOS_DECISION_CACHE_TTL,
+    max_size=settings.CERBOS_DECISION_CACHE_MAX_SIZE,
+    policy_version=settings.CERBOS_POLICY_VERSION,
+    policy_dir=settings.CERBOS_POLICY_DIR,
+    check_interval=settings.CERBOS_POLICY_CHECK_INTERVAL,
+)
 
 # Cerbos 클라이언트 싱글톤
-_cerbos_client: Optional[AsyncCerbosClient] = None
+_cerbos_client: Optional[CachedCerbosClient] = None
 
 
-async def get_cerbos_client() -> AsyncCerbosClient:
-    """Cerbos 클라이언트 의존성 (싱글톤 패턴)"""
+async def get_cerbos_client() -> CachedCerbosClient:
+    """Cerbos 클라이언트 의존성 (싱글톤 패턴, 판정 캐시 + 일괄 요청)"""
     global _cerbos_client
     if _cerbos_client is None:
-        _cerbos_client = AsyncCerbosClient(
-            host=f"http://{settings.CERBOS_HOST}:{settings.CERBOS_PORT}"
+        _cerbos_client = CachedCerbosClient(
+            AsyncCerbosClient(host=f"http://{settings.CERBOS_HOST}:{settings.CERBOS_PORT}"),
+            decision_cache,
+            batch_size=settings.CERBOS_BATCH_SIZE,
         )
     return _cerbos_client
 
@@ -31,7 +283,7 @@ async def get_principal(
 
     Spring Boot 세션 인증 통합:
     1. JSESSIONID 쿠키를 통해 Spring Boot 세션 검증
-    2. Spring Boot API를 호출하여 사용자 정보 조회
+    2. 세션 캐시 → Spring Session Redis → Spring Boot API 순으로 사용자 정보 조회
     3. 사용자 정보를 Cerbos Principal 객체로 변환
 
     개발/테스트 모드:
@@ -58,7 +310,7 @@ async def get_principal(
         )
 
     try:
-        # Spring Boot API를 통해 세션 검증 및 사용자 정보 조회
+        # 세션 검증 및 사용자 정보 조회 (짧은 시간 캐시되므로 요청마다 API를 호출하지 않음)
         user_info = await spring_auth.get_current_user(JSESSIONID)
 
         # Cerbos Principal 객체로 변환
@@ -137,6 +389,50 @@ async def check_resource_permission(
         )
 
 
+async def check_resources_permission(
+    principal: Principal,
+    resources: List[Resource],
+    action: str,
+    cerbos: AsyncCerbosClient
+) -> Dict[str, bool]:
+    """
+    여러 리소스 권한 일괄 확인 (목록의 행별 권한 판정용)
+
+    리소스마다 check_resource_permission을 호출하지 않고 CheckResources 요청 1회
+    (CachedCerbosClient면 캐시 미스만, batch_size 단위)로 판정합니다.
+
+    Args:
+        principal: 사용자 정보
+        resources: 리소스 목록 (id 중복 없음)
+        action: 작업
+        cerbos: Cerbos 클라이언트
+
+    Returns:
+        Dict[str, bool]: 리소스 ID별 허용 여부
+
+    Raises:
+        HTTPException(503): 권한 서버 연결 실패
+    """
+    if not resources:
+        return {}
+    try:
+        result = await cerbos.check_resources(
+            principal=principal,
+            resources=ResourceList(
+                resources=[ResourceAction(resource=resource, actions=[action]) for resource in resources]
+            )
+        )
+        return {
+            resource.id: bool(resource_result.is_allowed(action))
+            for resource, resource_result in zip(resources, result.results)
+        }
+    except Exception as e:
+        raise HTTPException(
+            status_code=503,
+            detail=f"권한 서버 연결 실패: {str(e)}"
+        )
+
+
 def require_permission(resource_kind: str, action: str) -> Callable:
     """
     권한 체크 Depends 생성 팩토리
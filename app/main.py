@@ -1,8 +1,22 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 from fastapi.responses import FileResponse
 from app.core.config import settings
+from app.core.http_client import http_clients
+from app.core.database import dispose_engines
+from app.core.edb import edb_pool
+from app.services.usage_writer import usage_writer
+from app.services.categorization_worker import conversation_categorizer
+from app.services.pii_bulk_scanner import pii_bulk_scanner
+from app.services.usage_rollup import usage_rollup
+from app.services.embedding_cache import embedding_cache
+from app.services.ip_allowlist import ip_allowlist
+from app.services.dictionary_service import dictionary_service
+from app.services.vector_permission_sync import vector_permission_sync
+from app.middleware.spring_session_auth import spring_auth
+from app.middleware.ip_filter import IPFilterMiddleware
 from app.api import api_router
 from app.routers.admin import (
     notices,
@@ -50,14 +64,48 @@ from app.routers.chat import chat, rooms, history
 from app.routers.chat import files as chat_files
 import os
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """앱 수명주기 - 백그라운드 기록기 시작, 종료 시 공유 리소스 정리"""
+    usage_writer.start()
+    if settings.CATEGORIZER_ENABLED:
+        conversation_categorizer.start()
+    if settings.USAGE_ROLLUP_ENABLED:
+        usage_rollup.start()
+    if settings.IP_FILTER_ENABLED:
+        ip_allowlist.start()
+    if settings.VECTOR_PERMISSION_SYNC_ENABLED:
+        vector_permission_sync.start()
+    spring_auth.start()
+    yield
+    await spring_auth.stop()
+    await vector_permission_sync.stop()
+    await ip_allowlist.stop()
+    await usage_rollup.stop()
+    await conversation_categorizer.stop()
+    await pii_bulk_scanner.shutdown()
+    await usage_writer.stop()
+    await embedding_cache.close()
+    await dictionary_service.close()
+    await http_clients.aclose()
+    await edb_pool.close()
+    await dispose_engines()
+
+
 app = FastAPI(
     title="ex-GPT Admin API",
     description="Enterprise AI Platform Management System",
     version="0.1.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    lifespan=lifespan
 )
 
+# IP 접근 제어 (ip_whitelist 규칙, 메모리 허용 목록) - CORS보다 먼저 등록해 차단 응답에도 CORS 헤더 적용
+if settings.IP_FILTER_ENABLED:
+    app.add_middleware(IPFilterMiddleware)
+
 # CORS 설정
 app.add_middleware(
     CORSMiddleware,
@@ -2,17 +2,31 @@
 Public-facing API - User Chat Service Only
 Security-isolated from admin APIs
 """
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from app.core.config import settings
+from app.core.http_client import http_clients
+from app.services.usage_writer import usage_writer
 from app.routers import chat_proxy
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """앱 수명주기 - 사용 이력 기록기 시작, 종료 시 잔여 이력 저장 및 커넥션 풀 정리"""
+    usage_writer.start()
+    yield
+    await usage_writer.stop()
+    await http_clients.aclose()
+
+
 app = FastAPI(
     title="ex-GPT Chat API",
     description="Public chat service for end users",
     version="0.1.0",
     docs_url=None,  # Disable docs for public API
-    redoc_url=None
+    redoc_url=None,
+    lifespan=lifespan
 )
 
 # CORS 설정
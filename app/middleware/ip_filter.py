@@ -4,12 +4,15 @@ adminpage.txt: 8. 설정 > 1) 관리자관리>IP접근권한 관리
 
 시큐어 코딩: IP 기반 접근 제어
 """
-from fastapi import Request, HTTPException, status
+import logging
+
+from fastapi import Request, status
+from fastapi.responses import JSONResponse
 from starlette.middleware.base import BaseHTTPMiddleware
-from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.services.ip_access import IPAccessService
-from app.core.database import async_session
+from app.services.ip_allowlist import ip_allowlist
+
+logger = logging.getLogger(__name__)
 
 
 class IPFilterMiddleware(BaseHTTPMiddleware):
@@ -17,7 +20,7 @@ class IPFilterMiddleware(BaseHTTPMiddleware):
     IP 화이트리스트 기반 접근 제어 미들웨어
 
     시큐어 코딩:
-    - IP 기반 접근 제어
+    - IP 기반 접근 제어 (단일 IP / CIDR 대역, 가장 구체적인 규칙 우선)
     - 허용되지 않은 IP 차단
     - 로깅 및 감사
     """
@@ -41,18 +44,15 @@ class IPFilterMiddleware(BaseHTTPMiddleware):
         # 클라이언트 IP 주소 추출
         client_ip = self._get_client_ip(request)
 
-        # IP 주소 확인
-        async with async_session() as db:
-            ip_service = IPAccessService()
-            is_allowed = await ip_service.is_ip_allowed(client_ip, db)
-
-        if not is_allowed:
-            # 로깅 (실제 환경에서는 logging 모듈 사용)
-            print(f"[IP BLOCKED] {client_ip} attempted to access {request.url.path}")
+        # IP 주소 확인 (메모리 허용 목록, 요청당 DB 조회 없음)
+        await ip_allowlist.ensure_loaded()
+        if not ip_allowlist.is_allowed(client_ip):
+            logger.warning(f"[IP BLOCKED] {client_ip} attempted to access {request.url.path}")
 
-            raise HTTPException(
+            # BaseHTTPMiddleware에서 발생한 HTTPException은 500으로 처리되므로 직접 응답
+            return JSONResponse(
                 status_code=status.HTTP_403_FORBIDDEN,
-                detail="접근이 거부되었습니다. IP 주소가 허용 목록에 없습니다."
+                content={"detail": "접근이 거부되었습니다. IP 주소가 허용 목록에 없습니다."}
             )
 
         # 다음 미들웨어 또는 엔드포인트로 전달
@@ -3,11 +3,26 @@ Spring Boot 세션 인증 미들웨어
 
 기존 Spring Boot (Tomcat) 서버의 JSESSIONID를 검증하여 사용자 인증 처리
 Redis 공유 세션 방식 또는 API 검증 방식 지원
+
+- Redis 방식: Spring Session 해시(spring:session:sessions:<id>)를 redis.asyncio로 직접 조회해
+  SPRING_SECURITY_CONTEXT / 세션 속성에서 사용자 정보를 추출
+- 검증 결과는 프로세스 내에서 몇 초간 캐시 (실패 결과도 짧게 캐시)
+- Spring의 세션 삭제/만료 keyspace 이벤트를 구독해 캐시 즉시 무효화
+- Redis에서 판단할 수 없는 경우(미설정, 장애, 해석 불가 직렬화 형식)에만 Spring Boot API 호출
 """
+import asyncio
+import json
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
 import httpx
 from fastapi import Cookie, HTTPException, Depends
-from typing import Optional, Dict
-import logging
+
+from app.core.config import settings
+from app.core.http_client import http_clients
+from app.core.redis import OptionalRedis
 
 logger = logging.getLogger(__name__)
 
@@ -17,23 +32,257 @@ logger = logging.getLogger(__name__)
 SPRING_BOOT_URL = "http://172.17.0.1:18180/exGenBotDS"
 SPRING_BOOT_VALIDATE_API = f"{SPRING_BOOT_URL}/api/auth/validate"
 
+SECURITY_CONTEXT_ATTR = "SPRING_SECURITY_CONTEXT"
+# 세션 속성에 직접 저장된 사용자 정보 (Spring 애플리케이션이 설정한 경우) → user_info 키
+SESSION_USER_ATTRS = {
+    "user_id": "user_id",
+    "userId": "user_id",
+    "username": "username",
+    "department": "department",
+    "email": "email",
+    "roles": "roles",
+}
+
+_JAVA_SERIALIZATION_MAGIC = b"\xac\xed"
+
+
+class UnsupportedSessionFormat(Exception):
+    """Redis 세션 값을 해석할 수 없음 (Spring Boot API로 검증)"""
+
+
+def _unwrap_jackson(value: Any) -> Any:
+    """
+    GenericJackson2JsonRedisSerializer 타입 정보 제거
+
+    - 객체: {"@class": "...", ...} → "@class" 키 제거
+    - 컬렉션: ["java.util.ArrayList", [...]] → [...]
+    """
+    if isinstance(value, dict):
+        return {k: _unwrap_jackson(v) for k, v in value.items() if k != "@class"}
+    if isinstance(value, list):
+        if len(value) == 2 and isinstance(value[0], str) and value[0].startswith("java.") \
+                and isinstance(value[1], (list, dict, int, float, str)):
+            return _unwrap_jackson(value[1])
+        return [_unwrap_jackson(v) for v in value]
+    return value
+
+
+def _java_to_python(value: Any, depth: int = 0) -> Any:
+    """javaobj 역직렬화 결과 → dict/list/기본형 (최선 노력)"""
+    if depth > 12 or value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    if isinstance(value, dict):
+        return {str(_java_to_python(k, depth + 1)): _java_to_python(v, depth + 1) for k, v in value.items()}
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return [_java_to_python(v, depth + 1) for v in value]
+    fields = {
+        name: _java_to_python(field, depth + 1)
+        for name, field in vars(value).items()
+        if not name.startswith("_") and name not in ("classdesc", "annotations")
+    }
+    # Collections$Unmodifiable* 래퍼는 내부 컬렉션(c / list)만 사용
+    for inner in ("c", "list"):
+        if inner in fields and isinstance(fields[inner], list):
+            return fields[inner]
+    return fields
+
+
+def decode_session_value(raw: Any) -> Any:
+    """
+    Spring Session 해시 값 역직렬화
+
+    - JSON (GenericJackson2JsonRedisSerializer)
+    - Java 직렬화 (JdkSerializationRedisSerializer, 기본값) - javaobj-py3 필요
+    - 그 외 문자열 (StringRedisSerializer)
+
+    Raises:
+        UnsupportedSessionFormat: Java 직렬화인데 javaobj-py3가 없거나 해석 실패
+    """
+    if raw is None:
+        return None
+    if isinstance(raw, str):
+        raw = raw.encode("utf-8")
+
+    if raw[:2] == _JAVA_SERIALIZATION_MAGIC:
+        try:
+            import javaobj
+        except ImportError:
+            logger.error("javaobj-py3 not installed. Install with: pip install javaobj-py3")
+            raise UnsupportedSessionFormat("Java serialized session attribute")
+        try:
+            return _java_to_python(javaobj.loads(raw))
+        except Exception as e:
+            raise UnsupportedSessionFormat(f"Java deserialization failed: {e}")
+
+    text = raw.decode("utf-8", errors="replace")
+    try:
+        return _unwrap_jackson(json.loads(text))
+    except ValueError:
+        return text
+
+
+def _strip_role(authority: Any) -> Optional[str]:
+    if isinstance(authority, dict):
+        authority = authority.get("authority") or authority.get("role")
+    if not isinstance(authority, str) or not authority:
+        return None
+    return authority[5:] if authority.startswith("ROLE_") else authority
+
+
+def extract_user_info(attributes: Dict[str, Any]) -> Optional[Dict]:
+    """
+    역직렬화된 세션 속성 → 사용자 정보 (Spring Boot validate API 응답과 같은 형태)
+
+    Args:
+        attributes: {속성명: 값} (sessionAttr: 접두사 제거)
+
+    Returns:
+        dict: {"authenticated": True, "user_id", "username", "roles", "department", "email"},
+              로그인하지 않은 세션이면 None
+    """
+    user_info: Dict[str, Any] = {}
+
+    context = attributes.get(SECURITY_CONTEXT_ATTR)
+    authentication = context.get("authentication") if isinstance(context, dict) else None
+    if isinstance(authentication, dict) and authentication.get("authenticated", True):
+        principal = authentication.get("principal")
+        if isinstance(principal, dict):
+            username = principal.get("username")
+            authorities = principal.get("authorities") or authentication.get("authorities") or []
+        else:
+            username = principal if isinstance(principal, str) else authentication.get("name")
+            authorities = authentication.get("authorities") or []
+        if username:
+            user_info["user_id"] = user_info["username"] = username
+            user_info["roles"] = [role for role in map(_strip_role, authorities) if role]
+
+    for attr, key in SESSION_USER_ATTRS.items():
+        value = attributes.get(attr)
+        if value not in (None, "", []):
+            user_info[key] = value
+
+    if not user_info.get("user_id"):
+        return None
+    if isinstance(user_info.get("roles"), str):
+        user_info["roles"] = [role.strip() for role in user_info["roles"].split(",") if role.strip()]
+    user_info.setdefault("roles", [])
+    user_info.setdefault("username", user_info["user_id"])
+    user_info["authenticated"] = True
+    return user_info
+
+
+def is_session_expired(session: Dict[str, Any], now_ms: Optional[float] = None) -> bool:
+    """lastAccessedTime + maxInactiveInterval 기준 만료 여부 (Spring은 만료 후에도 해시를 잠시 남김)"""
+    try:
+        last_accessed = int(decode_session_value(session.get("lastAccessedTime")))
+        max_inactive = int(decode_session_value(session.get("maxInactiveInterval")))
+    except (TypeError, ValueError, UnsupportedSessionFormat):
+        return False
+    if max_inactive < 0:
+        return False
+    now_ms = time.time() * 1000 if now_ms is None else now_ms
+    return last_accessed + max_inactive * 1000 <= now_ms
+
+
+class SessionCache:
+    """검증된 세션 → 사용자 정보 캐시 (실패도 짧게 캐시)"""
+
+    def __init__(self, ttl: float = 5.0, negative_ttl: float = 2.0, max_size: int = 10000):
+        """
+        Args:
+            ttl: 유효 세션 캐시 시간 (초, 0이면 비활성화)
+            negative_ttl: 유효하지 않은 세션 캐시 시간 (초)
+            max_size: 최대 세션 수
+        """
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.max_size = max_size
+        self._entries: "OrderedDict[str, Tuple[Optional[Dict], float]]" = OrderedDict()
+        self.hits = 0
+        self.negative_hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def get(self, session_id: str) -> Tuple[bool, Optional[Dict]]:
+        """
+        Returns:
+            (적중 여부, 사용자 정보) - 적중했는데 사용자 정보가 None이면 유효하지 않은 세션
+        """
+        entry = self._entries.get(session_id)
+        if entry is None or entry[1] <= time.monotonic():
+            if entry is not None:
+                del self._entries[session_id]
+            self.misses += 1
+            return False, None
+        if entry[0] is None:
+            self.negative_hits += 1
+        else:
+            self.hits += 1
+        return True, entry[0]
+
+    def put(self, session_id: str, user_info: Optional[Dict]) -> None:
+        ttl = self.ttl if user_info is not None else self.negative_ttl
+        if ttl <= 0:
+            return
+        self._entries[session_id] = (user_info, time.monotonic() + ttl)
+        self._entries.move_to_end(session_id)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, session_id: str) -> None:
+        if self._entries.pop(session_id, None) is not None:
+            self.invalidations += 1
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def metrics(self) -> Dict[str, Any]:
+        lookups = self.hits + self.negative_hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "negative_hits": self.negative_hits,
+            "misses": self.misses,
+            "hit_ratio": round((self.hits + self.negative_hits) / lookups, 4) if lookups else 0.0,
+            "invalidations": self.invalidations,
+        }
+
 
 class SpringSessionAuth:
     """Spring Boot 세션 인증 헬퍼"""
 
-    def __init__(self, use_redis: bool = False):
+    def __init__(
+        self,
+        redis_url: Optional[str] = None,
+        namespace: str = "spring:session",
+        cache: Optional[SessionCache] = None,
+    ):
         """
         Args:
-            use_redis: True면 Redis에서 직접 세션 조회, False면 Spring Boot API 호출
+            redis_url: Spring Session Redis URL (None이면 Spring Boot API 호출 방식만 사용)
+            namespace: Spring Session Redis 키 접두사 (spring.session.redis.namespace)
+            cache: 세션 검증 결과 캐시
         """
-        self.use_redis = use_redis
-        if use_redis:
-            try:
-                from redis import Redis
-                self.redis_client = Redis(host='localhost', port=6379, db=0, decode_responses=False)
-            except ImportError:
-                logger.error("Redis 라이브러리가 설치되지 않았습니다: pip install redis")
-                raise
+        self.redis = OptionalRedis(
+            redis_url, "Spring session", "using Spring Boot API", decode_responses=False,
+        )
+        self.namespace = namespace
+        self.cache = cache or SessionCache()
+        self.redis_lookups = 0
+        self.api_fallbacks = 0
+        self._task: Optional[asyncio.Task] = None
+        self._stopping = False
+
+    @property
+    def use_redis(self) -> bool:
+        return self.redis.enabled
+
+    @property
+    def redis_errors(self) -> int:
+        return self.redis.errors
+
+    def session_key(self, session_id: str) -> str:
+        return f"{self.namespace}:sessions:{session_id}"
 
     async def validate_session_via_api(self, jsessionid: str) -> Dict:
         """
@@ -49,11 +298,10 @@ class SpringSessionAuth:
             HTTPException: 세션 유효하지 않을 때
         """
         try:
-            async with httpx.AsyncClient(timeout=5.0) as client:
-                response = await client.get(
-                    SPRING_BOOT_VALIDATE_API,
-                    cookies={"JSESSIONID": jsessionid}
-                )
+            response = await http_clients.get("spring").get(
+                SPRING_BOOT_VALIDATE_API,
+                cookies={"JSESSIONID": jsessionid}
+            )
 
             if response.status_code == 200:
                 user_info = response.json()
@@ -76,9 +324,9 @@ class SpringSessionAuth:
             logger.error(f"Spring Boot 서버 연결 실패: {e}")
             raise HTTPException(status_code=503, detail="Authentication service unavailable")
 
-    async def validate_session_via_redis(self, jsessionid: str) -> Dict:
+    async def validate_session_via_redis(self, jsessionid: str) -> Optional[Dict]:
         """
-        Redis에서 직접 세션 조회 (Spring Session 형식)
+        Redis에서 직접 세션 조회 (Spring Session 해시 형식)
 
         Args:
             jsessionid: JSESSIONID 쿠키 값
@@ -87,37 +335,75 @@ class SpringSessionAuth:
             dict: 사용자 정보 {"user_id": "...", "roles": [...]}
 
         Raises:
-            HTTPException: 세션 유효하지 않을 때
+            HTTPException(401): 세션이 없거나 만료되었거나 로그인하지 않은 세션
+            UnsupportedSessionFormat: 세션 값을 해석할 수 없음 (API 검증 필요)
+            Exception: Redis 조회 실패
         """
-        try:
-            # Spring Session의 Redis key 형식
-            session_key = f"spring:session:sessions:{jsessionid}"
-            session_data = self.redis_client.get(session_key)
-
-            if not session_data:
-                logger.warning(f"Redis에 세션이 없습니다: {jsessionid[:8]}...")
-                raise HTTPException(status_code=401, detail="Session not found")
-
-            # Spring Session 데이터 파싱 (Java 직렬화 형식)
-            # 실제 구현 시 Spring Session의 세션 포맷에 맞게 파싱 필요
-            # 여기서는 간단한 예시만 제공
-
-            # TODO: Spring Security Context에서 사용자 정보 추출
-            # session_obj = parse_spring_session(session_data)
-            # user_info = extract_user_from_security_context(session_obj)
-
-            # 임시 구현 (실제로는 위 파싱 로직 필요)
-            user_info = {
-                "user_id": "admin",  # 실제로는 세션에서 추출
-                "roles": ["ADMIN"]
-            }
+        redis = await self.redis.client()
+        if redis is None:
+            raise UnsupportedSessionFormat("Redis unavailable")
+
+        self.redis_lookups += 1
+        session = await redis.hgetall(self.session_key(jsessionid))
+        session = {
+            (k.decode("utf-8") if isinstance(k, bytes) else k): v
+            for k, v in session.items()
+        }
+        if not session or is_session_expired(session):
+            logger.warning(f"Redis에 세션이 없습니다: {jsessionid[:8]}...")
+            raise HTTPException(status_code=401, detail="Session not found")
+
+        # 사용자 정보와 관계있는 속성만 역직렬화
+        attributes = {}
+        for name in (SECURITY_CONTEXT_ATTR, *SESSION_USER_ATTRS):
+            raw = session.get(f"sessionAttr:{name}")
+            if raw is not None:
+                attributes[name] = decode_session_value(raw)
+
+        user_info = extract_user_info(attributes)
+        if user_info is None:
+            logger.warning(f"로그인하지 않은 세션입니다: {jsessionid[:8]}...")
+            raise HTTPException(status_code=401, detail="Session expired or invalid")
+
+        user_info["auth_source"] = "redis"
+        logger.debug(f"Redis 세션 검증 성공: user_id={user_info.get('user_id')}")
+        return user_info
+
+    async def validate_session(self, jsessionid: str) -> Dict:
+        """
+        세션 검증 (캐시 → Redis → Spring Boot API 순)
 
-            logger.info(f"Redis 세션 검증 성공: user_id={user_info.get('user_id')}")
-            return user_info
+        Raises:
+            HTTPException: 인증 실패 시
+        """
+        hit, user_info = self.cache.get(jsessionid)
+        if hit:
+            if user_info is None:
+                raise HTTPException(status_code=401, detail="Session expired or invalid")
+            return dict(user_info)
 
-        except Exception as e:
-            logger.error(f"Redis 세션 조회 실패: {e}")
-            raise HTTPException(status_code=500, detail="Session validation error")
+        try:
+            if self.use_redis:
+                try:
+                    user_info = await self.validate_session_via_redis(jsessionid)
+                except UnsupportedSessionFormat as e:
+                    logger.debug(f"Redis 세션 해석 불가, Spring Boot API로 검증: {e}")
+                except HTTPException:
+                    raise
+                except Exception as e:
+                    self.redis.failed(e)
+
+            if user_info is None:
+                self.api_fallbacks += 1
+                user_info = await self.validate_session_via_api(jsessionid)
+        except HTTPException as e:
+            # 인증 실패만 캐시 (인증 서버 장애는 캐시하지 않음)
+            if e.status_code == 401:
+                self.cache.put(jsessionid, None)
+            raise
+
+        self.cache.put(jsessionid, user_info)
+        return dict(user_info)
 
     async def get_current_user(
         self,
@@ -150,17 +436,102 @@ class SpringSessionAuth:
                 headers={"WWW-Authenticate": "Cookie"}
             )
 
-        # Redis 또는 API 방식으로 검증
-        if self.use_redis:
-            return await self.validate_session_via_redis(JSESSIONID)
-        else:
-            return await self.validate_session_via_api(JSESSIONID)
+        return await self.validate_session(JSESSIONID)
+
+    # ------------------------------------------------------------------
+    # Redis / keyspace 이벤트
+    # ------------------------------------------------------------------
+
+    def handle_keyspace_event(self, key: Any) -> Optional[str]:
+        """
+        keyspace 이벤트 키 → 세션 캐시 무효화
+
+        Spring은 세션 삭제/만료 시 <namespace>:sessions:<id> 및
+        <namespace>:sessions:expires:<id> 키를 삭제/만료시킵니다.
+
+        Returns:
+            무효화한 세션 ID (세션 키가 아니면 None)
+        """
+        if isinstance(key, bytes):
+            key = key.decode("utf-8", errors="replace")
+        prefix = f"{self.namespace}:sessions:"
+        if not isinstance(key, str) or not key.startswith(prefix):
+            return None
+        session_id = key[len(prefix):]
+        if session_id.startswith("expires:"):
+            session_id = session_id[len("expires:"):]
+        self.cache.invalidate(session_id)
+        return session_id
+
+    def start(self) -> None:
+        """세션 삭제/만료 keyspace 이벤트 구독 시작 (Redis 방식일 때)"""
+        if not self.use_redis or (self._task is not None and not self._task.done()):
+            return
+        self._stopping = False
+        self._task = asyncio.create_task(self._run(), name="spring-session-events")
+        logger.info("Spring session keyspace listener started")
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._stopping = True
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.redis.close()
+
+    async def _run(self) -> None:
+        while not self._stopping:
+            pubsub = None
+            try:
+                redis = await self.redis.client()
+                if redis is None:
+                    await asyncio.sleep(self.redis.retry_after)
+                    continue
+                pubsub = redis.pubsub()
+                # notify-keyspace-events "Egx"는 Spring Session이 설정 (ConfigureNotifyKeyspaceEventsAction)
+                await pubsub.psubscribe("__keyevent@*__:del", "__keyevent@*__:expired")
+                async for message in pubsub.listen():
+                    if message.get("type") == "pmessage":
+                        self.handle_keyspace_event(message.get("data"))
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                self.redis.failed(e)
+                # 구독이 끊긴 동안의 이벤트는 알 수 없으므로 캐시 비움
+                self.cache.clear()
+                await asyncio.sleep(1.0)
+            finally:
+                if pubsub is not None:
+                    try:
+                        await pubsub.aclose()
+                    except Exception:
+                        pass
+
+    def metrics(self) -> Dict[str, Any]:
+        data = self.cache.metrics()
+        data["redis"] = self.use_redis
+        data["redis_lookups"] = self.redis_lookups
+        data["api_fallbacks"] = self.api_fallbacks
+        data["redis_errors"] = self.redis_errors
+        data["listening"] = self._task is not None and not self._task.done()
+        return data
 
 
 # Singleton 인스턴스
-# use_redis=False: Spring Boot API 호출 방식 (기본)
-# use_redis=True: Redis 직접 조회 방식
-spring_auth = SpringSessionAuth(use_redis=False)
+# SPRING_SESSION_REDIS_URL 미설정: Spring Boot API 호출 방식 (기본)
+# SPRING_SESSION_REDIS_URL 설정: Redis 직접 조회 방식 (해석 불가 시 API 호출)
+spring_auth = SpringSessionAuth(
+    redis_url=settings.SPRING_SESSION_REDIS_URL,
+    namespace=settings.SPRING_SESSION_NAMESPACE,
+    cache=SessionCache(
+        ttl=settings.SPRING_SESSION_CACHE_TTL,
+        negative_ttl=settings.SPRING_SESSION_NEGATIVE_CACHE_TTL,
+        max_size=settings.SPRING_SESSION_CACHE_MAX_SIZE,
+    ),
+)
 
 
 # FastAPI Dependency로 사용
@@ -4,6 +4,7 @@ from app.models.document import Document, DocumentVersion, DocumentChange
 from app.models.category import Category, ParsingPattern
 from app.models.document_vector import DocumentVector, VectorStatus
 from app.models.usage import UsageHistory
+from app.models.usage_rollup import UsageRollupHourly, UsageRollupDaily, UsageRollupDailyUser, UsageRollupState
 from app.models.permission import Role, Permission, Department
 from app.models.document_permission import ApprovalLine, DocumentPermission, UserDocumentPermission
 from app.models.access import AccessRequest
@@ -11,7 +12,7 @@ from app.models.approval import DocumentChangeRequest, ApprovalStep
 from app.models.notice import Notice
 from app.models.notification import Notification
 from app.models.satisfaction import SatisfactionSurvey
-from app.models.pii_detection import PIIDetectionResult, PIIStatus
+from app.models.pii_detection import PIIDetectionResult, PIIStatus, PIIScanJob, PIIScanJobStatus
 from app.models.ip_whitelist import IPWhitelist
 from app.models.stt import STTBatch, STTTranscription, STTSummary, STTEmailLog
 from app.models.chat_models import (
@@ -34,6 +35,10 @@ __all__ = [
     "DocumentVector",
     "VectorStatus",
     "UsageHistory",
+    "UsageRollupHourly",
+    "UsageRollupDaily",
+    "UsageRollupDailyUser",
+    "UsageRollupState",
     "Role",
     "Permission",
     "Department",
@@ -48,6 +53,8 @@ __all__ = [
     "SatisfactionSurvey",
     "PIIDetectionResult",
     "PIIStatus",
+    "PIIScanJob",
+    "PIIScanJobStatus",
     "IPWhitelist",
     "STTBatch",
     "STTTranscription",
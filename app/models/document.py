@@ -1,5 +1,6 @@
-from sqlalchemy import Column, Integer, String, Text, Boolean, ForeignKey, Enum, JSON
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, FetchedValue, Index, Integer, String, Text, Boolean, ForeignKey, Enum, JSON
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.orm import deferred, relationship
 from app.models.base import Base, TimestampMixin
 import enum
 
@@ -24,6 +25,14 @@ class DocumentStatus(str, enum.Enum):
 class Document(Base, TimestampMixin):
     """문서 모델"""
     __tablename__ = "documents"
+    __table_args__ = (
+        # 검색: tsvector(GIN) + 제목/파일명 부분 일치(pg_trgm GIN) (app/services/document_search.py)
+        Index("ix_documents_search_vector", "search_vector", postgresql_using="gin"),
+        Index("ix_documents_title_trgm", "title", postgresql_using="gin",
+              postgresql_ops={"title": "gin_trgm_ops"}),
+        Index("ix_documents_file_name_trgm", "file_name", postgresql_using="gin",
+              postgresql_ops={"file_name": "gin_trgm_ops"}),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     document_id = Column(String(100), unique=True, nullable=False, index=True)
@@ -40,6 +49,9 @@ class Document(Base, TimestampMixin):
     summary = Column(Text)
     doc_metadata = Column(JSON)  # 'metadata'는 SQLAlchemy 예약어
 
+    # 검색 색인 (title/file_name/summary/content로 DB 트리거가 갱신, 조회 시 로드하지 않음)
+    search_vector = deferred(Column(TSVECTOR, server_default=FetchedValue(), server_onupdate=FetchedValue()))
+
     # 버전 관리
     current_version = Column(String(20), default="1.0")
 
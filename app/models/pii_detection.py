@@ -2,7 +2,7 @@
 개인정보 검출 결과 모델
 PRD_v2.md P0 요구사항: FUN-003
 """
-from sqlalchemy import Column, Integer, String, Boolean, ForeignKey, Text, Enum as sa_Enum
+from sqlalchemy import Column, Integer, String, Boolean, ForeignKey, Text, DateTime, Enum as sa_Enum
 from sqlalchemy.orm import relationship
 from app.models.base import Base, TimestampMixin
 import enum
@@ -32,11 +32,16 @@ class PIIDetectionResult(Base, TimestampMixin):
     status = Column(pii_status_enum, default='pending', comment="처리 상태")
     admin_note = Column(Text, comment="관리자 메모")
     processed_by = Column(Integer, ForeignKey('users.id'), comment="처리한 관리자 ID")
+    content_hash = Column(String(64), comment="검사한 문서 내용의 SHA-256 (변경 없으면 재검사 생략)")
 
     # 관계
     document = relationship("Document", back_populates="pii_detections")
     admin = relationship("User", foreign_keys=[processed_by])
 
+    __table_args__ = (
+        sa.Index('idx_pii_detection_results_document_id', 'document_id', 'id'),
+    )
+
     @property
     def pii_matches(self):
         """JSON 문자열을 파싱하여 매치 목록 반환"""
@@ -47,3 +52,26 @@ class PIIDetectionResult(Base, TimestampMixin):
             return json.loads(self.pii_data)
         except (json.JSONDecodeError, TypeError):
             return []
+
+
+class PIIScanJobStatus(str, enum.Enum):
+    """일괄 PII 검사 작업 상태"""
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+
+class PIIScanJob(Base, TimestampMixin):
+    """문서 전체 일괄 PII 검사 작업 (체크포인트)"""
+    __tablename__ = "pii_scan_jobs"
+
+    id = Column(Integer, primary_key=True, index=True)
+    status = Column(String(20), nullable=False, default=PIIScanJobStatus.RUNNING.value, comment="작업 상태")
+    last_document_id = Column(Integer, nullable=False, default=0, comment="마지막으로 처리한 문서 ID (재개 위치)")
+    total_documents = Column(Integer, nullable=False, default=0, comment="시작 시점 전체 문서 수")
+    scanned_count = Column(Integer, nullable=False, default=0, comment="검사한 문서 수")
+    skipped_count = Column(Integer, nullable=False, default=0, comment="내용 변경 없어 생략한 문서 수")
+    detected_count = Column(Integer, nullable=False, default=0, comment="PII가 검출된 문서 수")
+    error_message = Column(Text, comment="실패 사유")
+    finished_at = Column(DateTime(timezone=True), comment="종료 시각")
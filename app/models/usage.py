@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, Float, JSON, Boolean, DateTime
+from sqlalchemy import Column, Computed, Index, Integer, String, Text, Float, JSON, Boolean, DateTime, text
 from app.models.base import Base, TimestampMixin
 
 
@@ -20,9 +20,12 @@ class UsageHistory(Base, TimestampMixin):
         referenced_documents: 참조 문서 JSON (문서 ID 배열)
         model_name: 사용된 AI 모델명 (예: "ex-GPT")
         usage_metadata: 추가 메타데이터 JSON
+        department: 부서 (usage_metadata.department에서 생성되는 컬럼)
         ip_address: 사용자 IP 주소 (IPv6 지원, 최대 45자)
         main_category: 대분류 (경영/기술/기타)
         sub_category: 소분류 (세부 카테고리)
+        category_claimed_at: 분류 워커 선점 시각 (리스, 만료 시 다른 워커가 재선점)
+        rolled_up_category: 사용 집계(usage_rollup)에 반영된 대분류 (NULL이면 아직 집계 전)
         is_deleted: 소프트 딜리트 플래그 (기본값: False)
         deleted_at: 삭제 시간 (소프트 딜리트 시 기록)
         created_at: 레코드 생성 시간 (TimestampMixin)
@@ -32,7 +35,10 @@ class UsageHistory(Base, TimestampMixin):
         - user_id (사용자별 조회 최적화)
         - session_id (세션별 조회 최적화)
         - main_category, sub_category (카테고리별 통계)
+        - department (부서별 통계 GROUP BY)
         - is_deleted (삭제되지 않은 레코드 필터링)
+        - created_at, (user_id, created_at), (session_id, created_at) (기간 필터 / 최신순 조회)
+        - id WHERE rolled_up_category IS NULL (집계 대기 행, partial)
 
     Notes:
         - 삭제 시 하드 딜리트하지 않고 is_deleted=True로 표시
@@ -40,6 +46,17 @@ class UsageHistory(Base, TimestampMixin):
         - thinking_content는 사용자에게 보이지 않는 AI 내부 사고 과정
     """
     __tablename__ = "usage_history"
+    __table_args__ = (
+        # 기간 필터는 func.date(created_at) 대신 반열린 범위로 비교해야 인덱스 사용 (app/utils/date_range.py)
+        Index("ix_usage_history_created_at", "created_at"),
+        Index("ix_usage_history_user_id_created_at", "user_id", "created_at"),
+        Index("ix_usage_history_session_id_created_at", "session_id", "created_at"),
+        Index(
+            "ix_usage_history_rollup_pending", "id",
+            postgresql_where=text("rolled_up_category IS NULL"),
+            sqlite_where=text("rolled_up_category IS NULL"),
+        ),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
 
@@ -71,12 +88,22 @@ class UsageHistory(Base, TimestampMixin):
     # 추가 메타데이터
     usage_metadata = Column(JSON)  # 'metadata'는 SQLAlchemy 예약어
 
+    # 부서 (usage_metadata.department → DB가 계산하여 저장, 부서별 통계용)
+    department = Column(
+        Text,
+        Computed("usage_metadata ->> 'department'", persisted=True),
+        index=True,
+        comment="부서 (usage_metadata.department 생성 컬럼)"
+    )
+
     # IP 주소
     ip_address = Column(String(45))
 
     # 질문 분류 (대분류/소분류)
     main_category = Column(String(50), index=True, comment="대분류: 경영분야, 기술분야, 경영/기술 외, 미분류")
     sub_category = Column(String(50), index=True, comment="소분류: 세부 카테고리")
+    category_claimed_at = Column(DateTime(timezone=True), nullable=True, comment="분류 워커 선점 시각 (리스)")
+    rolled_up_category = Column(String(50), nullable=True, comment="집계에 반영된 대분류 (NULL이면 미집계)")
 
     # 소프트 딜리트
     is_deleted = Column(Boolean, nullable=False, server_default='false', comment="소프트 딜리트 플래그")
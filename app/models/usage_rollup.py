@@ -0,0 +1,72 @@
+"""
+사용 이력 집계(rollup) 모델
+
+통계 API가 매 요청마다 usage_history 전체를 집계하지 않도록
+시간별 / 일별 집계를 미리 유지합니다 (app/services/usage_rollup.py).
+"""
+from sqlalchemy import Column, Integer, BigInteger, String, Float, Date, DateTime
+from app.models.base import Base
+
+
+class UsageRollupHourly(Base):
+    """
+    시간별 사용 집계
+
+    (bucket, department, model_name, main_category)별 질문 수 / 응답 시간 합 / 토큰 합
+    """
+    __tablename__ = "usage_rollup_hourly"
+
+    bucket = Column(DateTime(timezone=True), primary_key=True, comment="집계 시간 (정시)")
+    department = Column(String(100), primary_key=True, comment="부서 (usage_metadata.department, 없으면 미분류)")
+    model_name = Column(String(100), primary_key=True, comment="모델명 (없으면 빈 문자열)")
+    main_category = Column(String(50), primary_key=True, comment="대분류 (없으면 미분류)")
+
+    question_count = Column(Integer, nullable=False, default=0, comment="질문 수")
+    response_count = Column(Integer, nullable=False, default=0, comment="응답 시간이 기록된 질문 수")
+    response_time_sum = Column(Float, nullable=False, default=0.0, comment="응답 시간 합 (밀리초)")
+    token_sum = Column(BigInteger, nullable=False, default=0, comment="토큰 사용량 합")
+
+
+class UsageRollupDaily(Base):
+    """
+    일별 사용 집계 (통계 기준 시간대의 날짜)
+
+    (bucket, department, model_name, main_category)별 질문 수 / 응답 시간 합 / 토큰 합
+    """
+    __tablename__ = "usage_rollup_daily"
+
+    bucket = Column(Date, primary_key=True, comment="집계 날짜")
+    department = Column(String(100), primary_key=True, comment="부서 (usage_metadata.department, 없으면 미분류)")
+    model_name = Column(String(100), primary_key=True, comment="모델명 (없으면 빈 문자열)")
+    main_category = Column(String(50), primary_key=True, comment="대분류 (없으면 미분류)")
+
+    question_count = Column(Integer, nullable=False, default=0, comment="질문 수")
+    response_count = Column(Integer, nullable=False, default=0, comment="응답 시간이 기록된 질문 수")
+    response_time_sum = Column(Float, nullable=False, default=0.0, comment="응답 시간 합 (밀리초)")
+    token_sum = Column(BigInteger, nullable=False, default=0, comment="토큰 사용량 합")
+
+
+class UsageRollupDailyUser(Base):
+    """
+    일별 사용자 목록
+
+    고유 사용자 수는 합산할 수 없으므로 (날짜, 사용자) 쌍을 따로 유지합니다.
+    """
+    __tablename__ = "usage_rollup_daily_users"
+
+    bucket = Column(Date, primary_key=True, comment="집계 날짜")
+    user_id = Column(String(100), primary_key=True, comment="사용자 식별자")
+
+
+class UsageRollupState(Base):
+    """
+    집계 워커 상태
+
+    행 단위 집계 여부는 usage_history.rolled_up_category로 관리하며,
+    이 행은 워커 간 잠금(SKIP LOCKED)과 마지막으로 집계한 id / 시각 기록에 사용합니다.
+    """
+    __tablename__ = "usage_rollup_state"
+
+    name = Column(String(50), primary_key=True, comment="집계 이름")
+    last_id = Column(BigInteger, nullable=False, default=0, comment="마지막으로 집계한 usage_history.id")
+    updated_at = Column(DateTime(timezone=True), comment="마지막 집계 시각")
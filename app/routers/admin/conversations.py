@@ -16,6 +16,15 @@ from app.core.database import get_db
 from app.dependencies import get_principal
 from cerbos.sdk.model import Principal
 from app.services.excel_service import ExcelService
+from app.services.usage_rollup import usage_rollup
+from app.utils.date_range import date_range_filter
+from app.utils.pagination import (
+    KeysetPage,
+    apply_keyset,
+    approximate_count,
+    build_keyset_page,
+    decode_cursor,
+)
 
 router = APIRouter(prefix="/api/v1/admin/conversations", tags=["admin-conversations"])
 
@@ -99,6 +108,37 @@ class ConversationListResponse(BaseModel):
     page: int
     limit: int
     total_pages: int
+    next_cursor: Optional[str] = None
+    prev_cursor: Optional[str] = None
+
+
+async def _approximate_total(
+    db: AsyncSession,
+    start: Optional[date],
+    end: Optional[date],
+    main_category: Optional[str],
+    sub_category: Optional[str]
+) -> Optional[int]:
+    """
+    COUNT(*) 없이 대화내역 전체 개수 추정
+
+    - 필터 없음: pg_class.reltuples
+    - 날짜 / 대분류 필터: 일별 사용량 집계 합산
+    - 소분류 필터: 집계에 없으므로 None (정확한 COUNT 사용)
+    """
+    if sub_category and sub_category != "전체":
+        return None
+    category = main_category if main_category and main_category != "전체" else None
+
+    if start is None and end is None and category is None:
+        return await approximate_count(db, UsageHistory.__tablename__)
+
+    rows = await usage_rollup.fetch(db, "daily", start, end)
+    return sum(
+        row.totals.question_count
+        for row in rows
+        if category is None or row.main_category == category
+    )
 
 
 # 인증 없이 사용 가능한 간단한 조회 엔드포인트
@@ -108,10 +148,12 @@ async def get_conversations_simple(
     end: Optional[date] = Query(None, description="종료일 (YYYY-MM-DD)"),
     main_category: Optional[str] = Query(None, description="대분류 (경영분야, 기술분야, 경영/기술 외, 미분류)"),
     sub_category: Optional[str] = Query(None, description="소분류"),
-    page: int = Query(1, ge=1, description="페이지 번호"),
+    page: int = Query(1, ge=1, description="페이지 번호 (cursor 사용 시 무시)"),
     limit: int = Query(50, ge=1, le=10000, description="페이지당 항목 수"),
     sort_by: str = Query(default="created_at", description="정렬 필드"),
     order: str = Query(default="desc", description="정렬 방향 (asc/desc)"),
+    cursor: Optional[str] = Query(None, description="페이지 커서 (응답의 next_cursor / prev_cursor)"),
+    count: str = Query("exact", pattern="^(exact|approximate)$", description="전체 개수 계산 방식"),
     db: AsyncSession = Depends(get_db)
 ):
     """
@@ -122,16 +164,20 @@ async def get_conversations_simple(
     - 기술분야: 도로/안전, 교통, 건설, 신사업, 기타
     - 경영/기술 외: 기타
     - 미분류
+
+    페이지네이션:
+    - created_at 정렬 시 next_cursor / prev_cursor 반환, cursor로 넘기면 OFFSET 없이 조회
+    - count=approximate: 필터가 없으면 통계 추정값, 날짜/대분류 필터는 사용량 집계로 전체 개수 계산
     """
-    from sqlalchemy.orm import selectinload
+    keyset = sort_by == "created_at"
+    page_cursor = decode_cursor(cursor)
+    if page_cursor is not None and not keyset:
+        raise HTTPException(status_code=400, detail="cursor는 created_at 정렬에서만 사용할 수 있습니다")
 
     conditions = []
 
     # 날짜 필터
-    if start:
-        conditions.append(func.date(UsageHistory.created_at) >= start)
-    if end:
-        conditions.append(func.date(UsageHistory.created_at) <= end)
+    conditions.extend(date_range_filter(UsageHistory.created_at, start, end))
 
     # 대분류 필터
     if main_category and main_category != "전체":
@@ -149,15 +195,19 @@ async def get_conversations_simple(
         conditions.append(UsageHistory.sub_category == sub_category)
 
     # 전체 개수 조회
-    count_query = select(func.count(UsageHistory.id))
-    if conditions:
-        count_query = count_query.filter(and_(*conditions))
+    total = None
+    if count == "approximate":
+        total = await _approximate_total(db, start, end, main_category, sub_category)
+    if total is None:
+        count_query = select(func.count(UsageHistory.id))
+        if conditions:
+            count_query = count_query.filter(and_(*conditions))
 
-    count_result = await db.execute(count_query)
-    total = count_result.scalar() or 0
+        count_result = await db.execute(count_query)
+        total = count_result.scalar() or 0
 
     # 페이지네이션 계산
-    offset = (page - 1) * limit
+    offset = (page - 1) * limit if page_cursor is None else 0
     total_pages = (total + limit - 1) // limit if limit > 0 else 0
 
     # 목록 조회 (User와 LEFT JOIN)
@@ -174,18 +224,28 @@ async def get_conversations_simple(
     if conditions:
         query = query.filter(and_(*conditions))
 
-    # 정렬 처리
-    sort_column = getattr(UsageHistory, sort_by, UsageHistory.created_at)
-    if order.lower() == "asc":
-        query = query.order_by(sort_column.asc())
+    # 정렬 처리 (created_at은 (created_at, id) 커서 조회)
+    descending = order.lower() != "asc"
+    if keyset:
+        query = apply_keyset(query, UsageHistory.created_at, UsageHistory.id, page_cursor, limit, descending)
+        query = query.offset(offset)
     else:
-        query = query.order_by(sort_column.desc())
-
-    query = query.offset(offset).limit(limit)
+        sort_column = getattr(UsageHistory, sort_by, UsageHistory.created_at)
+        query = query.order_by(sort_column.desc() if descending else sort_column.asc())
+        query = query.offset(offset).limit(limit)
 
     result = await db.execute(query)
     rows = result.all()
 
+    if keyset:
+        keyset_page = build_keyset_page(
+            rows, limit, lambda row: (row[0].created_at, row[0].id), page_cursor,
+            has_previous=offset > 0 if page_cursor is None else None
+        )
+        rows = keyset_page.items
+    else:
+        keyset_page = KeysetPage(items=rows)
+
     # ConversationListItem으로 변환
     items = []
     for row in rows:
@@ -213,7 +273,9 @@ async def get_conversations_simple(
         total=total,
         page=page,
         limit=limit,
-        total_pages=total_pages
+        total_pages=total_pages,
+        next_cursor=keyset_page.next_cursor,
+        prev_cursor=keyset_page.prev_cursor
     )
 
 
@@ -343,6 +405,8 @@ async def get_conversations(
     limit: int = Query(50, ge=1, le=10000, description="페이지당 항목 수 (최대 10000)"),
     sort_by: str = Query(default="created_at", description="정렬 필드"),
     order: str = Query(default="desc", description="정렬 방향 (asc/desc)"),
+    cursor: Optional[str] = Query(None, description="페이지 커서 (응답의 next_cursor / prev_cursor)"),
+    count: str = Query("exact", pattern="^(exact|approximate)$", description="전체 개수 계산 방식"),
     db: AsyncSession = Depends(get_db),
     principal: Principal = Depends(get_principal)
 ):
@@ -364,6 +428,8 @@ async def get_conversations(
         limit=limit,
         sort_by=sort_by,
         order=order,
+        cursor=cursor,
+        count=count,
         db=db
     )
 
@@ -406,10 +472,7 @@ async def export_conversations_excel(
     conditions = []
 
     # 날짜 필터
-    if start:
-        conditions.append(func.date(UsageHistory.created_at) >= start)
-    if end:
-        conditions.append(func.date(UsageHistory.created_at) <= end)
+    conditions.extend(date_range_filter(UsageHistory.created_at, start, end))
 
     # 대분류 필터
     if main_category and main_category != "전체":
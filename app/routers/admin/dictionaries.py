@@ -25,6 +25,7 @@ from app.schemas.dictionary import (
     DictionaryTermListResponse,
 )
 from app.services.excel_service import ExcelService
+from app.services.dictionary_service import dictionary_service
 
 router = APIRouter(prefix="/api/v1/admin/dictionaries", tags=["admin-dictionaries"])
 
@@ -97,6 +98,7 @@ async def create_dictionary(
     dictionary = Dictionary(**data.model_dump())
     db.add(dictionary)
     await db.commit()
+    await dictionary_service.notify_changed()
     await db.refresh(dictionary)
     return dictionary
 
@@ -121,6 +123,7 @@ async def update_dictionary(
         setattr(dictionary, key, value)
 
     await db.commit()
+    await dictionary_service.notify_changed()
     await db.refresh(dictionary)
     return dictionary
 
@@ -141,6 +144,7 @@ async def delete_dictionary(
 
     await db.delete(dictionary)
     await db.commit()
+    await dictionary_service.notify_changed()
 
     return {"message": "사전이 삭제되었습니다", "dict_id": dict_id}
 
@@ -232,6 +236,7 @@ async def create_dictionary_term(
     term = DictionaryTerm(**data.model_dump())
     db.add(term)
     await db.commit()
+    await dictionary_service.notify_changed()
     await db.refresh(term)
     return term
 
@@ -256,6 +261,7 @@ async def update_dictionary_term(
         setattr(term, key, value)
 
     await db.commit()
+    await dictionary_service.notify_changed()
     await db.refresh(term)
     return term
 
@@ -276,6 +282,7 @@ async def delete_dictionary_term(
 
     await db.delete(term)
     await db.commit()
+    await dictionary_service.notify_changed()
 
     return {"message": "용어가 삭제되었습니다", "term_id": term_id}
 
@@ -290,6 +297,7 @@ async def delete_dictionary_terms_batch(
     query = delete(DictionaryTerm).where(DictionaryTerm.term_id.in_(term_ids))
     result = await db.execute(query)
     await db.commit()
+    await dictionary_service.notify_changed()
 
     return {
         "message": f"{result.rowcount}개 용어가 삭제되었습니다",
@@ -17,6 +17,7 @@ from app.schemas.document_permission import (
 )
 from app.core.database import get_db
 from app.dependencies import require_permission, get_principal
+from app.services.vector_permission_sync import vector_permission_sync
 from cerbos.sdk.model import Principal
 
 
@@ -150,6 +151,7 @@ async def create_document_permission(
     db_doc_perm = DocumentPermission(**doc_perm.model_dump())
     db.add(db_doc_perm)
     await db.commit()
+    vector_permission_sync.mark_dirty([db_doc_perm.document_id])
     await db.refresh(
         db_doc_perm,
         attribute_names=['department', 'approval_line']
@@ -491,6 +493,7 @@ async def update_document_permission(
         setattr(db_doc_perm, field, value)
 
     await db.commit()
+    vector_permission_sync.mark_dirty([db_doc_perm.document_id])
     await db.refresh(
         db_doc_perm,
         attribute_names=['department', 'approval_line']
@@ -512,5 +515,7 @@ async def delete_document_permission(
     if not db_doc_perm:
         raise HTTPException(status_code=404, detail="문서 권한을 찾을 수 없습니다")
 
+    document_id = db_doc_perm.document_id
     await db.delete(db_doc_perm)
     await db.commit()
+    vector_permission_sync.mark_dirty([document_id])
@@ -11,7 +11,8 @@ from datetime import date
 from typing import Optional
 
 from app.models import Notice, UsageHistory, SatisfactionSurvey
-from app.core.database import get_db
+from app.core.database import get_analytics_db
+from app.utils.date_range import date_range_filter
 from app.dependencies import require_permission
 from cerbos.sdk.model import Principal
 
@@ -20,7 +21,7 @@ router = APIRouter(prefix="/api/v1/admin/export", tags=["admin-export"])
 
 @router.get("/notices")
 async def export_notices(
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_analytics_db),
     principal: Principal = Depends(require_permission("notice", "read"))
 ):
     """
@@ -59,7 +60,7 @@ async def export_notices(
 
 @router.get("/usage")
 async def export_usage(
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_analytics_db),
     principal: Principal = Depends(require_permission("usage_history", "read")),
     start_date: Optional[date] = Query(None, description="시작 날짜 (YYYY-MM-DD)"),
     end_date: Optional[date] = Query(None, description="종료 날짜 (YYYY-MM-DD)"),
@@ -79,15 +80,7 @@ async def export_usage(
     query = select(UsageHistory)
 
     # 날짜 범위 필터
-    if start_date:
-        from datetime import datetime, timezone
-        start_datetime = datetime.combine(start_date, datetime.min.time()).replace(tzinfo=timezone.utc)
-        query = query.where(UsageHistory.created_at >= start_datetime)
-
-    if end_date:
-        from datetime import datetime, timezone
-        end_datetime = datetime.combine(end_date, datetime.max.time()).replace(tzinfo=timezone.utc)
-        query = query.where(UsageHistory.created_at <= end_datetime)
+    query = query.where(*date_range_filter(UsageHistory.created_at, start_date, end_date))
 
     # 사용자 필터
     if user_id:
@@ -140,7 +133,7 @@ async def export_usage(
 
 @router.get("/satisfaction")
 async def export_satisfaction(
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_analytics_db),
     principal: Principal = Depends(require_permission("satisfaction", "read"))
 ):
     """
@@ -10,6 +10,7 @@ from pydantic import BaseModel, Field
 
 from app.models.ip_whitelist import IPWhitelist
 from app.services.ip_access import IPAccessService
+from app.services.ip_allowlist import ip_allowlist
 from app.core.database import get_db
 from app.dependencies import require_permission
 from cerbos.sdk.model import Principal
@@ -20,7 +21,7 @@ router = APIRouter(prefix="/api/v1/admin/ip-whitelist", tags=["admin-ip"])
 
 class IPWhitelistCreate(BaseModel):
     """IP 추가 요청"""
-    ip_address: str = Field(..., description="IP 주소 (IPv4/IPv6)")
+    ip_address: str = Field(..., description="IP 주소 또는 CIDR 대역 (IPv4/IPv6, 예: 10.10.0.0/16)")
     description: Optional[str] = Field(None, description="설명")
     is_allowed: bool = Field(True, description="액세스 허용 여부")
 
@@ -103,6 +104,29 @@ async def add_ip_whitelist(
     return ip_entry
 
 
+class IPRuleStatsResponse(BaseModel):
+    """IP 규칙별 적중 통계"""
+    id: int
+    network: str
+    is_allowed: bool
+    hits: int
+    denies: int
+
+
+@router.get("/stats", response_model=List[IPRuleStatsResponse])
+async def get_ip_whitelist_stats(
+    principal: Principal = Depends(require_permission("ip_whitelist", "view"))
+):
+    """
+    IP 규칙별 허용/차단 횟수를 조회합니다. (현재 워커 기동 이후, 적중 많은 순)
+
+    시큐어 코딩:
+    - 권한 검증: Cerbos를 통한 조회 권한 확인
+    """
+    await ip_allowlist.ensure_loaded()
+    return ip_allowlist.rule_metrics()
+
+
 @router.get("/{ip_id}", response_model=IPWhitelistResponse)
 async def get_ip_whitelist(
     ip_id: int,
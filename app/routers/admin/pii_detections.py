@@ -8,15 +8,17 @@ from sqlalchemy import select, func
 from typing import List
 import json
 
-from app.models.pii_detection import PIIDetectionResult, PIIStatus
+from app.models.pii_detection import PIIDetectionResult, PIIStatus, PIIScanJob
 from app.models.document import Document
 from app.schemas.pii_detection import (
     PIIDetectionResultResponse,
     PIIApprovalRequest,
     PIIDetectionListResponse,
-    PIIMatchSchema
+    PIIMatchSchema,
+    PIIScanJobResponse
 )
 from app.services.pii_scanner import PIIScanner
+from app.services.pii_bulk_scanner import pii_bulk_scanner
 from app.core.database import get_db
 from app.dependencies import require_permission, get_principal
 from cerbos.sdk.model import Principal
@@ -64,6 +66,79 @@ async def scan_document(
     )
 
 
+def _scan_job_response(job: PIIScanJob) -> PIIScanJobResponse:
+    processed = job.scanned_count + job.skipped_count
+    total = job.total_documents or 0
+    return PIIScanJobResponse(
+        id=job.id,
+        status=job.status,
+        running_here=pii_bulk_scanner.is_running(job.id),
+        total_documents=total,
+        processed_documents=processed,
+        scanned_count=job.scanned_count,
+        skipped_count=job.skipped_count,
+        detected_count=job.detected_count,
+        last_document_id=job.last_document_id,
+        progress_percent=round(min(processed / total * 100, 100.0), 1) if total else 0.0,
+        error_message=job.error_message,
+        created_at=job.created_at,
+        updated_at=job.updated_at,
+        finished_at=job.finished_at
+    )
+
+
+@router.post("/bulk-scan", response_model=PIIScanJobResponse)
+async def start_bulk_scan(
+    principal: Principal = Depends(require_permission("document", "update"))
+):
+    """
+    전체 문서 일괄 PII 검사를 시작합니다.
+
+    진행 중인 작업이 있으면 새로 만들지 않고 마지막 체크포인트부터 재개합니다.
+    내용이 바뀌지 않은 문서는 재검사하지 않습니다.
+
+    시큐어 코딩:
+    - 권한 검증: Cerbos를 통한 문서 수정 권한 확인
+    """
+    job = await pii_bulk_scanner.start()
+    return _scan_job_response(job)
+
+
+@router.get("/bulk-scan/{job_id}", response_model=PIIScanJobResponse)
+async def get_bulk_scan_progress(
+    job_id: int,
+    db: AsyncSession = Depends(get_db),
+    principal: Principal = Depends(require_permission("pii_detection", "view"))
+):
+    """
+    일괄 PII 검사 진행 상황을 조회합니다.
+
+    시큐어 코딩:
+    - 권한 검증: Cerbos를 통한 PII 조회 권한 확인
+    """
+    job = await db.get(PIIScanJob, job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="PII 검사 작업을 찾을 수 없습니다")
+    return _scan_job_response(job)
+
+
+@router.post("/bulk-scan/{job_id}/cancel", response_model=PIIScanJobResponse)
+async def cancel_bulk_scan(
+    job_id: int,
+    principal: Principal = Depends(require_permission("document", "update"))
+):
+    """
+    일괄 PII 검사를 중단합니다. (현재 배치까지 저장)
+
+    시큐어 코딩:
+    - 권한 검증: Cerbos를 통한 문서 수정 권한 확인
+    """
+    job = await pii_bulk_scanner.cancel(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="PII 검사 작업을 찾을 수 없습니다")
+    return _scan_job_response(job)
+
+
 @router.get("/", response_model=PIIDetectionListResponse)
 async def list_pii_detections(
     status: PIIStatus | None = Query(None, description="처리 상태 필터"),
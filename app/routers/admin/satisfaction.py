@@ -1,7 +1,7 @@
 """
 만족도 조사 조회 API 엔드포인트 (읽기 전용)
 """
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func
 from typing import List, Optional
@@ -10,6 +10,13 @@ from app.models import SatisfactionSurvey
 from app.schemas.satisfaction import SatisfactionResponse
 from app.core.database import get_db
 from app.dependencies import get_principal
+from app.utils.pagination import (
+    KeysetPage,
+    apply_keyset,
+    approximate_count,
+    build_keyset_page,
+    decode_cursor,
+)
 from cerbos.sdk.model import Principal
 
 router = APIRouter(prefix="/api/v1/admin/satisfaction", tags=["admin-satisfaction"])
@@ -24,6 +31,8 @@ async def list_satisfaction(
     user_id: Optional[str] = Query(None, description="사용자 ID 필터"),
     sort_by: Optional[str] = Query("created_at", description="정렬 필드"),
     order: Optional[str] = Query("desc", description="정렬 방향 (asc/desc)"),
+    cursor: Optional[str] = Query(None, description="페이지 커서 (응답의 next_cursor / prev_cursor)"),
+    count: str = Query("exact", pattern="^(exact|approximate)$", description="전체 개수 계산 방식"),
     db: AsyncSession = Depends(get_db),
     principal: Principal = Depends(get_principal)
 ):
@@ -32,7 +41,14 @@ async def list_satisfaction(
 
     - 평점, 피드백, 카테고리 등 조회
     - 필터링, 페이지네이션, 정렬 지원
+    - created_at 정렬 시 next_cursor / prev_cursor 반환 (cursor 지정 시 skip 무시)
+    - count=approximate: 필터가 없으면 pg_class 통계 추정값 사용
     """
+    keyset = sort_by == "created_at"
+    page_cursor = decode_cursor(cursor)
+    if page_cursor is not None and not keyset:
+        raise HTTPException(status_code=400, detail="cursor는 created_at 정렬에서만 사용할 수 있습니다")
+
     query = select(SatisfactionSurvey)
 
     # 필터
@@ -44,23 +60,37 @@ async def list_satisfaction(
         query = query.filter(SatisfactionSurvey.user_id == user_id)
 
     # 전체 개수
-    count_query = select(func.count()).select_from(query.subquery())
-    total_result = await db.execute(count_query)
-    total = total_result.scalar()
-
-    # 정렬 처리
-    sort_column = getattr(SatisfactionSurvey, sort_by, SatisfactionSurvey.created_at)
-    if order.lower() == "asc":
-        query = query.order_by(sort_column.asc())
+    total = None
+    if count == "approximate" and not (rating or category or user_id):
+        total = await approximate_count(db, SatisfactionSurvey.__tablename__)
+    if total is None:
+        count_query = select(func.count()).select_from(query.subquery())
+        total_result = await db.execute(count_query)
+        total = total_result.scalar()
+
+    # 정렬 및 페이징 (created_at은 (created_at, id) 커서 조회)
+    descending = order.lower() != "asc"
+    offset = skip if page_cursor is None else 0
+    if keyset:
+        query = apply_keyset(
+            query, SatisfactionSurvey.created_at, SatisfactionSurvey.id, page_cursor, limit, descending
+        ).offset(offset)
     else:
-        query = query.order_by(sort_column.desc())
-
-    # 페이징
-    query = query.offset(skip).limit(limit)
+        sort_column = getattr(SatisfactionSurvey, sort_by, SatisfactionSurvey.created_at)
+        query = query.order_by(sort_column.desc() if descending else sort_column.asc())
+        query = query.offset(offset).limit(limit)
 
     result = await db.execute(query)
     surveys = result.scalars().all()
 
+    page = KeysetPage(items=surveys)
+    if keyset:
+        page = build_keyset_page(
+            surveys, limit, lambda s: (s.created_at, s.id), page_cursor,
+            has_previous=offset > 0 if page_cursor is None else None
+        )
+    surveys = page.items
+
     return {
         "items": [
             {
@@ -76,7 +106,9 @@ async def list_satisfaction(
             }
             for s in surveys
         ],
-        "total": total
+        "total": total,
+        "next_cursor": page.next_cursor,
+        "prev_cursor": page.prev_cursor
     }
 
 
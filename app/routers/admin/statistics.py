@@ -5,16 +5,23 @@
 - Cerbos RBAC 기반 권한 검증
 - SQL Injection 방지 (SQLAlchemy ORM)
 - 날짜 형식 검증
+
+성능:
+- 추이 / 요약 / 모델별 통계는 usage_history 대신 시간별·일별 집계 테이블에서 조회
+  (app/services/usage_rollup.py)
 """
 from fastapi import APIRouter, Depends, Query, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, and_, extract, desc
+from sqlalchemy import select, func, and_, case, literal
 from datetime import datetime, date, timedelta
 from typing import List, Optional
 from collections import defaultdict
 
 from app.models import UsageHistory, SatisfactionSurvey, Document, Category
-from app.core.database import get_db
+from app.core.config import settings
+from app.core.database import get_analytics_db
+from app.services.usage_rollup import UsageAggregate, group_rollups, usage_rollup
+from app.utils.date_range import date_range_filter
 from app.dependencies import get_principal, get_cerbos_client, check_resource_permission
 from cerbos.sdk.model import Principal, Resource
 from cerbos.sdk.client import AsyncCerbosClient
@@ -24,6 +31,9 @@ router = APIRouter(prefix="/api/v1/admin/statistics", tags=["admin-statistics"])
 # Date format constant
 DATE_FORMAT = "%Y-%m-%d"
 
+# 상위 N개 밖의 항목을 합산하는 묶음 이름
+OTHER_LABEL = "그 외"
+
 
 # Helper function to parse date
 def _parse_date_param(date_str: str, param_name: str) -> date:
@@ -49,11 +59,47 @@ def _parse_date_param(date_str: str, param_name: str) -> date:
         )
 
 
+def build_top_n_query(key, filters: list, limit: int):
+    """
+    key별 질문 수 / 응답 시간 집계 (상위 limit개 + 나머지는 OTHER_LABEL 한 행)
+
+    집계와 순위 매기기를 모두 DB에서 수행하므로 결과 행 수는 limit + 1 이하입니다.
+
+    Args:
+        key: 묶을 컬럼 / 식
+        filters: usage_history WHERE 조건
+        limit: 개별로 반환할 상위 항목 수
+
+    Returns:
+        Select: (key, count, response_count, response_time_sum, rank) - 질문 수 내림차순
+    """
+    per_key = select(
+        key.label("key"),
+        func.count(UsageHistory.id).label("count"),
+        func.count(UsageHistory.response_time).label("response_count"),
+        func.coalesce(func.sum(UsageHistory.response_time), 0).label("response_time_sum"),
+    ).where(*filters).group_by("key").subquery()
+
+    ranked = select(
+        per_key,
+        func.row_number().over(order_by=(per_key.c.count.desc(), per_key.c.key)).label("rank"),
+    ).subquery()
+
+    bucket = case((ranked.c.rank <= limit, ranked.c.key), else_=literal(OTHER_LABEL)).label("key")
+    return select(
+        bucket,
+        func.sum(ranked.c.count).label("count"),
+        func.sum(ranked.c.response_count).label("response_count"),
+        func.sum(ranked.c.response_time_sum).label("response_time_sum"),
+        func.min(ranked.c.rank).label("rank"),
+    ).group_by(bucket).order_by("rank")
+
+
 @router.get("/summary")
 async def get_statistics_summary(
     start_date: Optional[str] = Query(None, description="시작 날짜 (YYYY-MM-DD)", regex=r"^\d{4}-\d{2}-\d{2}$"),
     end_date: Optional[str] = Query(None, description="종료 날짜 (YYYY-MM-DD)", regex=r"^\d{4}-\d{2}-\d{2}$"),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_analytics_db),
     principal: Principal = Depends(get_principal),
     cerbos: AsyncCerbosClient = Depends(get_cerbos_client)
 ):
@@ -71,55 +117,27 @@ async def get_statistics_summary(
     resource = Resource(id="summary", kind="statistics")
     await check_resource_permission(principal, resource, "read", cerbos)
 
-    # 날짜 필터링
-    query_filters = []
-    if start_date:
-        start_dt = _parse_date_param(start_date, "시작 날짜")
-        query_filters.append(UsageHistory.created_at >= datetime.combine(start_dt, datetime.min.time()))
-
-    if end_date:
-        end_dt = _parse_date_param(end_date, "종료 날짜")
-        query_filters.append(UsageHistory.created_at < datetime.combine(end_dt + timedelta(days=1), datetime.min.time()))
-
-    # 총 질문 수
-    total_questions_query = select(func.count(UsageHistory.id))
-    if query_filters:
-        total_questions_query = total_questions_query.filter(and_(*query_filters))
+    start_dt = _parse_date_param(start_date, "시작 날짜") if start_date else None
+    end_dt = _parse_date_param(end_date, "종료 날짜") if end_date else None
 
-    total_questions_result = await db.execute(total_questions_query)
-    total_questions = total_questions_result.scalar() or 0
-
-    # 평균 응답시간 (밀리초)
-    avg_response_query = select(func.avg(UsageHistory.response_time)).filter(
-        UsageHistory.response_time.isnot(None)
-    )
-    if query_filters:
-        avg_response_query = avg_response_query.filter(and_(*query_filters))
-
-    avg_response_result = await db.execute(avg_response_query)
-    avg_response_time = avg_response_result.scalar() or 0
+    # 총 질문 수 / 평균 응답시간 (일별 집계 합산)
+    totals = UsageAggregate()
+    for row in await usage_rollup.fetch(db, "daily", start_dt, end_dt):
+        totals.merge(row.totals)
+    total_questions = totals.question_count
+    avg_response_time = totals.average_response_time
 
     # 고유 사용자 수
-    unique_users_query = select(func.count(func.distinct(UsageHistory.user_id)))
-    if query_filters:
-        unique_users_query = unique_users_query.filter(and_(*query_filters))
-
-    unique_users_result = await db.execute(unique_users_query)
-    unique_users = unique_users_result.scalar() or 0
+    unique_users = len(await usage_rollup.fetch_users(db, start_dt, end_dt))
 
     # 일평균 계산
-    if start_date and end_date:
-        start_dt = _parse_date_param(start_date, "시작 날짜")
-        end_dt = _parse_date_param(end_date, "종료 날짜")
+    if start_dt and end_dt:
         days_diff = max((end_dt - start_dt).days + 1, 1)
     else:
-        # 전체 기간에 대한 일평균 (첫 레코드부터 현재까지)
-        first_record_query = select(func.min(UsageHistory.created_at))
-        first_record_result = await db.execute(first_record_query)
-        first_record_date = first_record_result.scalar()
-
-        if first_record_date:
-            days_diff = max((datetime.utcnow().date() - first_record_date.date()).days + 1, 1)
+        # 전체 기간에 대한 일평균 (첫 집계일부터 현재까지)
+        first_day = await usage_rollup.first_day(db)
+        if first_day:
+            days_diff = max((datetime.now(usage_rollup.tz).date() - first_day).days + 1, 1)
         else:
             days_diff = 1
 
@@ -137,7 +155,7 @@ async def get_statistics_summary(
 async def get_hourly_statistics(
     start_date: str = Query(..., description="시작 날짜 (YYYY-MM-DD)", regex=r"^\d{4}-\d{2}-\d{2}$"),
     end_date: str = Query(..., description="종료 날짜 (YYYY-MM-DD)", regex=r"^\d{4}-\d{2}-\d{2}$"),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_analytics_db),
     principal: Principal = Depends(get_principal),
     cerbos: AsyncCerbosClient = Depends(get_cerbos_client)
 ):
@@ -153,26 +171,15 @@ async def get_hourly_statistics(
     start_dt = _parse_date_param(start_date, "시작 날짜")
     end_dt = _parse_date_param(end_date, "종료 날짜")
 
-    # 시간별 집계
-    hourly_query = select(
-        extract('hour', UsageHistory.created_at).label('hour'),
-        func.count(UsageHistory.id).label('count'),
-        func.avg(UsageHistory.response_time).label('avg_response_time')
-    ).filter(
-        and_(
-            UsageHistory.created_at >= datetime.combine(start_dt, datetime.min.time()),
-            UsageHistory.created_at < datetime.combine(end_dt + timedelta(days=1), datetime.min.time())
-        )
-    ).group_by('hour').order_by('hour')
-
-    result = await db.execute(hourly_query)
+    # 시간별 집계 (집계 시간대 기준 0~23시)
+    rows = await usage_rollup.fetch(db, "hourly", start_dt, end_dt)
 
     hourly_stats = []
-    for row in result:
+    for hour, totals in group_rollups(rows, lambda r: usage_rollup.local_hour(r.bucket)).items():
         hourly_stats.append({
-            "hour": int(row.hour),
-            "count": row.count,
-            "average_response_time": round(row.avg_response_time or 0, 2)
+            "hour": hour,
+            "count": totals.question_count,
+            "average_response_time": round(totals.average_response_time, 2)
         })
 
     return hourly_stats
@@ -182,7 +189,7 @@ async def get_hourly_statistics(
 async def get_daily_statistics(
     start_date: str = Query(..., description="시작 날짜 (YYYY-MM-DD)", regex=r"^\d{4}-\d{2}-\d{2}$"),
     end_date: str = Query(..., description="종료 날짜 (YYYY-MM-DD)", regex=r"^\d{4}-\d{2}-\d{2}$"),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_analytics_db),
     principal: Principal = Depends(get_principal),
     cerbos: AsyncCerbosClient = Depends(get_cerbos_client)
 ):
@@ -199,27 +206,16 @@ async def get_daily_statistics(
     end_dt = _parse_date_param(end_date, "종료 날짜")
 
     # 일별 집계
-    daily_query = select(
-        func.date(UsageHistory.created_at).label('date'),
-        func.count(UsageHistory.id).label('count'),
-        func.avg(UsageHistory.response_time).label('avg_response_time'),
-        func.count(func.distinct(UsageHistory.user_id)).label('unique_users')
-    ).filter(
-        and_(
-            func.date(UsageHistory.created_at) >= start_dt,
-            func.date(UsageHistory.created_at) <= end_dt
-        )
-    ).group_by(func.date(UsageHistory.created_at)).order_by('date')
-
-    result = await db.execute(daily_query)
+    rows = await usage_rollup.fetch(db, "daily", start_dt, end_dt)
+    user_counts = await usage_rollup.fetch_daily_user_counts(db, start_dt, end_dt)
 
     daily_stats = []
-    for row in result:
+    for day, totals in group_rollups(rows, lambda r: r.bucket).items():
         daily_stats.append({
-            "date": str(row.date),
-            "count": row.count,
-            "average_response_time": round(row.avg_response_time or 0, 2),
-            "unique_users": row.unique_users
+            "date": str(day),
+            "count": totals.question_count,
+            "average_response_time": round(totals.average_response_time, 2),
+            "unique_users": user_counts.get(day, 0)
         })
 
     return daily_stats
@@ -228,7 +224,7 @@ async def get_daily_statistics(
 @router.get("/weekly")
 async def get_weekly_statistics(
     weeks: int = Query(4, ge=1, le=52, description="조회할 주 수"),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_analytics_db),
     principal: Principal = Depends(get_principal),
     cerbos: AsyncCerbosClient = Depends(get_cerbos_client)
 ):
@@ -241,33 +237,23 @@ async def get_weekly_statistics(
     resource = Resource(id="weekly", kind="statistics")
     await check_resource_permission(principal, resource, "read", cerbos)
 
-    # 주별 데이터 생성
-    weekly_stats = []
-    today = date.today()
+    # 오늘을 마지막 날로 하는 7일 단위 구간 (일별 집계를 한 번에 조회)
+    today = datetime.now(usage_rollup.tz).date()
+    first_day = today - timedelta(days=weeks * 7 - 1)
+    rows = await usage_rollup.fetch(db, "daily", first_day, today)
+    by_week = group_rollups(rows, lambda r: (today - r.bucket).days // 7)
 
-    for i in range(weeks):
+    weekly_stats = []
+    for i in reversed(range(weeks)):
         week_end = today - timedelta(days=i * 7)
         week_start = week_end - timedelta(days=6)
+        totals = by_week.get(i, UsageAggregate())
 
-        # 해당 주의 데이터 집계
-        week_query = select(
-            func.count(UsageHistory.id).label('count'),
-            func.avg(UsageHistory.response_time).label('avg_response_time')
-        ).filter(
-            and_(
-                func.date(UsageHistory.created_at) >= week_start,
-                func.date(UsageHistory.created_at) <= week_end
-            )
-        )
-
-        result = await db.execute(week_query)
-        row = result.one()
-
-        weekly_stats.insert(0, {
+        weekly_stats.append({
             "week_start": str(week_start),
             "week_end": str(week_end),
-            "count": row.count or 0,
-            "average_response_time": round(row.avg_response_time or 0, 2)
+            "count": totals.question_count,
+            "average_response_time": round(totals.average_response_time, 2)
         })
 
     return weekly_stats
@@ -276,7 +262,7 @@ async def get_weekly_statistics(
 @router.get("/monthly")
 async def get_monthly_statistics(
     months: int = Query(12, ge=1, le=24, description="조회할 월 수"),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_analytics_db),
     principal: Principal = Depends(get_principal),
     cerbos: AsyncCerbosClient = Depends(get_cerbos_client)
 ):
@@ -289,28 +275,21 @@ async def get_monthly_statistics(
     resource = Resource(id="monthly", kind="statistics")
     await check_resource_permission(principal, resource, "read", cerbos)
 
-    # 월별 집계
-    monthly_query = select(
-        extract('year', UsageHistory.created_at).label('year'),
-        extract('month', UsageHistory.created_at).label('month'),
-        func.count(UsageHistory.id).label('count'),
-        func.avg(UsageHistory.response_time).label('avg_response_time')
-    ).group_by('year', 'month').order_by(desc('year'), desc('month')).limit(months)
-
-    result = await db.execute(monthly_query)
+    # 최근 N개월 (이번 달 포함) 일별 집계를 월별로 합산
+    today = datetime.now(usage_rollup.tz).date()
+    month_index = today.year * 12 + today.month - 1 - (months - 1)
+    first_day = date(month_index // 12, month_index % 12 + 1, 1)
+    rows = await usage_rollup.fetch(db, "daily", first_day, today)
 
     monthly_stats = []
-    for row in result:
+    for (year, month), totals in group_rollups(rows, lambda r: (r.bucket.year, r.bucket.month)).items():
         monthly_stats.append({
-            "year": int(row.year),
-            "month": int(row.month),
-            "count": row.count,
-            "average_response_time": round(row.avg_response_time or 0, 2)
+            "year": year,
+            "month": month,
+            "count": totals.question_count,
+            "average_response_time": round(totals.average_response_time, 2)
         })
 
-    # 최신순 정렬을 역순으로 (오래된 것부터)
-    monthly_stats.reverse()
-
     return monthly_stats
 
 
@@ -318,14 +297,16 @@ async def get_monthly_statistics(
 async def get_statistics_by_department(
     start_date: Optional[str] = Query(None, description="시작 날짜 (YYYY-MM-DD)", regex=r"^\d{4}-\d{2}-\d{2}$"),
     end_date: Optional[str] = Query(None, description="종료 날짜 (YYYY-MM-DD)", regex=r"^\d{4}-\d{2}-\d{2}$"),
-    db: AsyncSession = Depends(get_db),
+    limit: int = Query(20, ge=1, le=100, description="개별로 표시할 상위 부서 수 (나머지는 '그 외')"),
+    db: AsyncSession = Depends(get_analytics_db),
     principal: Principal = Depends(get_principal),
     cerbos: AsyncCerbosClient = Depends(get_cerbos_client)
 ):
     """
     부서별 통계 조회
 
-    usage_metadata.department에서 부서 정보 추출
+    usage_metadata.department 생성 컬럼(usage_history.department) 기준 GROUP BY
+    상위 limit개 부서 + 나머지 합산 1행
 
     **권한 필요**: statistics:read
     """
@@ -334,106 +315,67 @@ async def get_statistics_by_department(
     await check_resource_permission(principal, resource, "read", cerbos)
 
     # 날짜 필터링
-    query_filters = []
-    if start_date:
-        start_dt = _parse_date_param(start_date, "시작 날짜")
-        query_filters.append(UsageHistory.created_at >= datetime.combine(start_dt, datetime.min.time()))
-
-    if end_date:
-        end_dt = _parse_date_param(end_date, "종료 날짜")
-        query_filters.append(UsageHistory.created_at < datetime.combine(end_dt + timedelta(days=1), datetime.min.time()))
-
-    # 모든 사용 이력 조회
-    usage_query = select(UsageHistory)
-    if query_filters:
-        usage_query = usage_query.filter(and_(*query_filters))
+    start_dt = _parse_date_param(start_date, "시작 날짜") if start_date else None
+    end_dt = _parse_date_param(end_date, "종료 날짜") if end_date else None
+    query_filters = date_range_filter(UsageHistory.created_at, start_dt, end_dt)
 
-    result = await db.execute(usage_query)
-    all_usage = result.scalars().all()
+    # 부서별 집계 (부서 정보 없으면 미분류)
+    department = func.coalesce(UsageHistory.department, "미분류")
+    result = await db.execute(build_top_n_query(department, query_filters, limit))
 
-    # Python에서 부서별로 집계
-    dept_stats_dict = defaultdict(lambda: {"count": 0, "total_response_time": 0, "response_times": []})
-
-    for usage in all_usage:
-        # usage_metadata에서 부서 정보 추출
-        department = "미분류"
-        if usage.usage_metadata and isinstance(usage.usage_metadata, dict):
-            department = usage.usage_metadata.get("department", "미분류")
-
-        dept_stats_dict[department]["count"] += 1
-        if usage.response_time:
-            dept_stats_dict[department]["response_times"].append(usage.response_time)
-
-    # 결과 생성
     dept_stats = []
-    for dept, stats in dept_stats_dict.items():
-        avg_response = (
-            sum(stats["response_times"]) / len(stats["response_times"])
-            if stats["response_times"] else 0
-        )
+    for row in result:
         dept_stats.append({
-            "department": dept,
-            "department_name": dept,
-            "count": stats["count"],
-            "average_response_time": round(avg_response, 2)
+            "department": row.key,
+            "department_name": row.key,
+            "count": row.count,
+            "average_response_time": round(row.response_time_sum / row.response_count, 2) if row.response_count else 0
         })
 
-    # count 기준으로 정렬 후 상위 20개
-    dept_stats.sort(key=lambda x: x["count"], reverse=True)
-    return dept_stats[:20]
+    return dept_stats
 
 
 @router.get("/by-model")
 async def get_statistics_by_model(
     start_date: Optional[str] = Query(None, description="시작 날짜 (YYYY-MM-DD)", regex=r"^\d{4}-\d{2}-\d{2}$"),
     end_date: Optional[str] = Query(None, description="종료 날짜 (YYYY-MM-DD)", regex=r"^\d{4}-\d{2}-\d{2}$"),
-    db: AsyncSession = Depends(get_db),
+    limit: int = Query(20, ge=1, le=100, description="개별로 표시할 상위 모델 수 (나머지는 '그 외')"),
+    db: AsyncSession = Depends(get_analytics_db),
     principal: Principal = Depends(get_principal),
     cerbos: AsyncCerbosClient = Depends(get_cerbos_client)
 ):
     """
     모델별 통계 조회
 
+    일별 집계 기준, 상위 limit개 모델 + 나머지 합산 1행
+
     **권한 필요**: statistics:read
     """
     # 권한 검증
     resource = Resource(id="by-model", kind="statistics")
     await check_resource_permission(principal, resource, "read", cerbos)
 
-    # 날짜 필터링
-    query_filters = []
-    if start_date:
-        start_dt = _parse_date_param(start_date, "시작 날짜")
-        query_filters.append(UsageHistory.created_at >= datetime.combine(start_dt, datetime.min.time()))
-
-    if end_date:
-        end_dt = _parse_date_param(end_date, "종료 날짜")
-        query_filters.append(UsageHistory.created_at < datetime.combine(end_dt + timedelta(days=1), datetime.min.time()))
-
-    # 모델별 집계
-    model_query = select(
-        UsageHistory.model_name,
-        func.count(UsageHistory.id).label('count'),
-        func.avg(UsageHistory.response_time).label('avg_response_time'),
-        func.sum(UsageHistory.response_time).label('total_response_time')
-    ).filter(
-        UsageHistory.model_name.isnot(None)
-    )
-
-    if query_filters:
-        model_query = model_query.filter(and_(*query_filters))
+    start_dt = _parse_date_param(start_date, "시작 날짜") if start_date else None
+    end_dt = _parse_date_param(end_date, "종료 날짜") if end_date else None
 
-    model_query = model_query.group_by(UsageHistory.model_name).order_by(desc('count'))
+    # 모델별 집계 (모델명이 없는 행 제외)
+    rows = await usage_rollup.fetch(db, "daily", start_dt, end_dt)
+    by_model = group_rollups((r for r in rows if r.model_name), lambda r: r.model_name)
 
-    result = await db.execute(model_query)
+    ranked = sorted(by_model.items(), key=lambda item: item[1].question_count, reverse=True)
+    if len(ranked) > limit:
+        other = UsageAggregate()
+        for _, totals in ranked[limit:]:
+            other.merge(totals)
+        ranked = ranked[:limit] + [(OTHER_LABEL, other)]
 
     model_stats = []
-    for row in result:
+    for model_name, totals in ranked:
         model_stats.append({
-            "model_name": row.model_name or "Unknown",
-            "count": row.count,
-            "average_response_time": round(row.avg_response_time or 0, 2),
-            "total_response_time": round(row.total_response_time or 0, 2)
+            "model_name": model_name,
+            "count": totals.question_count,
+            "average_response_time": round(totals.average_response_time, 2),
+            "total_response_time": round(totals.response_time_sum, 2)
         })
 
     return model_stats
@@ -443,7 +385,7 @@ async def get_statistics_by_model(
 async def get_error_reports_daily(
     start_date: Optional[str] = Query(None, description="시작 날짜 (YYYY-MM-DD)", regex=r"^\d{4}-\d{2}-\d{2}$"),
     end_date: Optional[str] = Query(None, description="종료 날짜 (YYYY-MM-DD)", regex=r"^\d{4}-\d{2}-\d{2}$"),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_analytics_db),
     principal: Principal = Depends(get_principal),
     cerbos: AsyncCerbosClient = Depends(get_cerbos_client)
 ):
@@ -459,25 +401,19 @@ async def get_error_reports_daily(
     await check_resource_permission(principal, resource, "read", cerbos)
 
     # 날짜 필터링
-    query_filters = []
-    if start_date:
-        start_dt = _parse_date_param(start_date, "시작 날짜")
-        query_filters.append(SatisfactionSurvey.created_at >= datetime.combine(start_dt, datetime.min.time()))
-
-    if end_date:
-        end_dt = _parse_date_param(end_date, "종료 날짜")
-        query_filters.append(SatisfactionSurvey.created_at < datetime.combine(end_dt + timedelta(days=1), datetime.min.time()))
+    start_dt = _parse_date_param(start_date, "시작 날짜") if start_date else None
+    end_dt = _parse_date_param(end_date, "종료 날짜") if end_date else None
+    query_filters = date_range_filter(SatisfactionSurvey.created_at, start_dt, end_dt)
 
     # 오류 신고: rating <= 2 (1~2점)
     query_filters.append(SatisfactionSurvey.rating <= 2)
 
     # 일별 오류 신고 수 집계
+    # 날짜는 STATS_TIMEZONE 기준 (필터 범위와 같은 기준으로 묶음)
     error_query = select(
-        func.date(SatisfactionSurvey.created_at).label('date'),
+        func.date(func.timezone(settings.STATS_TIMEZONE, SatisfactionSurvey.created_at)).label('date'),
         func.count(SatisfactionSurvey.id).label('count')
-    ).filter(and_(*query_filters)).group_by(
-        func.date(SatisfactionSurvey.created_at)
-    ).order_by(func.date(SatisfactionSurvey.created_at))
+    ).filter(and_(*query_filters)).group_by("date").order_by("date")
 
     result = await db.execute(error_query)
 
@@ -493,7 +429,7 @@ async def get_error_reports_daily(
 
 @router.get("/documents-by-category")
 async def get_documents_by_category(
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_analytics_db),
     principal: Principal = Depends(get_principal),
     cerbos: AsyncCerbosClient = Depends(get_cerbos_client)
 ):
@@ -544,7 +480,7 @@ async def get_documents_by_category(
 async def get_questions_by_field(
     start_date: Optional[str] = Query(None, description="시작 날짜 (YYYY-MM-DD)", regex=r"^\d{4}-\d{2}-\d{2}$"),
     end_date: Optional[str] = Query(None, description="종료 날짜 (YYYY-MM-DD)", regex=r"^\d{4}-\d{2}-\d{2}$"),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_analytics_db),
     principal: Principal = Depends(get_principal),
     cerbos: AsyncCerbosClient = Depends(get_cerbos_client)
 ):
@@ -563,24 +499,11 @@ async def get_questions_by_field(
     await check_resource_permission(principal, resource, "read", cerbos)
 
     # 날짜 필터링
-    query_filters = []
-    if start_date:
-        start_dt = _parse_date_param(start_date, "시작 날짜")
-        query_filters.append(UsageHistory.created_at >= datetime.combine(start_dt, datetime.min.time()))
+    start_dt = _parse_date_param(start_date, "시작 날짜") if start_date else None
+    end_dt = _parse_date_param(end_date, "종료 날짜") if end_date else None
+    query_filters = date_range_filter(UsageHistory.created_at, start_dt, end_dt)
 
-    if end_date:
-        end_dt = _parse_date_param(end_date, "종료 날짜")
-        query_filters.append(UsageHistory.created_at < datetime.combine(end_dt + timedelta(days=1), datetime.min.time()))
-
-    # 전체 질문 수
-    total_query = select(func.count(UsageHistory.id))
-    if query_filters:
-        total_query = total_query.filter(and_(*query_filters))
-
-    total_result = await db.execute(total_query)
-    total_questions = total_result.scalar() or 0
-
-    # 실제 main_category와 sub_category 기반 통계
+    # 실제 main_category와 sub_category 기반 통계 (DB GROUP BY, 결과는 분류 조합 수만큼)
     category_query = select(
         UsageHistory.main_category,
         UsageHistory.sub_category,
@@ -597,6 +520,9 @@ async def get_questions_by_field(
     category_result = await db.execute(category_query)
     category_rows = category_result.all()
 
+    # 전체 질문 수 = 분류 조합별 질문 수 합 (NULL 분류도 한 그룹으로 집계됨)
+    total_questions = sum(count for _, _, count in category_rows)
+
     # 카테고리별 데이터 집계
     stats_by_main = defaultdict(lambda: {"total": 0, "subcategories": defaultdict(int)})
 
@@ -5,33 +5,27 @@ TDD GREEN 단계: 테스트를 통과하는 최소 코드 작성
 """
 from fastapi import APIRouter, Depends, Query
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, extract, literal_column
+from sqlalchemy import select, func
 from typing import List, Optional
-from datetime import date, datetime, timedelta
+from datetime import date, datetime, timedelta, timezone
 import httpx
 import logging
 import time
 import psutil
 import subprocess
-import asyncpg
-import os
 from typing import Dict, Any
 
 from app.models import UsageHistory, SatisfactionSurvey, Notice
-from app.core.database import get_db
+from app.core.database import get_analytics_db
+from app.core.edb import edb_pool
+from app.services.usage_rollup import UsageAggregate, group_rollups, usage_rollup
+from app.utils.date_range import date_range_filter
 from app.dependencies import get_principal
 from cerbos.sdk.model import Principal
 from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
-# EDB 설정
-EDB_HOST = os.getenv("EDB_HOST", "host.docker.internal")
-EDB_PORT = int(os.getenv("EDB_PORT", "5444"))
-EDB_DATABASE = os.getenv("EDB_DATABASE", "AGENAI")
-EDB_USER = os.getenv("EDB_USER", "wisenut_dev")
-EDB_PASSWORD = os.getenv("EDB_PASSWORD", "express!12")
-
 # Server monitoring cache (30 seconds TTL for real-time data)
 _server_stats_cache = {
     "cpu_history": {"data": [], "timestamp": 0},
@@ -53,7 +47,7 @@ CACHE_TTL_SECONDS = 3600  # 1시간
 async def get_dashboard_stats(
     start: date = Query(..., description="시작 날짜 (YYYY-MM-DD)"),
     end: date = Query(..., description="종료 날짜 (YYYY-MM-DD)"),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_analytics_db),
     principal: Principal = Depends(get_principal)
 ):
     """
@@ -79,39 +73,19 @@ async def get_dashboard_stats(
         from fastapi import HTTPException
         raise HTTPException(status_code=400, detail="조회 기간은 1년을 초과할 수 없습니다")
 
-    # 기간 내 대화내역 필터
-    start_datetime = datetime.combine(start, datetime.min.time())
-    end_datetime = datetime.combine(end, datetime.max.time())
-
-    # 총 질문 수
-    total_questions_query = select(func.count(UsageHistory.id)).filter(
-        UsageHistory.created_at >= start_datetime,
-        UsageHistory.created_at <= end_datetime
-    )
-    total_questions_result = await db.execute(total_questions_query)
-    total_questions = total_questions_result.scalar() or 0
-
-    # 평균 응답 시간
-    avg_response_time_query = select(func.avg(UsageHistory.response_time)).filter(
-        UsageHistory.created_at >= start_datetime,
-        UsageHistory.created_at <= end_datetime,
-        UsageHistory.response_time.isnot(None)
-    )
-    avg_response_time_result = await db.execute(avg_response_time_query)
-    avg_response_time = avg_response_time_result.scalar() or 0
+    # 총 질문 수 / 평균 응답 시간 (일별 집계 합산)
+    totals = UsageAggregate()
+    for row in await usage_rollup.fetch(db, "daily", start, end):
+        totals.merge(row.totals)
+    total_questions = totals.question_count
+    avg_response_time = totals.average_response_time
 
     # 총 사용자 수 (고유 user_id)
-    total_users_query = select(func.count(func.distinct(UsageHistory.user_id))).filter(
-        UsageHistory.created_at >= start_datetime,
-        UsageHistory.created_at <= end_datetime
-    )
-    total_users_result = await db.execute(total_users_query)
-    total_users = total_users_result.scalar() or 0
+    total_users = len(await usage_rollup.fetch_users(db, start, end))
 
     # 평균 만족도
     avg_satisfaction_query = select(func.avg(SatisfactionSurvey.rating)).filter(
-        SatisfactionSurvey.created_at >= start_datetime,
-        SatisfactionSurvey.created_at <= end_datetime
+        *date_range_filter(SatisfactionSurvey.created_at, start, end)
     )
     avg_satisfaction_result = await db.execute(avg_satisfaction_query)
     avg_satisfaction = avg_satisfaction_result.scalar() or 0
@@ -128,7 +102,7 @@ async def get_dashboard_stats(
 async def get_daily_trend(
     start: date = Query(..., description="시작 날짜 (YYYY-MM-DD)"),
     end: date = Query(..., description="종료 날짜 (YYYY-MM-DD)"),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_analytics_db),
     principal: Principal = Depends(get_principal)
 ):
     """
@@ -147,33 +121,16 @@ async def get_daily_trend(
         from fastapi import HTTPException
         raise HTTPException(status_code=400, detail="종료 날짜는 시작 날짜보다 늦어야 합니다")
 
-    start_datetime = datetime.combine(start, datetime.min.time())
-    end_datetime = datetime.combine(end, datetime.max.time())
-
     # 일자별 질문 수 및 평균 응답 시간
-    query = select(
-        func.date(UsageHistory.created_at).label('date'),
-        func.count(UsageHistory.id).label('question_count'),
-        func.avg(UsageHistory.response_time).label('avg_response_time')
-    ).filter(
-        UsageHistory.created_at >= start_datetime,
-        UsageHistory.created_at <= end_datetime
-    ).group_by(
-        func.date(UsageHistory.created_at)
-    ).order_by(
-        func.date(UsageHistory.created_at).asc()
-    )
-
-    result = await db.execute(query)
-    rows = result.fetchall()
+    rows = await usage_rollup.fetch(db, "daily", start, end)
 
     items = [
         {
-            "date": row.date.isoformat() if row.date else None,
-            "question_count": row.question_count or 0,
-            "avg_response_time": round(float(row.avg_response_time), 2) if row.avg_response_time else 0
+            "date": day.isoformat(),
+            "question_count": totals.question_count,
+            "avg_response_time": round(totals.average_response_time, 2)
         }
-        for row in rows
+        for day, totals in group_rollups(rows, lambda r: r.bucket).items()
     ]
 
     return {"items": items}
@@ -182,7 +139,7 @@ async def get_daily_trend(
 @router.get("/hourly-pattern")
 async def get_hourly_pattern(
     date: date = Query(..., description="조회 날짜 (YYYY-MM-DD)"),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_analytics_db),
     principal: Principal = Depends(get_principal)
 ):
     """
@@ -195,31 +152,15 @@ async def get_hourly_pattern(
       - hour: 시간 (0~23)
       - question_count: 질문 수
     """
-    start_datetime = datetime.combine(date, datetime.min.time())
-    end_datetime = datetime.combine(date, datetime.max.time())
-
     # 시간대별 질문 수
-    query = select(
-        extract('hour', UsageHistory.created_at).label('hour'),
-        func.count(UsageHistory.id).label('question_count')
-    ).filter(
-        UsageHistory.created_at >= start_datetime,
-        UsageHistory.created_at <= end_datetime
-    ).group_by(
-        extract('hour', UsageHistory.created_at)
-    ).order_by(
-        extract('hour', UsageHistory.created_at).asc()
-    )
-
-    result = await db.execute(query)
-    rows = result.fetchall()
+    rows = await usage_rollup.fetch(db, "hourly", date, date)
+    by_hour = group_rollups(rows, lambda r: usage_rollup.local_hour(r.bucket))
 
     # 시간대별 데이터 생성 (0~23시, 데이터 없으면 0)
-    hour_data = {row.hour: row.question_count for row in rows}
     items = [
         {
             "hour": hour,
-            "question_count": hour_data.get(float(hour), 0)
+            "question_count": by_hour[hour].question_count if hour in by_hour else 0
         }
         for hour in range(24)
     ]
@@ -231,7 +172,7 @@ async def get_hourly_pattern(
 async def get_weekly_trend(
     start: date = Query(..., description="시작 날짜 (YYYY-MM-DD)"),
     end: date = Query(..., description="종료 날짜 (YYYY-MM-DD)"),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_analytics_db),
     principal: Principal = Depends(get_principal)
 ):
     """
@@ -250,34 +191,17 @@ async def get_weekly_trend(
         from fastapi import HTTPException
         raise HTTPException(status_code=400, detail="종료 날짜는 시작 날짜보다 늦어야 합니다")
 
-    start_datetime = datetime.combine(start, datetime.min.time())
-    end_datetime = datetime.combine(end, datetime.max.time())
-
-    # 주별 질문 수 및 평균 응답 시간
-    # Note: literal_column() avoids asyncpg parameter binding issues with to_char()
-    query = select(
-        literal_column("to_char(usage_history.created_at, 'IYYY-IW')").label('week'),
-        func.count(UsageHistory.id).label('question_count'),
-        func.avg(UsageHistory.response_time).label('avg_response_time')
-    ).filter(
-        UsageHistory.created_at >= start_datetime,
-        UsageHistory.created_at <= end_datetime
-    ).group_by(
-        literal_column("to_char(usage_history.created_at, 'IYYY-IW')")
-    ).order_by(
-        literal_column("to_char(usage_history.created_at, 'IYYY-IW')")
-    )
-
-    result = await db.execute(query)
-    rows = result.fetchall()
+    # 주별 질문 수 및 평균 응답 시간 (ISO 주차)
+    rows = await usage_rollup.fetch(db, "daily", start, end)
+    by_week = group_rollups(rows, lambda r: "%04d-%02d" % r.bucket.isocalendar()[:2])
 
     items = [
         {
-            "week": row.week,
-            "question_count": row.question_count or 0,
-            "avg_response_time": round(float(row.avg_response_time), 2) if row.avg_response_time else 0
+            "week": week,
+            "question_count": totals.question_count,
+            "avg_response_time": round(totals.average_response_time, 2)
         }
-        for row in rows
+        for week, totals in by_week.items()
     ]
 
     return {"items": items}
@@ -287,7 +211,7 @@ async def get_weekly_trend(
 async def get_monthly_trend(
     start: date = Query(..., description="시작 날짜 (YYYY-MM-DD)"),
     end: date = Query(..., description="종료 날짜 (YYYY-MM-DD)"),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_analytics_db),
     principal: Principal = Depends(get_principal)
 ):
     """
@@ -306,34 +230,17 @@ async def get_monthly_trend(
         from fastapi import HTTPException
         raise HTTPException(status_code=400, detail="종료 날짜는 시작 날짜보다 늦어야 합니다")
 
-    start_datetime = datetime.combine(start, datetime.min.time())
-    end_datetime = datetime.combine(end, datetime.max.time())
-
     # 월별 질문 수 및 평균 응답 시간
-    # Note: literal_column() avoids asyncpg parameter binding issues with to_char()
-    query = select(
-        literal_column("to_char(usage_history.created_at, 'YYYY-MM')").label('month'),
-        func.count(UsageHistory.id).label('question_count'),
-        func.avg(UsageHistory.response_time).label('avg_response_time')
-    ).filter(
-        UsageHistory.created_at >= start_datetime,
-        UsageHistory.created_at <= end_datetime
-    ).group_by(
-        literal_column("to_char(usage_history.created_at, 'YYYY-MM')")
-    ).order_by(
-        literal_column("to_char(usage_history.created_at, 'YYYY-MM')")
-    )
-
-    result = await db.execute(query)
-    rows = result.fetchall()
+    rows = await usage_rollup.fetch(db, "daily", start, end)
+    by_month = group_rollups(rows, lambda r: r.bucket.strftime("%Y-%m"))
 
     items = [
         {
-            "month": row.month,
-            "question_count": row.question_count or 0,
-            "avg_response_time": round(float(row.avg_response_time), 2) if row.avg_response_time else 0
+            "month": month,
+            "question_count": totals.question_count,
+            "avg_response_time": round(totals.average_response_time, 2)
         }
-        for row in rows
+        for month, totals in by_month.items()
     ]
 
     return {"items": items}
@@ -343,7 +250,7 @@ async def get_monthly_trend(
 async def get_top_questions(
     limit: int = Query(10, ge=1, le=100, description="조회할 개수"),
     days: int = Query(30, ge=1, le=365, description="최근 N일"),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_analytics_db),
     principal: Principal = Depends(get_principal)
 ):
     """
@@ -357,7 +264,7 @@ async def get_top_questions(
       - count: 질문 횟수
     """
     # 최근 N일 데이터 조회
-    start_datetime = datetime.now() - timedelta(days=days)
+    start_datetime = datetime.now(timezone.utc) - timedelta(days=days)
 
     # 질문별 횟수 집계
     query = select(
@@ -391,22 +298,6 @@ async def get_top_questions(
 # EDB Helper Functions
 # =============================================================================
 
-async def get_edb_connection():
-    """EDB 데이터베이스 연결 생성"""
-    try:
-        conn = await asyncpg.connect(
-            host=EDB_HOST,
-            port=EDB_PORT,
-            database=EDB_DATABASE,
-            user=EDB_USER,
-            password=EDB_PASSWORD
-        )
-        return conn
-    except Exception as e:
-        logger.error(f"Failed to connect to EDB: {e}")
-        raise
-
-
 async def get_edb_document_count() -> int:
     """
     EDB에서 활성 문서 수 조회
@@ -414,25 +305,20 @@ async def get_edb_document_count() -> int:
     Returns:
         int: wisenut.doc_bas_info에서 use_yn='Y'인 문서 수
     """
-    conn = None
     try:
-        conn = await get_edb_connection()
-
-        # 활성 문서만 조회 (use_yn = 'Y')
-        query = """
-            SELECT COUNT(*)
-            FROM wisenut.doc_bas_info
-            WHERE use_yn = 'Y'
-        """
-        count = await conn.fetchval(query)
+        async with edb_pool.acquire() as conn:
+            # 활성 문서만 조회 (use_yn = 'Y')
+            query = """
+                SELECT COUNT(*)
+                FROM wisenut.doc_bas_info
+                WHERE use_yn = 'Y'
+            """
+            count = await conn.fetchval(query)
         return count or 0
 
     except Exception as e:
         logger.error(f"Failed to get EDB document count: {e}")
         return 0
-    finally:
-        if conn:
-            await conn.close()
 
 
 # =============================================================================
@@ -573,7 +459,7 @@ async def get_qdrant_unique_document_count() -> int:
 
 @router.get("/system")
 async def get_system_info(
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_analytics_db),
     principal: Principal = Depends(get_principal)
 ):
     """
@@ -7,7 +7,7 @@
 - Input validation (Pydantic + Query parameters)
 - 데이터 길이 제한
 """
-from fastapi import APIRouter, Depends, Query, Request, HTTPException
+from fastapi import APIRouter, Depends, Query, Request, Response, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from typing import List, Optional
@@ -17,6 +17,8 @@ import logging
 from app.models import UsageHistory
 from app.schemas.usage import UsageHistoryResponse, UsageHistoryCreate
 from app.core.database import get_db
+from app.utils.date_range import day_start
+from app.utils.pagination import apply_keyset, build_keyset_page, decode_cursor
 from app.dependencies import get_principal, get_cerbos_client, check_resource_permission
 from cerbos.sdk.model import Principal, Resource
 from cerbos.sdk.client import AsyncCerbosClient
@@ -43,17 +45,17 @@ def _parse_date_filter(date_str: str, field_name: str, is_end_date: bool = False
         is_end_date: 종료일인 경우 True (하루 추가)
 
     Returns:
-        datetime: 파싱된 datetime 객체
+        datetime: 해당 날짜 00:00 (STATS_TIMEZONE 기준, UTC 변환)
 
     Raises:
         HTTPException: 날짜 형식이 잘못된 경우
     """
     try:
-        parsed_date = datetime.strptime(date_str, DATE_FORMAT)
+        parsed_date = datetime.strptime(date_str, DATE_FORMAT).date()
         if is_end_date:
             # 종료일 포함을 위해 다음날 00:00:00 사용
             parsed_date += timedelta(days=1)
-        return parsed_date
+        return day_start(parsed_date)
     except ValueError as e:
         raise HTTPException(
             status_code=400,
@@ -86,6 +88,7 @@ def _extract_client_ip(request: Request) -> Optional[str]:
 
 @router.get("/", response_model=List[UsageHistoryResponse])
 async def list_usage_history(
+    response: Response,
     skip: int = Query(0, ge=0, description="건너뛸 레코드 수"),
     limit: int = Query(100, le=1000, description="조회할 최대 레코드 수"),
     user_id: Optional[str] = Query(None, description="사용자 ID 필터"),
@@ -93,6 +96,7 @@ async def list_usage_history(
     model_name: Optional[str] = Query(None, description="모델명 필터", max_length=100),
     start_date: Optional[str] = Query(None, description="시작 날짜 (YYYY-MM-DD)", regex=r"^\d{4}-\d{2}-\d{2}$"),
     end_date: Optional[str] = Query(None, description="종료 날짜 (YYYY-MM-DD)", regex=r"^\d{4}-\d{2}-\d{2}$"),
+    cursor: Optional[str] = Query(None, description="페이지 커서 (X-Next-Cursor / X-Prev-Cursor 헤더 값)"),
     db: AsyncSession = Depends(get_db),
     principal: Principal = Depends(get_principal),
     cerbos: AsyncCerbosClient = Depends(get_cerbos_client)
@@ -102,7 +106,7 @@ async def list_usage_history(
 
     - 질문, 답변, 응답시간, 모델 정보 등 조회
     - 검색 및 필터링 지원 (날짜 범위, 사용자 ID, 검색어, 모델명)
-    - 페이지네이션 지원
+    - 페이지네이션 지원 (응답 헤더 X-Next-Cursor / X-Prev-Cursor를 cursor로 넘기면 skip 없이 조회)
 
     **권한 필요**: usage_history:read
     **시큐어 코딩**: 날짜 형식 검증 (regex), SQL Injection 방지 (SQLAlchemy ORM)
@@ -137,11 +141,22 @@ async def list_usage_history(
     if model_name:
         query = query.filter(UsageHistory.model_name == model_name)
 
-    # 정렬 및 페이징
-    query = query.order_by(UsageHistory.created_at.desc()).offset(skip).limit(limit)
+    # 정렬 및 페이징 (최신순, (created_at, id) 커서)
+    page_cursor = decode_cursor(cursor)
+    offset = skip if page_cursor is None else 0
+    query = apply_keyset(query, UsageHistory.created_at, UsageHistory.id, page_cursor, limit).offset(offset)
 
     result = await db.execute(query)
-    return result.scalars().all()
+    page = build_keyset_page(
+        result.scalars().all(), limit, lambda h: (h.created_at, h.id), page_cursor,
+        has_previous=offset > 0 if page_cursor is None else None
+    )
+
+    if page.next_cursor:
+        response.headers["X-Next-Cursor"] = page.next_cursor
+    if page.prev_cursor:
+        response.headers["X-Prev-Cursor"] = page.prev_cursor
+    return page.items
 
 
 @router.get("/{history_id}", response_model=UsageHistoryResponse)
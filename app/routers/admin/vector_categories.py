@@ -6,39 +6,13 @@ from pydantic import BaseModel, Field
 from typing import Optional, List
 from datetime import datetime
 import logging
-import os
-import asyncpg
+
+from app.core.edb import EDBConnection, get_edb
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/v1/admin/vector-categories", tags=["admin-vector-categories"])
 
-# EDB 설정
-EDB_HOST = os.getenv("EDB_HOST", "host.docker.internal")
-EDB_PORT = int(os.getenv("EDB_PORT", "5444"))
-EDB_DATABASE = os.getenv("EDB_DATABASE", "AGENAI")
-EDB_USER = os.getenv("EDB_USER", "wisenut_dev")
-EDB_PASSWORD = os.getenv("EDB_PASSWORD", "express!12")
-
-
-async def get_edb_connection():
-    """EDB 데이터베이스 연결 생성"""
-    try:
-        conn = await asyncpg.connect(
-            host=EDB_HOST,
-            port=EDB_PORT,
-            database=EDB_DATABASE,
-            user=EDB_USER,
-            password=EDB_PASSWORD
-        )
-        return conn
-    except Exception as e:
-        logger.error(f"Failed to connect to EDB: {e}")
-        raise HTTPException(
-            status_code=500,
-            detail=f"데이터베이스 연결 실패: {str(e)}"
-        )
-
 
 # Pydantic Models
 class CategoryCreate(BaseModel):
@@ -71,7 +45,8 @@ class CategoryResponse(BaseModel):
 
 @router.get("", response_model=List[CategoryResponse])
 async def list_categories(
-    include_inactive: bool = False
+    include_inactive: bool = False,
+    conn: EDBConnection = Depends(get_edb)
 ):
     """
     카테고리 목록 조회
@@ -82,10 +57,7 @@ async def list_categories(
     Returns:
         카테고리 목록 (문서 수 포함)
     """
-    conn = None
     try:
-        conn = await get_edb_connection()
-
         # WHERE 조건 구성
         where_clause = "c.level_n1_cd = 'DOC_CAT_CD'"
         if not include_inactive:
@@ -130,19 +102,18 @@ async def list_categories(
         logger.info(f"Returned {len(categories)} categories")
         return categories
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Failed to list categories: {e}")
         raise HTTPException(
             status_code=500,
             detail=f"카테고리 목록 조회 실패: {str(e)}"
         )
-    finally:
-        if conn:
-            await conn.close()
 
 
 @router.post("", status_code=201)
-async def create_category(category: CategoryCreate):
+async def create_category(category: CategoryCreate, conn: EDBConnection = Depends(get_edb)):
     """
     카테고리 생성
 
@@ -152,10 +123,7 @@ async def create_category(category: CategoryCreate):
     Returns:
         생성된 카테고리 정보
     """
-    conn = None
     try:
-        conn = await get_edb_connection()
-
         # 카테고리 코드 중복 확인
         existing = await conn.fetchval(
             """
@@ -207,13 +175,10 @@ async def create_category(category: CategoryCreate):
             status_code=500,
             detail=f"카테고리 생성 실패: {str(e)}"
         )
-    finally:
-        if conn:
-            await conn.close()
 
 
 @router.put("/{code}")
-async def update_category(code: str, category: CategoryUpdate):
+async def update_category(code: str, category: CategoryUpdate, conn: EDBConnection = Depends(get_edb)):
     """
     카테고리 수정
 
@@ -224,10 +189,7 @@ async def update_category(code: str, category: CategoryUpdate):
     Returns:
         수정된 카테고리 정보
     """
-    conn = None
     try:
-        conn = await get_edb_connection()
-
         # 카테고리 존재 확인
         existing = await conn.fetchrow(
             """
@@ -340,13 +302,10 @@ async def update_category(code: str, category: CategoryUpdate):
             status_code=500,
             detail=f"카테고리 수정 실패: {str(e)}"
         )
-    finally:
-        if conn:
-            await conn.close()
 
 
 @router.delete("/{code}")
-async def delete_category(code: str, hard_delete: bool = False):
+async def delete_category(code: str, hard_delete: bool = False, conn: EDBConnection = Depends(get_edb)):
     """
     카테고리 삭제
 
@@ -357,10 +316,7 @@ async def delete_category(code: str, hard_delete: bool = False):
     Returns:
         삭제 결과
     """
-    conn = None
     try:
-        conn = await get_edb_connection()
-
         # 카테고리 존재 확인
         existing = await conn.fetchval(
             """
@@ -429,23 +385,17 @@ async def delete_category(code: str, hard_delete: bool = False):
             status_code=500,
             detail=f"카테고리 삭제 실패: {str(e)}"
         )
-    finally:
-        if conn:
-            await conn.close()
 
 
 @router.get("/next-code")
-async def get_next_category_code():
+async def get_next_category_code(conn: EDBConnection = Depends(get_edb)):
     """
     다음 사용 가능한 카테고리 코드 조회
 
     Returns:
         다음 사용 가능한 카테고리 코드
     """
-    conn = None
     try:
-        conn = await get_edb_connection()
-
         # 현재 사용 중인 카테고리 코드 조회
         existing_codes = await conn.fetch(
             """
@@ -482,6 +432,3 @@ async def get_next_category_code():
             status_code=500,
             detail=f"다음 카테고리 코드 조회 실패: {str(e)}"
         )
-    finally:
-        if conn:
-            await conn.close()
@@ -22,12 +22,13 @@ from typing import List, Optional
 from datetime import datetime
 from fastapi import APIRouter, UploadFile, File, Form, HTTPException, Depends
 from pydantic import BaseModel
-import asyncpg
 from minio import Minio
 from minio.error import S3Error
 import httpx
 import io
 
+from app.core.edb import EDBConnection, get_edb
+
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/v1/admin/vector-documents", tags=["admin-vector-document-upload"])
@@ -42,13 +43,6 @@ ALLOWED_EXTENSIONS = {
 # 파일 크기 제한 (200MB)
 MAX_FILE_SIZE = 200 * 1024 * 1024  # 200MB
 
-# EDB 연결 설정
-EDB_HOST = os.getenv("EDB_HOST", "host.docker.internal")
-EDB_PORT = int(os.getenv("EDB_PORT", "5444"))
-EDB_DATABASE = os.getenv("EDB_DATABASE", "AGENAI")
-EDB_USER = os.getenv("EDB_USER", "wisenut_dev")
-EDB_PASSWORD = os.getenv("EDB_PASSWORD", "express!12")
-
 # MinIO 설정
 MINIO_ENDPOINT = os.getenv("MINIO_ENDPOINT", "host.docker.internal:10002")
 MINIO_ACCESS_KEY = os.getenv("MINIO_ACCESS_KEY", "admin")
@@ -61,25 +55,6 @@ EXGPT_API_URL = os.getenv("EXGPT_API_URL", "http://host.docker.internal:8083")
 EXGPT_API_KEY = os.getenv("EXGPT_API_KEY", "z3JE1M8huXmNux6y")
 
 
-async def get_edb_connection():
-    """EDB 데이터베이스 연결"""
-    try:
-        conn = await asyncpg.connect(
-            host=EDB_HOST,
-            port=EDB_PORT,
-            database=EDB_DATABASE,
-            user=EDB_USER,
-            password=EDB_PASSWORD
-        )
-        return conn
-    except Exception as e:
-        logger.error(f"Failed to connect to EDB: {e}")
-        raise HTTPException(
-            status_code=500,
-            detail=f"데이터베이스 연결 실패: {str(e)}"
-        )
-
-
 def get_minio_client():
     """MinIO 클라이언트 생성"""
     try:
@@ -142,7 +117,7 @@ async def upload_to_minio(file: UploadFile, category_code: str, path_levels: Opt
 
 
 async def save_document_metadata(
-    conn: asyncpg.Connection,
+    conn: EDBConnection,
     category_code: str,
     filename: str,
     file_size: int,
@@ -293,7 +268,8 @@ async def upload_single_document(
     description: Optional[str] = Form(None, description="문서 설명"),
     path_level1: Optional[str] = Form(None, description="경로 레벨 1"),
     path_level2: Optional[str] = Form(None, description="경로 레벨 2"),
-    path_level3: Optional[str] = Form(None, description="경로 레벨 3")
+    path_level3: Optional[str] = Form(None, description="경로 레벨 3"),
+    conn: EDBConnection = Depends(get_edb)
 ):
     """
     단일 문서 파일 업로드
@@ -310,7 +286,6 @@ async def upload_single_document(
     Returns:
         업로드된 문서 정보
     """
-    conn = None
     try:
         # 파일명 검증
         if not validate_filename(file.filename):
@@ -330,9 +305,6 @@ async def upload_single_document(
                 detail=f"파일 크기가 제한을 초과합니다: {file_size} bytes > 200MB"
             )
 
-        # EDB 연결
-        conn = await get_edb_connection()
-
         # 카테고리 존재 확인
         category_exists = await conn.fetchval(
             """
@@ -399,15 +371,13 @@ async def upload_single_document(
             status_code=500,
             detail=f"문서 업로드 실패: {str(e)}"
         )
-    finally:
-        if conn:
-            await conn.close()
 
 
 @router.post("/upload-batch", status_code=201)
 async def upload_multiple_documents(
     files: List[UploadFile] = File(..., description="업로드할 문서 파일들"),
-    category_code: str = Form(..., description="카테고리 코드")
+    category_code: str = Form(..., description="카테고리 코드"),
+    conn: EDBConnection = Depends(get_edb)
 ):
     """
     다중 문서 파일 업로드
@@ -419,10 +389,7 @@ async def upload_multiple_documents(
     Returns:
         업로드 결과 (성공/실패 목록)
     """
-    conn = None
     try:
-        conn = await get_edb_connection()
-
         # 카테고리 존재 확인
         category_exists = await conn.fetchval(
             """
@@ -505,6 +472,3 @@ async def upload_multiple_documents(
             status_code=500,
             detail=f"배치 업로드 실패: {str(e)}"
         )
-    finally:
-        if conn:
-            await conn.close()
@@ -6,23 +6,17 @@ from typing import Optional
 from datetime import datetime
 import logging
 import os
-import asyncpg
+import re
 import httpx
 from minio import Minio
 from minio.error import S3Error
 
+from app.core.edb import DOC_COUNT_BY_CATEGORY_SQL, DOC_COUNT_SQL, DOC_DETAIL_SQL, EDBConnection, get_edb
+
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/v1/admin/vector-documents", tags=["admin-vector-documents"])
 
-# EDB 설정 (Docker에서 host.docker.internal 사용)
-# 주의: pg_hba.conf에 172.31.0.0/16 추가 필요
-EDB_HOST = os.getenv("EDB_HOST", "host.docker.internal")
-EDB_PORT = int(os.getenv("EDB_PORT", "5444"))
-EDB_DATABASE = os.getenv("EDB_DATABASE", "AGENAI")
-EDB_USER = os.getenv("EDB_USER", "wisenut_dev")
-EDB_PASSWORD = os.getenv("EDB_PASSWORD", "express!12")
-
 # MinIO 설정
 MINIO_ENDPOINT = os.getenv("MINIO_ENDPOINT", "host.docker.internal:10002")
 MINIO_ACCESS_KEY = os.getenv("MINIO_ACCESS_KEY", "admin")
@@ -35,25 +29,6 @@ EXGPT_API_URL = os.getenv("EXGPT_API_URL", "http://host.docker.internal:8083")
 EXGPT_API_KEY = os.getenv("EXGPT_API_KEY", "z3JE1M8huXmNux6y")
 
 
-async def get_edb_connection():
-    """EDB 데이터베이스 연결 생성"""
-    try:
-        conn = await asyncpg.connect(
-            host=EDB_HOST,
-            port=EDB_PORT,
-            database=EDB_DATABASE,
-            user=EDB_USER,
-            password=EDB_PASSWORD
-        )
-        return conn
-    except Exception as e:
-        logger.error(f"Failed to connect to EDB: {e}")
-        raise HTTPException(
-            status_code=500,
-            detail=f"데이터베이스 연결 실패: {str(e)}"
-        )
-
-
 def get_minio_client():
     """MinIO 클라이언트 생성"""
     try:
@@ -128,38 +103,19 @@ async def delete_from_exgpt(document_id: int):
 
 
 @router.get("/stats")
-async def get_vector_documents_stats():
+async def get_vector_documents_stats(conn: EDBConnection = Depends(get_edb)):
     """
     벡터 문서 통계 조회 (doc_cat_cd별 문서 수)
 
     Returns:
         {"total": int, "by_doctype": {...}}
     """
-    conn = None
     try:
-        conn = await get_edb_connection()
-
         # 전체 문서 수
-        total = await conn.fetchval(
-            "SELECT COUNT(*) FROM wisenut.doc_bas_lst WHERE use_yn = 'Y'"
-        )
+        total = await conn.fetchval(DOC_COUNT_SQL)
 
         # doc_cat_cd별 집계 (com_cd_lv2와 JOIN하여 카테고리명 가져오기)
-        rows = await conn.fetch(
-            """
-            SELECT
-                d.doc_cat_cd as category_code,
-                COALESCE(c.level_n2_nm, d.doc_cat_cd, '기타') as category_name,
-                COUNT(*) as count
-            FROM wisenut.doc_bas_lst d
-            LEFT JOIN wisenut.com_cd_lv2 c
-                ON c.level_n1_cd = 'DOC_CAT_CD'
-                AND c.level_n2_cd = d.doc_cat_cd
-            WHERE d.use_yn = 'Y'
-            GROUP BY d.doc_cat_cd, c.level_n2_nm
-            ORDER BY count DESC
-            """
-        )
+        rows = await conn.fetch(DOC_COUNT_BY_CATEGORY_SQL)
 
         # 응답 형식: {category_code: {name: category_name, count: count}}
         doctype_counts = {
@@ -174,15 +130,14 @@ async def get_vector_documents_stats():
             "by_doctype": doctype_counts
         }
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Failed to get vector documents stats: {e}")
         raise HTTPException(
             status_code=500,
             detail=f"벡터 문서 통계 조회 실패: {str(e)}"
         )
-    finally:
-        if conn:
-            await conn.close()
 
 
 @router.get("")
@@ -190,7 +145,8 @@ async def list_vector_documents(
     skip: int = Query(0, ge=0),
     limit: int = Query(100, le=1000),
     search: Optional[str] = None,
-    doctype: Optional[str] = None
+    doctype: Optional[str] = None,
+    conn: EDBConnection = Depends(get_edb)
 ):
     """
     벡터 문서 목록 조회 (EDB에서 실제 데이터 가져오기)
@@ -204,18 +160,19 @@ async def list_vector_documents(
     Returns:
         {"items": [...], "total": int}
     """
-    conn = None
     try:
-        conn = await get_edb_connection()
-
         # WHERE 조건 구성 (테이블 alias d 명시)
         conditions = ["d.use_yn = 'Y'"]
         params = []
         param_count = 1
 
         if search:
-            conditions.append(f"(d.doc_title_nm ILIKE ${param_count} OR d.doc_rep_title_nm ILIKE ${param_count})")
-            params.append(f"%{search}%")
+            # ILIKE '%검색어%'는 pg_trgm GIN 인덱스 사용 (migrations/create_edb_search_indexes.sql)
+            conditions.append(
+                f"(d.doc_title_nm ILIKE ${param_count} ESCAPE '!' "
+                f"OR d.doc_rep_title_nm ILIKE ${param_count} ESCAPE '!')"
+            )
+            params.append("%" + re.sub(r"([!%_])", r"!\1", search) + "%")
             param_count += 1
 
         if doctype:
@@ -233,6 +190,16 @@ async def list_vector_documents(
         """
         total = await conn.fetchval(total_query, *params)
 
+        # 정렬: 기본 최신순, 검색 시 제목 유사도(pg_trgm) 순
+        order_by = "d.reg_dt DESC"
+        if search:
+            order_by = (
+                f"GREATEST(similarity(COALESCE(d.doc_title_nm, ''), ${param_count}), "
+                f"similarity(COALESCE(d.doc_rep_title_nm, ''), ${param_count})) DESC, d.reg_dt DESC"
+            )
+            params.append(search)
+            param_count += 1
+
         # 문서 목록 조회 (com_cd_lv2와 JOIN하여 카테고리명 가져오기)
         list_query = f"""
             SELECT
@@ -251,7 +218,7 @@ async def list_vector_documents(
                 ON c.level_n1_cd = 'DOC_CAT_CD'
                 AND c.level_n2_cd = d.doc_cat_cd
             WHERE {where_clause}
-            ORDER BY d.reg_dt DESC
+            ORDER BY {order_by}
             OFFSET ${param_count} LIMIT ${param_count + 1}
         """
         params.extend([skip, limit])
@@ -289,19 +256,18 @@ async def list_vector_documents(
             "total": total
         }
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Failed to list vector documents: {e}")
         raise HTTPException(
             status_code=500,
             detail=f"벡터 문서 목록 조회 실패: {str(e)}"
         )
-    finally:
-        if conn:
-            await conn.close()
 
 
 @router.get("/{document_id}")
-async def get_vector_document(document_id: str):
+async def get_vector_document(document_id: str, conn: EDBConnection = Depends(get_edb)):
     """
     벡터 문서 상세 조회
 
@@ -311,33 +277,9 @@ async def get_vector_document(document_id: str):
     Returns:
         문서 상세 정보
     """
-    conn = None
     try:
-        conn = await get_edb_connection()
-
         # EDB에서 doc_id로 문서 조회 (com_cd_lv2와 JOIN하여 카테고리명 가져오기)
-        row = await conn.fetchrow(
-            """
-            SELECT
-                d.doc_id,
-                COALESCE(d.doc_rep_title_nm, d.doc_title_nm, '제목 없음') as title,
-                d.doc_cat_cd as doctype,
-                COALESCE(c.level_n2_nm, d.doc_cat_cd, '기타') as doctype_name,
-                d.doc_det_level_n1_cd,
-                d.doc_det_level_n2_cd,
-                d.doc_det_level_n3_cd,
-                COALESCE(LENGTH(d.doc_txt), 0) as token_count,
-                d.use_yn,
-                d.reg_dt as created_at,
-                d.doc_txt
-            FROM wisenut.doc_bas_lst d
-            LEFT JOIN wisenut.com_cd_lv2 c
-                ON c.level_n1_cd = 'DOC_CAT_CD'
-                AND c.level_n2_cd = d.doc_cat_cd
-            WHERE d.doc_id = $1
-            """,
-            int(document_id)
-        )
+        row = await conn.fetchrow(DOC_DETAIL_SQL, int(document_id))
 
         if not row:
             raise HTTPException(status_code=404, detail="문서를 찾을 수 없습니다")
@@ -372,15 +314,13 @@ async def get_vector_document(document_id: str):
             status_code=500,
             detail=f"벡터 문서 조회 실패: {str(e)}"
         )
-    finally:
-        if conn:
-            await conn.close()
 
 
 @router.delete("/{document_id}")
 async def delete_vector_document(
     document_id: str,
-    hard_delete: bool = Query(False, description="완전 삭제 여부 (기본: False, soft delete)")
+    hard_delete: bool = Query(False, description="완전 삭제 여부 (기본: False, soft delete)"),
+    conn: EDBConnection = Depends(get_edb)
 ):
     """
     벡터 문서 삭제
@@ -392,10 +332,7 @@ async def delete_vector_document(
     Returns:
         삭제 결과
     """
-    conn = None
     try:
-        conn = await get_edb_connection()
-
         # document_id를 정수로 변환
         try:
             doc_id_int = int(document_id)
@@ -463,15 +400,13 @@ async def delete_vector_document(
             status_code=500,
             detail=f"문서 삭제 실패: {str(e)}"
         )
-    finally:
-        if conn:
-            await conn.close()
 
 
 @router.post("/batch-delete")
 async def batch_delete_documents(
     document_ids: list[str],
-    hard_delete: bool = Query(False, description="완전 삭제 여부")
+    hard_delete: bool = Query(False, description="완전 삭제 여부"),
+    conn: EDBConnection = Depends(get_edb)
 ):
     """
     다중 문서 삭제
@@ -483,10 +418,7 @@ async def batch_delete_documents(
     Returns:
         삭제 결과
     """
-    conn = None
     try:
-        conn = await get_edb_connection()
-
         # 문자열 ID를 정수로 변환
         try:
             doc_ids_int = [int(doc_id) for doc_id in document_ids]
@@ -542,12 +474,11 @@ async def batch_delete_documents(
             "hard_delete": hard_delete
         }
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Failed to batch delete documents: {e}")
         raise HTTPException(
             status_code=500,
             detail=f"다중 문서 삭제 실패: {str(e)}"
         )
-    finally:
-        if conn:
-            await conn.close()
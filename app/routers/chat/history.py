@@ -4,12 +4,21 @@ History API Router
 """
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import text
+from sqlalchemy import func, select
 from pydantic import BaseModel
+from collections import defaultdict
+from typing import Any, Dict, List, Optional
 from app.core.database import get_db
+from app.models.chat_models import (
+    Conversation,
+    ConversationSummary,
+    ReferenceDocument,
+    SuggestedQuestion,
+)
 from app.schemas.chat_schemas import ConversationListResponse, HistoryDetailResponse
 from app.utils.auth import get_current_user_from_session
 from app.services.chat_service import validate_room_id
+from app.utils.pagination import apply_keyset, build_keyset_page, decode_cursor
 import logging
 
 router = APIRouter(prefix="/api/v1/history", tags=["chat-history"])
@@ -19,6 +28,7 @@ logger = logging.getLogger(__name__)
 class PaginationRequest(BaseModel):
     page: int = 1
     page_size: int = 10
+    cursor: Optional[str] = None  # 응답의 next_cursor / prev_cursor (지정 시 page 무시)
 
 
 @router.post("/list")
@@ -44,27 +54,29 @@ async def get_conversation_list(
     # 사용자 ID는 세션에서 가져옴
     user_id = current_user["user_id"]
 
-    # 페이지네이션 계산
-    offset = (pagination.page - 1) * pagination.page_size
+    # 페이지네이션 계산 (cursor가 있으면 OFFSET 없이 (REG_DT, ID) 기준 조회)
+    cursor = decode_cursor(pagination.cursor)
+    offset = (pagination.page - 1) * pagination.page_size if cursor is None else 0
     limit = pagination.page_size
 
     # USR_CNVS_SMRY 조회
-    result = await db.execute(
-        text("""
-        SELECT
-            "CNVS_IDT_ID" as cnvs_idt_id,
-            COALESCE("CNVS_SMRY_TXT", '대화 요약 없음') as cnvs_smry_txt,
-            "REG_DT" as reg_dt
-        FROM "USR_CNVS_SMRY"
-        WHERE "USR_ID" = :user_id
-          AND "USE_YN" = 'Y'
-        ORDER BY "REG_DT" DESC
-        LIMIT :limit OFFSET :offset
-        """),
-        {"user_id": user_id, "limit": limit, "offset": offset}
+    query = select(
+        ConversationSummary.cnvs_smry_id,
+        ConversationSummary.cnvs_idt_id,
+        func.coalesce(ConversationSummary.cnvs_smry_txt, '대화 요약 없음').label("cnvs_smry_txt"),
+        ConversationSummary.reg_dt,
+    ).where(
+        ConversationSummary.usr_id == user_id,
+        ConversationSummary.use_yn == 'Y',
     )
+    query = apply_keyset(query, ConversationSummary.reg_dt, ConversationSummary.cnvs_smry_id, cursor, limit)
+    result = await db.execute(query.offset(offset))
 
-    conversations = result.fetchall()
+    page = build_keyset_page(
+        result.fetchall(), limit, lambda row: (row.reg_dt, row.cnvs_smry_id), cursor,
+        has_previous=offset > 0 if cursor is None else None
+    )
+    conversations = page.items
 
     logger.info(f"Conversation list retrieved - user: {user_id}, count: {len(conversations)}")
 
@@ -77,58 +89,73 @@ async def get_conversation_list(
             }
             for row in conversations
         ],
-        "total": len(conversations)
+        "total": len(conversations),
+        "next_cursor": page.next_cursor,
+        "prev_cursor": page.prev_cursor
     }
 
 
-@router.get("/{room_id}")
-async def get_conversation_detail(
-    room_id: str,
-    current_user: dict = Depends(get_current_user_from_session),
-    db: AsyncSession = Depends(get_db)
-):
+async def load_room_messages(db: AsyncSession, room_id: str) -> List[Dict[str, Any]]:
     """
-    특정 대화의 메시지 상세 조회
+    대화방 메시지 로드 (질문/답변 + 참조 문서 + 추천 질문)
+
+    메시지 수와 관계없이 3회 조회 (메시지 / 참조 문서 / 추천 질문을 대화방 단위로 한 번에 읽고 메모리에서 묶음)
 
     Args:
-        room_id: 대화방 ID
-        current_user: 인증된 사용자
         db: 데이터베이스 세션
+        room_id: 대화방 ID
 
     Returns:
-        HistoryDetailResponse: 메시지 리스트
-
-    Security:
-        - Room ID 소유권 검증
+        List[Dict]: 시간순 메시지 (질문, 답변 순)
     """
-    user_id = current_user["user_id"]
-
-    # 권한 검증
-    is_valid = await validate_room_id(room_id, user_id, db)
-    if not is_valid:
-        raise HTTPException(status_code=403, detail="접근 권한이 없습니다.")
-
     # USR_CNVS 조회 (질문 + 답변)
     result = await db.execute(
-        text("""
-        SELECT
-            "CNVS_ID",
-            "QUES_TXT",
-            "ANS_TXT",
-            "TKN_USE_CNT",
-            "RSP_TIM_MS",
-            "REG_DT"
-        FROM "USR_CNVS"
-        WHERE "CNVS_IDT_ID" = :room_id
-          AND "USE_YN" = 'Y'
-        ORDER BY "REG_DT", "CNVS_ID"
-        """),
-        {"room_id": room_id}
+        select(
+            Conversation.cnvs_id.label("CNVS_ID"),
+            Conversation.ques_txt.label("QUES_TXT"),
+            Conversation.ans_txt.label("ANS_TXT"),
+            Conversation.tkn_use_cnt.label("TKN_USE_CNT"),
+            Conversation.rsp_tim_ms.label("RSP_TIM_MS"),
+            Conversation.reg_dt.label("REG_DT"),
+        ).where(
+            Conversation.cnvs_idt_id == room_id,
+            Conversation.use_yn == 'Y',
+        ).order_by(Conversation.reg_dt, Conversation.cnvs_id)
     )
-
     conversations = result.fetchall()
-    messages = []
+    if not conversations:
+        return []
+
+    # 참조 문서 / 추천 질문은 대화방 전체를 한 번에 조회 (메시지별 조회 없음)
+    room_messages = select(Conversation.cnvs_id).where(
+        Conversation.cnvs_idt_id == room_id,
+        Conversation.use_yn == 'Y',
+    )
+
+    refs_result = await db.execute(
+        select(ReferenceDocument).where(
+            ReferenceDocument.cnvs_id.in_(room_messages)
+        ).order_by(ReferenceDocument.cnvs_id, ReferenceDocument.ref_seq)
+    )
+    references: Dict[int, List[Dict[str, Any]]] = defaultdict(list)
+    for r in refs_result.scalars():
+        references[r.cnvs_id].append({
+            "ref_seq": r.ref_seq,
+            "doc_name": r.att_doc_nm,
+            "chunk_text": r.doc_chnk_txt,
+            "similarity": float(r.smlt_rte) if r.smlt_rte else 0.0
+        })
+
+    sugg_result = await db.execute(
+        select(SuggestedQuestion.cnvs_id, SuggestedQuestion.add_ques_txt).where(
+            SuggestedQuestion.cnvs_id.in_(room_messages)
+        ).order_by(SuggestedQuestion.cnvs_id, SuggestedQuestion.add_ques_seq)
+    )
+    suggestions: Dict[int, List[str]] = defaultdict(list)
+    for cnvs_id, add_ques_txt in sugg_result.all():
+        suggestions[cnvs_id].append(add_ques_txt)
 
+    messages = []
     for row in conversations:
         # 질문 메시지
         messages.append({
@@ -144,38 +171,6 @@ async def get_conversation_detail(
 
         # 답변 메시지
         if row.ANS_TXT:
-            # 참조 문서 조회
-            refs_result = await db.execute(
-                text("""
-                SELECT "REF_SEQ", "ATT_DOC_NM", "DOC_CHNK_TXT", "SMLT_RTE"
-                FROM "USR_CNVS_REF_DOC_LST"
-                WHERE "CNVS_ID" = :cnvs_id
-                ORDER BY "REF_SEQ"
-                """),
-                {"cnvs_id": row.CNVS_ID}
-            )
-            references = [
-                {
-                    "ref_seq": r.REF_SEQ,
-                    "doc_name": r.ATT_DOC_NM,
-                    "chunk_text": r.DOC_CHNK_TXT,
-                    "similarity": float(r.SMLT_RTE) if r.SMLT_RTE else 0.0
-                }
-                for r in refs_result.fetchall()
-            ]
-
-            # 추천 질문 조회
-            sugg_result = await db.execute(
-                text("""
-                SELECT "ADD_QUES_TXT"
-                FROM "USR_CNVS_ADD_QUES_LST"
-                WHERE "CNVS_ID" = :cnvs_id
-                ORDER BY "ADD_QUES_SEQ"
-                """),
-                {"cnvs_id": row.CNVS_ID}
-            )
-            suggested = [r.ADD_QUES_TXT for r in sugg_result.fetchall()]
-
             messages.append({
                 "cnvs_id": row.CNVS_ID,
                 "role": "assistant",
@@ -185,10 +180,42 @@ async def get_conversation_detail(
                     "tokens": row.TKN_USE_CNT or 0,
                     "response_time_ms": row.RSP_TIM_MS or 0
                 },
-                "references": references if references else None,
-                "suggested_questions": suggested if suggested else None
+                "references": references.get(row.CNVS_ID) or None,
+                "suggested_questions": suggestions.get(row.CNVS_ID) or None
             })
 
+    return messages
+
+
+@router.get("/{room_id}")
+async def get_conversation_detail(
+    room_id: str,
+    current_user: dict = Depends(get_current_user_from_session),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    특정 대화의 메시지 상세 조회
+
+    Args:
+        room_id: 대화방 ID
+        current_user: 인증된 사용자
+        db: 데이터베이스 세션
+
+    Returns:
+        HistoryDetailResponse: 메시지 리스트
+
+    Security:
+        - Room ID 소유권 검증
+    """
+    user_id = current_user["user_id"]
+
+    # 권한 검증
+    is_valid = await validate_room_id(room_id, user_id, db)
+    if not is_valid:
+        raise HTTPException(status_code=403, detail="접근 권한이 없습니다.")
+
+    messages = await load_room_messages(db, room_id)
+
     logger.info(f"Conversation detail retrieved - room_id: {room_id}, messages: {len(messages)}")
 
     return {
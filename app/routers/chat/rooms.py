@@ -7,7 +7,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import text
 from app.core.database import get_db
 from app.utils.auth import get_current_user_from_session
-from app.services.chat_service import validate_room_id
+from app.services.chat_service import room_validity_cache, validate_room_id
 from app.schemas.chat_schemas import RoomNameUpdateRequest
 from datetime import datetime
 import logging
@@ -118,6 +118,7 @@ async def delete_room(
     )
 
     await db.commit()
+    room_validity_cache.discard(room_id)
 
     logger.info(f"Room deleted - room_id: {room_id}, user: {user_id}")
 
@@ -6,7 +6,7 @@ from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from sqlalchemy.orm import aliased
-from sqlalchemy.exc import SQLAlchemyError, IntegrityError
+from sqlalchemy.exc import SQLAlchemyError
 from pydantic import BaseModel
 from typing import List, Optional, Dict, Any
 import httpx
@@ -18,6 +18,9 @@ from datetime import datetime
 from app.models import UsageHistory
 from app.core.database import get_db
 from app.core.config import settings
+from app.core.http_client import http_clients
+from app.services.usage_writer import usage_writer
+from app.utils.sse_relay import SSEAccumulator
 
 logger = logging.getLogger(__name__)
 
@@ -34,131 +37,6 @@ class ChatStreamRequest(BaseModel):
     history: List[Dict[str, Any]] = []
 
 
-async def save_usage_to_db(
-    db: AsyncSession,
-    user_id: str,
-    session_id: str,
-    question: str,
-    answer: str,
-    conversation_title: Optional[str] = None,
-    thinking_content: Optional[str] = None,
-    main_category: Optional[str] = None,
-    sub_category: Optional[str] = None,
-    referenced_documents: Optional[List[str]] = None
-) -> None:
-    """
-    대화 내용을 usage_history 테이블에 저장
-
-    Args:
-        db: 비동기 데이터베이스 세션
-        user_id: 사용자 식별자 (예: "user_123456")
-        session_id: 대화 세션 ID (예: "user_123_session_789")
-        question: 사용자 질문 텍스트
-        answer: AI 응답 텍스트
-        conversation_title: 대화 제목 (None일 경우 자동 생성)
-        thinking_content: AI 사고 과정 (<think> 태그 내용)
-        main_category: 대분류 (None일 경우 자동 분류)
-        sub_category: 소분류 (None일 경우 자동 분류)
-        referenced_documents: 참조 문서 목록 (파일명 리스트)
-
-    Returns:
-        None
-
-    Raises:
-        SQLAlchemyError: 데이터베이스 저장 실패 시
-
-    Note:
-        - 제목이 없으면 질문의 첫 50자로 자동 생성
-        - 카테고리가 없으면 LLM을 사용하여 자동 분류
-        - 에러 발생 시 자동으로 롤백 처리
-    """
-    try:
-        # 중복 저장 방지: 같은 session_id + question이 이미 있으면 skip (시간 제한 없음)
-        from datetime import datetime, timedelta
-        duplicate_check = select(UsageHistory).filter(
-            UsageHistory.session_id == session_id,
-            UsageHistory.question == question
-        ).limit(1)
-        duplicate_result = await db.execute(duplicate_check)
-        existing_duplicate = duplicate_result.scalar_one_or_none()
-
-        if existing_duplicate:
-            logger.warning(f"Duplicate save prevented: session_id={session_id}, question={question[:50]}...")
-            # 기존 레코드에 카테고리가 없고 새 요청에 카테고리가 있으면 업데이트
-            if not existing_duplicate.main_category and main_category:
-                existing_duplicate.main_category = main_category
-                existing_duplicate.sub_category = sub_category
-                await db.commit()
-                logger.info(f"Updated category for existing record: {main_category} > {sub_category}")
-            return
-
-        # 해당 세션의 첫 대화인지 확인
-        if not conversation_title:
-            query = select(UsageHistory).filter(
-                UsageHistory.session_id == session_id
-            ).limit(1)
-            result = await db.execute(query)
-            existing = result.scalar_one_or_none()
-
-            # 첫 대화라면 질문으로 제목 생성 (규칙 기반 즉시 생성)
-            if not existing:
-                from app.utils.title_generator import generate_conversation_title, sanitize_title
-                title, was_truncated = generate_conversation_title(question)
-                conversation_title = sanitize_title(title)
-                logger.info(f"Auto-generated title (chat_proxy): '{conversation_title}' (truncated={was_truncated})")
-
-        # 자동 카테고리 분류 (P0 요구사항)
-        if not main_category or not sub_category:
-            from app.services.categorization import categorize_conversation_safe
-            try:
-                auto_main, auto_sub = await categorize_conversation_safe(question, answer)
-                main_category = main_category or auto_main
-                sub_category = sub_category or auto_sub
-                logger.info(f"Auto-categorized: {main_category} > {sub_category}")
-            except Exception as e:
-                logger.error(f"Categorization failed: {e}", exc_info=True)
-                main_category = main_category or "미분류"
-                sub_category = sub_category or "없음"
-
-        # 새 레코드 생성
-        usage_record = UsageHistory(
-            user_id=user_id,
-            session_id=session_id,
-            conversation_title=conversation_title,
-            question=question,
-            answer=answer,
-            thinking_content=thinking_content,
-            referenced_documents=referenced_documents,
-            main_category=main_category,
-            sub_category=sub_category,
-            model_name=settings.CHAT_MODEL_NAME,
-            created_at=datetime.utcnow(),
-            updated_at=datetime.utcnow()
-        )
-
-        db.add(usage_record)
-        await db.commit()
-
-        logger.info(f"Usage saved to DB: user_id={user_id}, session_id={session_id}")
-
-    except IntegrityError as e:
-        # Unique constraint violation (중복 저장 시도) - 무시하고 계속 진행
-        await db.rollback()
-        if "idx_unique_session_question" in str(e):
-            logger.warning(f"Duplicate prevented by DB constraint: session_id={session_id}, question={question[:50]}...")
-        else:
-            logger.error(f"IntegrityError while saving usage: {e}", exc_info=True)
-        # 중복은 에러가 아니므로 raise하지 않음
-    except SQLAlchemyError as e:
-        logger.error(f"Database error while saving usage: {e}", exc_info=True)
-        await db.rollback()
-        raise
-    except Exception as e:
-        logger.error(f"Unexpected error while saving usage: {e}", exc_info=True)
-        await db.rollback()
-        raise
-
-
 @router.post("/chat_stream")
 async def chat_stream_proxy(
     request: ChatStreamRequest,
@@ -167,7 +45,10 @@ async def chat_stream_proxy(
 ):
     """
     layout.html의 채팅 요청을 ds-api로 프록시하고 응답을 스트리밍
-    동시에 usage_history에 저장
+    스트림 종료 시 usage_history 저장 큐에 적재 (write-behind, app/services/usage_writer.py)
+
+    CHAT_PROXY_RELAY_MODE=True: 업스트림 바이트를 청크 단위로 그대로 전달하고,
+    저장할 값은 SSEAccumulator가 같은 바이트에서 증분 추출 (이벤트별 JSON 파싱/재직렬화 없음)
     """
 
     # session_id가 없으면 자동 생성 (user_id + timestamp)
@@ -227,39 +108,58 @@ async def chat_stream_proxy(
     accumulated_thinking = ""  # thinking 내용 별도 저장
     referenced_documents = []  # 참조 문서 목록
     is_thinking = False  # 현재 thinking 처리 중인지 여부
+    usage_metadata = None  # 토큰 수 (릴레이 모드)
 
     async def stream_and_save():
-        nonlocal accumulated_response, accumulated_thinking, referenced_documents, is_thinking
+        nonlocal accumulated_response, accumulated_thinking, referenced_documents, is_thinking, usage_metadata
 
         try:
-            # ds-api 스트리밍 요청 (RAG 검색 포함)
-            async with httpx.AsyncClient(timeout=settings.CHAT_TIMEOUT, follow_redirects=True) as client:
-                async with client.stream(
-                    "POST",
-                    f"{settings.DS_API_URL}/v1/chat/",
-                    json=llm_payload,
-                    headers={
-                        "Content-Type": "application/json",
-                        "X-API-Key": settings.DS_API_KEY
-                    }
-                ) as response:
-
-                    if response.status_code != 200:
-                        error_msg = f"LLM API 오류: {response.status_code}"
-                        yield f"data: {json.dumps({'content': error_msg}, ensure_ascii=False)}\n\n"
-                        yield "data: [DONE]\n\n"
-
-                        # 오류도 DB에 저장
-                        await save_usage_to_db(
-                            db=db,
-                            user_id=request.user_id,
-                            session_id=request.session_id,
-                            question=request.message,
-                            answer=error_msg
-                        )
-                        return
-
-                    # ds-api SSE 응답 전달 (type: token, final, sources 등)
+            # ds-api 스트리밍 요청 (RAG 검색 포함) - 공유 커넥션 풀 사용
+            client = http_clients.get("ds_api")
+            async with client.stream(
+                "POST",
+                f"{settings.DS_API_URL}/v1/chat/",
+                json=llm_payload,
+                headers={
+                    "Content-Type": "application/json",
+                    "X-API-Key": settings.DS_API_KEY
+                },
+                timeout=settings.CHAT_TIMEOUT,
+                follow_redirects=True
+            ) as response:
+
+                if response.status_code != 200:
+                    error_msg = f"LLM API 오류: {response.status_code}"
+                    yield f"data: {json.dumps({'content': error_msg}, ensure_ascii=False)}\n\n"
+                    yield "data: [DONE]\n\n"
+
+                    # 오류도 저장 큐에 적재
+                    usage_writer.submit(
+                        user_id=request.user_id,
+                        session_id=request.session_id,
+                        question=request.message,
+                        answer=error_msg
+                    )
+                    return
+
+                if settings.CHAT_PROXY_RELAY_MODE:
+                    # ds-api SSE 바이트 그대로 전달 + 저장용 값만 옆에서 추출
+                    parser = SSEAccumulator()
+                    # 압축 응답은 해제된 바이트를 전달 (클라이언트 응답에는 Content-Encoding이 없음)
+                    encoding = response.headers.get("content-encoding", "identity").lower()
+                    chunks = response.aiter_raw() if encoding == "identity" else response.aiter_bytes()
+                    async for chunk in chunks:
+                        parser.feed(chunk)
+                        yield chunk
+                    parser.close()
+
+                    accumulated_response = parser.answer
+                    accumulated_thinking = parser.thinking
+                    referenced_documents = parser.sources
+                    usage_metadata = parser.usage_metadata()
+
+                else:
+                    # ds-api SSE 응답 파싱 후 재직렬화하여 전달 (type: token, final, sources 등)
                     async for line in response.aiter_lines():
                         if line:
                             # 응답 데이터 파싱 및 누적
@@ -307,7 +207,7 @@ async def chat_stream_proxy(
                                 except json.JSONDecodeError:
                                     pass
 
-            # 스트리밍 완료 후 DB에 저장
+            # 스트리밍 완료 후 저장 큐에 적재 (DB 저장은 백그라운드 flusher가 배치 처리)
             # 제목 생성용 세션은 DB에 저장하지 않음
             if request.session_id and request.session_id.startswith(settings.TITLE_GEN_PREFIX):
                 logger.info(f"Title generation session ({request.session_id}) - skipping DB save")
@@ -316,16 +216,16 @@ async def chat_stream_proxy(
                 # thinking 태그 제거 (내용만 저장)
                 clean_thinking = accumulated_thinking.replace('<think>', '').replace('</think>', '').strip()
 
-                await save_usage_to_db(
-                    db=db,
+                usage_writer.submit(
                     user_id=request.user_id,
                     session_id=request.session_id,
                     question=request.message,
                     answer=accumulated_response.strip(),
                     thinking_content=clean_thinking if clean_thinking else None,
-                    referenced_documents=referenced_documents if referenced_documents else None
+                    referenced_documents=referenced_documents if referenced_documents else None,
+                    usage_metadata=usage_metadata
                 )
-                logger.info(f"DB save completed: answer={len(accumulated_response)} chars, thinking={len(clean_thinking)} chars, docs={len(referenced_documents)}")
+                logger.info(f"Usage queued: answer={len(accumulated_response)} chars, thinking={len(clean_thinking)} chars, docs={len(referenced_documents)}")
 
         except httpx.HTTPError as e:
             error_msg = f"HTTP 오류: {str(e)}"
@@ -333,17 +233,16 @@ async def chat_stream_proxy(
             yield f"data: {json.dumps({'content': error_msg}, ensure_ascii=False)}\n\n"
             yield "data: [DONE]\n\n"
 
-            # 오류도 DB에 저장
+            # 오류도 저장 큐에 적재
             try:
-                await save_usage_to_db(
-                    db=db,
+                usage_writer.submit(
                     user_id=request.user_id,
                     session_id=request.session_id,
                     question=request.message,
                     answer=error_msg
                 )
             except Exception as db_error:
-                logger.error(f"Failed to save error to DB: {db_error}", exc_info=True)
+                logger.error(f"Failed to queue error usage: {db_error}", exc_info=True)
 
         except Exception as e:
             error_msg = f"프록시 오류: {str(e)}"
@@ -351,17 +250,16 @@ async def chat_stream_proxy(
             yield f"data: {json.dumps({'content': error_msg}, ensure_ascii=False)}\n\n"
             yield "data: [DONE]\n\n"
 
-            # 오류도 DB에 저장
+            # 오류도 저장 큐에 적재
             try:
-                await save_usage_to_db(
-                    db=db,
+                usage_writer.submit(
                     user_id=request.user_id,
                     session_id=request.session_id,
                     question=request.message,
                     answer=error_msg
                 )
             except Exception as db_error:
-                logger.error(f"Failed to save error to DB: {db_error}", exc_info=True)
+                logger.error(f"Failed to queue error usage: {db_error}", exc_info=True)
 
     return StreamingResponse(
         stream_and_save(),
@@ -447,15 +345,21 @@ async def get_session_messages(
 ):
     """
     특정 세션의 모든 메시지 조회
-    """
-    from sqlalchemy import asc
 
-    query = select(UsageHistory).filter(
+    응답에 필요한 컬럼만 1회 조회 ((session_id, created_at) 인덱스 순서로 읽음)
+    """
+    query = select(
+        UsageHistory.id,
+        UsageHistory.question,
+        UsageHistory.answer,
+        UsageHistory.thinking_content,
+        UsageHistory.created_at
+    ).filter(
         UsageHistory.session_id == session_id
-    ).order_by(asc(UsageHistory.created_at))
+    ).order_by(UsageHistory.created_at, UsageHistory.id)
 
     result = await db.execute(query)
-    messages = result.scalars().all()
+    messages = result.all()
 
     return {
         "session_id": session_id,
@@ -7,6 +7,16 @@ Endpoints:
 - GET /health/db - Database connection check
 - GET /health/ready - Readiness probe (Kubernetes)
 - GET /health/live - Liveness probe (Kubernetes)
+- GET /health/upstreams - Upstream HTTP connection pool metrics
+- GET /health/usage-writer - Usage history write-behind queue metrics
+- GET /health/embedding-cache - Embedding cache hit/miss metrics
+- GET /health/db-pools - Database connection pool usage (OLTP / analytics)
+- GET /health/edb - EDB (wisenut) connection pool status and acquire wait time
+- GET /health/usage-rollup - Usage rollup high-water mark and throughput
+- GET /health/ip-allowlist - In-memory IP allowlist version and allow/deny counters
+- GET /health/authz-cache - Cerbos decision cache hit ratio and policy version
+- GET /health/sessions - Spring session cache hit ratio and Redis / API validation counts
+- GET /health/vector-permissions - Pending / synced document permission payload updates
 
 Security:
 - No authentication required (public endpoints)
@@ -15,8 +25,20 @@ Security:
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import text
-from app.core.database import get_db
+from app.core.database import get_db, all_pool_stats
 from app.core.config import settings
+from app.core.edb import edb_pool
+from app.core.http_client import http_clients
+from app.services.usage_writer import usage_writer
+from app.services.categorization_worker import conversation_categorizer
+from app.services.usage_rollup import usage_rollup
+from app.services.vectorization_service import vectorization_service
+from app.services.embedding_cache import embedding_cache
+from app.services.ai_service import ai_service
+from app.services.ip_allowlist import ip_allowlist
+from app.services.vector_permission_sync import vector_permission_sync
+from app.dependencies import decision_cache
+from app.middleware.spring_session_auth import spring_auth
 from datetime import datetime
 import logging
 
@@ -202,3 +224,399 @@ async def liveness_probe():
         "timestamp": datetime.utcnow().isoformat() + "Z",
         "uptime": "application is running"
     }
+
+
+@router.get("/health/upstreams")
+@admin_router.get("/health/upstreams")
+async def upstream_pool_metrics():
+    """
+    Upstream Connection Pool Metrics
+
+    Reports per-upstream pool usage of the shared HTTP clients
+    (ds-api, vLLM, embedding, Qdrant, Cerbos, STT).
+
+    Returns:
+        {
+            "timestamp": "2025-10-22T12:00:00.000Z",
+            "upstreams": {
+                "ds_api": {
+                    "max_connections": 500,
+                    "in_flight": 12,
+                    "peak_in_flight": 87,
+                    "saturation": 0.024,
+                    "total_requests": 10234,
+                    "saturated_requests": 0,
+                    "errors": 3,
+                    "avg_ttfb_ms": 412.5
+                }
+            }
+        }
+    """
+    return {
+        "timestamp": datetime.utcnow().isoformat() + "Z",
+        "upstreams": http_clients.metrics()
+    }
+
+
+@router.get("/health/usage-writer")
+@admin_router.get("/health/usage-writer")
+async def usage_writer_metrics():
+    """
+    Usage History Write-Behind Metrics
+
+    Reports queue depth, flush latency and spill counters of the
+    background usage_history writer.
+
+    Returns:
+        {
+            "timestamp": "2025-10-22T12:00:00.000Z",
+            "writer": {
+                "running": true,
+                "queue_depth": 3,
+                "queue_capacity": 5000,
+                "inserted": 10230,
+                "duplicates": 4,
+                "spilled": 0,
+                "avg_flush_ms": 18.4,
+                "max_lag_ms": 912.0,
+                ...
+            }
+        }
+    """
+    return {
+        "timestamp": datetime.utcnow().isoformat() + "Z",
+        "writer": usage_writer.metrics()
+    }
+
+
+@router.get("/health/categorizer")
+@admin_router.get("/health/categorizer")
+async def categorizer_metrics():
+    """
+    Conversation Categorizer Metrics
+
+    Reports throughput, LLM call count, cache hits and the lag of the
+    oldest uncategorized usage_history row.
+
+    Returns:
+        {
+            "timestamp": "2025-10-22T12:00:00.000Z",
+            "categorizer": {
+                "running": true,
+                "batches": 120,
+                "categorized": 11840,
+                "llm_calls": 7310,
+                "cache_hits": 4530,
+                "failures": 2,
+                "rows_per_sec": 38.2,
+                "lag_seconds": 12.4,
+                "cache_size": 7310,
+                ...
+            }
+        }
+    """
+    return {
+        "timestamp": datetime.utcnow().isoformat() + "Z",
+        "categorizer": conversation_categorizer.metrics()
+    }
+
+
+@router.get("/health/vectorization")
+@admin_router.get("/health/vectorization")
+async def vectorization_metrics():
+    """
+    Vectorization Pipeline Metrics
+
+    Reports document vectorization throughput (chunks/sec) split into
+    embedding and Qdrant upsert phases.
+
+    Returns:
+        {
+            "timestamp": "2025-10-22T12:00:00.000Z",
+            "vectorization": {
+                "documents": 42,
+                "chunks": 18230,
+                "failures": 0,
+                "chunks_per_sec": 310.4,
+                "embed_chunks_per_sec": 355.0,
+                "upsert_chunks_per_sec": 2480.1,
+                "last_run": {"chunks": 2000, "total_seconds": 6.1, ...},
+                ...
+            }
+        }
+    """
+    return {
+        "timestamp": datetime.utcnow().isoformat() + "Z",
+        "vectorization": vectorization_service.metrics()
+    }
+
+
+@router.get("/health/embedding-cache")
+@admin_router.get("/health/embedding-cache")
+async def embedding_cache_metrics():
+    """
+    Embedding Cache Metrics
+
+    Reports content-hash embedding cache hits (in-process LRU / Redis),
+    misses, and the estimated embedding time saved by cache hits, plus
+    RAG query embedding cache / coalescing / micro-batch counters.
+
+    Returns:
+        {
+            "timestamp": "2025-10-22T12:00:00.000Z",
+            "embedding_cache": {
+                "local_hits": 1200,
+                "redis_hits": 5400,
+                "misses": 800,
+                "hit_ratio": 0.8919,
+                "embed_seconds": 12.4,
+                "estimated_saved_seconds": 102.3,
+                ...
+            },
+            "query_embedder": {
+                "hits": 9100,
+                "misses": 700,
+                "coalesced": 210,
+                "batches": 180,
+                "avg_batch_size": 3.9,
+                ...
+            }
+        }
+    """
+    return {
+        "timestamp": datetime.utcnow().isoformat() + "Z",
+        "embedding_cache": embedding_cache.metrics(),
+        "query_embedder": ai_service.query_embedder.metrics()
+    }
+
+
+@router.get("/health/db-pools")
+@admin_router.get("/health/db-pools")
+async def db_pool_metrics():
+    """
+    Database Connection Pool Metrics
+
+    Reports pool usage for the OLTP engine and the analytics/export engine.
+    Rising avg_wait_ms or timeouts means the pool is saturated.
+
+    Returns:
+        {
+            "timestamp": "2025-10-22T12:00:00.000Z",
+            "pools": {
+                "oltp": {
+                    "size": 20,
+                    "checked_in": 12,
+                    "checked_out": 8,
+                    "overflow": 0,
+                    "max_overflow": 10,
+                    "checkouts": 10423,
+                    "timeouts": 0,
+                    "avg_wait_ms": 0.041,
+                    "max_wait_ms": 12.5
+                },
+                "analytics": {...}
+            }
+        }
+    """
+    return {
+        "timestamp": datetime.utcnow().isoformat() + "Z",
+        "pools": all_pool_stats()
+    }
+
+
+@router.get("/health/edb")
+@admin_router.get("/health/edb")
+async def edb_pool_metrics():
+    """
+    EDB Connection Pool Health
+
+    Runs SELECT 1 through the shared EDB (wisenut) pool and reports pool
+    size and connection acquire wait time.
+
+    Returns:
+        {
+            "timestamp": "2025-10-22T12:00:00.000Z",
+            "status": "healthy",
+            "latency_ms": 1.8,
+            "pool": {
+                "min_size": 2,
+                "max_size": 10,
+                "size": 4,
+                "idle": 3,
+                "acquisitions": 5120,
+                "failures": 0,
+                "avg_wait_ms": 0.21,
+                "max_wait_ms": 14.3
+            }
+        }
+    """
+    try:
+        check = await edb_pool.health_check()
+    except Exception as e:
+        logger.error(f"EDB health check failed: {e}")
+        check = {"status": "unhealthy", "error": "EDB connection failed"}
+    return {
+        "timestamp": datetime.utcnow().isoformat() + "Z",
+        **check,
+        "pool": edb_pool.metrics()
+    }
+
+
+@router.get("/health/usage-rollup")
+@admin_router.get("/health/usage-rollup")
+async def usage_rollup_metrics():
+    """
+    Usage Rollup Metrics
+
+    Reports the high-water mark and throughput of the job that keeps the
+    hourly / daily usage rollup tables behind the statistics endpoints.
+
+    Returns:
+        {
+            "timestamp": "2025-10-22T12:00:00.000Z",
+            "rollup": {
+                "running": true,
+                "batches": 310,
+                "rows": 48211,
+                "rebuilds": 0,
+                "failures": 0,
+                "last_id": 982231,
+                "last_run_at": "2025-10-22T11:59:12.000000+00:00",
+                "settle_seconds": 300.0,
+                "timezone": "Asia/Seoul"
+            }
+        }
+    """
+    return {
+        "timestamp": datetime.utcnow().isoformat() + "Z",
+        "rollup": usage_rollup.metrics()
+    }
+
+
+@router.get("/health/ip-allowlist")
+@admin_router.get("/health/ip-allowlist")
+async def ip_allowlist_metrics():
+    """
+    IP Allowlist Metrics
+
+    Reports the rule version loaded by this worker and the allow/deny totals.
+    Per-rule counters are only exposed through the admin IP whitelist API.
+
+    Returns:
+        {
+            "timestamp": "2025-10-22T12:00:00.000Z",
+            "allowlist": {
+                "allowed": 120433,
+                "denied": 12,
+                "unmatched": 10,
+                "invalid": 0,
+                "reloads": 4,
+                "failures": 0,
+                "last_reload_at": 1761134352.1,
+                "loaded": true,
+                "version": 7,
+                "rules": 23,
+                "running": true,
+                "redis": true,
+                "redis_errors": 0
+            }
+        }
+    """
+    return {
+        "timestamp": datetime.utcnow().isoformat() + "Z",
+        "allowlist": ip_allowlist.metrics()
+    }
+
+
+@router.get("/health/authz-cache")
+@admin_router.get("/health/authz-cache")
+async def authz_cache_metrics():
+    """
+    Authorization Decision Cache Metrics
+
+    Reports how many Cerbos decisions were served from the in-process cache
+    and which policy version the cached decisions belong to.
+
+    Returns:
+        {
+            "timestamp": "2025-10-22T12:00:00.000Z",
+            "decision_cache": {
+                "entries": 812,
+                "max_size": 50000,
+                "ttl": 30.0,
+                "hits": 95120,
+                "misses": 2210,
+                "hit_ratio": 0.9773,
+                "invalidations": 1,
+                "policy_version": "3f2a9c..."
+            }
+        }
+    """
+    return {
+        "timestamp": datetime.utcnow().isoformat() + "Z",
+        "decision_cache": decision_cache.metrics()
+    }
+
+
+@router.get("/health/sessions")
+@admin_router.get("/health/sessions")
+async def session_cache_metrics():
+    """
+    Spring Session Validation Metrics
+
+    Reports how many JSESSIONID validations were served from the in-process
+    cache, read from Spring Session Redis, or sent to the Spring Boot API.
+
+    Returns:
+        {
+            "timestamp": "2025-10-22T12:00:00.000Z",
+            "sessions": {
+                "entries": 340,
+                "hits": 48210,
+                "negative_hits": 35,
+                "misses": 1920,
+                "hit_ratio": 0.9617,
+                "invalidations": 12,
+                "redis": true,
+                "redis_lookups": 1915,
+                "api_fallbacks": 5,
+                "redis_errors": 0,
+                "listening": true
+            }
+        }
+    """
+    return {
+        "timestamp": datetime.utcnow().isoformat() + "Z",
+        "sessions": spring_auth.metrics()
+    }
+
+
+@router.get("/health/vector-permissions")
+@admin_router.get("/health/vector-permissions")
+async def vector_permission_metrics():
+    """
+    Vector Permission Sync Metrics
+
+    Reports document permission changes waiting to be written to the Qdrant
+    point payload (access_departments) used by RAG search filtering.
+
+    Returns:
+        {
+            "timestamp": "2025-10-22T12:00:00.000Z",
+            "vector_permissions": {
+                "documents": 152,
+                "requests": 152,
+                "failures": 0,
+                "full_syncs": 1,
+                "last_sync_at": 1761134352.1,
+                "pending": 0,
+                "backfilled": true,
+                "collection": "130825-512-v3",
+                "running": true
+            }
+        }
+    """
+    return {
+        "timestamp": datetime.utcnow().isoformat() + "Z",
+        "vector_permissions": vector_permission_sync.metrics()
+    }
@@ -36,6 +36,8 @@ class ConversationListResponse(BaseModel):
     """대화 목록 응답"""
     conversations: List[ConversationSummary]
     total: int
+    next_cursor: Optional[str] = None
+    prev_cursor: Optional[str] = None
 
 
 class MessageReference(BaseModel):
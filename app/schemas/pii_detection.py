@@ -45,3 +45,21 @@ class PIIDetectionListResponse(BaseModel):
     items: List[PIIDetectionResultResponse]
     page: int
     page_size: int
+
+
+class PIIScanJobResponse(BaseModel):
+    """일괄 PII 검사 작업 진행 상황"""
+    id: int
+    status: str = Field(..., description="작업 상태 (running, completed, failed, cancelled)")
+    running_here: bool = Field(False, description="현재 API 프로세스에서 실행 중인지 여부")
+    total_documents: int
+    processed_documents: int = Field(..., description="검사 + 생략 문서 수")
+    scanned_count: int
+    skipped_count: int
+    detected_count: int
+    last_document_id: int = Field(..., description="체크포인트 (마지막 처리 문서 ID)")
+    progress_percent: float
+    error_message: Optional[str] = None
+    created_at: datetime
+    updated_at: datetime
+    finished_at: Optional[datetime] = None
@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+"""
+미분류 대화 카테고리 일괄 분류 (backfill)
+main_category가 없는 과거 usage_history를 배치로 분류
+"""
+import argparse
+import asyncio
+import sys
+
+# PYTHONPATH 설정
+sys.path.insert(0, '/app')
+
+from app.services.categorization_worker import conversation_categorizer
+
+
+async def main(max_rows=None):
+    """메인 실행"""
+    try:
+        print("=" * 80)
+        print("대화 카테고리 backfill 시작")
+        print("=" * 80)
+
+        total = await conversation_categorizer.backfill(max_rows=max_rows)
+        metrics = conversation_categorizer.metrics()
+
+        print(f"\n✅ 분류 완료: {total}건")
+        print(f"   LLM 호출: {metrics['llm_calls']}회, 캐시 적중: {metrics['cache_hits']}회")
+        print(f"   처리량: {metrics['rows_per_sec']} rows/s")
+
+    except Exception as e:
+        print(f"\n❌ 오류 발생: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="미분류 대화 카테고리 backfill")
+    parser.add_argument("--max-rows", type=int, default=None, help="최대 처리 행 수")
+    args = parser.parse_args()
+    asyncio.run(main(max_rows=args.max_rows))
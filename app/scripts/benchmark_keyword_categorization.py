@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+키워드 분류 마이크로 벤치마크
+기존 키워드별 부분문자열 검색 루프와 Aho-Corasick 오토마톤 비교 (기본 100k 대화)
+"""
+import argparse
+import random
+import sys
+import time
+
+# PYTHONPATH 설정
+sys.path.insert(0, '/app')
+
+from app.services.categorization import KEYWORD_RULES, categorize_many
+
+FILLER = [
+    "질문", "답변은", "다음과", "같습니다", "관련", "규정", "에", "대한", "내용을",
+    "확인해", "주세요", "한국도로공사", "기준", "절차", "있습니다", "및", "the", "report",
+]
+
+
+def legacy_categorize(question: str, answer: str):
+    """기존 구현 (키워드 수 × 텍스트 길이)"""
+    text = (question + " " + answer).lower()
+    scores = {}
+    for main_cat, sub_cats in KEYWORD_RULES.items():
+        for sub_cat, keywords in sub_cats.items():
+            score = sum(1 for keyword in keywords if keyword.lower() in text)
+            if score > 0:
+                scores[(main_cat, sub_cat)] = score
+    if scores:
+        return max(scores.items(), key=lambda x: x[1])[0]
+    return "미분류", "없음"
+
+
+def make_conversations(count: int, seed: int):
+    rng = random.Random(seed)
+    keywords = [k for sub_cats in KEYWORD_RULES.values() for kws in sub_cats.values() for k in kws]
+    conversations = []
+    for _ in range(count):
+        question = " ".join(rng.choice(FILLER + keywords[:20]) for _ in range(rng.randint(5, 20)))
+        answer_words = [rng.choice(FILLER) for _ in range(rng.randint(80, 300))]
+        for _ in range(rng.randint(0, 6)):
+            answer_words.insert(rng.randrange(len(answer_words)), rng.choice(keywords))
+        conversations.append((question, " ".join(answer_words)))
+    return conversations
+
+
+def main():
+    parser = argparse.ArgumentParser(description="키워드 분류 벤치마크")
+    parser.add_argument("--count", type=int, default=100_000, help="대화 수")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    conversations = make_conversations(args.count, args.seed)
+    avg_len = sum(len(q) + len(a) for q, a in conversations) / len(conversations)
+    print(f"대화 {len(conversations):,}건, 평균 {avg_len:.0f}자")
+
+    started = time.perf_counter()
+    legacy = [legacy_categorize(q, a) for q, a in conversations]
+    legacy_sec = time.perf_counter() - started
+
+    started = time.perf_counter()
+    compiled = categorize_many(conversations)
+    compiled_sec = time.perf_counter() - started
+
+    mismatches = sum(1 for a, b in zip(legacy, compiled) if a != b)
+    print(f"기존 루프      : {legacy_sec:7.2f}s ({len(conversations) / legacy_sec:,.0f} conv/s)")
+    print(f"Aho-Corasick   : {compiled_sec:7.2f}s ({len(conversations) / compiled_sec:,.0f} conv/s)")
+    print(f"속도 향상      : {legacy_sec / compiled_sec:.2f}x, 결과 불일치 {mismatches}건")
+    if mismatches:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -8,7 +8,11 @@ import httpx
 import json
 import logging
 from app.core.config import settings
+from app.core.http_client import http_clients
 from app.services.dictionary_service import dictionary_service
+from app.services.embedding_cache import embedding_cache
+from app.services.query_embedder import QueryEmbedder
+from app.services.vector_permission_sync import vector_permission_sync
 
 logger = logging.getLogger(__name__)
 
@@ -44,12 +48,17 @@ class AIService:
         self.qdrant_api_key = getattr(settings, 'QDRANT_API_KEY', '')
         self.qdrant_collection = getattr(settings, 'QDRANT_COLLECTION', '130825-512-v3')
         self.embedding_api_url = getattr(settings, 'EMBEDDING_API_URL', 'http://localhost:8001/v1')
+        self.embedding_model = "Qwen/Qwen3-Embedding-0.6B"
+        self.query_embedder = QueryEmbedder(
+            embed=self._embed_texts,
+            ttl=settings.QUERY_EMBED_CACHE_TTL,
+            max_size=settings.QUERY_EMBED_CACHE_SIZE,
+            batch_window=settings.QUERY_EMBED_BATCH_WINDOW_MS / 1000,
+            max_batch=settings.QUERY_EMBED_MAX_BATCH,
+        )
 
         self.qdrant_url = f"http://{self.qdrant_host}:{self.qdrant_port}"
 
-        # HTTP 클라이언트 (타임아웃 설정)
-        self.client = httpx.AsyncClient(timeout=300.0)
-
         logger.info(f"AIService initialized - vLLM: {self.vllm_api_url}, Qdrant: {self.qdrant_url}")
 
     async def stream_chat(
@@ -106,8 +115,8 @@ class AIService:
                     department=department,  # legacy support
                     search_scope=search_scope,
                     limit=5,
-                    user_department_id=user_dept_id,  # NEW: 부서별 권한 필터링
-                    db=db  # NEW: 권한 조회용
+                    user_department_id=user_dept_id,  # 부서별 권한 필터링 (Qdrant payload)
+                    db=db
                 )
 
                 if search_results:
@@ -133,7 +142,7 @@ class AIService:
 
             logger.info(f"Calling vLLM API - model: {self.vllm_model_name}, temp: {temperature}")
 
-            async with self.client.stream(
+            async with http_clients.get("vllm").stream(
                 "POST",
                 f"{self.vllm_api_url}/chat/completions",
                 json=payload,
@@ -183,7 +192,7 @@ class AIService:
             search_scope: 검색 범위 필터
             limit: 최대 결과 수
             user_department_id: 사용자 부서 ID (문서 권한 필터링용)
-            db: 데이터베이스 세션 (문서 권한 조회용)
+            db: 데이터베이스 세션 (권한 payload backfill 전 열람 가능 문서 조회용)
 
         Returns:
             List[Dict]: 검색 결과
@@ -208,31 +217,16 @@ class AIService:
             # 2. Qdrant 필터 구성
             must_filters = []
 
-            # 2-1. 부서별 문서 권한 필터링 (NEW - 핵심 기능!)
-            if user_department_id is not None and db is not None:
-                from sqlalchemy import select
-                from app.models.document_permission import DocumentPermission
-
-                # 사용자 부서가 접근 가능한 문서 ID 조회
-                perm_query = select(DocumentPermission.document_id).where(
-                    DocumentPermission.department_id == user_department_id,
-                    DocumentPermission.can_read == True
-                ).distinct()
-
-                result = await db.execute(perm_query)
-                accessible_doc_ids = [row[0] for row in result.fetchall()]
-
-                if accessible_doc_ids:
-                    # Qdrant 필터: document_id가 접근 가능한 목록에 있어야 함
-                    must_filters.append({
-                        "key": "document_id",
-                        "match": {"any": accessible_doc_ids}
-                    })
-                    logger.info(f"Department {user_department_id} can access {len(accessible_doc_ids)} documents")
-                else:
+            # 2-1. 부서별 문서 권한 필터링
+            # 열람 가능 부서가 point payload(access_departments)에 비정규화되어 있어
+            # 문서 수와 무관하게 조건 하나로 필터링 (vector_permission_sync 참고)
+            if user_department_id is not None:
+                condition = await vector_permission_sync.access_condition(user_department_id, db)
+                if condition is None:
                     # 접근 가능한 문서가 없으면 빈 결과 반환
                     logger.warning(f"Department {user_department_id} has no accessible documents")
                     return []
+                must_filters.append(condition)
 
             # 2-2. 레거시 부서 필터 (deprecated)
             elif department:
@@ -263,7 +257,7 @@ class AIService:
             if self.qdrant_api_key:
                 headers["api-key"] = self.qdrant_api_key
 
-            response = await self.client.post(
+            response = await http_clients.get("qdrant").post(
                 f"{self.qdrant_url}/collections/{self.qdrant_collection}/points/search",
                 json=search_payload,
                 headers=headers
@@ -291,34 +285,40 @@ class AIService:
 
     async def _get_embedding(self, text: str) -> Optional[List[float]]:
         """
-        텍스트 임베딩 생성
+        질의 임베딩 생성 (질의 캐시 / 동시 요청 병합 / 마이크로 배치)
 
         Args:
-            text: 임베딩할 텍스트
+            text: 임베딩할 텍스트 (동의어 치환된 질의)
 
         Returns:
             List[float]: 임베딩 벡터 (1024-dim for Qwen3-Embedding-0.6B)
         """
         try:
-            response = await self.client.post(
-                f"{self.embedding_api_url}/embeddings",
-                json={
-                    "input": text,
-                    "model": "Qwen/Qwen3-Embedding-0.6B"
-                },
-                headers={"Content-Type": "application/json"}
-            )
-            response.raise_for_status()
-
-            data = response.json()
-            embedding = data.get("data", [{}])[0].get("embedding", [])
-
-            return embedding
+            return await self.query_embedder.embed(text)
 
         except Exception as e:
             logger.error(f"Embedding generation error: {e}", exc_info=True)
             return None
 
+    async def _embed_texts(self, texts: List[str]) -> List[List[float]]:
+        """배치 임베딩 (임베딩 캐시에 없는 텍스트만 API 호출)"""
+        return await embedding_cache.get_or_embed(self.embedding_model, texts, self._request_embeddings)
+
+    async def _request_embeddings(self, texts: List[str]) -> List[List[float]]:
+        """임베딩 API 호출 (실패 시 예외)"""
+        response = await http_clients.get("embedding").post(
+            f"{self.embedding_api_url}/embeddings",
+            json={
+                "input": texts,
+                "model": self.embedding_model
+            },
+            headers={"Content-Type": "application/json"}
+        )
+        response.raise_for_status()
+
+        data = response.json()
+        return [item.get("embedding", []) for item in data.get("data", [])]
+
     def _build_messages(
         self,
         message: str,
@@ -391,8 +391,11 @@ class AIService:
         return "\n".join(context_parts)
 
     async def close(self):
-        """HTTP 클라이언트 종료"""
-        await self.client.aclose()
+        """
+        종료 훅 (하위 호환용)
+
+        HTTP 커넥션 풀은 app.core.http_client 레지스트리가 앱 lifespan에서 정리합니다.
+        """
         logger.info("AIService closed")
 
 
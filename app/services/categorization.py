@@ -3,12 +3,13 @@ Conversation Categorization Service
 규칙 기반 대화 자동 분류 서비스 (MVP)
 TODO: LLM 기반 분류로 업그레이드
 """
-import httpx
 import json
 import logging
 import re
-from typing import Dict, Tuple, Optional
+from typing import Dict, Iterable, List, Tuple, Optional
 from app.core.config import settings
+from app.core.http_client import http_clients
+from app.utils.keyword_matcher import KeywordAutomaton
 
 logger = logging.getLogger(__name__)
 
@@ -127,6 +128,57 @@ CATEGORIZATION_PROMPT = """다음은 한국도로공사 ex-GPT 시스템의 사
 JSON만 출력하세요."""
 
 
+def build_keyword_automaton(rules: Dict[str, Dict[str, List[str]]]) -> KeywordAutomaton:
+    """KEYWORD_RULES 형식의 규칙을 (대분류, 소분류) 라벨 오토마톤으로 컴파일"""
+    return KeywordAutomaton(
+        (keyword, (main_cat, sub_cat))
+        for main_cat, sub_cats in rules.items()
+        for sub_cat, keywords in sub_cats.items()
+        for keyword in keywords
+    )
+
+
+def _rule_order(rules: Dict[str, Dict[str, List[str]]]) -> Dict[Tuple[str, str], int]:
+    return {
+        (main_cat, sub_cat): index
+        for index, (main_cat, sub_cat) in enumerate(
+            (main_cat, sub_cat) for main_cat, sub_cats in rules.items() for sub_cat in sub_cats
+        )
+    }
+
+
+# 모듈 로드 시 1회 컴파일 (reload_keyword_rules로 교체)
+_keyword_automaton = build_keyword_automaton(KEYWORD_RULES)
+_keyword_rule_order = _rule_order(KEYWORD_RULES)
+
+
+def reload_keyword_rules(rules: Dict[str, Dict[str, List[str]]]) -> None:
+    """
+    키워드 규칙 교체 (DB 등 외부 소스에서 읽은 규칙 반영)
+
+    새 오토마톤을 완성한 뒤 참조만 바꾸므로 분류 중인 요청에 영향이 없습니다.
+
+    Args:
+        rules: KEYWORD_RULES와 같은 {대분류: {소분류: [키워드, ...]}} 구조
+    """
+    global _keyword_automaton, _keyword_rule_order
+    automaton = build_keyword_automaton(rules)
+    order = _rule_order(rules)
+    _keyword_automaton, _keyword_rule_order = automaton, order
+    logger.info(f"Keyword rules reloaded: {len(automaton)} keywords, {len(order)} subcategories")
+
+
+def _best_keyword_category(question: str, answer: str) -> Tuple[Tuple[str, str], int]:
+    # 텍스트 1회 순회로 모든 소분류 점수 계산 (소분류별 서로 다른 키워드 매칭 수)
+    automaton, order = _keyword_automaton, _keyword_rule_order
+    scores = automaton.count_labels(question + " " + answer)
+    if not scores:
+        return ("미분류", "없음"), 0
+    # 동점이면 규칙 정의 순서가 앞선 소분류
+    best = min(scores, key=lambda category: (-scores[category], order[category]))
+    return best, scores[best]
+
+
 def categorize_by_keywords(question: str, answer: str) -> Tuple[str, str]:
     """
     키워드 기반 대화 분류 (규칙 기반 MVP)
@@ -138,25 +190,23 @@ def categorize_by_keywords(question: str, answer: str) -> Tuple[str, str]:
     Returns:
         (main_category, sub_category) 튜플
     """
-    text = (question + " " + answer).lower()
-
-    # 각 카테고리별로 점수 계산
-    scores = {}
-    for main_cat, sub_cats in KEYWORD_RULES.items():
-        for sub_cat, keywords in sub_cats.items():
-            score = sum(1 for keyword in keywords if keyword.lower() in text)
-            if score > 0:
-                scores[(main_cat, sub_cat)] = score
-
-    # 가장 높은 점수를 가진 카테고리 선택
-    if scores:
-        best_category = max(scores.items(), key=lambda x: x[1])[0]
-        main_cat, sub_cat = best_category
-        logger.info(f"Keyword-based categorization: {main_cat} > {sub_cat} (score: {scores[best_category]})")
-        return main_cat, sub_cat
-    else:
-        # 키워드 매치 없으면 미분류
-        return "미분류", "없음"
+    (main_cat, sub_cat), score = _best_keyword_category(question, answer)
+    if score:
+        logger.info(f"Keyword-based categorization: {main_cat} > {sub_cat} (score: {score})")
+    return main_cat, sub_cat
+
+
+def categorize_many(pairs: Iterable[Tuple[str, str]]) -> List[Tuple[str, str]]:
+    """
+    키워드 기반 일괄 분류 (재분류 배치용)
+
+    Args:
+        pairs: (question, answer) 목록
+
+    Returns:
+        입력 순서와 같은 (main_category, sub_category) 목록
+    """
+    return [_best_keyword_category(question or "", answer or "")[0] for question, answer in pairs]
 
 
 async def categorize_conversation_vllm(question: str, answer: str) -> Tuple[str, str]:
@@ -201,64 +251,64 @@ async def categorize_conversation_vllm(question: str, answer: str) -> Tuple[str,
             "temperature": 0.0
         }
 
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.post(
-                "http://host.docker.internal:8000/v1/chat/completions",
-                json=llm_payload,
-                headers={"Content-Type": "application/json"}
-            )
-
-            if response.status_code != 200:
-                logger.error(f"vLLM categorization failed: {response.status_code} {response.text}")
-                return "미분류", "없음"
-
-            result = response.json()
-            content = result.get("choices", [{}])[0].get("message", {}).get("content", "")
-
-            # <think> 태그 제거
-            if "<think>" in content:
-                # think 태그 이후의 내용만 사용
-                parts = content.split("</think>")
-                if len(parts) > 1:
-                    content = parts[1].strip()
-                else:
-                    # think 태그가 닫히지 않은 경우 전체 내용 사용
-                    content = content.replace("<think>", "").strip()
-
-            # JSON 파싱
-            try:
-                # JSON 블록 추출
-                if "```json" in content:
-                    content = content.split("```json")[1].split("```")[0].strip()
-                elif "```" in content:
-                    content = content.split("```")[1].split("```")[0].strip()
-
-                # JSON 찾기 (중괄호 시작)
-                if "{" in content:
-                    start = content.index("{")
-                    end = content.rindex("}") + 1
-                    content = content[start:end]
-
-                category_data = json.loads(content)
-                main_category = category_data.get("main_category", "미분류")
-                sub_category = category_data.get("sub_category", "없음")
-
-                # 유효성 검증
-                if main_category not in CATEGORY_MAP and main_category != "미분류":
-                    logger.warning(f"Invalid main_category from LLM: {main_category}, using 미분류")
-                    main_category = "미분류"
-                    sub_category = "없음"
-                elif main_category in CATEGORY_MAP:
-                    if sub_category not in CATEGORY_MAP[main_category]['subcategories']:
-                        logger.warning(f"Invalid sub_category from LLM: {sub_category}, using 기타")
-                        sub_category = "기타"
-
-                logger.info(f"LLM Categorized: {main_category} > {sub_category}")
-                return main_category, sub_category
-
-            except (json.JSONDecodeError, ValueError) as e:
-                logger.error(f"Failed to parse LLM response as JSON: {content}, error: {e}")
-                return "미분류", "없음"
+        response = await http_clients.get("vllm").post(
+            "http://host.docker.internal:8000/v1/chat/completions",
+            json=llm_payload,
+            headers={"Content-Type": "application/json"},
+            timeout=30.0
+        )
+
+        if response.status_code != 200:
+            logger.error(f"vLLM categorization failed: {response.status_code} {response.text}")
+            return "미분류", "없음"
+
+        result = response.json()
+        content = result.get("choices", [{}])[0].get("message", {}).get("content", "")
+
+        # <think> 태그 제거
+        if "<think>" in content:
+            # think 태그 이후의 내용만 사용
+            parts = content.split("</think>")
+            if len(parts) > 1:
+                content = parts[1].strip()
+            else:
+                # think 태그가 닫히지 않은 경우 전체 내용 사용
+                content = content.replace("<think>", "").strip()
+
+        # JSON 파싱
+        try:
+            # JSON 블록 추출
+            if "```json" in content:
+                content = content.split("```json")[1].split("```")[0].strip()
+            elif "```" in content:
+                content = content.split("```")[1].split("```")[0].strip()
+
+            # JSON 찾기 (중괄호 시작)
+            if "{" in content:
+                start = content.index("{")
+                end = content.rindex("}") + 1
+                content = content[start:end]
+
+            category_data = json.loads(content)
+            main_category = category_data.get("main_category", "미분류")
+            sub_category = category_data.get("sub_category", "없음")
+
+            # 유효성 검증
+            if main_category not in CATEGORY_MAP and main_category != "미분류":
+                logger.warning(f"Invalid main_category from LLM: {main_category}, using 미분류")
+                main_category = "미분류"
+                sub_category = "없음"
+            elif main_category in CATEGORY_MAP:
+                if sub_category not in CATEGORY_MAP[main_category]['subcategories']:
+                    logger.warning(f"Invalid sub_category from LLM: {sub_category}, using 기타")
+                    sub_category = "기타"
+
+            logger.info(f"LLM Categorized: {main_category} > {sub_category}")
+            return main_category, sub_category
+
+        except (json.JSONDecodeError, ValueError) as e:
+            logger.error(f"Failed to parse LLM response as JSON: {content}, error: {e}")
+            return "미분류", "없음"
 
     except Exception as e:
         logger.error(f"Error during LLM categorization: {e}", exc_info=True)
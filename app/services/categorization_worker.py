@@ -0,0 +1,339 @@
+"""
+Conversation Categorization Worker
+usage_history 대화 카테고리 배치 분류 워커
+
+채팅 저장 경로에서 LLM 분류를 분리하여 백그라운드에서 처리합니다.
+- main_category IS NULL 행을 배치로 선점 (category_claimed_at 리스) 후 바로 커밋
+  → vLLM 호출 동안 행 잠금 / 유휴 트랜잭션을 유지하지 않음
+- 정규화된 질문 해시 기준 결과 캐시 (같은 질문은 vLLM 1회 호출)
+- vLLM 동시 호출 수 제한 (parallelism)
+- (대분류, 소분류)별 bulk UPDATE, 이미 '미분류'로 집계된 행은 같은 트랜잭션에서 사용 집계 보정
+- 과거 데이터 backfill 모드 (id 오름차순 keyset 순회)
+- 처리량 / 지연(lag) 카운터
+"""
+import asyncio
+import hashlib
+import logging
+import re
+import time
+from collections import OrderedDict, defaultdict
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import func, select, update
+
+from app.core.config import settings
+from app.core.session_factory import LazySessionFactory
+from app.models import UsageHistory
+from app.services.categorization import categorize_conversation_safe
+from app.services.usage_rollup import usage_rollup
+
+logger = logging.getLogger(__name__)
+
+_WHITESPACE = re.compile(r"\s+")
+_TRAILING_PUNCT = re.compile(r"[\s\?\!\.。？！~]+$")
+
+
+def normalize_question(question: str) -> str:
+    """캐시 키용 질문 정규화 (대소문자, 공백, 끝 문장부호 무시)"""
+    text = _WHITESPACE.sub(" ", (question or "").strip().lower())
+    return _TRAILING_PUNCT.sub("", text)
+
+
+def question_hash(question: str) -> str:
+    return hashlib.sha1(normalize_question(question).encode("utf-8")).hexdigest()
+
+
+class CategorizerStats:
+    """분류 워커 카운터"""
+
+    def __init__(self):
+        self.batches = 0
+        self.categorized = 0
+        self.llm_calls = 0
+        self.cache_hits = 0
+        self.failures = 0
+        self.busy_seconds = 0.0
+        self.lag_seconds: Optional[float] = None  # 가장 오래된 미분류 행의 대기 시간
+        self.last_run_at: Optional[datetime] = None
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "batches": self.batches,
+            "categorized": self.categorized,
+            "llm_calls": self.llm_calls,
+            "cache_hits": self.cache_hits,
+            "failures": self.failures,
+            "rows_per_sec": round(self.categorized / self.busy_seconds, 2) if self.busy_seconds else 0.0,
+            "lag_seconds": round(self.lag_seconds, 1) if self.lag_seconds is not None else None,
+            "last_run_at": self.last_run_at.isoformat() if self.last_run_at else None,
+        }
+
+
+class ConversationCategorizer:
+    """
+    미분류 대화 배치 분류기
+
+    실시간 모드는 최신 행부터 처리하여 대시보드 반영 지연을 줄이고,
+    backfill 모드는 id 오름차순으로 과거 데이터를 끝까지 순회합니다.
+    """
+
+    session_factory = LazySessionFactory()
+
+    def __init__(
+        self,
+        session_factory=None,
+        batch_size: int = 100,
+        parallelism: int = 8,
+        poll_interval: float = 5.0,
+        cache_size: int = 10000,
+        claim_lease: float = 600.0,
+        classify=None,
+        rollup=None,
+    ):
+        """
+        Args:
+            session_factory: AsyncSession 팩토리 (None이면 app.core.database.AsyncSessionLocal)
+            batch_size: 1회 조회/분류 행 수
+            parallelism: vLLM 동시 호출 수
+            poll_interval: 미분류 행이 없을 때 대기 시간 (초)
+            cache_size: 질문 해시 캐시 최대 항목 수
+            claim_lease: 선점 리스 (초) - 이 시간 안에 기록되지 않은 행은 다른 워커가 재선점
+            classify: (question, answer) -> (main, sub) 비동기 분류 함수
+            rollup: 집계 이후 분류된 행을 보정할 UsageRollupService (None이면 usage_rollup)
+        """
+        self.session_factory = session_factory
+        self.batch_size = batch_size
+        self.parallelism = parallelism
+        self.poll_interval = poll_interval
+        self.cache_size = cache_size
+        self.claim_lease = claim_lease
+        self.classify = classify or categorize_conversation_safe
+        self.rollup = rollup or usage_rollup
+
+        self.stats = CategorizerStats()
+        self._cache: "OrderedDict[str, Tuple[str, str]]" = OrderedDict()
+        self._task: Optional[asyncio.Task] = None
+        self._stopping = False
+
+    # ------------------------------------------------------------------
+    # 캐시
+    # ------------------------------------------------------------------
+
+    def _cache_get(self, key: str) -> Optional[Tuple[str, str]]:
+        value = self._cache.get(key)
+        if value is not None:
+            self._cache.move_to_end(key)
+        return value
+
+    def _cache_put(self, key: str, value: Tuple[str, str]) -> None:
+        self._cache[key] = value
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+    # ------------------------------------------------------------------
+    # 배치 처리
+    # ------------------------------------------------------------------
+
+    def _pending_query(self, now: datetime, after_id: Optional[int] = None, newest_first: bool = True):
+        lease_expired = now - timedelta(seconds=self.claim_lease)
+        query = select(UsageHistory.id, UsageHistory.question, UsageHistory.answer).where(
+            UsageHistory.main_category.is_(None),
+            UsageHistory.is_deleted == False,  # noqa: E712
+            ~UsageHistory.session_id.like(f"{settings.TITLE_GEN_PREFIX}%"),
+            (UsageHistory.category_claimed_at.is_(None)) | (UsageHistory.category_claimed_at < lease_expired),
+        )
+        if after_id is not None:
+            query = query.where(UsageHistory.id > after_id)
+        order = UsageHistory.id.desc() if newest_first else UsageHistory.id.asc()
+        # 여러 API 워커 프로세스가 같은 행을 동시에 선점하지 않도록 SKIP LOCKED (잠금은 선점 커밋까지만)
+        return query.order_by(order).limit(self.batch_size).with_for_update(skip_locked=True)
+
+    async def _claim(self, after_id: Optional[int], newest_first: bool) -> List[Any]:
+        """미분류 행 선점 - category_claimed_at 기록 후 즉시 커밋 (짧은 트랜잭션)"""
+        now = datetime.now(timezone.utc)
+        async with self.session_factory() as session:
+            result = await session.execute(self._pending_query(now, after_id, newest_first))
+            rows = result.all()
+            if rows:
+                await session.execute(
+                    update(UsageHistory)
+                    .where(UsageHistory.id.in_([row.id for row in rows]))
+                    .values(category_claimed_at=now)
+                    .execution_options(synchronize_session=False)
+                )
+                await session.commit()
+        return rows
+
+    async def _classify_rows(self, rows: List[Any]) -> Dict[int, Tuple[str, str]]:
+        """행별 분류 - 같은 질문은 한 번만 vLLM 호출"""
+        results: Dict[int, Tuple[str, str]] = {}
+        groups: Dict[str, List[Any]] = defaultdict(list)
+
+        for row in rows:
+            key = question_hash(row.question)
+            cached = self._cache_get(key)
+            if cached is not None:
+                results[row.id] = cached
+                self.stats.cache_hits += 1
+            else:
+                groups[key].append(row)
+
+        semaphore = asyncio.Semaphore(self.parallelism)
+
+        async def classify_group(key: str, members: List[Any]) -> None:
+            first = members[0]
+            async with semaphore:
+                self.stats.llm_calls += 1
+                try:
+                    category = await self.classify(first.question, first.answer or "")
+                except Exception as e:
+                    logger.error(f"Categorization failed for usage_history {first.id}: {e}")
+                    self.stats.failures += 1
+                    category = ("미분류", "없음")
+            if category[0] != "미분류":
+                self._cache_put(key, category)
+            for member in members:
+                results[member.id] = category
+            self.stats.cache_hits += len(members) - 1
+
+        await asyncio.gather(*(classify_group(key, members) for key, members in groups.items()))
+        return results
+
+    async def _write_back(self, session, results: Dict[int, Tuple[str, str]]) -> int:
+        """(대분류, 소분류)별로 묶어 bulk UPDATE 후 이미 집계된 행의 사용 집계 보정"""
+        by_category: Dict[Tuple[str, str], List[int]] = defaultdict(list)
+        for row_id, category in results.items():
+            by_category[category].append(row_id)
+
+        updated = 0
+        for (main_cat, sub_cat), ids in by_category.items():
+            result = await session.execute(
+                update(UsageHistory)
+                .where(UsageHistory.id.in_(ids), UsageHistory.main_category.is_(None))
+                .values(main_category=main_cat, sub_category=sub_cat)
+                .execution_options(synchronize_session=False)
+            )
+            updated += result.rowcount or 0
+        await self.rollup.recategorize(session, list(results))
+        await session.commit()
+        return updated
+
+    async def run_once(self, after_id: Optional[int] = None, newest_first: bool = True) -> Dict[str, Any]:
+        """
+        미분류 행 1배치 처리
+
+        Args:
+            after_id: 이 id보다 큰 행만 처리 (backfill keyset)
+            newest_first: True면 최신 행 우선
+
+        Returns:
+            Dict: {"fetched": int, "updated": int, "last_id": Optional[int]}
+        """
+        started = time.perf_counter()
+        rows = await self._claim(after_id, newest_first)
+        if not rows:
+            self.stats.lag_seconds = 0.0
+            return {"fetched": 0, "updated": 0, "last_id": after_id}
+
+        # vLLM 호출은 트랜잭션 밖에서 (선점 행은 리스로 보호)
+        results = await self._classify_rows(rows)
+        async with self.session_factory() as session:
+            updated = await self._write_back(session, results)
+            await self._refresh_lag(session)
+
+        self.stats.batches += 1
+        self.stats.categorized += updated
+        self.stats.busy_seconds += time.perf_counter() - started
+        self.stats.last_run_at = datetime.now(timezone.utc)
+        logger.info(f"Categorized {updated}/{len(rows)} conversations ({self.stats.llm_calls} LLM calls total)")
+        return {"fetched": len(rows), "updated": updated, "last_id": max(row.id for row in rows)}
+
+    async def _refresh_lag(self, session) -> None:
+        result = await session.execute(
+            select(func.min(UsageHistory.created_at)).where(
+                UsageHistory.main_category.is_(None),
+                UsageHistory.is_deleted == False,  # noqa: E712
+                ~UsageHistory.session_id.like(f"{settings.TITLE_GEN_PREFIX}%"),
+            )
+        )
+        oldest = result.scalar()
+        if oldest is None:
+            self.stats.lag_seconds = 0.0
+        else:
+            if oldest.tzinfo is None:
+                oldest = oldest.replace(tzinfo=timezone.utc)
+            self.stats.lag_seconds = (datetime.now(timezone.utc) - oldest).total_seconds()
+
+    async def backfill(self, max_rows: Optional[int] = None) -> int:
+        """
+        과거 미분류 데이터 일괄 분류 (id 오름차순 keyset 순회)
+
+        Args:
+            max_rows: 최대 처리 행 수 (None이면 끝까지)
+
+        Returns:
+            int: 분류된 행 수
+        """
+        total = 0
+        last_id = 0
+        while max_rows is None or total < max_rows:
+            result = await self.run_once(after_id=last_id, newest_first=False)
+            if result["fetched"] == 0:
+                break
+            total += result["updated"]
+            last_id = result["last_id"]
+        logger.info(f"Categorization backfill completed: {total} rows")
+        return total
+
+    # ------------------------------------------------------------------
+    # 수명주기
+    # ------------------------------------------------------------------
+
+    def start(self) -> None:
+        """백그라운드 분류 루프 시작"""
+        if self._task is not None and not self._task.done():
+            return
+        self._stopping = False
+        self._task = asyncio.create_task(self._run(), name="conversation-categorizer")
+        logger.info(f"Conversation categorizer started (batch={self.batch_size}, parallelism={self.parallelism})")
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._stopping = True
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        logger.info("Conversation categorizer stopped")
+
+    async def _run(self) -> None:
+        while not self._stopping:
+            try:
+                result = await self.run_once()
+                if result["fetched"] == self.batch_size:
+                    continue  # 적체 중이면 즉시 다음 배치
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Categorizer batch failed: {e}", exc_info=True)
+            await asyncio.sleep(self.poll_interval)
+
+    def metrics(self) -> Dict[str, Any]:
+        data = self.stats.snapshot()
+        data["cache_size"] = len(self._cache)
+        data["running"] = self._task is not None and not self._task.done()
+        return data
+
+
+# 싱글톤 인스턴스
+conversation_categorizer = ConversationCategorizer(
+    batch_size=settings.CATEGORIZER_BATCH_SIZE,
+    parallelism=settings.CATEGORIZER_PARALLELISM,
+    poll_interval=settings.CATEGORIZER_POLL_INTERVAL,
+    claim_lease=settings.CATEGORIZER_CLAIM_LEASE,
+)
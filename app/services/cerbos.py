@@ -1,16 +1,15 @@
 """Cerbos 권한 관리 서비스"""
-import httpx
+import logging
 from typing import Dict, List, Optional
-from app.core.config import settings
+
+from cerbos.sdk.model import Principal, Resource, ResourceAction, ResourceList
+
+logger = logging.getLogger(__name__)
 
 
 class CerbosClient:
     """Cerbos API 클라이언트"""
 
-    def __init__(self):
-        self.base_url = f"http://{settings.CERBOS_HOST}:{settings.CERBOS_PORT}"
-        self.api_url = f"{self.base_url}/api/check"
-
     async def check_permission(
         self,
         principal_id: str,
@@ -36,46 +35,25 @@ class CerbosClient:
         Returns:
             Dict[str, bool]: 액션별 허용 여부
         """
-        payload = {
-            "principal": {
-                "id": principal_id,
-                "roles": principal_roles,
-                "attr": principal_attr or {}
-            },
-            "resource": {
-                "kind": resource_kind,
-                "id": resource_id,
-                "attr": resource_attr or {}
-            },
-            "actions": actions
-        }
+        # 의존성과 같은 판정 캐시 + 일괄 요청 클라이언트 사용 (요청마다 PDP 왕복하지 않음)
+        from app.dependencies import get_cerbos_client
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    self.api_url,
-                    json=payload,
-                    timeout=5.0
-                )
-                response.raise_for_status()
-                result = response.json()
-
-                # 결과를 액션별 딕셔너리로 변환
-                permissions = {}
-                for action_result in result.get("results", []):
-                    action = action_result.get("action")
-                    effect = action_result.get("effect")
-                    permissions[action] = effect == "EFFECT_ALLOW"
-
-                return permissions
-
-        except httpx.RequestError as e:
-            # Cerbos 연결 실패 시 기본 권한 정책 적용
-            print(f"Cerbos connection error: {e}")
-            return {action: False for action in actions}
+            cerbos = await get_cerbos_client()
+            result = await cerbos.check_resources(
+                principal=Principal(id=principal_id, roles=set(principal_roles), attr=principal_attr or {}),
+                resources=ResourceList(resources=[
+                    ResourceAction(
+                        resource=Resource(id=resource_id, kind=resource_kind, attr=resource_attr or {}),
+                        actions=list(actions)
+                    )
+                ])
+            )
+            return {action: result.results[0].is_allowed(action) for action in actions}
 
         except Exception as e:
-            print(f"Cerbos permission check error: {e}")
+            # Cerbos 연결 실패 시 기본 권한 정책 적용 (모두 거부)
+            logger.error(f"Cerbos permission check error: {e}")
             return {action: False for action in actions}
 
     async def check_single_permission(
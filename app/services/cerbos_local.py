@@ -0,0 +1,155 @@
+"""
+로컬 Cerbos 정책 평가기 (테스트/개발용 PDP 대체)
+
+policies/policies/*.yaml 리소스 정책을 프로세스 안에서 평가해 AsyncCerbosClient.check_resources와
+같은 형태의 응답을 돌려줍니다. Cerbos 서버 없이 권한 의존성을 테스트할 때 사용합니다.
+
+지원 범위 (현재 정책에서 쓰는 기능):
+- resourcePolicy rules: actions ('*' 포함), roles ('*' 포함), effect (DENY 우선)
+- condition.match: expr 하나 또는 all/any/none 목록
+- expr: `<값> == <값>` / `<값> != <값>`
+  (값: request.principal.id / request.principal.attr.X / request.resource.id / request.resource.attr.X / 문자열·숫자·bool 리터럴)
+지원하지 않는 expr는 거짓으로 평가합니다 (기본 거부).
+"""
+import fnmatch
+import logging
+import re
+import uuid
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import yaml
+from cerbos.sdk.model import (
+    CheckResourcesResponse,
+    CheckResourcesResult,
+    Effect,
+    Principal,
+    Resource,
+    ResourceList,
+)
+
+logger = logging.getLogger(__name__)
+
+_EXPR = re.compile(r"^\s*(.+?)\s*(==|!=)\s*(.+?)\s*$")
+_MISSING = object()
+
+
+class LocalPolicyEvaluator:
+    """디스크 리소스 정책을 평가하는 AsyncCerbosClient 대체 구현"""
+
+    def __init__(self, policy_dir: str):
+        """
+        Args:
+            policy_dir: 리소스 정책 YAML 디렉터리 (예: policies/policies)
+        """
+        self.policy_dir = Path(policy_dir)
+        self.calls = 0  # check_resources 호출 수
+        self.checked_resources = 0  # 평가한 리소스 수
+        self._policies: Dict[Tuple[str, str], List[Dict[str, Any]]] = {}
+        self.reload()
+
+    def reload(self) -> None:
+        """정책 파일 다시 읽기"""
+        policies: Dict[Tuple[str, str], List[Dict[str, Any]]] = {}
+        for path in sorted(self.policy_dir.glob("*.yaml")):
+            for document in yaml.safe_load_all(path.read_text(encoding="utf-8")):
+                policy = (document or {}).get("resourcePolicy")
+                if not policy:
+                    continue
+                key = (policy["resource"], policy.get("version", "default"))
+                policies[key] = policy.get("rules", [])
+        self._policies = policies
+
+    async def check_resources(
+        self,
+        principal: Principal,
+        resources: ResourceList,
+        request_id: Optional[str] = None,
+        aux_data: Optional[Any] = None,
+    ) -> CheckResourcesResponse:
+        """
+        CheckResources 평가
+
+        Args:
+            principal: 사용자
+            resources: (리소스, 액션 목록) 목록
+            request_id: 요청 ID
+            aux_data: 보조 데이터 (사용하지 않음)
+
+        Returns:
+            CheckResourcesResponse: 요청 순서와 같은 리소스별 결과
+        """
+        self.calls += 1
+        self.checked_resources += len(resources.resources)
+        results = []
+        for item in resources.resources:
+            actions = {
+                action: self.evaluate(principal, item.resource, action)
+                for action in item.actions
+            }
+            results.append(CheckResourcesResult(resource=item.resource, actions=actions))
+        return CheckResourcesResponse(request_id=request_id or str(uuid.uuid4()), results=results)
+
+    def evaluate(self, principal: Principal, resource: Resource, action: str) -> Effect:
+        """단일 (리소스, 액션) 판정 - DENY 규칙 우선, 일치하는 ALLOW 없으면 DENY"""
+        rules = self._policies.get((resource.kind, resource.policy_version or "default"), [])
+        allowed = False
+        for rule in rules:
+            if not any(fnmatch.fnmatchcase(action, pattern) for pattern in rule.get("actions", [])):
+                continue
+            roles = rule.get("roles", [])
+            if "*" not in roles and not set(roles) & set(principal.roles):
+                continue
+            if not self._condition(rule.get("condition"), principal, resource):
+                continue
+            if rule.get("effect") == Effect.DENY.value:
+                return Effect.DENY
+            if rule.get("effect") == Effect.ALLOW.value:
+                allowed = True
+        return Effect.ALLOW if allowed else Effect.DENY
+
+    def _condition(self, condition: Optional[Dict[str, Any]], principal: Principal, resource: Resource) -> bool:
+        if not condition:
+            return True
+        return self._match(condition.get("match", {}), principal, resource)
+
+    def _match(self, match: Dict[str, Any], principal: Principal, resource: Resource) -> bool:
+        if "expr" in match:
+            return self._expr(match["expr"], principal, resource)
+        if "all" in match:
+            return all(self._match(m, principal, resource) for m in match["all"].get("of", []))
+        if "any" in match:
+            return any(self._match(m, principal, resource) for m in match["any"].get("of", []))
+        if "none" in match:
+            return not any(self._match(m, principal, resource) for m in match["none"].get("of", []))
+        return False
+
+    def _expr(self, expr: str, principal: Principal, resource: Resource) -> bool:
+        parsed = _EXPR.match(str(expr))
+        if not parsed:
+            logger.warning(f"Unsupported policy expression (evaluated as false): {expr}")
+            return False
+        left, operator, right = parsed.groups()
+        left_value = self._value(left, principal, resource)
+        right_value = self._value(right, principal, resource)
+        if left_value is _MISSING or right_value is _MISSING:
+            return False
+        return (left_value == right_value) if operator == "==" else (left_value != right_value)
+
+    @staticmethod
+    def _value(token: str, principal: Principal, resource: Resource) -> Any:
+        if token.startswith("request.principal."):
+            target, path = principal, token[len("request.principal."):]
+        elif token.startswith("request.resource."):
+            target, path = resource, token[len("request.resource."):]
+        else:
+            try:
+                return yaml.safe_load(token)
+            except yaml.YAMLError:
+                return _MISSING
+
+        if path == "id":
+            return target.id
+        if path.startswith("attr."):
+            return (target.attr or {}).get(path[len("attr."):], _MISSING)
+        return _MISSING
@@ -4,21 +4,103 @@ Chat Service
 """
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import text
+from app.core.config import settings
 from app.schemas.chat_schemas import ChatRequest
 from app.utils.room_id_generator import generate_room_id
 from app.services.ai_service import ai_service
-from typing import AsyncGenerator, List, Dict, Any
+from collections import OrderedDict
+from typing import AsyncGenerator, List, Dict, Any, Optional, Set, Tuple
+import asyncio
 import json
 import logging
 import time
 
 logger = logging.getLogger(__name__)
 
+INSERT_ROOM_SQL = text("""
+INSERT INTO "USR_CNVS_SMRY" (
+    "CNVS_IDT_ID", "CNVS_SMRY_TXT", "USR_ID", "USE_YN", "REG_DT"
+) VALUES (
+    :room_id, :summary, :user_id, 'Y', CURRENT_TIMESTAMP
+)
+""")
+
+INSERT_REFERENCE_SQL = text("""
+INSERT INTO "USR_CNVS_REF_DOC_LST" (
+    "CNVS_ID", "REF_SEQ", "ATT_DOC_NM",
+    "DOC_CHNK_TXT", "SMLT_RTE", "REG_DT"
+) VALUES (
+    :cnvs_id, :ref_seq, :doc_name,
+    :chunk_text, :score, CURRENT_TIMESTAMP
+)
+""")
+
+INSERT_SUGGESTED_QUESTION_SQL = text("""
+INSERT INTO "USR_CNVS_ADD_QUES_LST" (
+    "CNVS_ID", "ADD_QUES_SEQ", "ADD_QUES_TXT", "REG_DT"
+) VALUES (
+    :cnvs_id, :seq, :question, CURRENT_TIMESTAMP
+)
+""")
+
+
+class RoomValidityCache:
+    """
+    대화방 소유권 확인 결과 캐시 (프로세스 로컬, TTL)
+
+    같은 대화방에서 이어지는 턴마다 COUNT 조회를 반복하지 않도록 유효한 결과만 저장합니다.
+    삭제 시 discard()로 즉시 제거하며, 다른 워커에서 삭제된 경우 TTL 안에서만 이전 결과를 사용합니다.
+    """
+
+    def __init__(self, ttl: float = 60.0, max_size: int = 10000):
+        """
+        Args:
+            ttl: 캐시 만료 시간 (초, 0이면 캐시 사용 안 함)
+            max_size: 최대 대화방 수
+        """
+        self.ttl = ttl
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()  # room_id -> (user_id, 만료 시각)
+
+    def get(self, room_id: str, user_id: str) -> bool:
+        """캐시에 유효한 소유권 확인 결과가 있는지"""
+        entry = self._entries.get(room_id)
+        if entry is not None:
+            owner, expires_at = entry
+            if expires_at > time.monotonic():
+                if owner == user_id:
+                    self._entries.move_to_end(room_id)
+                    self.hits += 1
+                    return True
+            else:
+                del self._entries[room_id]
+        self.misses += 1
+        return False
+
+    def add(self, room_id: str, user_id: str) -> None:
+        """유효한 대화방으로 기록"""
+        if self.ttl <= 0:
+            return
+        self._entries[room_id] = (user_id, time.monotonic() + self.ttl)
+        self._entries.move_to_end(room_id)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def discard(self, room_id: str) -> None:
+        """대화방 삭제 시 제거"""
+        self._entries.pop(room_id, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
 
 async def validate_room_id(
     room_id: str,
     user_id: str,
-    db: AsyncSession
+    db: AsyncSession,
+    use_cache: bool = False
 ) -> bool:
     """
     Room ID 검증 (DB에서 소유권 확인 - Stateless)
@@ -27,6 +109,7 @@ async def validate_room_id(
         room_id: 대화방 ID (CNVS_IDT_ID)
         user_id: 사용자 ID
         db: 데이터베이스 세션
+        use_cache: 최근 확인된 대화방이면 DB 조회 생략 (채팅 턴 경로용)
 
     Returns:
         bool: 유효 여부 (소유권 + USE_YN = 'Y')
@@ -38,6 +121,9 @@ async def validate_room_id(
     if not room_id or not room_id.strip():
         return False
 
+    if use_cache and room_validity_cache.get(room_id, user_id):
+        return True
+
     result = await db.execute(
         text("""
         SELECT COUNT(*)
@@ -50,6 +136,8 @@ async def validate_room_id(
     )
 
     count = result.scalar()
+    if count > 0 and use_cache:
+        room_validity_cache.add(room_id, user_id)
     return count > 0
 
 
@@ -75,23 +163,7 @@ async def create_room(
         - CNVS_SMRY_TXT: 첫 질문으로 자동 생성
         - REP_CNVS_NM: 사용자가 나중에 수정 가능
     """
-    # 요약 텍스트 생성 (첫 질문의 앞 50자)
-    summary = first_question[:50] + "..." if len(first_question) > 50 else first_question
-
-    await db.execute(
-        text("""
-        INSERT INTO "USR_CNVS_SMRY" (
-            "CNVS_IDT_ID", "CNVS_SMRY_TXT", "USR_ID", "USE_YN", "REG_DT"
-        ) VALUES (
-            :room_id, :summary, :user_id, 'Y', CURRENT_TIMESTAMP
-        )
-        """),
-        {
-            "room_id": room_id,
-            "summary": summary,
-            "user_id": user_id
-        }
-    )
+    await db.execute(INSERT_ROOM_SQL, _room_params(room_id, user_id, first_question))
     await db.commit()
 
     logger.info(f"Room created - room_id: {room_id}, user: {user_id}")
@@ -189,28 +261,142 @@ async def save_reference_documents(
         cnvs_id: 메시지 ID
         search_results: 검색 결과 리스트
     """
-    for idx, doc in enumerate(search_results):
-        await db.execute(
+    if search_results:
+        # 여러 행을 한 번에 전송 (executemany)
+        await db.execute(INSERT_REFERENCE_SQL, _reference_params(cnvs_id, search_results))
+    await db.commit()
+
+    logger.info(f"Reference documents saved - cnvs_id: {cnvs_id}, count: {len(search_results)}")
+
+
+def _room_params(room_id: str, user_id: str, first_question: str) -> Dict[str, Any]:
+    # 요약 텍스트 생성 (첫 질문의 앞 50자)
+    summary = first_question[:50] + "..." if len(first_question) > 50 else first_question
+    return {"room_id": room_id, "summary": summary, "user_id": user_id}
+
+
+def _reference_params(cnvs_id: int, search_results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    return [
+        {
+            "cnvs_id": cnvs_id,
+            "ref_seq": idx,
+            "doc_name": doc["metadata"]["title"],
+            "chunk_text": doc["chunk_text"],
+            "score": doc["score"]
+        }
+        for idx, doc in enumerate(search_results)
+    ]
+
+
+async def save_chat_turn(
+    db: AsyncSession,
+    room_id: str,
+    user_id: str,
+    question: str,
+    answer: Optional[str] = None,
+    token_count: Optional[int] = None,
+    response_time_ms: Optional[int] = None,
+    search_results: Optional[List[Dict[str, Any]]] = None,
+    suggested_questions: Optional[List[str]] = None,
+    session_id: Optional[str] = None,
+    new_room: bool = False
+) -> int:
+    """
+    채팅 1턴 저장 (단일 트랜잭션, 커밋 1회)
+
+    대화방 생성(새 대화) → 질문/답변 INSERT → 참조 문서 / 추천 질문 다건 INSERT를
+    한 트랜잭션으로 묶습니다. 스트리밍 중에는 트랜잭션을 열어 두지 않도록 응답 완료 후 호출합니다.
+
+    Args:
+        db: 데이터베이스 세션
+        room_id: 대화방 ID
+        user_id: 사용자 ID
+        question: 질문 텍스트
+        answer: 답변 텍스트 (응답 실패 시 None)
+        token_count: 토큰 사용 수
+        response_time_ms: 응답 시간 (밀리초)
+        search_results: 참조 문서 (검색 결과)
+        suggested_questions: 추천 질문
+        session_id: HTTP 세션 ID
+        new_room: True면 대화방(USR_CNVS_SMRY)도 함께 생성
+
+    Returns:
+        int: CNVS_ID (생성된 메시지 ID)
+    """
+    try:
+        if new_room:
+            await db.execute(INSERT_ROOM_SQL, _room_params(room_id, user_id, question))
+
+        result = await db.execute(
             text("""
-            INSERT INTO "USR_CNVS_REF_DOC_LST" (
-                "CNVS_ID", "REF_SEQ", "ATT_DOC_NM",
-                "DOC_CHNK_TXT", "SMLT_RTE", "REG_DT"
+            INSERT INTO "USR_CNVS" (
+                "CNVS_IDT_ID", "QUES_TXT", "ANS_TXT", "TKN_USE_CNT", "RSP_TIM_MS",
+                "SESN_ID", "USE_YN", "REG_DT"
             ) VALUES (
-                :cnvs_id, :ref_seq, :doc_name,
-                :chunk_text, :score, CURRENT_TIMESTAMP
+                :room_id, :question, :answer, :tokens, :response_time,
+                :session_id, 'Y', CURRENT_TIMESTAMP
             )
+            RETURNING "CNVS_ID"
             """),
             {
-                "cnvs_id": cnvs_id,
-                "ref_seq": idx,
-                "doc_name": doc["metadata"]["title"],
-                "chunk_text": doc["chunk_text"],
-                "score": doc["score"]
+                "room_id": room_id,
+                "question": question,
+                "answer": answer,
+                "tokens": token_count,
+                "response_time": response_time_ms,
+                "session_id": session_id
             }
         )
-    await db.commit()
+        cnvs_id = result.scalar()
+
+        if search_results:
+            await db.execute(INSERT_REFERENCE_SQL, _reference_params(cnvs_id, search_results))
+        if suggested_questions:
+            await db.execute(INSERT_SUGGESTED_QUESTION_SQL, [
+                {"cnvs_id": cnvs_id, "seq": seq, "question": suggested}
+                for seq, suggested in enumerate(suggested_questions)
+            ])
+
+        await db.commit()
+    except Exception:
+        await db.rollback()
+        raise
+
+    if new_room:
+        room_validity_cache.add(room_id, user_id)
+
+    logger.info(
+        f"Chat turn saved - room_id: {room_id}, cnvs_id: {cnvs_id}, "
+        f"references: {len(search_results or [])}, suggested: {len(suggested_questions or [])}"
+    )
+    return cnvs_id
 
-    logger.info(f"Reference documents saved - cnvs_id: {cnvs_id}, count: {len(search_results)}")
+
+# 클라이언트 연결 종료 후 질문 저장 태스크 (완료 전 GC 방지)
+_disconnect_saves: Set[asyncio.Task] = set()
+
+
+async def _save_question_after_disconnect(room_id: str, user_id: str, question: str, new_room: bool) -> None:
+    """클라이언트 연결 종료 시 질문만 저장 (정리 중인 요청 세션 대신 별도 세션 사용)"""
+    from app.core.database import AsyncSessionLocal
+
+    try:
+        async with AsyncSessionLocal() as db:
+            await save_chat_turn(db, room_id, user_id, question, new_room=new_room)
+    except Exception as e:
+        logger.error(f"Failed to save question after client disconnect: {e}")
+
+
+def _schedule_disconnect_save(room_id: str, user_id: str, question: str, new_room: bool) -> None:
+    try:
+        task = asyncio.get_running_loop().create_task(
+            _save_question_after_disconnect(room_id, user_id, question, new_room)
+        )
+    except RuntimeError:
+        logger.error(f"Failed to save question after client disconnect (no running loop) - room_id: {room_id}")
+        return
+    _disconnect_saves.add(task)
+    task.add_done_callback(_disconnect_saves.discard)
 
 
 def count_tokens(text: str) -> int:
@@ -249,45 +435,41 @@ async def generate_chat_stream(
             - data: [DONE]
 
     Flow:
-        1. Room ID 생성/검증
-        2. 질문 저장
-        3. AI 응답 스트리밍
-        4. 답변 저장
-        5. 메타데이터 전송
+        1. Room ID 생성/검증 (기존 대화방은 소유권 확인 캐시 사용)
+        2. AI 응답 스트리밍
+        3. 대화방 / 질문 / 답변 / 참조 문서 저장 (단일 트랜잭션)
+        4. 메타데이터 전송
+
+        응답 도중 오류가 나거나 클라이언트 연결이 끊겨도 질문(새 대화면 대화방 포함)은 저장합니다.
     """
+    save_attempted = False
+    turn_saved = False
+    room_id = None
+    is_new_room = False
+
     try:
         # 1. Room ID 생성 또는 검증
         if not request.cnvs_idt_id or request.cnvs_idt_id.strip() == "":
-            # 새 대화 - Room ID 생성
+            # 새 대화 - Room ID 생성 (대화방은 턴 저장 시 함께 INSERT)
             room_id = generate_room_id(user_id)
-            await create_room(db, room_id, user_id, request.message)
             is_new_room = True
             logger.info(f"New conversation started - room_id: {room_id}")
         else:
             # 기존 대화 - Room ID 검증
             room_id = request.cnvs_idt_id
-            is_valid = await validate_room_id(room_id, user_id, db)
+            is_valid = await validate_room_id(room_id, user_id, db, use_cache=True)
             if not is_valid:
                 error_msg = json.dumps({"error": "유효하지 않은 대화방 ID이거나 접근 권한이 없습니다."})
                 yield f"data: {error_msg}\n\n"
                 yield "data: [DONE]\n\n"
                 return
-            is_new_room = False
             logger.info(f"Continue conversation - room_id: {room_id}")
 
         # 2. 새 룸 생성 시 room_id 전송
         if is_new_room:
             yield f"data: {json.dumps({'type': 'room_created', 'room_id': room_id})}\n\n"
 
-        # 3. 질문 저장
-        cnvs_id = await save_question(
-            db,
-            room_id,
-            request.message,
-            session_id=None  # TODO: 세션 ID 전달
-        )
-
-        # 4. AI 응답 스트리밍
+        # 3. AI 응답 스트리밍
         accumulated_response = ""
         search_results = []
         start_time = time.time()
@@ -306,39 +488,64 @@ async def generate_chat_stream(
             accumulated_response += chunk
             yield f"data: {json.dumps({'content': {'response': chunk}})}\n\n"
 
-        # 5. 답변 저장
+        # 4. 대화방 / 질문 / 답변 / 참조 문서 저장 (커밋 1회)
         response_time_ms = int((time.time() - start_time) * 1000)
         token_count = count_tokens(accumulated_response)
 
-        await save_answer(
+        # 추천 질문 (TODO)
+        # suggested = await ai_service.generate_suggested_questions(accumulated_response)
+        suggested = None
+
+        save_attempted = True
+        await save_chat_turn(
             db,
-            cnvs_id,
-            accumulated_response,
-            token_count,
-            response_time_ms
+            room_id,
+            user_id,
+            request.message,
+            answer=accumulated_response,
+            token_count=token_count,
+            response_time_ms=response_time_ms,
+            search_results=search_results if request.search_documents else None,
+            suggested_questions=suggested,
+            session_id=None,  # TODO: 세션 ID 전달
+            new_room=is_new_room
         )
+        turn_saved = True
 
-        # 6. 참조 문서 저장 (RAG 사용 시)
-        if request.search_documents and search_results:
-            await save_reference_documents(db, cnvs_id, search_results)
-
-        # 7. 메타데이터 전송
+        # 5. 메타데이터 전송
         metadata = {
             "tokens": token_count,
             "time_ms": response_time_ms
         }
         yield f"data: {json.dumps({'metadata': metadata})}\n\n"
 
-        # 8. 추천 질문 (TODO)
-        if request.suggest_questions:
-            # suggested = await ai_service.generate_suggested_questions(accumulated_response)
-            # yield f"data: {json.dumps({'suggested_questions': suggested})}\n\n"
-            pass
+        if request.suggest_questions and suggested:
+            yield f"data: {json.dumps({'suggested_questions': suggested})}\n\n"
 
-        # 9. 종료 신호
+        # 6. 종료 신호
         yield "data: [DONE]\n\n"
 
     except Exception as e:
         logger.error(f"Chat stream error: {e}", exc_info=True)
+        # 응답 도중 실패해도 질문은 남김 (저장 단계 자체의 실패는 재시도하지 않음)
+        if room_id and not save_attempted:
+            try:
+                await save_chat_turn(db, room_id, user_id, request.message, new_room=is_new_room)
+            except Exception as save_error:
+                logger.error(f"Failed to save question after stream error: {save_error}")
         yield f"data: {json.dumps({'error': '서버 오류가 발생했습니다'})}\n\n"
         yield "data: [DONE]\n\n"
+
+    except BaseException:
+        # 클라이언트 연결 종료 (GeneratorExit / CancelledError) - 이미 room_created를 받은 클라이언트가
+        # 다음 턴에서 대화방 검증에 실패하지 않도록 별도 태스크로 질문 저장 (제너레이터 취소와 무관)
+        if room_id and not turn_saved:
+            _schedule_disconnect_save(room_id, user_id, request.message, is_new_room)
+        raise
+
+
+# 싱글톤 인스턴스
+room_validity_cache = RoomValidityCache(
+    ttl=settings.CHAT_ROOM_CACHE_TTL,
+    max_size=settings.CHAT_ROOM_CACHE_MAX_SIZE
+)
@@ -1,17 +1,219 @@
 """
 동의어 서비스
 사용자 쿼리에서 동의어를 찾아 정식명칭으로 치환
+
+- 사전을 로드할 때 동의어 전체를 하나의 trie로 컴파일하고, 쿼리는 한 번만 순회하며
+  각 위치에서 가장 긴 동의어를 찾아 치환/확장 (비용이 사전 크기와 무관)
+- 컴파일된 사전은 통째로 교체 (요청 처리 중에는 항상 완성된 사전 하나만 사용)
+- 관리자 사전 수정 시 Redis 버전(dictionary:version)을 올리고, 각 워커는 버전이 바뀌면 다시 로드
 """
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, or_
-from typing import List, Dict, Optional
+from sqlalchemy import select
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+import asyncio
 import logging
 import re
+import time
 
+from app.core.config import settings
+from app.core.redis import OptionalRedis
 from app.models.dictionary import Dictionary, DictionaryTerm, DictType
 
 logger = logging.getLogger(__name__)
 
+VERSION_KEY = "dictionary:version"
+
+_HTML_TAG = re.compile(r'<[^>]+>')
+_TERMINAL = None  # trie 노드에서 동의어 목록을 저장하는 키 (문자 키와 겹치지 않음)
+
+
+def _compact(text: str) -> str:
+    """공백 제거"""
+    return "".join(ch for ch in text if not ch.isspace())
+
+
+class SynonymEntry(NamedTuple):
+    """컴파일된 동의어 항목"""
+    synonym: str  # 캐시 키 (대소문자 구분 안 하면 소문자)
+    formal_name: str
+    case_sensitive: bool
+    word_boundary: bool  # True: 띄어쓰기까지 정확히 일치, False: 공백 무시
+    compact: str  # 공백 제거한 동의어 (word_boundary=False 비교용)
+    is_formal: bool  # 동의어가 정식명칭 자신인지
+
+
+class CompiledDictionary:
+    """
+    동의어 사전 trie (최장 일치)
+
+    trie 간선은 소문자 / 공백 제외 문자이며, 후보를 찾은 뒤 항목별 조건
+    (대소문자 구분, 띄어쓰기 구분)으로 원문 구간을 확인합니다.
+    쿼리 위치마다 가장 긴 동의어 하나를 고르고 그 끝으로 건너뛰므로
+    겹치는 동의어는 긴 쪽만 적용됩니다 (예: "기재부"보다 "기획재정부" 우선).
+    """
+
+    def __init__(self, cache: Dict[str, Dict[str, Any]], version: Optional[int] = None):
+        """
+        Args:
+            cache: {동의어: {"formal_name": str, "case_sensitive": bool, "word_boundary": bool}}
+            version: 로드 당시 Redis 사전 버전
+        """
+        self.version = version
+        self.loaded_at = time.time()
+        self.entries: Dict[str, SynonymEntry] = {}
+        self._root: Dict[Any, Any] = {}
+
+        for synonym, info in cache.items():
+            formal_name = info["formal_name"]
+            case_sensitive = info["case_sensitive"]
+            entry = SynonymEntry(
+                synonym=synonym,
+                formal_name=formal_name,
+                case_sensitive=case_sensitive,
+                word_boundary=info["word_boundary"],
+                compact=_compact(synonym),
+                is_formal=(formal_name == synonym) if case_sensitive else (formal_name.lower() == synonym.lower()),
+            )
+            self.entries[synonym] = entry
+
+            node = self._root
+            for ch in entry.compact:
+                key = ch.lower()
+                child = node.get(key)
+                if child is None:
+                    child = node[key] = {}
+                node = child
+            node.setdefault(_TERMINAL, []).append(entry)
+
+        # 같은 trie 노드의 항목은 조건이 엄격한 것부터 확인
+        stack = [self._root]
+        while stack:
+            node = stack.pop()
+            for key, child in node.items():
+                if key is _TERMINAL:
+                    child.sort(key=lambda e: (not e.case_sensitive, not e.word_boundary))
+                else:
+                    stack.append(child)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    @staticmethod
+    def _accepts(entry: SynonymEntry, span: str) -> bool:
+        if entry.word_boundary:
+            return span == entry.synonym if entry.case_sensitive else span.lower() == entry.synonym
+        span = _compact(span)
+        return span == entry.compact if entry.case_sensitive else span.lower() == entry.compact
+
+    def scan(self, text: str) -> List[Tuple[int, int, SynonymEntry]]:
+        """
+        쿼리에서 겹치지 않는 최장 일치 동의어 목록 (왼쪽부터)
+
+        Returns:
+            [(시작, 끝, 항목)] - text[시작:끝]이 동의어 구간
+        """
+        root = self._root
+        if not root or not text:
+            return []
+
+        matches: List[Tuple[int, int, SynonymEntry]] = []
+        lowered = [ch.lower() for ch in text]
+        length = len(text)
+        i = 0
+        while i < length:
+            node = root.get(lowered[i])
+            if node is None:
+                i += 1
+                continue
+
+            best: Optional[Tuple[int, SynonymEntry]] = None
+            end = i + 1
+            while True:
+                candidates = node.get(_TERMINAL)
+                if candidates:
+                    span = text[i:end]
+                    for entry in candidates:
+                        if self._accepts(entry, span):
+                            best = (end, entry)
+                            break
+                # 다음 문자 (동의어 중간의 공백은 건너뛰고 항목 확인 시 판단)
+                k = end
+                while k < length and text[k].isspace():
+                    k += 1
+                if k >= length:
+                    break
+                node = node.get(lowered[k])
+                if node is None:
+                    break
+                end = k + 1
+
+            if best is None:
+                i += 1
+            else:
+                matches.append((i, best[0], best[1]))
+                i = best[0]
+        return matches
+
+    def expand(self, query: str) -> Tuple[str, List[str]]:
+        """
+        동의어 뒤에 정식명칭 병기 - "육본" → "육본(육군본부)"
+
+        동의어별 첫 등장만 확장하며, 정식명칭이 이미 쿼리에 있거나 앞에서 병기했으면 건너뜀
+
+        Returns:
+            (확장된 쿼리, 적용 내역)
+        """
+        lowered_query = query.lower()
+        parts: List[str] = []
+        replacements: List[str] = []
+        expanded_synonyms = set()
+        expanded_formals = set()
+        last = 0
+        for start, end, entry in self.scan(query):
+            formal_lower = entry.formal_name.lower()
+            if entry.is_formal or entry.synonym in expanded_synonyms \
+                    or formal_lower in expanded_formals or formal_lower in lowered_query:
+                continue
+            expanded_synonyms.add(entry.synonym)
+            expanded_formals.add(formal_lower)
+            parts.append(query[last:end])
+            parts.append(f"({entry.formal_name})")
+            last = end
+            replacements.append(f"{query[start:end]} → {entry.formal_name}")
+        if not replacements:
+            return query, replacements
+        parts.append(query[last:])
+        return "".join(parts), replacements
+
+    def replace(self, query: str) -> Tuple[str, List[str]]:
+        """
+        동의어를 정식명칭으로 치환 - "육본" → "육군본부"
+
+        띄어쓰기 구분 항목은 모든 등장을, 공백 무시 항목은 첫 등장만 치환
+
+        Returns:
+            (치환된 쿼리, 적용 내역)
+        """
+        parts: List[str] = []
+        replacements: List[str] = []
+        replaced_flexible = set()
+        last = 0
+        for start, end, entry in self.scan(query):
+            if entry.is_formal:
+                continue
+            if not entry.word_boundary:
+                if entry.synonym in replaced_flexible:
+                    continue
+                replaced_flexible.add(entry.synonym)
+            parts.append(query[last:start])
+            parts.append(entry.formal_name)
+            last = end
+            replacements.append(f"{query[start:end]} → {entry.formal_name}")
+        if not replacements:
+            return query, replacements
+        parts.append(query[last:])
+        return "".join(parts), replacements
+
 
 class DictionaryService:
     """
@@ -20,31 +222,58 @@ class DictionaryService:
     Features:
         - 사용자 쿼리에서 동의어 탐지
         - 동의어를 정식명칭으로 치환
-        - 캐시를 통한 성능 최적화
+        - 컴파일된 사전(trie) 캐시 + Redis 버전 기반 갱신
 
     Security:
         - SQL Injection 방지 (SQLAlchemy ORM 사용)
         - XSS 방지 (HTML 이스케이프)
     """
 
-    def __init__(self):
-        """초기화"""
-        self._cache: Dict[str, Dict[str, any]] = {}  # {동의어: {"formal_name": str, "case_sensitive": bool, "word_boundary": bool}}
-        self._cache_loaded = False
+    def __init__(self, redis_url: Optional[str] = None, version_check_interval: float = 2.0):
+        """
+        초기화
 
-    async def load_dictionaries(self, db: AsyncSession) -> None:
+        Args:
+            redis_url: 사전 버전을 공유할 Redis URL (None이면 프로세스 내 무효화만 사용)
+            version_check_interval: Redis 버전 확인 최소 간격 (초)
         """
-        DB에서 모든 동의어 사전을 로드하여 캐시
+        self.redis = OptionalRedis(redis_url, "Dictionary", "using in-process invalidation only")
+        self.version_check_interval = version_check_interval
+        self._compiled: Optional[CompiledDictionary] = None
+        self._cache_loaded = False  # False면 다음 쿼리에서 다시 로드
+        self._next_version_check = 0.0
+        self._lock = asyncio.Lock()
+        self.reloads = 0
+
+    @property
+    def compiled(self) -> Optional[CompiledDictionary]:
+        """현재 사용 중인 컴파일된 사전"""
+        return self._compiled
+
+    async def load_dictionaries(self, db: AsyncSession, version: Optional[int] = None) -> None:
+        """
+        DB에서 모든 동의어 사전을 로드하여 컴파일 후 교체
 
         Args:
             db: 데이터베이스 세션
+            version: 로드 직전에 읽은 Redis 사전 버전
 
         Security:
             - SQL Injection 방지 (파라미터 바인딩)
         """
         try:
-            # 활성화된 동의어 사전만 조회 (Dictionary 정보도 함께 로드)
-            query = select(DictionaryTerm, Dictionary).join(Dictionary).where(
+            # 활성화된 동의어 사전만 조회 (필요한 컬럼만)
+            query = select(
+                DictionaryTerm.main_term,
+                DictionaryTerm.main_alias,
+                DictionaryTerm.alias_1,
+                DictionaryTerm.alias_2,
+                DictionaryTerm.alias_3,
+                DictionaryTerm.english_name,
+                DictionaryTerm.english_alias,
+                Dictionary.case_sensitive,
+                Dictionary.word_boundary,
+            ).join(Dictionary).where(
                 Dictionary.dict_type == DictType.synonym,
                 Dictionary.use_yn == True,
                 DictionaryTerm.use_yn == True
@@ -54,47 +283,62 @@ class DictionaryService:
             rows = result.all()
 
             # 캐시 구축
-            self._cache.clear()
-
-            for term, dictionary in rows:
-                case_sensitive = dictionary.case_sensitive
-                word_boundary = dictionary.word_boundary
-
-                # 동의어를 캐시에 추가하는 헬퍼 함수
-                def add_to_cache(synonym: str):
+            cache: Dict[str, Dict[str, Any]] = {}
+            for main_term, *aliases, case_sensitive, word_boundary in rows:
+                # 정식명칭은 자기 자신으로 매핑, 이어서 주요약칭 / 추가 약칭들 / 영문명 / 영문약칭
+                for synonym in (main_term, *aliases):
                     if not synonym or not synonym.strip():
-                        return
+                        continue
                     key = synonym.strip() if case_sensitive else synonym.strip().lower()
-                    self._cache[key] = {
-                        "formal_name": term.main_term,
+                    cache[key] = {
+                        "formal_name": main_term,
                         "case_sensitive": case_sensitive,
                         "word_boundary": word_boundary
                     }
 
-                # 정식명칭은 자기 자신으로 매핑
-                add_to_cache(term.main_term)
-
-                # 주요약칭
-                add_to_cache(term.main_alias)
-
-                # 추가 약칭들
-                add_to_cache(term.alias_1)
-                add_to_cache(term.alias_2)
-                add_to_cache(term.alias_3)
-
-                # 영문명
-                add_to_cache(term.english_name)
-
-                # 영문약칭
-                add_to_cache(term.english_alias)
-
+            # 대용량 사전 컴파일이 이벤트 루프를 막지 않도록 스레드에서 실행
+            compiled = await asyncio.to_thread(CompiledDictionary, cache, version)
+            self._compiled = compiled
             self._cache_loaded = True
-            logger.info(f"Dictionary cache loaded - {len(self._cache)} entries")
+            self.reloads += 1
+            logger.info(f"Dictionary cache loaded - {len(compiled)} entries (version={version})")
 
         except Exception as e:
             logger.error(f"Failed to load dictionaries: {e}", exc_info=True)
             self._cache_loaded = False
 
+    async def _ensure_current(self, db: AsyncSession) -> Optional[CompiledDictionary]:
+        """
+        최신 사전 반환 (필요 시 다시 로드)
+
+        - 로드 전이거나 reload_cache() 호출 후: 로드
+        - Redis 버전이 바뀌었으면: 다시 로드 (version_check_interval마다 확인)
+        - 다른 요청이 로드 중이면 기존 사전을 그대로 사용
+        """
+        compiled = self._compiled
+        now = time.monotonic()
+        version = compiled.version if compiled is not None else None
+
+        if self._cache_loaded and compiled is not None:
+            if now < self._next_version_check:
+                return compiled
+            self._next_version_check = now + self.version_check_interval
+            version = await self.redis.get_int(VERSION_KEY)
+            if version is None or version == compiled.version:
+                return compiled
+        else:
+            version = await self.redis.get_int(VERSION_KEY)
+
+        if self._lock.locked() and compiled is not None:
+            return compiled
+        async with self._lock:
+            current = self._compiled
+            if not (self._cache_loaded and current is not None and current.version == version
+                    and current is not compiled):
+                await self.load_dictionaries(db, version)
+            self._next_version_check = time.monotonic() + self.version_check_interval
+        return self._compiled
+
     async def expand_query(self, query: str, db: AsyncSession) -> str:
         """
         사용자 쿼리를 동의어로 확장
@@ -113,53 +357,14 @@ class DictionaryService:
             - XSS 방지 (HTML 태그 제거)
             - 입력 검증
         """
-        # 캐시 로드 확인
-        if not self._cache_loaded:
-            await self.load_dictionaries(db)
-
-        if not self._cache:
+        compiled = await self._ensure_current(db)
+        if not compiled:
             return query
 
         # HTML 태그 제거 (XSS 방지)
-        cleaned_query = re.sub(r'<[^>]+>', '', query)
-
-        # 동의어 찾기 및 치환
-        expanded_query = cleaned_query
-        replacements = []
-
-        # 긴 단어부터 검색 (예: "기재부" 보다 "기획재정부"가 먼저)
-        for synonym in sorted(self._cache.keys(), key=len, reverse=True):
-            cache_entry = self._cache[synonym]
-            formal_name = cache_entry["formal_name"]
-            case_sensitive = cache_entry["case_sensitive"]
-
-            # 대소문자 구분에 따라 매칭
-            found = False
-            if case_sensitive:
-                # 대소문자 구분: 정확히 일치하는 경우만
-                if synonym in expanded_query:
-                    found = True
-            else:
-                # 대소문자 구분 안 함
-                if synonym in expanded_query.lower():
-                    found = True
-
-            if found:
-                # 이미 정식명칭이 있으면 스킵
-                if formal_name.lower() in expanded_query.lower():
-                    continue
-
-                # 동의어를 "동의어(정식명칭)" 형태로 치환
-                if case_sensitive:
-                    # 대소문자 구분하여 치환
-                    expanded_query = expanded_query.replace(synonym, f"{synonym}({formal_name})", 1)
-                else:
-                    # 대소문자 구분 없이 치환
-                    pattern = re.compile(re.escape(synonym), re.IGNORECASE)
-                    expanded_query = pattern.sub(f"{synonym}({formal_name})", expanded_query, count=1)
-
-                replacements.append(f"{synonym} → {formal_name}")
+        cleaned_query = _HTML_TAG.sub('', query)
 
+        expanded_query, replacements = compiled.expand(cleaned_query)
         if replacements:
             logger.info(f"Query expanded - {len(replacements)} replacements: {replacements}")
 
@@ -183,86 +388,56 @@ class DictionaryService:
             - XSS 방지 (HTML 태그 제거)
             - 입력 검증
         """
-        # 캐시 로드 확인
-        if not self._cache_loaded:
-            await self.load_dictionaries(db)
-
-        if not self._cache:
+        compiled = await self._ensure_current(db)
+        if not compiled:
             return query
 
         # HTML 태그 제거 (XSS 방지)
-        cleaned_query = re.sub(r'<[^>]+>', '', query)
-
-        # 동의어 찾기 및 완전 치환
-        replaced_query = cleaned_query
-        replacements = []
-
-        # 긴 단어부터 검색 (예: "기재부" 보다 "기획재정부"가 먼저)
-        for synonym in sorted(self._cache.keys(), key=len, reverse=True):
-            cache_entry = self._cache[synonym]
-            formal_name = cache_entry["formal_name"]
-            case_sensitive = cache_entry["case_sensitive"]
-            word_boundary = cache_entry["word_boundary"]
-
-            # 이미 정식명칭이 있으면 스킵
-            if case_sensitive:
-                if formal_name == synonym:
-                    continue
-            else:
-                if formal_name.lower() == synonym.lower():
-                    continue
-
-            # 띄어쓰기 구분 여부에 따라 매칭
-            if word_boundary:
-                # 띄어쓰기 구분 ON: 정확히 일치하는 경우만
-                if case_sensitive:
-                    pattern = re.compile(re.escape(synonym))
-                else:
-                    pattern = re.compile(re.escape(synonym), re.IGNORECASE)
-
-                if pattern.search(replaced_query):
-                    replaced_query = pattern.sub(formal_name, replaced_query)
-                    replacements.append(f"{synonym} → {formal_name}")
-            else:
-                # 띄어쓰기 구분 OFF: 공백 무시하고 매칭
-                # 쿼리와 동의어 모두에서 공백 제거 후 비교
-                query_no_space = replaced_query.replace(' ', '')
-                synonym_no_space = synonym.replace(' ', '')
-
-                # 대소문자 처리
-                if case_sensitive:
-                    search_query = query_no_space
-                    search_synonym = synonym_no_space
-                else:
-                    search_query = query_no_space.lower()
-                    search_synonym = synonym_no_space.lower()
-
-                # 매칭 확인
-                if search_synonym in search_query:
-                    # 원본 쿼리에서 공백 포함/제외 모든 변형 찾기
-                    # 예: "한국도로공사", "한국 도로공사", "한국도로 공사" 등
-                    # 간단히 처리: 공백이 있는/없는 모든 경우를 패턴으로
-                    flexible_pattern = '\\s*'.join([re.escape(char) for char in synonym_no_space])
-
-                    if case_sensitive:
-                        pattern = re.compile(flexible_pattern)
-                    else:
-                        pattern = re.compile(flexible_pattern, re.IGNORECASE)
-
-                    if pattern.search(replaced_query):
-                        replaced_query = pattern.sub(formal_name, replaced_query, count=1)
-                        replacements.append(f"{synonym} → {formal_name}")
+        cleaned_query = _HTML_TAG.sub('', query)
 
+        replaced_query, replacements = compiled.replace(cleaned_query)
         if replacements:
             logger.info(f"Query replaced - {len(replacements)} replacements: {replacements}")
 
         return replaced_query
 
     def reload_cache(self):
-        """캐시 재로드 플래그 설정"""
+        """캐시 재로드 플래그 설정 (현재 프로세스)"""
         self._cache_loaded = False
         logger.info("Dictionary cache invalidated - will reload on next query")
 
+    async def notify_changed(self) -> None:
+        """
+        사전 변경 알림 (관리자 사전/용어 생성·수정·삭제 후 호출)
+
+        현재 프로세스는 다음 쿼리에서 다시 로드, 다른 워커는 Redis 버전 증가를 보고 다시 로드
+        """
+        redis = await self.redis.client()
+        if redis is not None:
+            try:
+                await redis.incr(VERSION_KEY)
+            except Exception as e:
+                self.redis.failed(e)
+        self.reload_cache()
+
+    async def close(self) -> None:
+        await self.redis.close()
+
+    def metrics(self) -> Dict[str, Any]:
+        compiled = self._compiled
+        return {
+            "loaded": compiled is not None,
+            "stale": not self._cache_loaded,
+            "entries": len(compiled) if compiled is not None else 0,
+            "version": compiled.version if compiled is not None else None,
+            "loaded_at": compiled.loaded_at if compiled is not None else None,
+            "reloads": self.reloads,
+            "redis": self.redis.enabled,
+        }
+
 
 # Singleton 인스턴스
-dictionary_service = DictionaryService()
+dictionary_service = DictionaryService(
+    redis_url=settings.REDIS_URL,
+    version_check_interval=settings.DICTIONARY_VERSION_CHECK_INTERVAL,
+)
@@ -12,6 +12,7 @@ from app.models.document import Document
 from app.models.document_permission import DocumentPermission
 from app.models.permission import Department
 from app.models.user import User
+from app.services.vector_permission_sync import vector_permission_sync
 
 
 class DocumentAccessService:
@@ -66,6 +67,7 @@ class DocumentAccessService:
             permissions.append(permission)
 
         await db.commit()
+        vector_permission_sync.mark_dirty([document_id])
         return permissions
 
     async def grant_all_departments_access(
@@ -126,6 +128,7 @@ class DocumentAccessService:
             await db.delete(permission)
 
         await db.commit()
+        vector_permission_sync.mark_dirty([document_id])
         return len(permissions)
 
     async def can_user_access_document(
@@ -173,7 +176,7 @@ class DocumentAccessService:
         """
         사용자가 접근 가능한 문서 목록을 조회합니다.
 
-        RAG 검색 시 이 메서드를 호출하여 부서별로 문서를 필터링합니다.
+        RAG 검색은 Qdrant payload(access_departments)로 필터링하므로 이 메서드를 사용하지 않습니다.
 
         Args:
             user_id: 사용자 ID
@@ -7,7 +7,10 @@ import os
 import logging
 from typing import List, Optional, Tuple
 import hashlib
-import httpx
+
+from app.core.http_client import http_clients
+from app.services.embedding_cache import embedding_cache
+from app.utils.text_chunker import TextChunk, get_default_chunker
 
 logger = logging.getLogger(__name__)
 
@@ -15,6 +18,8 @@ logger = logging.getLogger(__name__)
 class DocumentProcessor:
     """문서 처리 서비스 (텍스트 추출, 청킹, 임베딩)"""
 
+    EMBEDDING_MODEL = "Qwen3-Embedding-0.6B"
+
     def __init__(self, embedding_endpoint: str = "http://vllm-embeddings:8000/v1"):
         """
         초기화
@@ -23,8 +28,7 @@ class DocumentProcessor:
             embedding_endpoint: Embedding API 엔드포인트
         """
         self.embedding_endpoint = embedding_endpoint
-        self.chunk_size = 500  # 문자 단위
-        self.chunk_overlap = 50
+        self.chunker = get_default_chunker()  # 임베딩 토큰 기준 청킹
 
     def extract_text(self, file_content: bytes, filename: str) -> Optional[str]:
         """
@@ -170,47 +174,23 @@ class DocumentProcessor:
             logger.error(f"Failed to extract from Excel: {e}")
             return None
 
-    def chunk_text(self, text: str) -> List[str]:
+    def chunk_text(self, text: str) -> List[TextChunk]:
         """
-        텍스트를 청크로 분할
+        텍스트를 청크로 분할 (임베딩 토큰 기준, 문단/문장 경계 유지)
 
         Args:
             text: 전체 텍스트
 
         Returns:
-            List[str]: 청크 리스트
+            List[TextChunk]: 원문 오프셋이 포함된 청크 리스트
         """
-        if not text:
-            return []
-
-        chunks = []
-        start = 0
-        text_length = len(text)
-
-        while start < text_length:
-            end = start + self.chunk_size
-
-            # 청크 경계를 문장 끝으로 조정 (마침표, 줄바꿈)
-            if end < text_length:
-                # 다음 마침표나 줄바꿈 찾기
-                for delim in ['\n\n', '\n', '. ', '。', '! ', '? ']:
-                    delim_pos = text.find(delim, end - 50, end + 50)
-                    if delim_pos != -1:
-                        end = delim_pos + len(delim)
-                        break
-
-            chunk = text[start:end].strip()
-            if chunk:
-                chunks.append(chunk)
-
-            start = end - self.chunk_overlap
-
+        chunks = self.chunker.chunk(text)
         logger.info(f"Text split into {len(chunks)} chunks")
         return chunks
 
     async def get_embeddings(self, texts: List[str]) -> Optional[List[List[float]]]:
         """
-        텍스트 리스트에 대한 임베딩 생성
+        텍스트 리스트에 대한 임베딩 생성 (내용이 같은 텍스트는 캐시 사용)
 
         Args:
             texts: 텍스트 리스트
@@ -219,27 +199,29 @@ class DocumentProcessor:
             Optional[List[List[float]]]: 임베딩 벡터 리스트 (실패 시 None)
         """
         try:
-            async with httpx.AsyncClient(timeout=60.0) as client:
-                response = await client.post(
-                    f"{self.embedding_endpoint}/embeddings",
-                    json={
-                        "input": texts,
-                        "model": "Qwen3-Embedding-0.6B"
-                    }
-                )
-
-                if response.status_code == 200:
-                    result = response.json()
-                    embeddings = [item['embedding'] for item in result['data']]
-                    logger.info(f"Generated {len(embeddings)} embeddings")
-                    return embeddings
-                else:
-                    logger.error(f"Embedding API failed: {response.status_code} - {response.text}")
-                    return None
+            embeddings = await embedding_cache.get_or_embed(self.EMBEDDING_MODEL, texts, self._request_embeddings)
+            logger.info(f"Generated {len(embeddings)} embeddings")
+            return embeddings
         except Exception as e:
             logger.error(f"Failed to get embeddings: {e}")
             return None
 
+    async def _request_embeddings(self, texts: List[str]) -> List[List[float]]:
+        """Embedding API 호출 (실패 시 예외)"""
+        response = await http_clients.get("embedding").post(
+            f"{self.embedding_endpoint}/embeddings",
+            json={
+                "input": texts,
+                "model": self.EMBEDDING_MODEL
+            },
+            timeout=60.0
+        )
+
+        if response.status_code != 200:
+            raise ValueError(f"Embedding API failed: {response.status_code} - {response.text}")
+        result = response.json()
+        return [item['embedding'] for item in result['data']]
+
     async def process_document(
         self,
         file_content: bytes,
@@ -274,22 +256,24 @@ class DocumentProcessor:
             return text, None
 
         # 3. 임베딩 생성
-        embeddings = await self.get_embeddings(chunks)
+        embeddings = await self.get_embeddings([chunk.text for chunk in chunks])
         if not embeddings:
             logger.warning(f"No embeddings generated for {filename}")
             return text, None
 
         # 4. 청크+임베딩+메타데이터 결합
         chunk_data = []
-        for i, (chunk, embedding) in enumerate(zip(chunks, embeddings)):
-            chunk_id = f"{document_id}_chunk_{i}"
+        for chunk, embedding in zip(chunks, embeddings):
+            chunk_id = f"{document_id}_chunk_{chunk.index}"
             chunk_data.append({
                 "id": chunk_id,
                 "vector": embedding,
                 "payload": {
                     "document_id": document_id,
-                    "chunk_index": i,
-                    "text": chunk,
+                    "chunk_index": chunk.index,
+                    "text": chunk.text,
+                    "char_start": chunk.start,
+                    "char_end": chunk.end,
                     "filename": filename,
                     **metadata
                 }
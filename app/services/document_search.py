@@ -0,0 +1,202 @@
+"""
+문서 검색 (PostgreSQL full-text + pg_trgm)
+
+- 내용 검색: documents.search_vector (트리거가 갱신하는 tsvector, GIN 인덱스)
+- 제목/파일명 부분 일치: pg_trgm GIN 인덱스를 타는 ILIKE
+- 결과: 관련도 순 정렬 + 검색어 강조 스니펫
+
+한국어는 형태소 분석기(textsearch_ko 등) 없이도 동작하도록 한글 단어를 2글자(bigram)로 쪼개
+'simple' 설정으로 색인합니다. search_tokens()와 DB 함수 search_tokens(text)는 같은 규칙이어야 합니다.
+(migrations/versions/20251108_0900_add_document_search.py)
+
+예:
+    >>> search_tokens("도로공사 Manual 2025")
+    ['도로', '로공', '공사', 'manual', '2025']
+"""
+import html
+import re
+from typing import List, Optional, Tuple
+
+from sqlalchemy import case, func, literal, literal_column, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.document import Document
+
+TS_CONFIG = literal_column("'simple'::regconfig")
+SNIPPET_LENGTH = 200
+SNIPPET_CONTEXT = 60
+HIGHLIGHT_START = "<mark>"
+HIGHLIGHT_END = "</mark>"
+
+_HANGUL = re.compile(r"[가-힣]")
+_WORD_SPLIT = re.compile(r"[^0-9a-z가-힣]+")
+_LIKE_ESCAPE = re.compile(r"([!%_])")
+
+
+def search_tokens(text: Optional[str]) -> List[str]:
+    """
+    검색 토큰 (색인 / 질의 공통)
+
+    - 영문/숫자 단어: 소문자 단어 그대로
+    - 3글자 이상 한글 포함 단어: 2글자씩 겹쳐 자름 (도로공사 → 도로, 로공, 공사)
+
+    Args:
+        text: 원문
+
+    Returns:
+        List[str]: 토큰 목록 (순서 유지)
+    """
+    tokens: List[str] = []
+    for word in _WORD_SPLIT.split((text or "").lower()):
+        if not word:
+            continue
+        if _HANGUL.search(word) and len(word) > 2:
+            tokens.extend(word[i:i + 2] for i in range(len(word) - 1))
+        else:
+            tokens.append(word)
+    return tokens
+
+
+def _escape_like(text: str) -> str:
+    # 백슬래시는 standard_conforming_strings 설정에 따라 해석이 달라지므로 '!'를 이스케이프 문자로 사용
+    return _LIKE_ESCAPE.sub(r"!\1", text)
+
+
+def build_search_filter(query: str):
+    """
+    문서 검색 조건 (목록 필터용)
+
+    Args:
+        query: 검색어
+
+    Returns:
+        조건식 (tsvector 일치 또는 제목/파일명 부분 일치), 검색어가 비어 있으면 None
+    """
+    query = query.strip()
+    if not query:
+        return None
+    pattern = f"%{_escape_like(query)}%"
+    conditions = [
+        Document.title.ilike(pattern, escape="!"),
+        Document.file_name.ilike(pattern, escape="!"),
+    ]
+    tokens = search_tokens(query)
+    if tokens:
+        conditions.append(Document.search_vector.op("@@")(_tsquery(tokens)))
+    return or_(*conditions)
+
+
+def _tsquery(tokens: List[str]):
+    # 토큰은 [0-9a-z가-힣]만 포함하므로 to_tsquery 구문으로 그대로 사용 가능
+    return func.to_tsquery(TS_CONFIG, " & ".join(dict.fromkeys(tokens)))
+
+
+def build_search_query(query: str, limit: int = 10, offset: int = 0):
+    """
+    관련도 순 문서 검색 쿼리
+
+    점수 = ts_rank_cd(search_vector) + 제목 부분 일치 가산점 (1.0)
+    스니펫은 본문에서 검색어(없으면 첫 토큰) 위치 주변 SNIPPET_LENGTH자를 DB에서 잘라 옴
+
+    Args:
+        query: 검색어
+        limit: 최대 결과 수
+        offset: 건너뛸 결과 수
+
+    Returns:
+        select: (Document, rank, snippet) 행을 반환하는 쿼리
+    """
+    query = query.strip()
+    tokens = search_tokens(query)
+    pattern = f"%{_escape_like(query)}%"
+    title_match = Document.title.ilike(pattern, escape="!")
+
+    if tokens:
+        rank = func.ts_rank_cd(Document.search_vector, _tsquery(tokens))
+        anchor = tokens[0]
+    else:
+        rank = literal(0.0)
+        anchor = query.lower()
+    score = (rank + case((title_match, 1.0), else_=0.0)).label("rank")
+
+    content = func.lower(Document.content)
+    position = func.coalesce(
+        func.nullif(func.strpos(content, query.lower()), 0),
+        func.nullif(func.strpos(content, anchor), 0),
+        1,
+    )
+    snippet = func.substr(
+        Document.content, func.greatest(position - SNIPPET_CONTEXT, 1), SNIPPET_LENGTH
+    ).label("snippet")
+
+    return select(Document, score, snippet).where(
+        build_search_filter(query)
+    ).order_by(score.desc(), Document.id.desc()).offset(offset).limit(limit)
+
+
+def highlight(text: Optional[str], query: str) -> Optional[str]:
+    """
+    스니펫 검색어 강조 (HTML 이스케이프 후 <mark>로 감쌈)
+
+    검색어 전체, 단어, 한글 bigram 토큰이 나오는 구간을 합쳐 강조합니다.
+
+    Args:
+        text: 스니펫 원문
+        query: 검색어
+
+    Returns:
+        Optional[str]: 강조된 HTML 스니펫
+    """
+    if not text:
+        return text
+
+    terms = {query.strip().lower(), *query.lower().split(), *search_tokens(query)}
+    lowered = text.lower()
+    spans: List[Tuple[int, int]] = []
+    for term in filter(None, terms):
+        start = lowered.find(term)
+        while start != -1:
+            spans.append((start, start + len(term)))
+            start = lowered.find(term, start + 1)
+
+    merged: List[List[int]] = []
+    for start, end in sorted(spans):
+        if merged and start <= merged[-1][1]:
+            merged[-1][1] = max(merged[-1][1], end)
+        else:
+            merged.append([start, end])
+
+    parts, cursor = [], 0
+    for start, end in merged:
+        parts.append(html.escape(text[cursor:start]))
+        parts.append(HIGHLIGHT_START + html.escape(text[start:end]) + HIGHLIGHT_END)
+        cursor = end
+    parts.append(html.escape(text[cursor:]))
+    return "".join(parts)
+
+
+async def search_documents(
+    db: AsyncSession,
+    query: str,
+    limit: int = 10,
+    offset: int = 0
+) -> List[Tuple[Document, float, Optional[str]]]:
+    """
+    문서 검색 (관련도 순, 강조 스니펫 포함)
+
+    Args:
+        db: 데이터베이스 세션
+        query: 검색어
+        limit: 최대 결과 수
+        offset: 건너뛸 결과 수
+
+    Returns:
+        List[Tuple]: (문서, 관련도 점수, 강조 스니펫) 목록
+    """
+    if not query.strip():
+        return []
+    result = await db.execute(build_search_query(query, limit, offset))
+    return [
+        (document, float(rank or 0.0), highlight(snippet, query))
+        for document, rank, snippet in result.all()
+    ]
@@ -0,0 +1,224 @@
+"""
+임베딩 캐시 (content hash 기준)
+
+문서 재업로드 / 레거시 동기화 시 내용이 같은 청크를 다시 임베딩하지 않도록
+(모델, 정규화된 텍스트 해시) → 벡터를 캐시합니다.
+- 프로세스 내 LRU (1차) + Redis (2차, 워커 간 공유)
+- 벡터는 JSON 리스트가 아닌 float16/float32 바이트로 저장
+- 적중/미스 및 절약한 임베딩 시간 추정 메트릭
+"""
+import hashlib
+import logging
+import re
+import struct
+import time
+import unicodedata
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence
+
+from app.core.config import settings
+from app.core.redis import OptionalRedis
+
+logger = logging.getLogger(__name__)
+
+_WHITESPACE = re.compile(r'\s+')
+
+# 저장 형식: dtype 코드 1바이트 + little-endian 값 배열
+_DTYPE_CODES = {"float16": b"e", "float32": b"f"}
+_CODE_SIZES = {b"e": 2, b"f": 4}
+
+EmbedFunc = Callable[[List[str]], Awaitable[List[List[float]]]]
+
+
+def normalize_text(text: str) -> str:
+    """캐시 키용 정규화 (NFC, 연속 공백 축약, 앞뒤 공백 제거)"""
+    return _WHITESPACE.sub(" ", unicodedata.normalize("NFC", text)).strip()
+
+
+def cache_key(model: str, text: str) -> str:
+    """(모델, 정규화 텍스트 SHA-256) 캐시 키"""
+    digest = hashlib.sha256(normalize_text(text).encode("utf-8")).hexdigest()
+    return f"emb:{model}:{digest}"
+
+
+def encode_vector(vector: Sequence[float], dtype: str = "float16") -> bytes:
+    """벡터 → 바이트 (float16 범위를 넘는 값이 있으면 float32)"""
+    code = _DTYPE_CODES[dtype]
+    try:
+        return code + struct.pack(f"<{len(vector)}{code.decode()}", *vector)
+    except (OverflowError, struct.error):
+        return b"f" + struct.pack(f"<{len(vector)}f", *vector)
+
+
+def decode_vector(data: bytes) -> List[float]:
+    """바이트 → 벡터"""
+    code = data[:1]
+    count = (len(data) - 1) // _CODE_SIZES[code]
+    return list(struct.unpack_from(f"<{count}{code.decode()}", data, 1))
+
+
+class EmbeddingCacheStats:
+    """캐시 적중 카운터"""
+
+    def __init__(self):
+        self.local_hits = 0
+        self.redis_hits = 0
+        self.misses = 0
+        self.embed_seconds = 0.0  # 미스 청크 임베딩에 쓴 시간
+
+    def snapshot(self) -> Dict[str, Any]:
+        hits = self.local_hits + self.redis_hits
+        lookups = hits + self.misses
+        per_text = self.embed_seconds / self.misses if self.misses else 0.0
+        return {
+            "local_hits": self.local_hits,
+            "redis_hits": self.redis_hits,
+            "misses": self.misses,
+            "hit_ratio": round(hits / lookups, 4) if lookups else 0.0,
+            "embed_seconds": round(self.embed_seconds, 3),
+            # 적중 건수 × 미스 1건당 평균 임베딩 시간
+            "estimated_saved_seconds": round(hits * per_text, 3),
+        }
+
+
+class EmbeddingCache:
+    """2계층 (LRU + Redis) 임베딩 캐시"""
+
+    def __init__(
+        self,
+        redis_url: Optional[str] = None,
+        local_size: int = 10000,
+        ttl: int = 2592000,
+        dtype: str = "float16",
+        enabled: bool = True,
+    ):
+        """
+        Args:
+            redis_url: Redis URL (None이면 프로세스 내 LRU만 사용)
+            local_size: LRU 최대 항목 수
+            ttl: Redis 항목 만료 시간 (초)
+            dtype: 저장 정밀도 (float16 | float32)
+            enabled: False면 캐시 없이 항상 임베딩
+        """
+        if dtype not in _DTYPE_CODES:
+            raise ValueError(f"Unsupported embedding cache dtype: {dtype}")
+        self.local_size = local_size
+        self.ttl = ttl
+        self.dtype = dtype
+        self.enabled = enabled
+        self.stats = EmbeddingCacheStats()
+        self._local: "OrderedDict[str, bytes]" = OrderedDict()
+        self.redis = OptionalRedis(
+            redis_url, "Embedding cache", "using local cache only", decode_responses=False,
+        )
+
+    # ------------------------------------------------------------------
+    # 조회 / 저장
+    # ------------------------------------------------------------------
+
+    async def get_or_embed(self, model: str, texts: List[str], embed: EmbedFunc) -> List[List[float]]:
+        """
+        캐시에 없는 텍스트만 임베딩하여 입력 순서대로 반환
+
+        Args:
+            model: 임베딩 모델명 (캐시 네임스페이스)
+            texts: 임베딩할 텍스트 목록
+            embed: 미스 텍스트 임베딩 함수 (texts -> vectors, 순서 유지)
+
+        Returns:
+            texts 순서와 같은 임베딩 목록
+        """
+        if not self.enabled or not texts:
+            return await embed(texts)
+
+        keys = [cache_key(model, text) for text in texts]
+        found = await self._get_many(keys)
+
+        # 같은 내용의 청크는 한 번만 임베딩
+        missing: Dict[str, str] = {}
+        for key, text in zip(keys, texts):
+            if key not in found and key not in missing:
+                missing[key] = text
+
+        if missing:
+            started = time.perf_counter()
+            vectors = await embed(list(missing.values()))
+            self.stats.embed_seconds += time.perf_counter() - started
+            self.stats.misses += len(missing)
+            fresh = dict(zip(missing.keys(), vectors))
+            await self._set_many({key: encode_vector(vector, self.dtype) for key, vector in fresh.items()})
+        else:
+            fresh = {}
+
+        return [fresh[key] if key in fresh else decode_vector(found[key]) for key in keys]
+
+    async def _get_many(self, keys: List[str]) -> Dict[str, bytes]:
+        found: Dict[str, bytes] = {}
+        remote: List[str] = []
+        for key in dict.fromkeys(keys):
+            data = self._local.get(key)
+            if data is None:
+                remote.append(key)
+                continue
+            self._local.move_to_end(key)
+            found[key] = data
+            self.stats.local_hits += 1
+
+        redis = await self.redis.client() if remote else None
+        if redis is not None:
+            try:
+                values = await redis.mget(remote)
+            except Exception as e:
+                self.redis.failed(e)
+                values = []
+            for key, data in zip(remote, values):
+                if data is not None:
+                    found[key] = data
+                    self._remember(key, data)
+                    self.stats.redis_hits += 1
+        return found
+
+    async def _set_many(self, items: Dict[str, bytes]) -> None:
+        for key, data in items.items():
+            self._remember(key, data)
+
+        redis = await self.redis.client()
+        if redis is None:
+            return
+        try:
+            async with redis.pipeline(transaction=False) as pipe:
+                for key, data in items.items():
+                    pipe.set(key, data, ex=self.ttl)
+                await pipe.execute()
+        except Exception as e:
+            self.redis.failed(e)
+
+    def _remember(self, key: str, data: bytes) -> None:
+        self._local[key] = data
+        self._local.move_to_end(key)
+        while len(self._local) > self.local_size:
+            self._local.popitem(last=False)
+
+    async def close(self) -> None:
+        """Redis 연결 종료"""
+        await self.redis.close()
+
+    def metrics(self) -> Dict[str, Any]:
+        data = self.stats.snapshot()
+        data["enabled"] = self.enabled
+        data["dtype"] = self.dtype
+        data["local_entries"] = len(self._local)
+        data["local_size"] = self.local_size
+        data["redis"] = self.redis.enabled
+        data["redis_errors"] = self.redis.errors
+        return data
+
+
+# 싱글톤 인스턴스
+embedding_cache = EmbeddingCache(
+    redis_url=settings.REDIS_URL,
+    local_size=settings.EMBEDDING_CACHE_LOCAL_SIZE,
+    ttl=settings.EMBEDDING_CACHE_TTL,
+    dtype=settings.EMBEDDING_CACHE_DTYPE,
+    enabled=settings.EMBEDDING_CACHE_ENABLED,
+)
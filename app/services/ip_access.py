@@ -4,12 +4,12 @@ adminpage.txt: 8. 설정 > 1) 관리자관리>IP접근권한 관리
 
 시큐어 코딩: IP 기반 접근 제어
 """
-import ipaddress
 from typing import Optional
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 
 from app.models.ip_whitelist import IPWhitelist
+from app.services.ip_allowlist import ip_allowlist, parse_network
 
 
 class IPAccessService:
@@ -23,25 +23,18 @@ class IPAccessService:
         """
         IP 주소가 접근 허용 목록에 있는지 확인합니다.
 
+        메모리 허용 목록(app/services/ip_allowlist.py)으로 판정하므로 DB를 조회하지 않습니다.
+        단일 IP와 CIDR 대역 규칙 중 가장 구체적인 규칙이 적용됩니다.
+
         Args:
             ip_address: 검사할 IP 주소
-            db: 데이터베이스 세션
+            db: 데이터베이스 세션 (호환용, 사용하지 않음)
 
         Returns:
             접근 허용 여부
         """
-        # IP 주소 조회
-        result = await db.execute(
-            select(IPWhitelist).filter(IPWhitelist.ip_address == ip_address)
-        )
-        ip_entry = result.scalar_one_or_none()
-
-        # 화이트리스트에 없으면 차단
-        if not ip_entry:
-            return False
-
-        # is_allowed가 False면 차단
-        return ip_entry.is_allowed
+        await ip_allowlist.ensure_loaded()
+        return ip_allowlist.is_allowed(ip_address)
 
     async def add_ip(
         self,
@@ -55,7 +48,7 @@ class IPAccessService:
         IP 주소를 화이트리스트에 추가합니다.
 
         Args:
-            ip_address: IP 주소
+            ip_address: IP 주소 또는 CIDR 대역 (예: 10.10.0.0/16)
             description: 설명
             is_allowed: 액세스 허용 여부
             created_by: 등록한 관리자 ID
@@ -67,11 +60,15 @@ class IPAccessService:
         Raises:
             ValueError: 유효하지 않은 IP 주소
         """
-        # IP 주소 유효성 검증
+        # IP 주소 / CIDR 유효성 검증 (단일 IP는 그대로, CIDR은 정규화하여 저장)
         try:
-            ipaddress.ip_address(ip_address)
+            network = parse_network(ip_address)
         except ValueError:
             raise ValueError(f"유효하지 않은 IP 주소입니다: {ip_address}")
+        if network.num_addresses > 1:
+            ip_address = str(network)
+        else:
+            ip_address = str(network.network_address)
 
         # 중복 확인
         existing = await db.execute(
@@ -90,6 +87,7 @@ class IPAccessService:
         db.add(ip_entry)
         await db.commit()
         await db.refresh(ip_entry)
+        await ip_allowlist.notify_changed()
 
         return ip_entry
 
@@ -131,6 +129,7 @@ class IPAccessService:
 
         await db.commit()
         await db.refresh(ip_entry)
+        await ip_allowlist.notify_changed()
 
         return ip_entry
 
@@ -159,5 +158,6 @@ class IPAccessService:
 
         await db.delete(ip_entry)
         await db.commit()
+        await ip_allowlist.notify_changed()
 
         return True
@@ -0,0 +1,383 @@
+"""
+IP 허용 목록 엔진 (CIDR 지원, 메모리 prefix tree)
+
+IPFilterMiddleware가 요청마다 DB를 조회하지 않도록 ip_whitelist 규칙을 메모리에 적재합니다.
+- 규칙: 단일 IP(192.168.0.10) 또는 CIDR(10.10.0.0/16, 2001:db8::/32), IPv4/IPv6
+- 조회: 주소 비트를 따라 내려가는 이진 trie, 가장 긴 prefix 규칙이 결정 (O(prefix 길이))
+  → 허용 대역 안에서 특정 IP만 차단하는 예외 규칙 가능, 어떤 규칙에도 없으면 차단
+- 갱신: 관리자 수정 시 Redis 버전 카운터 증가 + pub/sub 알림 → 모든 워커가 다시 적재
+  (Redis 미설정/장애 시 refresh_interval마다 DB에서 다시 적재)
+- 규칙별 허용/차단 카운터
+"""
+import asyncio
+import ipaddress
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+from sqlalchemy import select
+
+from app.core.config import settings
+from app.core.redis import OptionalRedis
+
+logger = logging.getLogger(__name__)
+
+VERSION_KEY = "ip_allowlist:version"
+CHANNEL = "ip_allowlist:invalidate"
+
+Network = Union[ipaddress.IPv4Network, ipaddress.IPv6Network]
+RuleLoader = Callable[[], Awaitable[List[Tuple[int, str, bool]]]]
+
+
+def parse_network(value: str) -> Network:
+    """
+    IP 또는 CIDR 문자열 → 네트워크 (단일 IP는 /32, /128)
+
+    Raises:
+        ValueError: 유효하지 않은 IP/CIDR 또는 호스트 비트가 설정된 CIDR (10.0.0.1/8)
+    """
+    return ipaddress.ip_network(value.strip(), strict=True)
+
+
+class IPRule:
+    """허용 목록 규칙 (+ 적중 카운터)"""
+
+    __slots__ = ("id", "network", "is_allowed", "hits", "denies")
+
+    def __init__(self, rule_id: int, network: Network, is_allowed: bool):
+        self.id = rule_id
+        self.network = network
+        self.is_allowed = is_allowed
+        self.hits = 0  # 이 규칙으로 허용된 요청 수
+        self.denies = 0  # 이 규칙으로 차단된 요청 수
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "id": self.id,
+            "network": str(self.network),
+            "is_allowed": self.is_allowed,
+            "hits": self.hits,
+            "denies": self.denies,
+        }
+
+
+class PrefixTree:
+    """
+    이진 prefix tree (IP 버전별 1개)
+
+    노드는 [0 자식, 1 자식, 규칙] 리스트. 삽입/조회 모두 prefix 길이만큼 비트를 따라 내려감
+    """
+
+    def __init__(self, max_prefixlen: int):
+        self.max_prefixlen = max_prefixlen
+        self._root: list = [None, None, None]
+        self.size = 0
+
+    def insert(self, network: Network, rule: IPRule) -> None:
+        node = self._root
+        address = int(network.network_address)
+        for depth in range(network.prefixlen):
+            bit = (address >> (self.max_prefixlen - 1 - depth)) & 1
+            if node[bit] is None:
+                node[bit] = [None, None, None]
+            node = node[bit]
+        if node[2] is None:
+            self.size += 1
+        node[2] = rule
+
+    def longest_match(self, address: int) -> Optional[IPRule]:
+        node = self._root
+        match = node[2]
+        shift = self.max_prefixlen - 1
+        while shift >= 0:
+            node = node[(address >> shift) & 1]
+            if node is None:
+                break
+            if node[2] is not None:
+                match = node[2]
+            shift -= 1
+        return match
+
+
+class IPAllowlistStats:
+    """적재 / 판정 카운터"""
+
+    def __init__(self):
+        self.allowed = 0
+        self.denied = 0
+        self.unmatched = 0  # 어떤 규칙에도 없어 차단된 요청 수
+        self.invalid = 0  # 주소 형식 오류로 차단된 요청 수
+        self.reloads = 0
+        self.failures = 0
+        self.last_reload_at: Optional[float] = None
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "allowed": self.allowed,
+            "denied": self.denied,
+            "unmatched": self.unmatched,
+            "invalid": self.invalid,
+            "reloads": self.reloads,
+            "failures": self.failures,
+            "last_reload_at": self.last_reload_at,
+        }
+
+
+async def load_rules_from_db() -> List[Tuple[int, str, bool]]:
+    """ip_whitelist 전체 규칙 (id, ip_address, is_allowed)"""
+    from app.core.database import AsyncSessionLocal
+    from app.models.ip_whitelist import IPWhitelist
+
+    async with AsyncSessionLocal() as db:
+        result = await db.execute(
+            select(IPWhitelist.id, IPWhitelist.ip_address, IPWhitelist.is_allowed)
+        )
+        return [(row.id, row.ip_address, bool(row.is_allowed)) for row in result]
+
+
+class IPAllowlist:
+    """메모리 IP 허용 목록 (요청당 DB 조회 없음)"""
+
+    def __init__(
+        self,
+        redis_url: Optional[str] = None,
+        refresh_interval: float = 30.0,
+        loader: RuleLoader = load_rules_from_db,
+    ):
+        """
+        Args:
+            redis_url: 버전 카운터 / 무효화 채널용 Redis URL (None이면 주기적 재적재만 사용)
+            refresh_interval: 버전 확인(Redis) 또는 재적재(Redis 없음) 주기 (초)
+            loader: 규칙 적재 함수 (기본: ip_whitelist 테이블)
+        """
+        self.redis = OptionalRedis(redis_url, "IP allowlist", "falling back to periodic reload")
+        self.refresh_interval = refresh_interval
+        self.loader = loader
+        self.stats = IPAllowlistStats()
+        self.version: Optional[int] = None
+        self._trees = {4: PrefixTree(32), 6: PrefixTree(128)}
+        self._rules: Dict[int, IPRule] = {}
+        self._loaded = False
+        self._lock = asyncio.Lock()
+        self._task: Optional[asyncio.Task] = None
+        self._stopping = False
+
+    # ------------------------------------------------------------------
+    # 판정
+    # ------------------------------------------------------------------
+
+    @property
+    def loaded(self) -> bool:
+        return self._loaded
+
+    def match(self, ip: str) -> Optional[IPRule]:
+        """
+        가장 긴 prefix로 일치하는 규칙
+
+        Raises:
+            ValueError: 유효하지 않은 IP 주소
+        """
+        address = ipaddress.ip_address(ip)
+        if isinstance(address, ipaddress.IPv6Address) and address.ipv4_mapped:
+            address = address.ipv4_mapped  # ::ffff:10.0.0.1 → 10.0.0.1
+        return self._trees[address.version].longest_match(int(address))
+
+    def is_allowed(self, ip: str) -> bool:
+        """
+        IP 접근 허용 여부 (카운터 기록)
+
+        Args:
+            ip: 클라이언트 IP 주소
+
+        Returns:
+            bool: 가장 구체적인 규칙이 허용이면 True, 차단 규칙이거나 일치 규칙이 없으면 False
+        """
+        try:
+            rule = self.match(ip)
+        except ValueError:
+            self.stats.invalid += 1
+            self.stats.denied += 1
+            return False
+
+        if rule is None:
+            self.stats.unmatched += 1
+            self.stats.denied += 1
+            return False
+        if rule.is_allowed:
+            rule.hits += 1
+            self.stats.allowed += 1
+            return True
+        rule.denies += 1
+        self.stats.denied += 1
+        return False
+
+    # ------------------------------------------------------------------
+    # 적재
+    # ------------------------------------------------------------------
+
+    def load(self, rows: Iterable[Tuple[int, str, bool]], version: Optional[int] = None) -> None:
+        """
+        규칙 목록으로 prefix tree 교체 (규칙 id가 같으면 카운터 유지)
+
+        Args:
+            rows: (id, IP/CIDR, 허용 여부) 목록
+            version: 적재한 규칙의 버전
+        """
+        trees = {4: PrefixTree(32), 6: PrefixTree(128)}
+        rules: Dict[int, IPRule] = {}
+        for rule_id, value, is_allowed in rows:
+            try:
+                network = parse_network(value)
+            except ValueError:
+                logger.warning(f"Skipping invalid IP allowlist entry {rule_id}: {value!r}")
+                continue
+            rule = IPRule(rule_id, network, is_allowed)
+            previous = self._rules.get(rule_id)
+            if previous is not None and previous.network == network:
+                rule.hits, rule.denies = previous.hits, previous.denies
+            trees[network.version].insert(network, rule)
+            rules[rule_id] = rule
+
+        # 참조 교체만 하므로 판정 중인 요청은 이전 tree를 끝까지 사용
+        self._trees, self._rules = trees, rules
+        self.version = version
+        self._loaded = True
+        self.stats.reloads += 1
+        self.stats.last_reload_at = time.time()
+
+    async def reload(self) -> None:
+        """DB에서 규칙 재적재 (버전은 적재 전에 읽어 적재 중 변경을 놓치지 않음)"""
+        async with self._lock:
+            version = await self.redis.get_int(VERSION_KEY)
+            rows = await self.loader()
+            self.load(rows, version)
+        logger.info(f"IP allowlist loaded: {len(self._rules)} rules (version={version})")
+
+    async def ensure_loaded(self) -> None:
+        """최초 요청 시 1회 적재"""
+        if not self._loaded:
+            await self.reload()
+
+    async def notify_changed(self) -> None:
+        """
+        규칙 변경 알림 (관리자 추가/수정/삭제 후 호출)
+
+        현재 프로세스는 즉시 재적재, 다른 워커는 Redis 버전 증가 + pub/sub 메시지로 재적재
+        """
+        redis = await self.redis.client()
+        if redis is not None:
+            try:
+                version = await redis.incr(VERSION_KEY)
+                await redis.publish(CHANNEL, version)
+            except Exception as e:
+                self.redis.failed(e)
+        await self.reload()
+
+    async def refresh(self) -> bool:
+        """
+        버전이 바뀌었으면 재적재 (Redis 없으면 항상 재적재)
+
+        Returns:
+            bool: 재적재 여부
+        """
+        version = await self.redis.get_int(VERSION_KEY)
+        if version is not None and self._loaded and version == self.version:
+            return False
+        await self.reload()
+        return True
+
+    # ------------------------------------------------------------------
+    # 수명주기
+    # ------------------------------------------------------------------
+
+    def start(self) -> None:
+        """백그라운드 갱신 루프 시작 (pub/sub 수신 + 주기적 버전 확인)"""
+        if self._task is not None and not self._task.done():
+            return
+        self._stopping = False
+        self._task = asyncio.create_task(self._run(), name="ip-allowlist")
+        logger.info(f"IP allowlist refresher started (interval={self.refresh_interval}s)")
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._stopping = True
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.redis.close()
+
+    async def _run(self) -> None:
+        pubsub = None
+        while not self._stopping:
+            try:
+                if pubsub is None:
+                    pubsub = await self._subscribe()
+                if pubsub is not None:
+                    message = await pubsub.get_message(
+                        ignore_subscribe_messages=True, timeout=self.refresh_interval
+                    )
+                    if message is not None:
+                        await self.reload()
+                        continue
+                else:
+                    await asyncio.sleep(self.refresh_interval)
+                # 놓친 메시지 / Redis 없음 대비 주기적 확인
+                await self.refresh()
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                self.stats.failures += 1
+                logger.error(f"IP allowlist refresh failed: {e}", exc_info=True)
+                if pubsub is not None:
+                    await self._close_pubsub(pubsub)
+                    pubsub = None
+                await asyncio.sleep(self.refresh_interval)
+        if pubsub is not None:
+            await self._close_pubsub(pubsub)
+
+    async def _subscribe(self):
+        redis = await self.redis.client()
+        if redis is None:
+            return None
+        try:
+            pubsub = redis.pubsub()
+            await pubsub.subscribe(CHANNEL)
+            return pubsub
+        except Exception as e:
+            self.redis.failed(e)
+            return None
+
+    @staticmethod
+    async def _close_pubsub(pubsub) -> None:
+        try:
+            await pubsub.aclose()
+        except Exception:
+            pass
+
+    def rule_metrics(self) -> List[Dict[str, Any]]:
+        """규칙별 허용/차단 카운터 (적중 많은 순)"""
+        return sorted(
+            (rule.snapshot() for rule in self._rules.values()),
+            key=lambda item: item["hits"] + item["denies"],
+            reverse=True,
+        )
+
+    def metrics(self) -> Dict[str, Any]:
+        data = self.stats.snapshot()
+        data["loaded"] = self._loaded
+        data["version"] = self.version
+        data["rules"] = len(self._rules)
+        data["running"] = self._task is not None and not self._task.done()
+        data["redis"] = self.redis.enabled
+        data["redis_errors"] = self.redis.errors
+        return data
+
+
+# 싱글톤 인스턴스
+ip_allowlist = IPAllowlist(
+    redis_url=settings.REDIS_URL,
+    refresh_interval=settings.IP_ALLOWLIST_REFRESH_INTERVAL,
+)
@@ -0,0 +1,267 @@
+"""
+문서 전체 일괄 PII 검사
+PRD_v2.md P0 요구사항: FUN-003
+
+수십만 건 문서를 API 이벤트 루프를 막지 않고 검사합니다.
+- documents를 id keyset으로 배치 조회 (전체 내용을 한 번에 올리지 않음)
+- 정규식 검사는 프로세스 풀에서 수행 (CPU 작업 분리)
+- PIIDetectionResult 배치 INSERT + 배치당 1회 커밋
+- 배치마다 pii_scan_jobs에 체크포인트 기록 → 중단 후 이어서 실행
+- 문서 내용 해시가 직전 검사와 같으면 재검사 생략
+"""
+import asyncio
+import logging
+from concurrent.futures import Executor, ProcessPoolExecutor
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import func, insert, select
+
+from app.core.config import settings
+from app.core.session_factory import LazySessionFactory
+from app.models.document import Document
+from app.models.pii_detection import PIIDetectionResult, PIIScanJob, PIIScanJobStatus, PIIStatus
+from app.services.pii_detector import PIIDetector
+from app.services.pii_scanner import content_hash, serialize_matches
+
+logger = logging.getLogger(__name__)
+
+# 다른 API 워커가 실행 중인 작업으로 간주하는 최근 체크포인트 시간
+STALE_AFTER = timedelta(minutes=5)
+
+# (document_id, content_hash, pii_data, has_pii) - 변경 없는 문서는 pii_data가 None
+ScanResult = Tuple[int, str, Optional[str], bool]
+
+_detector: Optional[PIIDetector] = None
+
+
+def scan_contents(items: List[Tuple[int, Optional[str], Optional[str]]]) -> List[ScanResult]:
+    """
+    문서 내용 PII 검사 (프로세스 풀 작업 함수)
+
+    Args:
+        items: (document_id, content, 직전 검사 content_hash) 목록
+
+    Returns:
+        (document_id, content_hash, pii_data, has_pii) 목록
+    """
+    global _detector
+    if _detector is None:
+        _detector = PIIDetector()
+
+    results: List[ScanResult] = []
+    for document_id, content, previous_hash in items:
+        digest = content_hash(content)
+        if digest == previous_hash:
+            results.append((document_id, digest, None, False))
+            continue
+        matches = _detector.detect(content or "")
+        results.append((document_id, digest, serialize_matches(matches), bool(matches)))
+    return results
+
+
+class PIIBulkScanner:
+    """문서 전체 일괄 PII 검사 작업 실행기"""
+
+    session_factory = LazySessionFactory()
+
+    def __init__(
+        self,
+        session_factory=None,
+        batch_size: int = 500,
+        workers: int = 4,
+        executor: Optional[Executor] = None,
+    ):
+        """
+        Args:
+            session_factory: AsyncSession 팩토리 (None이면 app.core.database.AsyncSessionLocal)
+            batch_size: keyset 1회 조회 문서 수 (= 체크포인트 단위)
+            workers: 검사 프로세스 수
+            executor: 검사 실행기 (None이면 ProcessPoolExecutor를 처음 사용할 때 생성)
+        """
+        self.session_factory = session_factory
+        self.batch_size = batch_size
+        self.workers = workers
+        self._executor = executor
+        self._tasks: Dict[int, asyncio.Task] = {}
+
+    @property
+    def executor(self) -> Executor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers)
+        return self._executor
+
+    def is_running(self, job_id: int) -> bool:
+        task = self._tasks.get(job_id)
+        return task is not None and not task.done()
+
+    # ------------------------------------------------------------------
+    # 작업 관리
+    # ------------------------------------------------------------------
+
+    async def start(self) -> PIIScanJob:
+        """
+        일괄 검사 시작 (진행 중이던 작업이 있으면 체크포인트부터 재개)
+
+        Returns:
+            PIIScanJob: 시작(또는 재개)된 작업
+        """
+        async with self.session_factory() as session:
+            result = await session.execute(
+                select(PIIScanJob)
+                .where(PIIScanJob.status == PIIScanJobStatus.RUNNING.value)
+                .order_by(PIIScanJob.id.desc())
+                .limit(1)
+            )
+            job = result.scalar_one_or_none()
+
+            if job is not None:
+                if self.is_running(job.id):
+                    return job
+                if job.updated_at and datetime.now(timezone.utc) - job.updated_at < STALE_AFTER:
+                    # 다른 API 워커 프로세스가 체크포인트를 갱신 중
+                    return job
+                logger.info(f"Resuming PII scan job {job.id} after document {job.last_document_id}")
+            else:
+                total = await session.scalar(select(func.count(Document.id)))
+                job = PIIScanJob(
+                    status=PIIScanJobStatus.RUNNING.value,
+                    last_document_id=0,
+                    total_documents=total or 0,
+                )
+                session.add(job)
+                await session.commit()
+                await session.refresh(job)
+                logger.info(f"PII scan job {job.id} started ({job.total_documents} documents)")
+
+        self._tasks[job.id] = asyncio.create_task(self.run(job.id), name=f"pii-scan-{job.id}")
+        return job
+
+    async def cancel(self, job_id: int) -> Optional[PIIScanJob]:
+        """작업 취소 (현재 배치까지 저장 후 중단)"""
+        async with self.session_factory() as session:
+            job = await session.get(PIIScanJob, job_id)
+            if job is None:
+                return None
+            if job.status == PIIScanJobStatus.RUNNING.value:
+                job.status = PIIScanJobStatus.CANCELLED.value
+                job.finished_at = datetime.now(timezone.utc)
+                await session.commit()
+                await session.refresh(job)
+            return job
+
+    async def shutdown(self) -> None:
+        """실행 중인 작업 중단 및 프로세스 풀 정리 (체크포인트는 유지되어 재개 가능)"""
+        for task in self._tasks.values():
+            task.cancel()
+        for task in self._tasks.values():
+            try:
+                await task
+            except (asyncio.CancelledError, Exception):
+                pass
+        self._tasks.clear()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    # ------------------------------------------------------------------
+    # 배치 처리
+    # ------------------------------------------------------------------
+
+    async def run(self, job_id: int) -> None:
+        """작업이 끝나거나 취소될 때까지 배치 반복"""
+        try:
+            while await self.run_batch(job_id):
+                pass
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"PII scan job {job_id} failed: {e}", exc_info=True)
+            async with self.session_factory() as session:
+                job = await session.get(PIIScanJob, job_id)
+                if job is not None:
+                    job.status = PIIScanJobStatus.FAILED.value
+                    job.error_message = str(e)[:1000]
+                    job.finished_at = datetime.now(timezone.utc)
+                    await session.commit()
+
+    async def run_batch(self, job_id: int) -> bool:
+        """
+        체크포인트 다음 문서 1배치 검사
+
+        Returns:
+            bool: 처리할 배치가 더 있으면 True
+        """
+        async with self.session_factory() as session:
+            job = await session.get(PIIScanJob, job_id)
+            if job is None or job.status != PIIScanJobStatus.RUNNING.value:
+                return False
+
+            result = await session.execute(
+                select(Document.id, Document.content)
+                .where(Document.id > job.last_document_id)
+                .order_by(Document.id)
+                .limit(self.batch_size)
+            )
+            documents = result.all()
+            if not documents:
+                job.status = PIIScanJobStatus.COMPLETED.value
+                job.finished_at = datetime.now(timezone.utc)
+                await session.commit()
+                logger.info(
+                    f"PII scan job {job_id} completed: scanned={job.scanned_count}, "
+                    f"skipped={job.skipped_count}, detected={job.detected_count}"
+                )
+                return False
+
+            previous = await self._previous_hashes(session, [doc.id for doc in documents])
+            scanned = await self._scan([(doc.id, doc.content, previous.get(doc.id)) for doc in documents])
+
+            rows = [
+                {
+                    "document_id": document_id,
+                    "has_pii": has_pii,
+                    "pii_data": pii_data,
+                    "status": PIIStatus.PENDING.value if has_pii else PIIStatus.APPROVED.value,
+                    "content_hash": digest,
+                }
+                for document_id, digest, pii_data, has_pii in scanned
+                if pii_data is not None
+            ]
+            if rows:
+                await session.execute(insert(PIIDetectionResult), rows)
+
+            # 결과와 체크포인트를 같은 트랜잭션으로 커밋
+            job.last_document_id = documents[-1].id
+            job.scanned_count += len(rows)
+            job.skipped_count += len(scanned) - len(rows)
+            job.detected_count += sum(1 for row in rows if row["has_pii"])
+            await session.commit()
+            return True
+
+    async def _previous_hashes(self, session, document_ids: List[int]) -> Dict[int, Optional[str]]:
+        """문서별 가장 최근 검사 결과의 content_hash"""
+        result = await session.execute(
+            select(PIIDetectionResult.document_id, PIIDetectionResult.content_hash)
+            .where(PIIDetectionResult.document_id.in_(document_ids))
+            .distinct(PIIDetectionResult.document_id)
+            .order_by(PIIDetectionResult.document_id, PIIDetectionResult.id.desc())
+        )
+        return {document_id: digest for document_id, digest in result.all()}
+
+    async def _scan(self, items: List[Tuple[int, Optional[str], Optional[str]]]) -> List[ScanResult]:
+        """검사 프로세스 수만큼 나누어 병렬 검사"""
+        loop = asyncio.get_running_loop()
+        size = max(1, -(-len(items) // self.workers))
+        chunks = [items[i:i + size] for i in range(0, len(items), size)]
+        results = await asyncio.gather(*(
+            loop.run_in_executor(self.executor, scan_contents, chunk) for chunk in chunks
+        ))
+        return [row for chunk in results for row in chunk]
+
+
+# 싱글톤 인스턴스
+pii_bulk_scanner = PIIBulkScanner(
+    batch_size=settings.PII_SCAN_BATCH_SIZE,
+    workers=settings.PII_SCAN_WORKERS,
+)
@@ -7,7 +7,7 @@ PRD_v2.md P0 요구사항: FUN-003
 import re
 from dataclasses import dataclass
 from enum import Enum
-from typing import List
+from typing import Iterable, Iterator, List, Optional, Tuple
 
 
 class PIIType(str, Enum):
@@ -29,35 +29,76 @@ class PIIMatch:
     confidence: float  # 0.0 ~ 1.0
 
 
+_MOBILE_PREFIXES = {'010', '011', '016', '017', '018', '019'}
+
+# 스트리밍 검사 시 청크 경계에 걸친 매치를 놓치지 않기 위해 보관하는 최대 매치 길이
+# (모든 패턴은 길이 상한이 있어야 함)
+MAX_MATCH_LENGTH = 400
+
+_DIGIT_SEPARATORS = re.compile(r'[-\s]')
+
+
+def _luhn_valid(digits: str) -> bool:
+    """신용카드 Luhn 체크섬"""
+    total = 0
+    for index, char in enumerate(reversed(digits)):
+        value = ord(char) - 48
+        if index % 2:
+            value *= 2
+            if value > 9:
+                value -= 9
+        total += value
+    return total % 10 == 0
+
+
+def _resident_checksum_valid(digits: str) -> bool:
+    """주민등록번호 검증번호 (마지막 자리)"""
+    weights = (2, 3, 4, 5, 6, 7, 8, 9, 2, 3, 4, 5)
+    total = sum((ord(d) - 48) * w for d, w in zip(digits, weights))
+    return (11 - total % 11) % 10 == ord(digits[12]) - 48
+
+
 class PIIDetector:
-    """개인정보 검출기"""
+    """
+    개인정보 검출기
 
-    # 정규표현식 패턴
+    모든 패턴을 우선순위 순서의 named group 정규식 하나로 컴파일하여
+    텍스트를 한 번만 순회합니다. 같은 위치에서 시작하는 매치는
+    앞선 패턴이 우선하며, 검출 결과는 서로 겹치지 않습니다.
+    """
+
+    # 정규표현식 패턴 (우선순위 순서 - 긴 숫자열이 짧은 숫자열보다 먼저)
     PATTERNS = {
-        PIIType.RESIDENT_NUMBER: [
-            # 주민등록번호: 901234-1234567 형식
-            (r'\d{6}[-\s]?\d{7}', 1.0),
-        ],
-        PIIType.PHONE_NUMBER: [
-            # 휴대폰: 010-1234-5678, 01012345678
-            (r'01[016789][-\s]?\d{3,4}[-\s]?\d{4}', 0.95),
-            # 일반 전화: 02-123-4567
-            (r'0\d{1,2}[-\s]?\d{3,4}[-\s]?\d{4}', 0.9),
-        ],
-        PIIType.EMAIL: [
-            # 이메일: user@example.com
-            (r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}', 0.95),
-        ],
-        PIIType.ADDRESS: [
-            # 주소: 서울특별시, 경기도 등
-            (r'(서울|부산|대구|인천|광주|대전|울산|세종|경기|강원|충북|충남|전북|전남|경북|경남|제주)(특별|광역)?(시|도)\s+\S+(\s+\S+)*', 0.85),
-        ],
-        PIIType.CREDIT_CARD: [
-            # 신용카드: 1234-5678-9012-3456, 1234567890123456
-            (r'\d{4}[-\s]?\d{4}[-\s]?\d{4}[-\s]?\d{4}', 0.8),
-        ],
+        # 신용카드: 1234-5678-9012-3456, 1234567890123456
+        PIIType.CREDIT_CARD: r'(?<!\d)\d{4}[-\s]?\d{4}[-\s]?\d{4}[-\s]?\d{4}(?!\d)',
+        # 주민등록번호: 901234-1234567 형식
+        PIIType.RESIDENT_NUMBER: r'(?<!\d)\d{6}[-\s]?\d{7}(?!\d)',
+        # 휴대폰: 010-1234-5678, 01012345678 / 일반 전화: 02-123-4567
+        PIIType.PHONE_NUMBER: r'(?<!\d)0\d{1,2}[-\s]?\d{3,4}[-\s]?\d{4}(?!\d)',
+        # 이메일: user@example.com
+        PIIType.EMAIL: r'(?<![a-zA-Z0-9._%+-])[a-zA-Z0-9._%+-]{1,64}@[a-zA-Z0-9.-]{1,253}\.[a-zA-Z]{2,24}',
+        # 주소: 서울특별시, 경기도 등 + 같은 줄의 최대 4개 어절
+        PIIType.ADDRESS: (
+            r'(?:서울|부산|대구|인천|광주|대전|울산|세종|경기|강원|충북|충남|전북|전남|경북|경남|제주)'
+            r'(?:특별|광역)?(?:시|도)(?:[^\S\n]{1,8}\S{1,40}){1,4}'
+        ),
+    }
+
+    # 체크섬 결과에 따른 신뢰도
+    CONFIDENCE = {
+        # 2020.10 이후 발급분은 뒷자리가 임의번호라 검증번호가 맞지 않을 수 있음
+        PIIType.RESIDENT_NUMBER: (1.0, 0.9),  # (검증번호 일치, 불일치)
+        PIIType.CREDIT_CARD: (0.95, 0.5),  # (Luhn 통과, 실패)
+        PIIType.EMAIL: 0.95,
+        PIIType.ADDRESS: 0.85,
     }
 
+    _GROUPS = {pii_type.name: pii_type for pii_type in PATTERNS}
+    _COMBINED = re.compile("|".join(
+        f"(?P<{pii_type.name}>{pattern})" for pii_type, pattern in PATTERNS.items()
+    ))
+    _SINGLE = {pii_type: re.compile(pattern) for pii_type, pattern in PATTERNS.items()}
+
     def detect(self, text: str) -> List[PIIMatch]:
         """
         텍스트에서 개인정보를 검출합니다.
@@ -66,69 +107,146 @@ class PIIDetector:
             text: 검사할 텍스트
 
         Returns:
-            검출된 PII 목록
+            검출된 PII 목록 (시작 위치 순, 서로 겹치지 않음)
         """
-        matches = []
-
-        for pii_type, patterns in self.PATTERNS.items():
-            for pattern, confidence in patterns:
-                for match in re.finditer(pattern, text):
-                    # False Positive 필터링
-                    if self._is_valid_match(pii_type, match.group()):
-                        matches.append(PIIMatch(
-                            pii_type=pii_type,
-                            value=match.group(),
-                            start_pos=match.start(),
-                            end_pos=match.end(),
-                            confidence=confidence
-                        ))
-
+        matches, _ = self._scan(text, 0, len(text), final=True)
         return matches
 
-    def _is_valid_match(self, pii_type: PIIType, value: str) -> bool:
+    def detect_stream(self, chunks: Iterable[str]) -> Iterator[PIIMatch]:
+        """
+        청크 단위 텍스트에서 개인정보를 검출합니다.
+
+        전체 텍스트를 메모리에 올리지 않고 청크 경계에 걸친 매치까지
+        detect()와 같은 결과를 냅니다. 위치는 전체 텍스트 기준입니다.
+
+        Args:
+            chunks: 텍스트 청크 (HWP/PDF 추출 결과 등)
+
+        Yields:
+            검출된 PII (시작 위치 순)
+        """
+        buffer = ""
+        offset = 0  # buffer[0]의 전체 텍스트 기준 위치
+        pos = 0  # buffer 내 다음 검사 위치
+        for chunk in chunks:
+            if not chunk:
+                continue
+            buffer += chunk
+            matches, pos = self._scan(buffer, pos, len(buffer), final=False)
+            for match in matches:
+                yield self._shift(match, offset)
+            # 이미 확정된 구간은 버리고 lookbehind용 1글자만 남김
+            keep_from = max(pos - 1, 0)
+            buffer = buffer[keep_from:]
+            offset += keep_from
+            pos -= keep_from
+
+        matches, _ = self._scan(buffer, pos, len(buffer), final=True)
+        for match in matches:
+            yield self._shift(match, offset)
+
+    @staticmethod
+    def _shift(match: PIIMatch, offset: int) -> PIIMatch:
+        if offset:
+            match.start_pos += offset
+            match.end_pos += offset
+        return match
+
+    def _scan(self, text: str, pos: int, end: int, final: bool) -> Tuple[List[PIIMatch], int]:
+        """
+        pos부터 순차 검사
+
+        final이 아니면 뒤에 이어질 텍스트에 따라 결과가 달라질 수 있는
+        위치(끝에서 MAX_MATCH_LENGTH 이내)에서 멈추고 그 위치를 반환합니다.
         """
-        False Positive를 필터링합니다.
+        matches: List[PIIMatch] = []
+        limit = end if final else end - MAX_MATCH_LENGTH
+        search = self._COMBINED.search
+        while pos < limit:
+            found = search(text, pos)
+            if found is None or found.start() >= limit:
+                break
+            start = found.start()
+            match = self._accept(self._GROUPS[found.lastgroup], found)
+            if match is None:
+                # 같은 위치에서 후순위 패턴 재시도
+                match = self._fallback(text, start, self._GROUPS[found.lastgroup])
+            if match is None:
+                pos = start + 1
+                continue
+            matches.append(match)
+            pos = match.end_pos
+        if final or pos > limit:
+            return matches, pos
+        return matches, max(pos, limit)
+
+    def _fallback(self, text: str, start: int, failed: PIIType) -> Optional[PIIMatch]:
+        skipping = True
+        for pii_type, pattern in self._SINGLE.items():
+            if skipping:
+                skipping = pii_type != failed
+                continue
+            found = pattern.match(text, start)
+            if found is not None:
+                match = self._accept(pii_type, found)
+                if match is not None:
+                    return match
+        return None
+
+    def _accept(self, pii_type: PIIType, found: "re.Match") -> Optional[PIIMatch]:
+        value = found.group()
+        confidence = self._confidence(pii_type, value)
+        if confidence is None:
+            return None
+        return PIIMatch(
+            pii_type=pii_type,
+            value=value,
+            start_pos=found.start(),
+            end_pos=found.end(),
+            confidence=confidence
+        )
+
+    def _confidence(self, pii_type: PIIType, value: str) -> Optional[float]:
+        """
+        False Positive를 필터링하고 신뢰도를 계산합니다.
 
         Args:
             pii_type: PII 유형
             value: 검출된 값
 
         Returns:
-            유효한 매치인지 여부
+            신뢰도 (유효하지 않은 매치면 None)
         """
         # 주민등록번호 검증
         if pii_type == PIIType.RESIDENT_NUMBER:
-            # 하이픈 제거
-            digits = re.sub(r'[-\s]', '', value)
-            if len(digits) != 13:
-                return False
+            digits = _DIGIT_SEPARATORS.sub('', value)
             # 앞 6자리는 생년월일 (간단한 검증 - 월만 체크)
-            try:
-                month = int(digits[2:4])
-                day = int(digits[4:6])
-                # 월은 1-12, 일은 1-99 (테스트 데이터 호환성 위해 느슨하게)
-                if not (1 <= month <= 12 and 1 <= day <= 99):
-                    return False
-            except ValueError:
-                return False
+            month = int(digits[2:4])
+            day = int(digits[4:6])
+            # 월은 1-12, 일은 1-99 (테스트 데이터 호환성 위해 느슨하게)
+            if not (1 <= month <= 12 and 1 <= day <= 99):
+                return None
+            valid, invalid = self.CONFIDENCE[pii_type]
+            return valid if _resident_checksum_valid(digits) else invalid
 
         # 전화번호 검증
-        elif pii_type == PIIType.PHONE_NUMBER:
-            digits = re.sub(r'[-\s]', '', value)
+        if pii_type == PIIType.PHONE_NUMBER:
+            digits = _DIGIT_SEPARATORS.sub('', value)
             # 전화번호는 최소 9자리, 최대 11자리
             if not (9 <= len(digits) <= 11):
-                return False
+                return None
             # 1234567890 같은 연속된 숫자는 제외
             if digits == ''.join(str(i % 10) for i in range(len(digits))):
-                return False
+                return None
+            # 휴대폰 번호가 일반 전화보다 신뢰도 높음
+            return 0.95 if digits[:3] in _MOBILE_PREFIXES else 0.9
 
-        # 신용카드 검증 (Luhn 알고리즘은 생략, 단순 길이 검증)
-        elif pii_type == PIIType.CREDIT_CARD:
-            digits = re.sub(r'[-\s]', '', value)
-            if len(digits) != 16:
-                return False
+        # 신용카드 검증 (Luhn 체크섬)
+        if pii_type == PIIType.CREDIT_CARD:
+            valid, invalid = self.CONFIDENCE[pii_type]
+            return valid if _luhn_valid(_DIGIT_SEPARATORS.sub('', value)) else invalid
 
-        return True
+        return self.CONFIDENCE[pii_type]
 
     def mask(self, text: str) -> str:
         """
@@ -140,19 +258,14 @@ class PIIDetector:
         Returns:
             마스킹된 텍스트
         """
-        masked_text = text
-        matches = self.detect(text)
-
-        # 뒤에서부터 마스킹 (인덱스 유지)
-        for match in sorted(matches, key=lambda x: x.start_pos, reverse=True):
-            masked_value = self._mask_value(match.pii_type, match.value)
-            masked_text = (
-                masked_text[:match.start_pos] +
-                masked_value +
-                masked_text[match.end_pos:]
-            )
-
-        return masked_text
+        parts = []
+        cursor = 0
+        for match in self.detect(text):
+            parts.append(text[cursor:match.start_pos])
+            parts.append(self._mask_value(match.pii_type, match.value))
+            cursor = match.end_pos
+        parts.append(text[cursor:])
+        return "".join(parts)
 
     def _mask_value(self, pii_type: PIIType, value: str) -> str:
         """
@@ -171,7 +284,7 @@ class PIIDetector:
 
         elif pii_type == PIIType.PHONE_NUMBER:
             # 전화번호: 010-****-5678 (중간 마스킹)
-            digits = re.sub(r'[-\s]', '', value)
+            digits = _DIGIT_SEPARATORS.sub('', value)
             if len(digits) == 11:
                 return f"{digits[:3]}-****-{digits[7:]}"
             elif len(digits) == 10:
@@ -192,7 +305,7 @@ class PIIDetector:
 
         elif pii_type == PIIType.CREDIT_CARD:
             # 카드번호: 1234-****-****-3456 (중간 8자리 마스킹)
-            digits = re.sub(r'[-\s]', '', value)
+            digits = _DIGIT_SEPARATORS.sub('', value)
             return f"{digits[:4]}-****-****-{digits[12:]}"
 
         # 기본: 전체 마스킹
@@ -4,8 +4,9 @@ PRD_v2.md P0 요구사항: FUN-003
 
 문서를 스캔하여 개인정보를 검출하고 결과를 저장합니다.
 """
+import hashlib
 import json
-from typing import List
+from typing import List, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 
@@ -14,6 +15,50 @@ from app.models.pii_detection import PIIDetectionResult, PIIStatus
 from app.services.pii_detector import PIIDetector, PIIMatch
 
 
+def content_hash(content: Optional[str]) -> str:
+    """문서 내용 SHA-256 (변경 여부 판단용)"""
+    return hashlib.sha256((content or "").encode("utf-8")).hexdigest()
+
+
+def mask_for_storage(value: str) -> str:
+    """
+    저장용 마스킹 (부분만 표시)
+
+    Args:
+        value: 원본 값
+
+    Returns:
+        마스킹된 값
+    """
+    if len(value) > 4:
+        return value[:2] + "*" * (len(value) - 4) + value[-2:]
+    else:
+        return "***"
+
+
+def serialize_matches(matches: List[PIIMatch]) -> str:
+    """
+    PII 매치를 JSON으로 직렬화합니다.
+
+    Args:
+        matches: PII 매치 목록
+
+    Returns:
+        JSON 문자열
+    """
+    data = [
+        {
+            "type": match.pii_type.value,
+            "value": mask_for_storage(match.value),
+            "start_pos": match.start_pos,
+            "end_pos": match.end_pos,
+            "confidence": match.confidence
+        }
+        for match in matches
+    ]
+    return json.dumps(data, ensure_ascii=False)
+
+
 class PIIScanner:
     """문서 PII 스캐너"""
 
@@ -48,12 +93,13 @@ class PIIScanner:
         matches = self.detector.detect(content)
 
         # 결과 저장
-        pii_data = self._serialize_matches(matches)
+        pii_data = serialize_matches(matches)
         detection_result = PIIDetectionResult(
             document_id=document_id,
             has_pii=len(matches) > 0,
             pii_data=pii_data,
-            status=PIIStatus.PENDING if matches else PIIStatus.APPROVED
+            status=PIIStatus.PENDING if matches else PIIStatus.APPROVED,
+            content_hash=content_hash(content)
         )
 
         db.add(detection_result)
@@ -87,40 +133,3 @@ class PIIScanner:
                 print(f"Failed to scan document {doc_id}: {e}")
 
         return results
-
-    def _serialize_matches(self, matches: List[PIIMatch]) -> str:
-        """
-        PII 매치를 JSON으로 직렬화합니다.
-
-        Args:
-            matches: PII 매치 목록
-
-        Returns:
-            JSON 문자열
-        """
-        data = [
-            {
-                "type": match.pii_type.value,
-                "value": self._mask_for_storage(match.value),
-                "start_pos": match.start_pos,
-                "end_pos": match.end_pos,
-                "confidence": match.confidence
-            }
-            for match in matches
-        ]
-        return json.dumps(data, ensure_ascii=False)
-
-    def _mask_for_storage(self, value: str) -> str:
-        """
-        저장용 마스킹 (부분만 표시)
-
-        Args:
-            value: 원본 값
-
-        Returns:
-            마스킹된 값
-        """
-        if len(value) > 4:
-            return value[:2] + "*" * (len(value) - 4) + value[-2:]
-        else:
-            return "***"
@@ -0,0 +1,162 @@
+"""
+RAG 질의 임베딩 (캐시 + 요청 병합 + 마이크로 배치)
+
+자주 묻는 질문은 하루 수천 번 같은 질의로 임베딩됩니다.
+- 동의어 치환된 질의 기준 TTL + LRU 캐시
+- 같은 질의가 동시에 들어오면 진행 중인 임베딩 1건을 공유 (single-flight)
+- 서로 다른 질의는 짧은 대기 시간(수 ms) 동안 모아 한 번의 배치 요청으로 전송
+"""
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from app.services.embedding_cache import normalize_text
+
+logger = logging.getLogger(__name__)
+
+EmbedFunc = Callable[[List[str]], Awaitable[List[List[float]]]]
+
+
+class QueryEmbedderStats:
+    """질의 임베딩 카운터"""
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0  # 진행 중인 요청을 공유한 질의 수
+        self.batches = 0
+        self.batched_queries = 0
+        self.failures = 0
+
+    def snapshot(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses + self.coalesced
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "hit_ratio": round((self.hits + self.coalesced) / lookups, 4) if lookups else 0.0,
+            "batches": self.batches,
+            "avg_batch_size": round(self.batched_queries / self.batches, 2) if self.batches else 0.0,
+            "failures": self.failures,
+        }
+
+
+class QueryEmbedder:
+    """질의 임베딩 캐시 + single-flight + 마이크로 배치"""
+
+    def __init__(
+        self,
+        embed: EmbedFunc,
+        ttl: float = 3600.0,
+        max_size: int = 5000,
+        batch_window: float = 0.005,
+        max_batch: int = 32,
+    ):
+        """
+        Args:
+            embed: 배치 임베딩 함수 (texts -> vectors, 순서 유지)
+            ttl: 캐시 만료 시간 (초)
+            max_size: 캐시 최대 질의 수
+            batch_window: 배치로 모으는 대기 시간 (초)
+            max_batch: 배치 최대 질의 수 (도달 시 즉시 전송)
+        """
+        self._embed = embed
+        self.ttl = ttl
+        self.max_size = max_size
+        self.batch_window = batch_window
+        self.max_batch = max_batch
+        self.stats = QueryEmbedderStats()
+        self._cache: "OrderedDict[str, Tuple[float, List[float]]]" = OrderedDict()
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._pending: Dict[str, str] = {}  # 다음 배치로 보낼 key -> text
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+
+    async def embed(self, text: str) -> List[float]:
+        """
+        질의 임베딩 (캐시 / 진행 중 요청 / 배치 요청 순)
+
+        Args:
+            text: 동의어 치환된 질의
+
+        Returns:
+            임베딩 벡터
+        """
+        key = normalize_text(text)
+
+        cached = self._cache.get(key)
+        if cached is not None:
+            expires_at, vector = cached
+            if expires_at > time.monotonic():
+                self._cache.move_to_end(key)
+                self.stats.hits += 1
+                return vector
+            del self._cache[key]
+
+        future = self._inflight.get(key)
+        if future is not None:
+            self.stats.coalesced += 1
+        else:
+            self.stats.misses += 1
+            future = asyncio.get_running_loop().create_future()
+            self._inflight[key] = future
+            self._pending[key] = text
+            self._schedule_flush()
+        # 한 호출자가 취소되어도 공유 요청은 유지
+        return await asyncio.shield(future)
+
+    def _schedule_flush(self) -> None:
+        if len(self._pending) >= self.max_batch:
+            if self._flush_handle is not None:
+                self._flush_handle.cancel()
+                self._flush_handle = None
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = asyncio.get_running_loop().call_later(self.batch_window, self._flush)
+
+    def _flush(self) -> None:
+        self._flush_handle = None
+        batch, self._pending = self._pending, {}
+        if batch:
+            asyncio.get_running_loop().create_task(self._run_batch(batch))
+
+    async def _run_batch(self, batch: Dict[str, str]) -> None:
+        self.stats.batches += 1
+        self.stats.batched_queries += len(batch)
+        try:
+            vectors = await self._embed(list(batch.values()))
+            if len(vectors) != len(batch):
+                raise ValueError(f"Expected {len(batch)} embeddings, got {len(vectors)}")
+        except Exception as e:
+            self.stats.failures += 1
+            logger.error(f"Query embedding batch failed ({len(batch)} queries): {e}")
+            for key in batch:
+                future = self._inflight.pop(key)
+                if not future.done():
+                    future.set_exception(e)
+                    # 모든 호출자가 취소된 경우 "exception was never retrieved" 경고 방지
+                    future.exception()
+            return
+
+        expires_at = time.monotonic() + self.ttl
+        for key, vector in zip(batch, vectors):
+            self._remember(key, expires_at, vector)
+            future = self._inflight.pop(key)
+            if not future.done():
+                future.set_result(vector)
+
+    def _remember(self, key: str, expires_at: float, vector: List[float]) -> None:
+        self._cache[key] = (expires_at, vector)
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.max_size:
+            self._cache.popitem(last=False)
+
+    def metrics(self) -> Dict[str, Any]:
+        data = self.stats.snapshot()
+        data["cached_queries"] = len(self._cache)
+        data["max_size"] = self.max_size
+        data["ttl"] = self.ttl
+        data["batch_window_ms"] = round(self.batch_window * 1000, 1)
+        data["max_batch"] = self.max_batch
+        return data
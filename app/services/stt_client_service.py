@@ -6,7 +6,7 @@ import re
 import asyncio
 from typing import Optional, Dict
 from pathlib import Path
-import httpx
+from app.core.http_client import http_clients
 from app.services.stt_service import STTService
 
 
@@ -91,35 +91,17 @@ class STTClientService:
             payload["recipient_emails"] = recipient_emails
 
         # HTTP 요청 (실제 ex-GPT-STT API 엔드포인트 사용)
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            # 실제 파일 업로드 (multipart/form-data)
-            # ex-GPT-STT는 /api/v1/stt/upload 엔드포인트 사용
-
-            # 로컬 파일 시스템에 있는 경우만 직접 업로드
-            if audio_file_path.startswith("/") or audio_file_path.startswith("C:"):
-                # 로컬 파일
-                with open(audio_file_path, "rb") as f:
-                    files = {"file": (Path(audio_file_path).name, f, "audio/mpeg")}
-                    data = {
-                        "sender_name": sender_name,
-                        "meeting_title": meeting_title,
-                    }
-
-                    if sender_email:
-                        data["sender_email"] = sender_email
-                    if recipient_emails:
-                        data["recipient_emails"] = ",".join(recipient_emails)
-
-                    response = await client.post(
-                        f"{self.api_base_url}/api/v1/stt/upload",
-                        files=files,
-                        data=data
-                    )
-            else:
-                # MinIO/S3 경로인 경우 - 파일 경로만 전달
-                # (ex-GPT-STT가 MinIO에서 직접 다운로드)
+        client = http_clients.get("stt")
+
+        # 실제 파일 업로드 (multipart/form-data)
+        # ex-GPT-STT는 /api/v1/stt/upload 엔드포인트 사용
+
+        # 로컬 파일 시스템에 있는 경우만 직접 업로드
+        if audio_file_path.startswith("/") or audio_file_path.startswith("C:"):
+            # 로컬 파일
+            with open(audio_file_path, "rb") as f:
+                files = {"file": (Path(audio_file_path).name, f, "audio/mpeg")}
                 data = {
-                    "audio_file_path": audio_file_path,
                     "sender_name": sender_name,
                     "meeting_title": meeting_title,
                 }
@@ -131,13 +113,34 @@ class STTClientService:
 
                 response = await client.post(
                     f"{self.api_base_url}/api/v1/stt/upload",
-                    json=data
+                    files=files,
+                    data=data,
+                    timeout=self.timeout
                 )
+        else:
+            # MinIO/S3 경로인 경우 - 파일 경로만 전달
+            # (ex-GPT-STT가 MinIO에서 직접 다운로드)
+            data = {
+                "audio_file_path": audio_file_path,
+                "sender_name": sender_name,
+                "meeting_title": meeting_title,
+            }
+
+            if sender_email:
+                data["sender_email"] = sender_email
+            if recipient_emails:
+                data["recipient_emails"] = ",".join(recipient_emails)
+
+            response = await client.post(
+                f"{self.api_base_url}/api/v1/stt/upload",
+                json=data,
+                timeout=self.timeout
+            )
 
-            # 에러 처리
-            response.raise_for_status()
+        # 에러 처리
+        response.raise_for_status()
 
-            return response.json()
+        return response.json()
 
     async def get_task_status(self, task_id: str) -> Dict:
         """
@@ -149,12 +152,13 @@ class STTClientService:
         Returns:
             dict: {"task_id": str, "status": str, "progress": float}
         """
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            response = await client.get(
-                f"{self.api_base_url}/api/v1/stt/status/{task_id}"
-            )
-            response.raise_for_status()
-            return response.json()
+        client = http_clients.get("stt")
+        response = await client.get(
+            f"{self.api_base_url}/api/v1/stt/status/{task_id}",
+            timeout=self.timeout
+        )
+        response.raise_for_status()
+        return response.json()
 
     async def get_task_result(self, task_id: str) -> Dict:
         """
@@ -174,13 +178,14 @@ class STTClientService:
                 "segment_count": int
             }
         """
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            # ex-GPT-STT는 status 엔드포인트에서 결과도 반환
-            response = await client.get(
-                f"{self.api_base_url}/api/v1/stt/status/{task_id}"
-            )
-            response.raise_for_status()
-            return response.json()
+        client = http_clients.get("stt")
+        # ex-GPT-STT는 status 엔드포인트에서 결과도 반환
+        response = await client.get(
+            f"{self.api_base_url}/api/v1/stt/status/{task_id}",
+            timeout=self.timeout
+        )
+        response.raise_for_status()
+        return response.json()
 
     async def download_transcription_file(self, task_id: str) -> str:
         """
@@ -195,12 +200,13 @@ class STTClientService:
         Raises:
             HTTPException: 파일 다운로드 실패
         """
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            response = await client.get(
-                f"{self.api_base_url}/api/v1/download/{task_id}/transcription"
-            )
-            response.raise_for_status()
-            return response.text
+        client = http_clients.get("stt")
+        response = await client.get(
+            f"{self.api_base_url}/api/v1/download/{task_id}/transcription",
+            timeout=self.timeout
+        )
+        response.raise_for_status()
+        return response.text
 
     async def download_minutes_file(self, task_id: str) -> str:
         """
@@ -215,12 +221,13 @@ class STTClientService:
         Raises:
             HTTPException: 파일 다운로드 실패
         """
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            response = await client.get(
-                f"{self.api_base_url}/api/v1/download/{task_id}/minutes"
-            )
-            response.raise_for_status()
-            return response.text
+        client = http_clients.get("stt")
+        response = await client.get(
+            f"{self.api_base_url}/api/v1/download/{task_id}/minutes",
+            timeout=self.timeout
+        )
+        response.raise_for_status()
+        return response.text
 
     async def wait_for_completion(
         self,
@@ -272,10 +279,10 @@ class STTClientService:
             bool: 서버 정상 여부
         """
         try:
-            async with httpx.AsyncClient(timeout=5.0) as client:
-                response = await client.get(
-                    f"{self.api_base_url}/health"
-                )
-                return response.status_code == 200
+            response = await http_clients.get("stt").get(
+                f"{self.api_base_url}/health",
+                timeout=5.0
+            )
+            return response.status_code == 200
         except Exception:
             return False
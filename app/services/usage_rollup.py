@@ -0,0 +1,679 @@
+"""
+Usage Rollup Worker
+usage_history 시간별 / 일별 집계 유지
+
+통계 API가 대시보드를 열 때마다 usage_history 전체를 다시 집계하지 않도록
+(bucket, 부서, 모델, 대분류)별 질문 수 / 응답 시간 합 / 토큰 합을 미리 쌓아 둡니다.
+- usage_history.rolled_up_category가 NULL인 행만 읽어 가산 upsert 후 집계한 대분류를 기록
+  (id high-water mark가 아니므로 늦게 커밋된 낮은 id 행도 누락되지 않음)
+- 분류 워커가 main_category를 채울 시간을 두고(settle) 집계
+- 집계 이후 분류된 행은 분류 워커가 기록할 때 이전 대분류 bucket에서 빼고 새 대분류에 더해 보정
+- 조회 시 집계 테이블 + 최근 미집계 행(tail)을 합쳐 최신 상태 반환
+- 기간 재집계(rebuild)로 과거 데이터 backfill / 보정
+"""
+import asyncio
+import logging
+from collections import defaultdict
+from datetime import date, datetime, time as dt_time, timedelta, timezone
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+from zoneinfo import ZoneInfo
+
+from sqlalchemy import delete, func, or_, select, update
+
+from app.core.config import settings
+from app.core.session_factory import LazySessionFactory
+from app.models import (
+    UsageHistory,
+    UsageRollupDaily,
+    UsageRollupDailyUser,
+    UsageRollupHourly,
+    UsageRollupState,
+)
+
+logger = logging.getLogger(__name__)
+
+ROLLUP_NAME = "usage"
+UNKNOWN_DEPARTMENT = "미분류"
+UNKNOWN_CATEGORY = "미분류"
+
+# 한 INSERT 문에 담는 집계 행 수
+UPSERT_CHUNK_SIZE = 1000
+
+# 기간 재집계 시작 날짜 기본값
+EPOCH_DAY = date(2000, 1, 1)
+
+# usage_metadata에서 토큰 사용량을 읽는 키 (앞에서부터)
+TOKEN_KEYS = ("total_tokens", "tokens")
+
+
+def extract_department(metadata: Any) -> str:
+    """usage_metadata.department (없으면 미분류)"""
+    if isinstance(metadata, dict):
+        department = metadata.get("department")
+        if department:
+            return str(department)[:100]
+    return UNKNOWN_DEPARTMENT
+
+
+def extract_tokens(metadata: Any) -> int:
+    """usage_metadata의 토큰 사용량 (없으면 0)"""
+    if isinstance(metadata, dict):
+        for key in TOKEN_KEYS:
+            value = metadata.get(key)
+            if isinstance(value, (int, float)) and not isinstance(value, bool):
+                return int(value)
+    return 0
+
+
+def _as_utc(value: datetime) -> datetime:
+    return value.replace(tzinfo=timezone.utc) if value.tzinfo is None else value.astimezone(timezone.utc)
+
+
+class UsageAggregate:
+    """질문 수 / 응답 시간 / 토큰 합계"""
+
+    __slots__ = ("question_count", "response_count", "response_time_sum", "token_sum")
+
+    def __init__(self, question_count: int = 0, response_count: int = 0,
+                 response_time_sum: float = 0.0, token_sum: int = 0):
+        self.question_count = question_count
+        self.response_count = response_count
+        self.response_time_sum = response_time_sum
+        self.token_sum = token_sum
+
+    def add_row(self, response_time: Optional[float], tokens: int) -> None:
+        self.question_count += 1
+        if response_time is not None:
+            self.response_count += 1
+            self.response_time_sum += response_time
+        self.token_sum += tokens
+
+    def merge(self, other: "UsageAggregate") -> None:
+        self.question_count += other.question_count
+        self.response_count += other.response_count
+        self.response_time_sum += other.response_time_sum
+        self.token_sum += other.token_sum
+
+    @property
+    def average_response_time(self) -> float:
+        return self.response_time_sum / self.response_count if self.response_count else 0.0
+
+
+class RollupRow(NamedTuple):
+    """집계 1행 (bucket은 시간별이면 UTC datetime, 일별이면 date)"""
+    bucket: Any
+    department: str
+    model_name: str
+    main_category: str
+    totals: UsageAggregate
+
+
+def group_rollups(rows: Iterable[RollupRow], key: Callable[[RollupRow], Any]) -> Dict[Any, UsageAggregate]:
+    """
+    집계 행을 key별로 합산
+
+    Args:
+        rows: fetch()가 반환한 집계 행
+        key: 묶을 기준 (예: lambda r: r.model_name)
+
+    Returns:
+        key 오름차순 {key: UsageAggregate}
+    """
+    grouped: Dict[Any, UsageAggregate] = defaultdict(UsageAggregate)
+    for row in rows:
+        grouped[key(row)].merge(row.totals)
+    return dict(sorted(grouped.items(), key=lambda item: item[0]))
+
+
+class RollupStats:
+    """집계 워커 카운터"""
+
+    def __init__(self):
+        self.batches = 0
+        self.rows = 0
+        self.rebuilds = 0
+        self.failures = 0
+        self.last_id = 0
+        self.recategorized = 0
+        self.last_run_at: Optional[datetime] = None
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "batches": self.batches,
+            "rows": self.rows,
+            "rebuilds": self.rebuilds,
+            "failures": self.failures,
+            "last_id": self.last_id,
+            "recategorized": self.recategorized,
+            "last_run_at": self.last_run_at.isoformat() if self.last_run_at else None,
+        }
+
+
+class UsageRollupService:
+    """
+    usage_history 집계 유지 및 조회
+
+    집계 시간대(STATS_TIMEZONE) 기준으로 시간 / 날짜 bucket을 나눕니다.
+    """
+
+    session_factory = LazySessionFactory()
+
+    def __init__(
+        self,
+        session_factory=None,
+        batch_size: int = 5000,
+        poll_interval: float = 60.0,
+        settle_seconds: float = 300.0,
+        tail_seconds: float = 3600.0,
+        tz: str = "Asia/Seoul",
+    ):
+        """
+        Args:
+            session_factory: AsyncSession 팩토리 (None이면 app.core.database.AsyncSessionLocal)
+            batch_size: 1회 조회 usage_history 행 수
+            poll_interval: 집계 주기 (초)
+            settle_seconds: 분류되지 않은 행을 집계하기 전 대기 시간 (초)
+            tail_seconds: 조회 시 합산할 미집계 행의 최대 경과 시간 (초)
+            tz: 시간 / 날짜 bucket 기준 시간대
+        """
+        self.session_factory = session_factory
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self.settle_seconds = settle_seconds
+        self.tail_seconds = tail_seconds
+        self.tz = ZoneInfo(tz)
+
+        self.stats = RollupStats()
+        self._task: Optional[asyncio.Task] = None
+        self._stopping = False
+
+    # ------------------------------------------------------------------
+    # bucket
+    # ------------------------------------------------------------------
+
+    def hour_bucket(self, created_at: datetime) -> datetime:
+        """집계 시간대 기준 정시 (UTC)"""
+        local = _as_utc(created_at).astimezone(self.tz)
+        return local.replace(minute=0, second=0, microsecond=0).astimezone(timezone.utc)
+
+    def day_bucket(self, created_at: datetime) -> date:
+        """집계 시간대 기준 날짜"""
+        return _as_utc(created_at).astimezone(self.tz).date()
+
+    def local_hour(self, bucket: datetime) -> int:
+        """시간별 bucket의 집계 시간대 시각 (0~23)"""
+        return _as_utc(bucket).astimezone(self.tz).hour
+
+    def day_start(self, day: date) -> datetime:
+        """날짜 시작 시각 (UTC)"""
+        return datetime.combine(day, dt_time.min, tzinfo=self.tz).astimezone(timezone.utc)
+
+    # ------------------------------------------------------------------
+    # 집계
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _usage_columns():
+        return select(
+            UsageHistory.id,
+            UsageHistory.user_id,
+            UsageHistory.created_at,
+            UsageHistory.response_time,
+            UsageHistory.model_name,
+            UsageHistory.main_category,
+            UsageHistory.usage_metadata,
+        )
+
+    @staticmethod
+    def _category(row: Any) -> str:
+        return row.main_category or UNKNOWN_CATEGORY
+
+    def _aggregate(self, rows: Iterable[Any], category_of: Optional[Callable[[Any], str]] = None):
+        """usage_history 행 → (시간별, 일별, (날짜, 사용자)) 집계"""
+        category_of = category_of or self._category
+        hourly: Dict[Tuple, UsageAggregate] = defaultdict(UsageAggregate)
+        daily: Dict[Tuple, UsageAggregate] = defaultdict(UsageAggregate)
+        users: Set[Tuple[date, str]] = set()
+        for row in rows:
+            dims = (
+                extract_department(row.usage_metadata),
+                row.model_name or "",
+                category_of(row),
+            )
+            tokens = extract_tokens(row.usage_metadata)
+            day = self.day_bucket(row.created_at)
+            hourly[(self.hour_bucket(row.created_at),) + dims].add_row(row.response_time, tokens)
+            daily[(day,) + dims].add_row(row.response_time, tokens)
+            users.add((day, row.user_id))
+        return hourly, daily, users
+
+    @staticmethod
+    def _insert(session, table):
+        """방언별 INSERT (ON CONFLICT 지원)"""
+        if session.get_bind().dialect.name == "sqlite":
+            from sqlalchemy.dialects.sqlite import insert
+        else:
+            from sqlalchemy.dialects.postgresql import insert
+        return insert(table)
+
+    async def _upsert_totals(self, session, model, totals: Dict[Tuple, UsageAggregate], sign: int = 1) -> None:
+        """집계 테이블에 가산 upsert (sign=-1이면 차감)"""
+        table = model.__table__
+        items = [
+            {
+                "bucket": key[0],
+                "department": key[1],
+                "model_name": key[2],
+                "main_category": key[3],
+                "question_count": sign * agg.question_count,
+                "response_count": sign * agg.response_count,
+                "response_time_sum": sign * agg.response_time_sum,
+                "token_sum": sign * agg.token_sum,
+            }
+            for key, agg in totals.items()
+        ]
+        for i in range(0, len(items), UPSERT_CHUNK_SIZE):
+            stmt = self._insert(session, table).values(items[i:i + UPSERT_CHUNK_SIZE])
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["bucket", "department", "model_name", "main_category"],
+                set_={
+                    column: table.c[column] + stmt.excluded[column]
+                    for column in ("question_count", "response_count", "response_time_sum", "token_sum")
+                },
+            )
+            await session.execute(stmt)
+
+    async def _insert_users(self, session, users: Set[Tuple[date, str]]) -> None:
+        items = [{"bucket": day, "user_id": user_id} for day, user_id in users]
+        for i in range(0, len(items), UPSERT_CHUNK_SIZE):
+            stmt = self._insert(session, UsageRollupDailyUser.__table__).values(items[i:i + UPSERT_CHUNK_SIZE])
+            await session.execute(stmt.on_conflict_do_nothing())
+
+    async def _apply(self, session, rows: List[Any]) -> None:
+        hourly, daily, users = self._aggregate(rows)
+        await self._upsert_totals(session, UsageRollupHourly, hourly)
+        await self._upsert_totals(session, UsageRollupDaily, daily)
+        await self._insert_users(session, users)
+        await self._mark_rolled_up(session, rows)
+
+    async def _mark_rolled_up(self, session, rows: List[Any]) -> None:
+        """행별로 집계에 사용한 대분류 기록 (조회 이후 분류가 바뀐 행은 다음 보정 대상으로 남음)"""
+        by_category: Dict[str, List[int]] = defaultdict(list)
+        for row in rows:
+            by_category[self._category(row)].append(row.id)
+        for category, ids in by_category.items():
+            for i in range(0, len(ids), UPSERT_CHUNK_SIZE):
+                await session.execute(
+                    update(UsageHistory)
+                    .where(UsageHistory.id.in_(ids[i:i + UPSERT_CHUNK_SIZE]))
+                    .values(rolled_up_category=category)
+                    .execution_options(synchronize_session=False)
+                )
+
+    async def _lock_state(self, session) -> Optional[UsageRollupState]:
+        """집계 상태 행 잠금 (다른 워커가 집계 중이면 None)"""
+        await session.execute(
+            self._insert(session, UsageRollupState.__table__)
+            .values(name=ROLLUP_NAME, last_id=0)
+            .on_conflict_do_nothing()
+        )
+        result = await session.execute(
+            select(UsageRollupState)
+            .where(UsageRollupState.name == ROLLUP_NAME)
+            .with_for_update(skip_locked=True)
+        )
+        return result.scalar_one_or_none()
+
+    async def run_once(self) -> Dict[str, Any]:
+        """
+        미집계 행 1배치 집계
+
+        분류 대기 중인 최근 행(settle 이전)은 건너뛰고 다음 주기에 집계합니다.
+
+        Returns:
+            Dict: {"rolled_up": int, "last_id": int}
+        """
+        now = datetime.now(timezone.utc)
+        cutoff = now - timedelta(seconds=self.settle_seconds)
+        async with self.session_factory() as session:
+            state = await self._lock_state(session)
+            if state is None:
+                await session.rollback()
+                return {"rolled_up": 0, "last_id": self.stats.last_id}
+
+            # 분류 워커가 기록 중인 행은 건너뜀 (다음 주기에 새 대분류로 집계)
+            result = await session.execute(
+                self._usage_columns()
+                .where(
+                    UsageHistory.rolled_up_category.is_(None),
+                    or_(UsageHistory.main_category.isnot(None), UsageHistory.created_at <= cutoff),
+                )
+                .order_by(UsageHistory.id)
+                .limit(self.batch_size)
+                .with_for_update(skip_locked=True)
+            )
+            rows = result.all()
+            if rows:
+                await self._apply(session, rows)
+                state.last_id = max(state.last_id, rows[-1].id)
+                state.updated_at = now
+            last_id = state.last_id
+            await session.commit()
+
+        self.stats.last_id = last_id
+        self.stats.last_run_at = now
+        if rows:
+            self.stats.batches += 1
+            self.stats.rows += len(rows)
+            logger.info(f"Usage rollup: {len(rows)} rows (last_id={last_id})")
+        return {"rolled_up": len(rows), "last_id": last_id}
+
+    async def recategorize(self, session, ids: List[int]) -> int:
+        """
+        집계 이후 분류된 행 보정 (분류 워커가 대분류를 기록하는 트랜잭션에서 호출)
+
+        settle 시간이 지나 '미분류'로 집계된 행을 이전 대분류 bucket에서 빼고
+        새 대분류 bucket에 더합니다. 아직 집계되지 않은 행은 다음 집계에서 새 대분류로 반영됩니다.
+
+        Args:
+            session: 대분류를 기록한 AsyncSession (커밋은 호출자)
+            ids: 대분류를 기록한 usage_history.id
+
+        Returns:
+            int: 보정한 행 수
+        """
+        rows = []
+        for i in range(0, len(ids), UPSERT_CHUNK_SIZE):
+            result = await session.execute(
+                self._usage_columns()
+                .add_columns(UsageHistory.rolled_up_category)
+                .where(
+                    UsageHistory.id.in_(ids[i:i + UPSERT_CHUNK_SIZE]),
+                    UsageHistory.rolled_up_category.isnot(None),
+                )
+                .with_for_update()
+            )
+            rows.extend(row for row in result.all() if row.rolled_up_category != self._category(row))
+        if not rows:
+            return 0
+
+        old_hourly, old_daily, _ = self._aggregate(rows, category_of=lambda row: row.rolled_up_category)
+        new_hourly, new_daily, _ = self._aggregate(rows)
+        await self._upsert_totals(session, UsageRollupHourly, old_hourly, sign=-1)
+        await self._upsert_totals(session, UsageRollupDaily, old_daily, sign=-1)
+        await self._upsert_totals(session, UsageRollupHourly, new_hourly)
+        await self._upsert_totals(session, UsageRollupDaily, new_daily)
+        # 모든 행이 빠진 이전 대분류 bucket 정리
+        for model, totals in ((UsageRollupHourly, old_hourly), (UsageRollupDaily, old_daily)):
+            await session.execute(
+                delete(model).where(
+                    model.bucket.in_({key[0] for key in totals}),
+                    model.question_count <= 0,
+                )
+            )
+        await self._mark_rolled_up(session, rows)
+
+        self.stats.recategorized += len(rows)
+        logger.info(f"Usage rollup recategorized {len(rows)} rows")
+        return len(rows)
+
+    async def catch_up(self) -> int:
+        """
+        집계할 수 있는 미집계 행이 없을 때까지 반복 집계
+
+        Returns:
+            int: 집계한 행 수
+        """
+        total = 0
+        while True:
+            result = await self.run_once()
+            total += result["rolled_up"]
+            if result["rolled_up"] < self.batch_size:
+                return total
+
+    async def rebuild(self, start: Optional[date] = None, end: Optional[date] = None) -> int:
+        """
+        집계 재생성 (backfill / 보정)
+
+        기간을 주면 해당 날짜의 집계만 지우고 이미 집계된 행을 현재 대분류로 다시 계산합니다.
+        기간이 없으면 전체 집계를 비우고 모든 행을 미집계로 되돌려 처음부터 다시 쌓습니다.
+
+        Args:
+            start: 시작 날짜 (포함)
+            end: 종료 날짜 (포함)
+
+        Returns:
+            int: 다시 집계한 행 수
+        """
+        self.stats.rebuilds += 1
+        if start is None and end is None:
+            async with self.session_factory() as session:
+                if await self._lock_state(session) is None:
+                    raise RuntimeError("usage rollup is running in another worker, retry later")
+                for model in (UsageRollupHourly, UsageRollupDaily, UsageRollupDailyUser):
+                    await session.execute(delete(model))
+                await session.execute(
+                    update(UsageHistory)
+                    .where(UsageHistory.rolled_up_category.isnot(None))
+                    .values(rolled_up_category=None)
+                    .execution_options(synchronize_session=False)
+                )
+                await session.execute(
+                    UsageRollupState.__table__.update()
+                    .where(UsageRollupState.name == ROLLUP_NAME)
+                    .values(last_id=0, updated_at=datetime.now(timezone.utc))
+                )
+                await session.commit()
+            total = await self.catch_up()
+            logger.info(f"Usage rollup rebuilt: {total} rows")
+            return total
+
+        start = start or EPOCH_DAY
+        end = end or datetime.now(self.tz).date()
+        start_ts, end_ts = self.day_start(start), self.day_start(end + timedelta(days=1))
+
+        total = 0
+        async with self.session_factory() as session:
+            state = await self._lock_state(session)
+            if state is None:
+                raise RuntimeError("usage rollup is running in another worker, retry later")
+            # 같은 트랜잭션에서 지우고 다시 쌓아 조회 중인 대시보드는 이전 집계를 계속 봄
+            await session.execute(delete(UsageRollupHourly).where(
+                UsageRollupHourly.bucket >= start_ts, UsageRollupHourly.bucket < end_ts))
+            await session.execute(delete(UsageRollupDaily).where(
+                UsageRollupDaily.bucket >= start, UsageRollupDaily.bucket <= end))
+            await session.execute(delete(UsageRollupDailyUser).where(
+                UsageRollupDailyUser.bucket >= start, UsageRollupDailyUser.bucket <= end))
+
+            after_id = 0
+            while True:
+                result = await session.execute(
+                    self._usage_columns()
+                    .where(
+                        UsageHistory.id > after_id,
+                        UsageHistory.rolled_up_category.isnot(None),
+                        UsageHistory.created_at >= start_ts,
+                        UsageHistory.created_at < end_ts,
+                    )
+                    .order_by(UsageHistory.id)
+                    .limit(self.batch_size)
+                )
+                rows = result.all()
+                if not rows:
+                    break
+                await self._apply(session, rows)
+                total += len(rows)
+                after_id = rows[-1].id
+            await session.commit()
+
+        logger.info(f"Usage rollup rebuilt {start} ~ {end}: {total} rows")
+        return total
+
+    # ------------------------------------------------------------------
+    # 조회 (집계 + tail)
+    # ------------------------------------------------------------------
+
+    def _range_filters(self, column, start: Optional[date], end: Optional[date], hourly: bool = True):
+        filters = []
+        if start is not None:
+            filters.append(column >= (self.day_start(start) if hourly else start))
+        if end is not None:
+            filters.append(column < self.day_start(end + timedelta(days=1)) if hourly else column <= end)
+        return filters
+
+    async def _tail(self, session, start: Optional[date], end: Optional[date]) -> List[Any]:
+        """
+        아직 집계되지 않은 최근 행 (tail_seconds 이내)
+
+        집계 워커가 poll_interval + settle_seconds 안에 반영하므로 최근 행만 읽고,
+        그보다 오래된 미집계 행(워커 중단 등)은 다음 집계 이후에 반영됩니다.
+        """
+        since = datetime.now(timezone.utc) - timedelta(seconds=self.tail_seconds)
+        result = await session.execute(
+            self._usage_columns().where(
+                UsageHistory.rolled_up_category.is_(None),
+                UsageHistory.created_at >= since,
+                *self._range_filters(UsageHistory.created_at, start, end),
+            )
+        )
+        return result.all()
+
+    async def fetch(
+        self,
+        session,
+        grain: str,
+        start: Optional[date] = None,
+        end: Optional[date] = None,
+    ) -> List[RollupRow]:
+        """
+        기간 내 집계 행 (집계 테이블 + 미집계 tail)
+
+        Args:
+            session: AsyncSession
+            grain: "hourly" | "daily"
+            start: 시작 날짜 (포함, None이면 처음부터)
+            end: 종료 날짜 (포함, None이면 끝까지)
+
+        Returns:
+            List[RollupRow]
+        """
+        hourly = grain == "hourly"
+        model = UsageRollupHourly if hourly else UsageRollupDaily
+        result = await session.execute(
+            select(model).where(*self._range_filters(model.bucket, start, end, hourly))
+        )
+        merged: Dict[Tuple, UsageAggregate] = {}
+        for row in result.scalars():
+            bucket = _as_utc(row.bucket) if hourly else row.bucket
+            merged[(bucket, row.department, row.model_name, row.main_category)] = UsageAggregate(
+                row.question_count, row.response_count, row.response_time_sum, row.token_sum
+            )
+
+        tail_hourly, tail_daily, _ = self._aggregate(await self._tail(session, start, end))
+        for key, agg in (tail_hourly if hourly else tail_daily).items():
+            if key in merged:
+                merged[key].merge(agg)
+            else:
+                merged[key] = agg
+
+        return [RollupRow(*key, totals=agg) for key, agg in merged.items()]
+
+    async def fetch_users(self, session, start: Optional[date] = None, end: Optional[date] = None) -> Set[str]:
+        """기간 내 고유 사용자"""
+        result = await session.execute(
+            select(UsageRollupDailyUser.user_id).distinct().where(
+                *self._range_filters(UsageRollupDailyUser.bucket, start, end, hourly=False)
+            )
+        )
+        users = set(result.scalars())
+        users.update(row.user_id for row in await self._tail(session, start, end))
+        return users
+
+    async def fetch_daily_user_counts(
+        self,
+        session,
+        start: Optional[date] = None,
+        end: Optional[date] = None,
+    ) -> Dict[date, int]:
+        """기간 내 날짜별 고유 사용자 수"""
+        result = await session.execute(
+            select(UsageRollupDailyUser.bucket, func.count().label("users"))
+            .where(*self._range_filters(UsageRollupDailyUser.bucket, start, end, hourly=False))
+            .group_by(UsageRollupDailyUser.bucket)
+        )
+        counts = {row.bucket: row.users for row in result}
+
+        tail_users: Dict[date, Set[str]] = defaultdict(set)
+        for row in await self._tail(session, start, end):
+            tail_users[self.day_bucket(row.created_at)].add(row.user_id)
+        for day, users in tail_users.items():
+            if day in counts:
+                existing = await session.execute(
+                    select(UsageRollupDailyUser.user_id).where(UsageRollupDailyUser.bucket == day)
+                )
+                users = users | set(existing.scalars())
+            counts[day] = len(users)
+        return counts
+
+    async def first_day(self, session) -> Optional[date]:
+        """집계된 첫 날짜 (없으면 tail의 첫 날짜)"""
+        result = await session.execute(select(func.min(UsageRollupDaily.bucket)))
+        first = result.scalar()
+        if first is None:
+            result = await session.execute(select(func.min(UsageHistory.created_at)))
+            created_at = result.scalar()
+            return self.day_bucket(created_at) if created_at else None
+        return first
+
+    # ------------------------------------------------------------------
+    # 수명주기
+    # ------------------------------------------------------------------
+
+    def start(self) -> None:
+        """백그라운드 집계 루프 시작"""
+        if self._task is not None and not self._task.done():
+            return
+        self._stopping = False
+        self._task = asyncio.create_task(self._run(), name="usage-rollup")
+        logger.info(f"Usage rollup started (batch={self.batch_size}, interval={self.poll_interval}s)")
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._stopping = True
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        logger.info("Usage rollup stopped")
+
+    async def _run(self) -> None:
+        while not self._stopping:
+            try:
+                await self.catch_up()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.stats.failures += 1
+                logger.error(f"Usage rollup failed: {e}", exc_info=True)
+            await asyncio.sleep(self.poll_interval)
+
+    def metrics(self) -> Dict[str, Any]:
+        data = self.stats.snapshot()
+        data["running"] = self._task is not None and not self._task.done()
+        data["settle_seconds"] = self.settle_seconds
+        data["tail_seconds"] = self.tail_seconds
+        data["timezone"] = str(self.tz)
+        return data
+
+
+# 싱글톤 인스턴스
+usage_rollup = UsageRollupService(
+    batch_size=settings.USAGE_ROLLUP_BATCH_SIZE,
+    poll_interval=settings.USAGE_ROLLUP_POLL_INTERVAL,
+    settle_seconds=settings.USAGE_ROLLUP_SETTLE_SECONDS,
+    tail_seconds=settings.USAGE_ROLLUP_TAIL_SECONDS,
+    tz=settings.STATS_TIMEZONE,
+)
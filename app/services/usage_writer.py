@@ -0,0 +1,509 @@
+"""
+Usage History Write-Behind Service
+스트리밍 종료 후 usage_history 저장을 요청 경로에서 분리하는 비동기 배치 기록기
+
+- 제한된 크기의 in-process 큐 + 백그라운드 flusher
+- 다건 INSERT ... ON CONFLICT DO NOTHING 배치 저장 (중복은 DB unique index가 걸러냄)
+- 큐가 가득 차거나 DB 저장 실패 시 디스크 spill 파일(JSONL)에 기록 → 재시작/복구 후 재적재
+  (spill 파일은 워커 프로세스별, 종료된 프로세스의 파일은 재시작 시 인수)
+- 데이터 오류(DataError/IntegrityError) 배치는 분할 재시도, 끝까지 실패한 행은 dead-letter 파일로 격리
+- flush 지연시간 / 큐 적체 / spill 건수 메트릭
+"""
+import asyncio
+import glob
+import json
+import logging
+import os
+import re
+import time
+from collections import deque
+from datetime import datetime, timezone
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.exc import DataError, IntegrityError
+
+from app.core.config import settings
+from app.core.session_factory import LazySessionFactory
+from app.models import UsageHistory
+
+logger = logging.getLogger(__name__)
+
+_DATETIME_FIELDS = ("created_at", "updated_at")
+
+
+class UsageWriterStats:
+    """write-behind 파이프라인 카운터"""
+
+    def __init__(self):
+        self.enqueued = 0
+        self.inserted = 0
+        self.duplicates = 0
+        self.spilled = 0
+        self.replayed = 0
+        self.dead_lettered = 0
+        self.batches = 0
+        self.flush_failures = 0
+        self.last_flush_ms = 0.0
+        self.max_flush_ms = 0.0
+        self.total_flush_ms = 0.0
+        self.max_lag_ms = 0.0  # 큐 적재 → 커밋까지 최대 지연
+
+    def record_flush(self, elapsed_ms: float, lag_ms: float) -> None:
+        self.batches += 1
+        self.last_flush_ms = elapsed_ms
+        self.total_flush_ms += elapsed_ms
+        self.max_flush_ms = max(self.max_flush_ms, elapsed_ms)
+        self.max_lag_ms = max(self.max_lag_ms, lag_ms)
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "enqueued": self.enqueued,
+            "inserted": self.inserted,
+            "duplicates": self.duplicates,
+            "spilled": self.spilled,
+            "replayed": self.replayed,
+            "dead_lettered": self.dead_lettered,
+            "batches": self.batches,
+            "flush_failures": self.flush_failures,
+            "last_flush_ms": round(self.last_flush_ms, 2),
+            "avg_flush_ms": round(self.total_flush_ms / self.batches, 2) if self.batches else 0.0,
+            "max_flush_ms": round(self.max_flush_ms, 2),
+            "max_lag_ms": round(self.max_lag_ms, 2),
+        }
+
+
+def process_spill_path(path: str, pid: Optional[int] = None) -> str:
+    """워커 프로세스별 spill 파일 경로 (/tmp/usage.jsonl → /tmp/usage.<pid>.jsonl)"""
+    root, ext = os.path.splitext(path)
+    return f"{root}.{pid or os.getpid()}{ext}"
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def _to_json_row(row: Dict[str, Any]) -> Dict[str, Any]:
+    data = dict(row)
+    for field in _DATETIME_FIELDS:
+        if isinstance(data.get(field), datetime):
+            data[field] = data[field].isoformat()
+    return data
+
+
+def _from_json_row(data: Dict[str, Any]) -> Dict[str, Any]:
+    row = dict(data)
+    row.setdefault("usage_metadata", None)  # 이전 버전 spill 파일 (배치 INSERT는 모든 행의 키가 같아야 함)
+    for field in _DATETIME_FIELDS:
+        if isinstance(row.get(field), str):
+            row[field] = datetime.fromisoformat(row[field])
+    return row
+
+
+class UsageWriteBehind:
+    """
+    usage_history 비동기 배치 기록기
+
+    chat_proxy 스트림은 submit()으로 행을 큐에 넣고 즉시 종료하며,
+    실제 저장(제목 생성, INSERT)은 백그라운드 flusher가 배치로 처리합니다.
+    카테고리가 없는 행은 NULL로 저장되고 categorization_worker가 이후 배치로 분류합니다.
+    """
+
+    session_factory = LazySessionFactory()
+
+    def __init__(
+        self,
+        session_factory=None,
+        queue_size: int = 5000,
+        batch_size: int = 200,
+        flush_interval: float = 0.5,
+        spill_path: Optional[str] = None,
+    ):
+        """
+        Args:
+            session_factory: AsyncSession 팩토리 (None이면 app.core.database.AsyncSessionLocal)
+            queue_size: 큐 최대 적재 건수 (초과 시 spill 파일로 기록)
+            batch_size: 1회 INSERT 최대 행 수
+            flush_interval: 배치 수집 대기 시간 (초)
+            spill_path: 디스크 spill 파일 기준 경로 (JSONL, 실제 파일은 프로세스 pid를 붙인 경로)
+        """
+        self.session_factory = session_factory
+        self.queue_size = queue_size
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.spill_base = spill_path
+        self.spill_path = process_spill_path(spill_path) if spill_path else None
+
+        self.stats = UsageWriterStats()
+        self._queue: Optional[asyncio.Queue] = None
+        self._backlog: Deque[Dict[str, Any]] = deque()  # spill 파일에서 재적재한 행
+        self._replay_file: Optional[str] = None  # _backlog 행의 원본 파일 (모두 처리된 뒤 삭제)
+        self._replay_respill_failed = False
+        self._task: Optional[asyncio.Task] = None
+        self._stopping = False
+
+    @property
+    def pending(self) -> int:
+        """아직 저장되지 않은 큐/재적재 행 수"""
+        queued = self._queue.qsize() if self._queue is not None else 0
+        return queued + len(self._backlog)
+
+    # ------------------------------------------------------------------
+    # 수명주기
+    # ------------------------------------------------------------------
+
+    def start(self) -> None:
+        """백그라운드 flusher 시작 (이미 실행 중이면 무시)"""
+        if self._task is not None and not self._task.done():
+            return
+        self._stopping = False
+        self._queue = asyncio.Queue(maxsize=self.queue_size)
+        self._adopt_orphan_spills()
+        self._replay_spill()
+        self._task = asyncio.create_task(self._run(), name="usage-write-behind")
+        logger.info(
+            f"Usage write-behind started (queue={self.queue_size}, batch={self.batch_size}, "
+            f"interval={self.flush_interval}s, spill={self.spill_path})"
+        )
+
+    async def stop(self, timeout: float = 10.0) -> None:
+        """
+        flusher 종료 - 남은 행을 마지막으로 저장하고, 저장하지 못한 행은 spill 파일에 기록
+        """
+        if self._task is None:
+            return
+        self._stopping = True
+        try:
+            await asyncio.wait_for(self._task, timeout=timeout)
+        except asyncio.TimeoutError:
+            logger.warning("Usage write-behind did not drain in time - spilling remaining rows")
+            self._task.cancel()
+        finally:
+            self._task = None
+            self._spill(self._drain_all())
+            # 처리 중이던 replay 파일은 남겨 두고 다음 시작 시 재적재 (이미 저장된 행은 ON CONFLICT로 걸러짐)
+            self._replay_file = None
+        logger.info(f"Usage write-behind stopped: {self.stats.snapshot()}")
+
+    # ------------------------------------------------------------------
+    # 적재
+    # ------------------------------------------------------------------
+
+    def submit(
+        self,
+        user_id: str,
+        session_id: str,
+        question: str,
+        answer: str,
+        conversation_title: Optional[str] = None,
+        thinking_content: Optional[str] = None,
+        main_category: Optional[str] = None,
+        sub_category: Optional[str] = None,
+        referenced_documents: Optional[List[str]] = None,
+        model_name: Optional[str] = None,
+        usage_metadata: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """
+        대화 1건을 저장 큐에 적재 (non-blocking)
+
+        큐가 가득 차면 요청을 대기시키지 않고 spill 파일에 기록합니다(backpressure).
+        """
+        now = datetime.now(timezone.utc)
+        row = {
+            "user_id": user_id,
+            "session_id": session_id,
+            "conversation_title": conversation_title,
+            "question": question,
+            "answer": answer,
+            "thinking_content": thinking_content,
+            "referenced_documents": referenced_documents,
+            "main_category": main_category,
+            "sub_category": sub_category,
+            "model_name": model_name or settings.CHAT_MODEL_NAME,
+            "usage_metadata": usage_metadata,
+            "created_at": now,
+            "updated_at": now,
+        }
+
+        if self._task is None or self._task.done():
+            self.start()
+
+        self.stats.enqueued += 1
+        try:
+            self._queue.put_nowait(row)
+        except asyncio.QueueFull:
+            logger.warning(f"Usage write-behind queue full ({self.queue_size}) - spilling to disk")
+            self._spill([row])
+
+    # ------------------------------------------------------------------
+    # flusher
+    # ------------------------------------------------------------------
+
+    async def _run(self) -> None:
+        while True:
+            batch = await self._collect_batch()
+            if batch:
+                await self._flush(batch)
+            elif self._stopping:
+                break
+            self._finish_replay()
+            if not self._stopping and self._queue.qsize() < self.batch_size:
+                self._replay_spill()
+
+    async def _collect_batch(self) -> List[Dict[str, Any]]:
+        batch: List[Dict[str, Any]] = []
+        while self._backlog and len(batch) < self.batch_size:
+            batch.append(self._backlog.popleft())
+
+        if not batch and not self._stopping:
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), timeout=self.flush_interval))
+            except asyncio.TimeoutError:
+                return batch
+
+        while len(batch) < self.batch_size:
+            try:
+                batch.append(self._queue.get_nowait())
+            except asyncio.QueueEmpty:
+                break
+        return batch
+
+    async def _flush(self, batch: List[Dict[str, Any]]) -> None:
+        started = time.perf_counter()
+        oldest = min(row["created_at"] for row in batch)
+        rows = self._dedupe(batch)
+
+        try:
+            inserted, rejected = await self._insert_rows(rows)
+            self._dead_letter(rejected)
+
+            self.stats.inserted += inserted
+            self.stats.duplicates += len(batch) - inserted - len(rejected)
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            lag_ms = (datetime.now(timezone.utc) - oldest).total_seconds() * 1000
+            self.stats.record_flush(elapsed_ms, lag_ms)
+            logger.info(f"Usage batch flushed: {inserted}/{len(batch)} rows in {elapsed_ms:.1f}ms")
+
+        except Exception as e:
+            self.stats.flush_failures += 1
+            logger.error(f"Usage batch flush failed ({len(batch)} rows) - spilling to disk: {e}", exc_info=True)
+            if not self._spill(batch):
+                self._replay_respill_failed = True
+            if not self._stopping:
+                # DB 장애 시 재시도 폭주 방지
+                await asyncio.sleep(min(self.flush_interval * 10, 5.0))
+
+    async def _insert_rows(self, rows: List[Dict[str, Any]]) -> Tuple[int, List[Dict[str, Any]]]:
+        """
+        배치 INSERT - 데이터 오류는 배치를 반으로 나눠 재시도하여 문제 행만 골라냄
+
+        Returns:
+            (저장된 행 수, 단건으로도 저장에 실패한 행 목록)
+        """
+        try:
+            async with self.session_factory() as session:
+                await self._assign_titles(session, rows)
+
+                stmt = pg_insert(UsageHistory).values(rows).on_conflict_do_nothing()
+                result = await session.execute(stmt)
+                await session.commit()
+        except (DataError, IntegrityError) as e:
+            if len(rows) == 1:
+                logger.error(f"Usage row rejected by database (session={rows[0]['session_id']}): {e}")
+                return 0, rows
+            mid = len(rows) // 2
+            left_inserted, left_rejected = await self._insert_rows(rows[:mid])
+            right_inserted, right_rejected = await self._insert_rows(rows[mid:])
+            return left_inserted + right_inserted, left_rejected + right_rejected
+
+        inserted = result.rowcount if result.rowcount is not None and result.rowcount >= 0 else len(rows)
+        return inserted, []
+
+    @staticmethod
+    def _dedupe(batch: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """같은 배치 안의 (session_id, question) 중복 제거 - 먼저 들어온 행 유지"""
+        seen = set()
+        rows = []
+        for row in batch:
+            key = (row["session_id"], row["question"])
+            if key in seen:
+                continue
+            seen.add(key)
+            rows.append(row)
+        return rows
+
+    async def _assign_titles(self, session, rows: List[Dict[str, Any]]) -> None:
+        """세션 첫 대화의 제목 생성 - 기존 세션 여부는 배치당 1회 조회"""
+        session_ids = {row["session_id"] for row in rows if not row["conversation_title"]}
+        if not session_ids:
+            return
+
+        result = await session.execute(
+            select(UsageHistory.session_id)
+            .where(UsageHistory.session_id.in_(session_ids))
+            .distinct()
+        )
+        existing = {row[0] for row in result.fetchall()}
+
+        from app.utils.title_generator import generate_conversation_title, sanitize_title
+        for row in rows:
+            sid = row["session_id"]
+            if row["conversation_title"] or sid in existing:
+                continue
+            title, _ = generate_conversation_title(row["question"])
+            row["conversation_title"] = sanitize_title(title)
+            existing.add(sid)  # 같은 배치의 후속 턴은 제목 없음
+
+    # ------------------------------------------------------------------
+    # spill 파일
+    # ------------------------------------------------------------------
+
+    def _drain_all(self) -> List[Dict[str, Any]]:
+        rows = list(self._backlog)
+        self._backlog.clear()
+        if self._queue is not None:
+            while True:
+                try:
+                    rows.append(self._queue.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+        return rows
+
+    def _append_rows(self, path: str, rows: List[Dict[str, Any]]) -> None:
+        with open(path, "a", encoding="utf-8") as f:
+            for row in rows:
+                f.write(json.dumps(_to_json_row(row), ensure_ascii=False) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+    def _spill(self, rows: List[Dict[str, Any]]) -> bool:
+        """행을 spill 파일에 기록 (디스크에 남지 못했으면 False)"""
+        if not rows:
+            return True
+        if not self.spill_path:
+            logger.error(f"Usage write-behind has no spill path - {len(rows)} rows dropped")
+            return False
+        try:
+            self._append_rows(self.spill_path, rows)
+            self.stats.spilled += len(rows)
+            return True
+        except OSError as e:
+            logger.error(f"Failed to spill {len(rows)} usage rows to {self.spill_path}: {e}")
+            return False
+
+    def _dead_letter(self, rows: List[Dict[str, Any]]) -> None:
+        """단건으로도 저장되지 않는 행을 재적재 대상이 아닌 .dead 파일로 격리"""
+        if not rows:
+            return
+        self.stats.dead_lettered += len(rows)
+        if not self.spill_path:
+            logger.error(f"Usage write-behind has no spill path - {len(rows)} rejected rows dropped")
+            return
+        dead_path = f"{self.spill_path}.dead"
+        try:
+            self._append_rows(dead_path, rows)
+            logger.error(f"Moved {len(rows)} rejected usage rows to {dead_path}")
+        except OSError as e:
+            logger.error(f"Failed to dead-letter {len(rows)} usage rows to {dead_path}: {e}")
+
+    def _adopt_orphan_spills(self) -> None:
+        """
+        종료된 워커 프로세스가 남긴 spill/replay 파일을 이 프로세스의 replay 파일로 인수
+
+        rename은 원자적이므로 여러 워커가 동시에 시작해도 한 워커만 인수합니다.
+        """
+        if not self.spill_base:
+            return
+        root, ext = os.path.splitext(self.spill_base)
+        pattern = re.compile(rf"^{re.escape(root)}\.(\d+){re.escape(ext)}(\.replay.*)?$")
+        for path in sorted(glob.glob(f"{glob.escape(root)}.*")):
+            match = pattern.match(path)
+            if not match:
+                continue
+            pid = int(match.group(1))
+            if pid == os.getpid() or _pid_alive(pid):
+                continue
+            target = f"{self.spill_path}.replay.{os.path.basename(path)}"
+            try:
+                os.replace(path, target)
+                logger.warning(f"Adopted usage spill file {path} from exited worker {pid}")
+            except FileNotFoundError:
+                continue  # 다른 워커가 먼저 인수
+            except OSError as e:
+                logger.error(f"Failed to adopt usage spill file {path}: {e}")
+
+    def _replay_spill(self) -> None:
+        """
+        spill 파일을 재적재 목록으로 옮김 (rename 후 재적재하여 새 spill과 분리)
+
+        replay 파일은 그 행들이 모두 저장(또는 격리/재spill)된 뒤 삭제되므로,
+        처리 도중 종료되어 남은 .replay 파일은 다음 재적재 때 먼저 처리됩니다
+        (이미 저장된 행은 ON CONFLICT DO NOTHING으로 걸러짐).
+        """
+        if not self.spill_path or self._replay_file is not None:
+            return
+        try:
+            leftovers = sorted(glob.glob(f"{glob.escape(self.spill_path)}.replay*"))
+            if leftovers:
+                logger.warning(f"Found leftover usage replay file {leftovers[0]} - replaying")
+                self._load_replay_file(leftovers[0])
+            elif os.path.exists(self.spill_path):
+                replay_path = f"{self.spill_path}.replay"
+                os.replace(self.spill_path, replay_path)
+                self._load_replay_file(replay_path)
+        except OSError as e:
+            logger.error(f"Failed to replay usage spill file {self.spill_path}: {e}")
+
+    def _load_replay_file(self, replay_path: str) -> None:
+        count = 0
+        with open(replay_path, encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    self._backlog.append(_from_json_row(json.loads(line)))
+                    count += 1
+                except (json.JSONDecodeError, ValueError) as e:
+                    logger.warning(f"Skipping corrupt spill line: {e}")
+        self._replay_file = replay_path
+        self._replay_respill_failed = False
+        self.stats.replayed += count
+        if count:
+            logger.info(f"Replayed {count} spilled usage rows from {replay_path}")
+
+    def _finish_replay(self) -> None:
+        """재적재한 행이 모두 처리되면 replay 파일 삭제 (재spill 실패 시 다음 재적재를 위해 유지)"""
+        if self._replay_file is None or self._backlog:
+            return
+        replay_path, self._replay_file = self._replay_file, None
+        if self._replay_respill_failed:
+            logger.error(f"Keeping usage replay file {replay_path} - some rows could not be re-spilled")
+            return
+        try:
+            os.remove(replay_path)
+        except OSError as e:
+            logger.error(f"Failed to remove usage replay file {replay_path}: {e}")
+
+    def metrics(self) -> Dict[str, Any]:
+        data = self.stats.snapshot()
+        data["queue_depth"] = self.pending
+        data["queue_capacity"] = self.queue_size
+        data["running"] = self._task is not None and not self._task.done()
+        return data
+
+
+# 싱글톤 인스턴스
+usage_writer = UsageWriteBehind(
+    queue_size=settings.USAGE_WRITER_QUEUE_SIZE,
+    batch_size=settings.USAGE_WRITER_BATCH_SIZE,
+    flush_interval=settings.USAGE_WRITER_FLUSH_INTERVAL,
+    spill_path=settings.USAGE_WRITER_SPILL_PATH,
+)
@@ -0,0 +1,378 @@
+"""
+Vector Permission Sync
+문서 열람 권한을 Qdrant point payload에 비정규화
+
+RAG 검색 때마다 부서의 열람 가능 문서 ID 전체를 DB에서 읽어 Qdrant `match any` 필터로
+보내지 않도록, 각 point payload에 열람 가능 부서 ID 목록(access_departments)을 저장하고
+검색은 `access_departments = 사용자 부서` 조건 하나로 필터링합니다.
+- 벡터화(upsert) 시 현재 권한을 payload에 기록
+- DocumentAccessService에서 권한이 바뀌면 문서를 변경 대기열에 넣고,
+  워커가 문서별 set_payload(document_id 필터)를 points/batch 요청 하나로 모아 갱신
+- 시작 시 access_departments / document_id payload 인덱스 생성 후
+  필드가 없는 point가 있을 때만 전체 재동기화(sync_all)로 backfill
+- backfill 전에는 필드가 없는 point를 기존 방식(열람 가능 문서 ID 목록)으로 허용 (access_condition)
+- 대기열은 프로세스 메모리에만 있으므로 동기화 전에 종료된 변경은
+  scripts/sync_vector_permissions.py로 보정
+"""
+import asyncio
+import logging
+import time
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+from sqlalchemy import select
+
+from app.core.config import settings
+from app.core.http_client import http_clients
+from app.core.session_factory import LazySessionFactory
+from app.models.document import Document
+from app.models.document_permission import DocumentPermission
+
+logger = logging.getLogger(__name__)
+
+ACCESS_FIELD = "access_departments"
+
+# payload 인덱스 (필드명 → Qdrant field_schema)
+PAYLOAD_INDEXES = {
+    ACCESS_FIELD: "integer",
+    "document_id": "integer",
+}
+
+# 실패한 문서 재시도 대기 시간 (초)
+RETRY_AFTER = 10.0
+
+
+def access_filter(department_id: int) -> Dict[str, Any]:
+    """부서 열람 권한 Qdrant 조건 (payload 배열에 부서 ID가 포함된 point)"""
+    return {"key": ACCESS_FIELD, "match": {"value": department_id}}
+
+
+def legacy_access_filter(department_id: int, document_ids: List[int]) -> Dict[str, Any]:
+    """
+    backfill 전 부서 열람 권한 Qdrant 조건
+
+    access_departments가 있는 point는 부서 ID로, 아직 필드가 없는 point는
+    열람 가능 문서 ID 목록으로 판단 (필드가 없다고 모두에게 열지 않음)
+    """
+    return {"should": [
+        access_filter(department_id),
+        {"must": [
+            {"is_empty": {"key": ACCESS_FIELD}},
+            {"key": "document_id", "match": {"any": document_ids}},
+        ]},
+    ]}
+
+
+async def load_access_departments(session, document_ids: Iterable[int]) -> Dict[int, List[int]]:
+    """
+    문서별 열람 가능 부서 ID 목록
+
+    Args:
+        session: AsyncSession
+        document_ids: 문서 ID 목록
+
+    Returns:
+        {문서 ID: [부서 ID, ...]} - 권한이 없는 문서는 빈 목록
+    """
+    document_ids = list(dict.fromkeys(document_ids))
+    access: Dict[int, List[int]] = {document_id: [] for document_id in document_ids}
+    if not document_ids:
+        return access
+
+    result = await session.execute(
+        select(DocumentPermission.document_id, DocumentPermission.department_id).where(
+            DocumentPermission.document_id.in_(document_ids),
+            DocumentPermission.department_id.isnot(None),
+            DocumentPermission.can_read == True
+        ).distinct().order_by(DocumentPermission.document_id, DocumentPermission.department_id)
+    )
+    for document_id, department_id in result.all():
+        access[document_id].append(department_id)
+    return access
+
+
+async def load_readable_document_ids(session, department_id: int) -> List[int]:
+    """부서가 열람 가능한 문서 ID 목록"""
+    result = await session.execute(
+        select(DocumentPermission.document_id).where(
+            DocumentPermission.department_id == department_id,
+            DocumentPermission.can_read == True
+        ).distinct()
+    )
+    return [row[0] for row in result.all()]
+
+
+class PermissionSyncStats:
+    """권한 동기화 카운터"""
+
+    def __init__(self):
+        self.documents = 0
+        self.requests = 0
+        self.failures = 0
+        self.full_syncs = 0
+        self.last_sync_at: Optional[float] = None
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "documents": self.documents,
+            "requests": self.requests,
+            "failures": self.failures,
+            "full_syncs": self.full_syncs,
+            "last_sync_at": self.last_sync_at,
+        }
+
+
+class VectorPermissionSync:
+    """문서 권한 → Qdrant payload 동기화 워커"""
+
+    session_factory = LazySessionFactory()
+
+    def __init__(
+        self,
+        session_factory=None,
+        qdrant_url: Optional[str] = None,
+        collection: Optional[str] = None,
+        api_key: Optional[str] = None,
+        batch_size: int = 100,
+    ):
+        """
+        Args:
+            session_factory: AsyncSession 팩토리 (None이면 app.core.database.AsyncSessionLocal)
+            qdrant_url: Qdrant URL (None이면 QDRANT_HOST / QDRANT_PORT)
+            collection: 권한을 기록할 컬렉션 (None이면 QDRANT_COLLECTION)
+            api_key: Qdrant API 키
+            batch_size: 권한을 한 번에 조회할 문서 수
+        """
+        self.session_factory = session_factory
+        self.qdrant_url = qdrant_url or f"http://{settings.QDRANT_HOST}:{settings.QDRANT_PORT}"
+        self.collection = collection or settings.QDRANT_COLLECTION
+        self.api_key = api_key
+        self.batch_size = batch_size
+
+        self.stats = PermissionSyncStats()
+        # 모든 point에 access_departments가 있음 (전체 동기화 완료 또는 누락 point 0개 확인)
+        self.backfilled = False
+        self._full_sync_needed = True
+        self._pending: Set[int] = set()
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._stopping = False
+
+    def _headers(self) -> Dict[str, str]:
+        return {"api-key": self.api_key} if self.api_key else {}
+
+    # ------------------------------------------------------------------
+    # Qdrant
+    # ------------------------------------------------------------------
+
+    async def ensure_payload_indexes(self) -> None:
+        """access_departments / document_id payload 인덱스 생성 (이미 있으면 Qdrant가 무시)"""
+        client = http_clients.get("qdrant")
+        for field_name, field_schema in PAYLOAD_INDEXES.items():
+            response = await client.put(
+                f"{self.qdrant_url}/collections/{self.collection}/index",
+                params={"wait": "true"},
+                json={"field_name": field_name, "field_schema": field_schema},
+                headers=self._headers()
+            )
+            response.raise_for_status()
+
+    async def count_missing(self) -> int:
+        """access_departments가 없는 point 수"""
+        response = await http_clients.get("qdrant").post(
+            f"{self.qdrant_url}/collections/{self.collection}/points/count",
+            json={"filter": {"must": [{"is_empty": {"key": ACCESS_FIELD}}]}, "exact": True},
+            headers=self._headers()
+        )
+        response.raise_for_status()
+        return response.json()["result"]["count"]
+
+    async def set_documents_access(self, access: Dict[int, List[int]]) -> None:
+        """
+        문서들의 모든 point payload에 열람 가능 부서 기록
+
+        문서별 set_payload(document_id 필터)를 points/batch 요청 하나로 보냅니다.
+
+        Args:
+            access: {문서 ID: [부서 ID, ...]}
+        """
+        if not access:
+            return
+        self.stats.requests += 1
+        response = await http_clients.get("qdrant").post(
+            f"{self.qdrant_url}/collections/{self.collection}/points/batch",
+            params={"wait": "true"},
+            json={"operations": [
+                {"set_payload": {
+                    "payload": {ACCESS_FIELD: department_ids},
+                    "filter": {"must": [{"key": "document_id", "match": {"value": document_id}}]},
+                }}
+                for document_id, department_ids in access.items()
+            ]},
+            headers=self._headers()
+        )
+        response.raise_for_status()
+
+    # ------------------------------------------------------------------
+    # 검색 필터
+    # ------------------------------------------------------------------
+
+    async def access_condition(self, department_id: int, db=None) -> Optional[Dict[str, Any]]:
+        """
+        RAG 검색용 부서 열람 권한 Qdrant 조건
+
+        Args:
+            department_id: 사용자 부서 ID
+            db: AsyncSession (backfill 전 열람 가능 문서 ID 조회용)
+
+        Returns:
+            Qdrant 조건 - backfill 후에는 access_filter 하나,
+            backfill 전에는 legacy_access_filter, 열람 가능 문서가 없으면 None
+        """
+        if self.backfilled or db is None:
+            return access_filter(department_id)
+        document_ids = await load_readable_document_ids(db, department_id)
+        if not document_ids:
+            return None
+        return legacy_access_filter(department_id, document_ids)
+
+    # ------------------------------------------------------------------
+    # 동기화
+    # ------------------------------------------------------------------
+
+    def mark_dirty(self, document_ids: Iterable[int]) -> None:
+        """권한이 바뀐 문서를 동기화 대기열에 추가 (커밋 후 호출)"""
+        self._pending.update(document_ids)
+        self._wakeup.set()
+
+    async def sync_documents(self, document_ids: Iterable[int]) -> int:
+        """
+        문서 권한을 DB에서 읽어 Qdrant payload 갱신
+
+        Returns:
+            int: 갱신한 문서 수
+        """
+        document_ids = list(document_ids)
+        synced = 0
+        for offset in range(0, len(document_ids), self.batch_size):
+            async with self.session_factory() as session:
+                access = await load_access_departments(session, document_ids[offset:offset + self.batch_size])
+            await self.set_documents_access(access)
+            synced += len(access)
+        self.stats.documents += synced
+        self.stats.last_sync_at = time.time()
+        return synced
+
+    async def sync_all(self) -> int:
+        """
+        전체 문서 권한 재동기화 (기존 point backfill)
+
+        Returns:
+            int: 갱신한 문서 수
+        """
+        await self.ensure_payload_indexes()
+        total = 0
+        last_id = 0
+        while True:
+            async with self.session_factory() as session:
+                result = await session.execute(
+                    select(Document.id).where(Document.id > last_id).order_by(Document.id).limit(self.batch_size)
+                )
+                document_ids = [row[0] for row in result.all()]
+            if not document_ids:
+                break
+            total += await self.sync_documents(document_ids)
+            last_id = document_ids[-1]
+        self.stats.full_syncs += 1
+        self.backfilled = True
+        logger.info(f"Vector permission full sync completed - {total} documents (collection={self.collection})")
+        return total
+
+    async def backfill(self) -> int:
+        """
+        시작 시 backfill
+
+        access_departments가 없는 point가 있을 때만 전체 재동기화하고,
+        없으면 Qdrant 요청 없이 검색 필터를 바로 단일 조건으로 전환합니다.
+
+        Returns:
+            int: 갱신한 문서 수
+        """
+        await self.ensure_payload_indexes()
+        missing = await self.count_missing()
+        if not missing:
+            self.backfilled = True
+            return 0
+        logger.info(f"Vector permission backfill - {missing} points without {ACCESS_FIELD}")
+        return await self.sync_all()
+
+    async def flush(self) -> int:
+        """대기 중인 문서 동기화 (실패한 문서는 대기열로 되돌림)"""
+        if not self._pending:
+            return 0
+        document_ids = sorted(self._pending)
+        self._pending.clear()
+        try:
+            return await self.sync_documents(document_ids)
+        except Exception:
+            self._pending.update(document_ids)
+            raise
+
+    # ------------------------------------------------------------------
+    # 수명주기
+    # ------------------------------------------------------------------
+
+    def start(self) -> None:
+        """백그라운드 동기화 루프 시작"""
+        if self._task is not None and not self._task.done():
+            return
+        self._stopping = False
+        self._full_sync_needed = True
+        self._wakeup.set()
+        self._task = asyncio.create_task(self._run(), name="vector-permission-sync")
+        logger.info(f"Vector permission sync started (collection={self.collection})")
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._stopping = True
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        logger.info("Vector permission sync stopped")
+
+    async def _run(self) -> None:
+        while not self._stopping:
+            await self._wakeup.wait()
+            self._wakeup.clear()
+            try:
+                if self._full_sync_needed:
+                    await self.backfill()
+                    self._full_sync_needed = False
+                synced = await self.flush()
+                if synced:
+                    logger.info(f"Vector permission sync - {synced} documents")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.stats.failures += 1
+                logger.error(f"Vector permission sync failed ({len(self._pending)} pending): {e}")
+                await asyncio.sleep(RETRY_AFTER)
+                self._wakeup.set()
+
+    def metrics(self) -> Dict[str, Any]:
+        data = self.stats.snapshot()
+        data["pending"] = len(self._pending)
+        data["backfilled"] = self.backfilled
+        data["collection"] = self.collection
+        data["running"] = self._task is not None and not self._task.done()
+        return data
+
+
+# 싱글톤 인스턴스
+vector_permission_sync = VectorPermissionSync(
+    api_key=settings.QDRANT_API_KEY,
+    batch_size=settings.VECTOR_PERMISSION_SYNC_BATCH_SIZE,
+)
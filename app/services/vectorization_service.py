@@ -2,14 +2,61 @@
 Vectorization Service for Document Processing
 학습데이터 관리 - 문서 벡터화 서비스 (vLLM 임베딩 API 사용)
 """
-import httpx
 from typing import List, Optional, Dict, Any
 from app.core.config import settings
+from app.core.http_client import http_clients
+from app.services.embedding_cache import embedding_cache
+from app.services.vector_permission_sync import ACCESS_FIELD, load_access_departments
 from app.models.document_vector import DocumentVector, VectorStatus
+from app.utils.text_chunker import TextChunk, get_default_chunker
+from sqlalchemy import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 import asyncio
+import logging
+import time
 import uuid
 
+logger = logging.getLogger(__name__)
+
+
+class VectorizationStats:
+    """벡터화 처리량 카운터"""
+
+    def __init__(self):
+        self.documents = 0
+        self.chunks = 0
+        self.failures = 0
+        self.embed_seconds = 0.0
+        self.upsert_seconds = 0.0
+        self.total_seconds = 0.0
+        self.last_run: Optional[Dict[str, Any]] = None
+
+    def record(self, chunks: int, embed_seconds: float, upsert_seconds: float, total_seconds: float) -> Dict[str, Any]:
+        self.documents += 1
+        self.chunks += chunks
+        self.embed_seconds += embed_seconds
+        self.upsert_seconds += upsert_seconds
+        self.total_seconds += total_seconds
+        self.last_run = {
+            "chunks": chunks,
+            "embed_seconds": round(embed_seconds, 3),
+            "upsert_seconds": round(upsert_seconds, 3),
+            "total_seconds": round(total_seconds, 3),
+            "chunks_per_sec": round(chunks / total_seconds, 1) if total_seconds else 0.0,
+        }
+        return self.last_run
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "documents": self.documents,
+            "chunks": self.chunks,
+            "failures": self.failures,
+            "chunks_per_sec": round(self.chunks / self.total_seconds, 1) if self.total_seconds else 0.0,
+            "embed_chunks_per_sec": round(self.chunks / self.embed_seconds, 1) if self.embed_seconds else 0.0,
+            "upsert_chunks_per_sec": round(self.chunks / self.upsert_seconds, 1) if self.upsert_seconds else 0.0,
+            "last_run": self.last_run,
+        }
+
 
 class VectorizationService:
     """문서 벡터화 서비스 - vLLM 임베딩 사용"""
@@ -23,15 +70,16 @@ class VectorizationService:
         # vLLM 임베딩 엔드포인트 (direct container access via exgpt_net network)
         self.embedding_endpoint = "http://vllm-embeddings:8000/v1/embeddings"
         self.embedding_model = "default-model"  # Qwen3-Embedding-0.6B
+        self.embed_batch_size = settings.VECTORIZE_EMBED_BATCH_SIZE
+        self.embed_concurrency = settings.VECTORIZE_EMBED_CONCURRENCY
+        self.upsert_batch_size = settings.QDRANT_UPSERT_BATCH_SIZE
+        self.chunker = get_default_chunker()
+        self.embedding_cache = embedding_cache
+        self.stats = VectorizationStats()
 
-    async def chunk_text(
-        self,
-        text: str,
-        chunk_size: int = 500,
-        overlap: int = 50
-    ) -> List[str]:
+    async def chunk_text(self, text: str) -> List[TextChunk]:
         """
-        텍스트를 청크로 분할
+        텍스트를 임베딩 토큰 기준 청크로 분할 (공용 청커 사용)
         Secure: 크기 제한
         """
         if not text:
@@ -42,95 +90,118 @@ class VectorizationService:
         if len(text) > max_text_size:
             text = text[:max_text_size]
 
-        chunks = []
-        start = 0
-        text_length = len(text)
-
-        while start < text_length:
-            end = start + chunk_size
-            chunk = text[start:end]
-            chunks.append(chunk)
-            start = end - overlap
-
-        return chunks
+        return self.chunker.chunk(text)
 
     async def get_embeddings(self, texts: List[str]) -> List[List[float]]:
         """
         텍스트 임베딩 생성 (vLLM 사용)
         """
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.post(
-                    self.embedding_endpoint,
-                    json={
-                        "input": texts,
-                        "model": self.embedding_model
-                    }
-                )
-                response.raise_for_status()
-                data = response.json()
-                return [item["embedding"] for item in data["data"]]
+            response = await http_clients.get("embedding").post(
+                self.embedding_endpoint,
+                json={
+                    "input": texts,
+                    "model": self.embedding_model
+                },
+                timeout=30.0
+            )
+            response.raise_for_status()
+            data = response.json()
+            return [item["embedding"] for item in data["data"]]
         except Exception as e:
-            print(f"Embedding error: {e}")
+            logger.error(f"Embedding error: {e}")
             raise ValueError(f"임베딩 생성 실패: {e}")
 
+    async def embed_chunks(self, chunks: List[str]) -> List[List[float]]:
+        """
+        청크 임베딩 생성 (내용이 같은 청크는 캐시 사용)
+
+        Args:
+            chunks: 텍스트 청크 목록
+
+        Returns:
+            청크 순서와 같은 임베딩 목록
+        """
+        return await self.embedding_cache.get_or_embed(self.embedding_model, chunks, self._embed_batches)
+
+    async def _embed_batches(self, chunks: List[str]) -> List[List[float]]:
+        """배치 단위 임베딩 (vLLM 동시 요청 수 제한)"""
+        semaphore = asyncio.Semaphore(self.embed_concurrency)
+
+        async def embed_batch(batch: List[str]) -> List[List[float]]:
+            async with semaphore:
+                return await self.get_embeddings(batch)
+
+        batches = [chunks[i:i + self.embed_batch_size] for i in range(0, len(chunks), self.embed_batch_size)]
+        results = await asyncio.gather(*(embed_batch(batch) for batch in batches))
+        return [embedding for batch in results for embedding in batch]
+
     async def store_vectors_in_qdrant(
         self,
         document_id: int,
-        chunks: List[str],
+        chunks: List[TextChunk],
         embeddings: List[List[float]],
-        metadata: dict
+        metadata: dict,
+        access_departments: Optional[List[int]] = None
     ) -> List[str]:
         """
         Qdrant에 벡터 저장
+
+        upsert_batch_size 단위로 묶어 wait=false로 전송하고, 마지막 배치만
+        wait=true로 보내 앞선 배치까지 모두 반영된 뒤 반환합니다.
+        (Qdrant는 수신 순서대로 업데이트를 적용)
+
+        access_departments가 주어지면 검색 권한 필터용으로 payload에 함께 기록합니다.
+
         Returns: List of point IDs
         """
-        point_ids = []
-        print(f"[VECTORIZATION] Starting Qdrant storage for document {document_id}, {len(chunks)} chunks")
-        print(f"[VECTORIZATION] Qdrant URL: {self.qdrant_url}, Collection: {self.collection}")
+        headers = {}
+        if self.api_key:
+            headers["api-key"] = self.api_key
 
-        try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                for idx, (chunk, embedding) in enumerate(zip(chunks, embeddings)):
-                    point_id = str(uuid.uuid4())
+        points = [
+            {
+                "id": str(uuid.uuid4()),
+                "vector": {
+                    "default-model": embedding
+                },
+                "payload": {
+                    "document_id": document_id,
+                    "chunk_index": chunk.index,
+                    "chunk_text": chunk.text[:1000],  # Limit for payload
+                    "char_start": chunk.start,  # 원문 오프셋 (인용용)
+                    "char_end": chunk.end,
+                    "metadata": metadata
+                }
+            }
+            for chunk, embedding in zip(chunks, embeddings)
+        ]
+        if access_departments is not None:
+            for point in points:
+                point["payload"][ACCESS_FIELD] = access_departments
+        batches = [points[i:i + self.upsert_batch_size] for i in range(0, len(points), self.upsert_batch_size)]
 
-                    # Prepare payload
-                    payload = {
-                        "document_id": document_id,
-                        "chunk_index": idx,
-                        "chunk_text": chunk[:1000],  # Limit for payload
-                        "metadata": metadata
-                    }
+        try:
+            client = http_clients.get("qdrant")
+            url = f"{self.qdrant_url}/collections/{self.collection}/points"
+            for number, batch in enumerate(batches, start=1):
+                is_last = number == len(batches)
+                response = await client.put(
+                    url,
+                    params={"wait": "true" if is_last else "false"},
+                    json={"points": batch},
+                    headers=headers
+                )
+                response.raise_for_status()
 
-                    # Store in Qdrant
-                    headers = {}
-                    if self.api_key:
-                        headers["api-key"] = self.api_key
-
-                    print(f"[VECTORIZATION] Storing chunk {idx} with point_id {point_id}")
-                    response = await client.put(
-                        f"{self.qdrant_url}/collections/{self.collection}/points",
-                        json={
-                            "points": [{
-                                "id": point_id,
-                                "vector": {
-                                    "default-model": embedding
-                                },
-                                "payload": payload
-                            }]
-                        },
-                        headers=headers
-                    )
-                    print(f"[VECTORIZATION] Qdrant response status: {response.status_code}")
-                    print(f"[VECTORIZATION] Qdrant response: {response.text[:200]}")
-                    response.raise_for_status()
-                    point_ids.append(point_id)
-
-            print(f"[VECTORIZATION] Successfully stored {len(point_ids)} vectors in Qdrant")
-            return point_ids
+            logger.info(
+                f"Stored {len(points)} vectors for document {document_id} "
+                f"in {len(batches)} upsert batches (collection={self.collection})"
+            )
+            return [point["id"] for point in points]
 
         except Exception as e:
-            print(f"[VECTORIZATION ERROR] Qdrant storage error: {e}")
+            logger.error(f"Qdrant storage error for document {document_id}: {e}")
             raise ValueError(f"벡터 저장 실패: {e}")
 
     async def vectorize_document(
@@ -142,59 +213,78 @@ class VectorizationService:
     ):
         """
         문서 벡터화 전체 프로세스 (vLLM 임베딩 사용)
+
+        Returns:
+            이번 실행의 처리량 (chunks, *_seconds, chunks_per_sec) - 청크가 없으면 None
         """
         if metadata is None:
             metadata = {}
 
+        started = time.perf_counter()
         try:
             # 1. 텍스트 청크 분할
             chunks = await self.chunk_text(text)
             if not chunks:
                 return
 
-            # 2. 임베딩 생성 (배치 처리)
-            batch_size = 10
-            all_embeddings = []
-
-            for i in range(0, len(chunks), batch_size):
-                batch = chunks[i:i + batch_size]
-                embeddings = await self.get_embeddings(batch)
-                all_embeddings.extend(embeddings)
+            # 2. 임베딩 생성 (배치 병렬 처리)
+            all_embeddings = await self.embed_chunks([chunk.text for chunk in chunks])
+            embedded = time.perf_counter()
 
-            # 3. Qdrant에 저장
+            # 3. Qdrant에 저장 (Admin 문서는 열람 가능 부서를 payload에 기록)
+            access_departments = None
+            if self.collection != "session_collection-v2":
+                access = await load_access_departments(db, [document_id])
+                access_departments = access[document_id]
             point_ids = await self.store_vectors_in_qdrant(
                 document_id,
                 chunks,
                 all_embeddings,
-                metadata
+                metadata,
+                access_departments
             )
+            upserted = time.perf_counter()
 
             # 4. 메타데이터 DB에 저장 (Admin 문서만 - Personal 파일은 Qdrant만 사용)
             # Personal files (session_collection-v2) don't need document_vectors table
             # because they don't exist in the documents table (FK constraint issue)
             if self.collection != "session_collection-v2":
-                for idx, (chunk, point_id) in enumerate(zip(chunks, point_ids)):
-                    vector_record = DocumentVector(
-                        document_id=document_id,
-                        qdrant_point_id=point_id,
-                        qdrant_collection=self.collection,
-                        chunk_index=idx,
-                        chunk_text=chunk[:10000],  # Truncate if too long
-                        chunk_metadata=metadata,
-                        vector_dimension=len(all_embeddings[0]) if all_embeddings else None,
-                        embedding_model=self.embedding_model,
-                        status=VectorStatus.COMPLETED
-                    )
-                    db.add(vector_record)
-
+                vector_dimension = len(all_embeddings[0]) if all_embeddings else None
+                await db.execute(insert(DocumentVector), [
+                    {
+                        "document_id": document_id,
+                        "qdrant_point_id": point_id,
+                        "qdrant_collection": self.collection,
+                        "chunk_index": chunk.index,
+                        "chunk_text": chunk.text[:10000],  # Truncate if too long
+                        "chunk_metadata": {**metadata, "char_start": chunk.start, "char_end": chunk.end},
+                        "vector_dimension": vector_dimension,
+                        "embedding_model": self.embedding_model,
+                        "status": VectorStatus.COMPLETED
+                    }
+                    for chunk, point_id in zip(chunks, point_ids)
+                ])
                 await db.commit()
             else:
                 # Personal files: Qdrant storage only, no DB metadata
-                print(f"[VECTORIZATION] Personal file - skipping document_vectors table (Qdrant only)")
+                logger.debug("Personal file - skipping document_vectors table (Qdrant only)")
+
+            run = self.stats.record(
+                chunks=len(chunks),
+                embed_seconds=embedded - started,
+                upsert_seconds=upserted - embedded,
+                total_seconds=time.perf_counter() - started
+            )
+            logger.info(
+                f"Vectorized document {document_id}: {run['chunks']} chunks in {run['total_seconds']}s "
+                f"({run['chunks_per_sec']} chunks/s; embed {run['embed_seconds']}s, upsert {run['upsert_seconds']}s)"
+            )
+            return run
 
         except Exception as e:
             # Mark as failed
-            print(f"Vectorization failed for document {document_id}: {e}")
+            self.stats.failures += 1
+            logger.error(f"Vectorization failed for document {document_id}: {e}")
 
             # Create failed record (Admin 문서만 - Personal 파일은 생략)
             if self.collection != "session_collection-v2":
@@ -210,10 +300,18 @@ class VectorizationService:
                 await db.commit()
             else:
                 # Personal files: Just log error, no DB save
-                print(f"[VECTORIZATION ERROR] Personal file vectorization failed: {e}")
+                logger.error(f"Personal file vectorization failed: {e}")
 
             raise
 
+    def metrics(self) -> Dict[str, Any]:
+        data = self.stats.snapshot()
+        data["collection"] = self.collection
+        data["embed_batch_size"] = self.embed_batch_size
+        data["embed_concurrency"] = self.embed_concurrency
+        data["upsert_batch_size"] = self.upsert_batch_size
+        return data
+
 
 # Singleton instance
 vectorization_service = VectorizationService()
@@ -0,0 +1,82 @@
+"""
+Date Range
+날짜(일 단위) 필터를 created_at 인덱스를 탈 수 있는 반열린 시각 범위로 변환
+
+func.date(created_at) >= start 처럼 컬럼에 함수를 씌우면 인덱스를 사용할 수 없으므로
+날짜를 STATS_TIMEZONE(기본 KST) 자정 기준 [start 00:00, end+1 00:00) UTC 범위로 바꿔 비교합니다.
+
+예:
+    >>> day_range(date(2025, 10, 20), date(2025, 10, 20))
+    (datetime(2025, 10, 19, 15, 0, tzinfo=utc), datetime(2025, 10, 20, 15, 0, tzinfo=utc))
+"""
+from datetime import date, datetime, time, timedelta, timezone
+from typing import List, Optional, Tuple
+from zoneinfo import ZoneInfo
+
+from app.core.config import settings
+
+
+def day_start(day: date, tz: Optional[str] = None) -> datetime:
+    """
+    날짜 시작 시각 (UTC)
+
+    Args:
+        day: 날짜 (tz 기준)
+        tz: 시간대 이름 (기본: settings.STATS_TIMEZONE)
+
+    Returns:
+        datetime: tz 기준 day 00:00을 UTC로 변환한 시각
+    """
+    zone = ZoneInfo(tz or settings.STATS_TIMEZONE)
+    return datetime.combine(day, time.min, tzinfo=zone).astimezone(timezone.utc)
+
+
+def day_range(
+    start: Optional[date],
+    end: Optional[date],
+    tz: Optional[str] = None
+) -> Tuple[Optional[datetime], Optional[datetime]]:
+    """
+    날짜 범위 → 반열린 시각 범위 [lower, upper)
+
+    Args:
+        start: 시작 날짜 (포함, None이면 하한 없음)
+        end: 종료 날짜 (포함, None이면 상한 없음)
+        tz: 시간대 이름 (기본: settings.STATS_TIMEZONE)
+
+    Returns:
+        Tuple: (start 00:00 UTC, end 다음 날 00:00 UTC)
+    """
+    lower = day_start(start, tz) if start is not None else None
+    upper = day_start(end + timedelta(days=1), tz) if end is not None else None
+    return lower, upper
+
+
+def date_range_filter(
+    column,
+    start: Optional[date],
+    end: Optional[date],
+    tz: Optional[str] = None
+) -> List:
+    """
+    created_at 등 timestamp 컬럼용 날짜 범위 조건
+
+    Args:
+        column: timestamptz 컬럼 (예: UsageHistory.created_at)
+        start: 시작 날짜 (포함)
+        end: 종료 날짜 (포함)
+        tz: 시간대 이름 (기본: settings.STATS_TIMEZONE)
+
+    Returns:
+        List: where()에 풀어 넣을 조건 목록 (column >= lower, column < upper)
+
+    Example:
+        >>> query.where(*date_range_filter(UsageHistory.created_at, start, end))
+    """
+    lower, upper = day_range(start, end, tz)
+    filters = []
+    if lower is not None:
+        filters.append(column >= lower)
+    if upper is not None:
+        filters.append(column < upper)
+    return filters
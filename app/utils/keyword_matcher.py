@@ -0,0 +1,131 @@
+"""
+다중 키워드 매칭 유틸리티 (Aho-Corasick)
+
+키워드 목록을 한 번 컴파일해 두고 텍스트를 한 번만 순회하여
+등장한 모든 키워드(겹치는 키워드 포함)를 찾습니다.
+키워드 수가 늘어나도 텍스트당 비용은 텍스트 길이에만 비례합니다.
+"""
+from collections import deque
+from typing import Dict, Hashable, Iterable, List, Set, Tuple
+
+
+class KeywordAutomaton:
+    """
+    Aho-Corasick 오토마톤
+
+    실패 링크를 미리 전이표에 반영한 DFA 형태로 컴파일하여,
+    검색 시 문자당 dict 조회 1회만 수행합니다.
+
+    Examples:
+        >>> automaton = KeywordAutomaton([("안전", "safety"), ("안전점검", "inspection")])
+        >>> automaton.count_labels("터널 안전점검 일정")
+        {'safety': 1, 'inspection': 1}
+    """
+
+    def __init__(self, patterns: Iterable[Tuple[str, Hashable]], case_insensitive: bool = True):
+        """
+        Args:
+            patterns: (키워드, 라벨) 목록 - 같은 키워드가 여러 라벨에 속할 수 있음
+            case_insensitive: True면 키워드와 텍스트를 소문자로 비교
+        """
+        self.case_insensitive = case_insensitive
+        self.keywords: List[str] = []
+        self._labels: List[Tuple[Hashable, ...]] = []
+        self._build(patterns)
+
+    def __len__(self) -> int:
+        return len(self.keywords)
+
+    def _build(self, patterns: Iterable[Tuple[str, Hashable]]) -> None:
+        keyword_ids: Dict[str, int] = {}
+        labels: List[List[Hashable]] = []
+        for keyword, label in patterns:
+            if self.case_insensitive:
+                keyword = keyword.lower()
+            if not keyword:
+                continue
+            kid = keyword_ids.get(keyword)
+            if kid is None:
+                kid = keyword_ids[keyword] = len(self.keywords)
+                self.keywords.append(keyword)
+                labels.append([])
+            labels[kid].append(label)
+        self._labels = [tuple(items) for items in labels]
+
+        # 1. trie
+        goto: List[Dict[str, int]] = [{}]
+        output: List[List[int]] = [[]]
+        for kid, keyword in enumerate(self.keywords):
+            state = 0
+            for ch in keyword:
+                nxt = goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(goto)
+                    goto[state][ch] = nxt
+                    goto.append({})
+                    output.append([])
+                state = nxt
+            output[state].append(kid)
+
+        # 2. 실패 링크 (BFS) + 출력 병합
+        fail = [0] * len(goto)
+        order = [0]
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            order.append(state)
+            for ch, nxt in goto[state].items():
+                queue.append(nxt)
+                f = fail[state]
+                while f and ch not in goto[f]:
+                    f = fail[f]
+                target = goto[f].get(ch, 0)
+                fail[nxt] = target if target != nxt else 0
+                output[nxt] = output[nxt] + output[fail[nxt]]
+
+        # 3. 실패 링크를 전이표에 펼쳐 DFA로 변환 (BFS 순서라 fail 상태가 먼저 계산됨)
+        delta: List[Dict[str, int]] = [{} for _ in goto]
+        for state in order:
+            table = dict(delta[fail[state]]) if state else {}
+            table.update(goto[state])
+            delta[state] = table
+
+        self._delta = delta
+        self._output = [tuple(ids) for ids in output]
+
+    def find_ids(self, text: str) -> Set[int]:
+        """텍스트에 등장한 키워드 id 집합 (등장 횟수 무관)"""
+        if not text:
+            return set()
+        if self.case_insensitive:
+            text = text.lower()
+        delta = self._delta
+        output = self._output
+        found: Set[int] = set()
+        state = 0
+        for ch in text:
+            state = delta[state].get(ch, 0)
+            ids = output[state]
+            if ids:
+                found.update(ids)
+        return found
+
+    def find(self, text: str) -> Set[str]:
+        """텍스트에 등장한 키워드 집합"""
+        return {self.keywords[kid] for kid in self.find_ids(text)}
+
+    def count_labels(self, text: str) -> Dict[Hashable, int]:
+        """
+        라벨별로 등장한 서로 다른 키워드 수
+
+        Args:
+            text: 검색 대상 텍스트
+
+        Returns:
+            Dict[label, int]: 1개 이상 매칭된 라벨만 포함
+        """
+        counts: Dict[Hashable, int] = {}
+        for kid in self.find_ids(text):
+            for label in self._labels[kid]:
+                counts[label] = counts.get(label, 0) + 1
+        return counts
@@ -0,0 +1,204 @@
+"""
+Keyset Pagination
+(created_at, id) 기준 커서 페이지네이션
+
+OFFSET 페이징은 깊은 페이지일수록 앞의 행을 모두 읽고 버리므로
+마지막으로 본 행의 (created_at, id)를 불투명 커서로 넘겨 그 다음 행부터 인덱스로 바로 읽습니다.
+
+사용 예:
+    cursor = decode_cursor(token)
+    query = apply_keyset(select(UsageHistory), UsageHistory.created_at, UsageHistory.id, cursor, limit)
+    rows = (await db.execute(query)).scalars().all()
+    page = build_keyset_page(rows, limit, lambda row: (row.created_at, row.id), cursor)
+"""
+import base64
+import binascii
+import json
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Callable, List, Optional, Tuple
+
+from fastapi import HTTPException
+from sqlalchemy import text, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+@dataclass(frozen=True)
+class Cursor:
+    """
+    페이지 커서
+
+    Attributes:
+        created_at: 기준 행의 생성 시각
+        id: 기준 행의 ID (같은 시각 행 구분)
+        backward: True면 기준 행 이전(이전 페이지) 방향
+    """
+    created_at: datetime
+    id: int
+    backward: bool = False
+
+
+@dataclass
+class KeysetPage:
+    """
+    커서 페이지 조회 결과
+
+    Attributes:
+        items: 현재 페이지 행 (요청한 정렬 순서)
+        next_cursor: 다음 페이지 커서 (없으면 None)
+        prev_cursor: 이전 페이지 커서 (첫 페이지면 None)
+    """
+    items: List[Any] = field(default_factory=list)
+    next_cursor: Optional[str] = None
+    prev_cursor: Optional[str] = None
+
+
+def encode_cursor(created_at: datetime, id: int, backward: bool = False) -> str:
+    """
+    커서 인코딩 (URL-safe base64)
+
+    Args:
+        created_at: 기준 행의 생성 시각
+        id: 기준 행의 ID
+        backward: 이전 페이지 방향 여부
+
+    Returns:
+        str: 불투명 커서 문자열
+    """
+    payload = {"t": created_at.isoformat(), "i": id}
+    if backward:
+        payload["b"] = 1
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(token: Optional[str]) -> Optional[Cursor]:
+    """
+    커서 디코딩
+
+    Args:
+        token: encode_cursor()로 만든 커서 (None이면 첫 페이지)
+
+    Returns:
+        Optional[Cursor]: 디코딩된 커서
+
+    Raises:
+        HTTPException: 커서 형식이 잘못된 경우 (400)
+    """
+    if not token:
+        return None
+    try:
+        raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+        payload = json.loads(raw)
+        return Cursor(
+            created_at=datetime.fromisoformat(payload["t"]),
+            id=int(payload["i"]),
+            backward=bool(payload.get("b")),
+        )
+    except (binascii.Error, ValueError, KeyError, TypeError):
+        raise HTTPException(status_code=400, detail="잘못된 페이지 커서입니다")
+
+
+def apply_keyset(
+    query,
+    time_column,
+    id_column,
+    cursor: Optional[Cursor],
+    limit: int,
+    descending: bool = True
+):
+    """
+    쿼리에 커서 조건 / 정렬 / limit 적용
+
+    다음 페이지 존재 여부 확인을 위해 limit + 1행을 조회합니다.
+    이전 페이지 방향은 정렬을 뒤집어 조회하므로 build_keyset_page()로 순서를 되돌려야 합니다.
+
+    Args:
+        query: 필터가 적용된 select
+        time_column: 정렬 기준 시각 컬럼 (예: UsageHistory.created_at)
+        id_column: 동률 구분용 ID 컬럼
+        cursor: 기준 커서 (None이면 첫 페이지)
+        limit: 페이지 크기
+        descending: 최신순 여부
+
+    Returns:
+        select: 커서 조건이 적용된 쿼리
+    """
+    backward = cursor is not None and cursor.backward
+    # 최신순의 다음 페이지 = 더 오래된 행, 이전 페이지 = 더 최근 행
+    scan_descending = descending != backward
+
+    if cursor is not None:
+        key = tuple_(time_column, id_column)
+        bound = tuple_(cursor.created_at, cursor.id)
+        query = query.where(key < bound if scan_descending else key > bound)
+
+    if scan_descending:
+        query = query.order_by(time_column.desc(), id_column.desc())
+    else:
+        query = query.order_by(time_column.asc(), id_column.asc())
+    return query.limit(limit + 1)
+
+
+def build_keyset_page(
+    rows: List[Any],
+    limit: int,
+    key: Callable[[Any], Tuple[datetime, int]],
+    cursor: Optional[Cursor] = None,
+    has_previous: Optional[bool] = None
+) -> KeysetPage:
+    """
+    apply_keyset() 결과로 페이지와 앞뒤 커서 생성
+
+    Args:
+        rows: apply_keyset() 쿼리 결과 (최대 limit + 1행)
+        limit: 페이지 크기
+        key: 행 → (created_at, id)
+        cursor: 조회에 사용한 커서
+        has_previous: 이전 페이지 존재 여부 (None이면 커서로 판단, OFFSET 조회 시 지정)
+
+    Returns:
+        KeysetPage: 현재 페이지와 앞뒤 커서
+    """
+    rows = list(rows)
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+
+    backward = cursor is not None and cursor.backward
+    if backward:
+        rows.reverse()
+        has_next, has_prev = True, has_more
+    else:
+        has_next = has_more
+        has_prev = cursor is not None if has_previous is None else has_previous
+
+    page = KeysetPage(items=rows)
+    if rows:
+        if has_next:
+            page.next_cursor = encode_cursor(*key(rows[-1]))
+        if has_prev:
+            page.prev_cursor = encode_cursor(*key(rows[0]), backward=True)
+    return page
+
+
+async def approximate_count(db: AsyncSession, table_name: str) -> Optional[int]:
+    """
+    테이블 전체 행 수 추정값 (PostgreSQL pg_class.reltuples)
+
+    COUNT(*) 없이 통계 정보로 즉시 반환하며, 필터 없는 목록의 전체 개수 표시용입니다.
+
+    Args:
+        db: 데이터베이스 세션
+        table_name: 테이블 이름
+
+    Returns:
+        Optional[int]: 추정 행 수 (통계가 아직 없으면 None)
+    """
+    result = await db.execute(
+        text("SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(:table_name)"),
+        {"table_name": table_name}
+    )
+    estimate = result.scalar()
+    if estimate is None or estimate < 0:
+        return None
+    return int(estimate)
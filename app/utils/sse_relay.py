@@ -0,0 +1,178 @@
+"""
+SSE 릴레이용 증분 파서
+
+chat_proxy 릴레이 모드는 ds-api SSE 바이트를 그대로 클라이언트에 전달하고,
+이 파서는 같은 바이트를 옆에서 읽어 저장에 필요한 값(답변, thinking, 참조 문서, 토큰 수)만 모읍니다.
+- 청크 경계와 무관하게 바이트 버퍼에서 줄 단위로 처리 (문자열 디코딩 / 재직렬화 없음)
+- 대부분을 차지하는 token 이벤트는 정규식으로 content 문자열만 추출하고,
+  이스케이프가 있을 때만 해당 문자열 리터럴을 json.loads
+- 그 외 이벤트(sources, final 등)나 키 순서가 다른 이벤트만 전체 json.loads
+"""
+import json
+import re
+from typing import Any, Dict, List, Optional
+
+# {"type": "token", "content": "..."} (ds-api 기본 형태, 다른 형태는 전체 파싱)
+_TOKEN_EVENT = re.compile(
+    rb'\{\s*"type"\s*:\s*"token"\s*,\s*"content"\s*:\s*("(?:[^"\\]|\\.)*")\s*\}\s*$',
+    re.DOTALL,
+)
+_DONE = b"[DONE]"
+
+# 줄바꿈 없이 이보다 길어지는 줄은 해석하지 않음 (전달은 계속)
+MAX_LINE_BYTES = 4 * 1024 * 1024
+
+# 토큰 사용량으로 저장하는 final 이벤트 usage 키
+USAGE_KEYS = ("prompt_tokens", "completion_tokens", "total_tokens")
+
+
+def _decode_string(literal: bytes) -> str:
+    """JSON 문자열 리터럴("...") → str (이스케이프 없으면 slice + decode)"""
+    if b"\\" not in literal:
+        return literal[1:-1].decode("utf-8", errors="replace")
+    return json.loads(literal)
+
+
+class SSEAccumulator:
+    """
+    ds-api SSE 스트림에서 저장용 값만 추출하는 증분 파서
+
+    Examples:
+        >>> parser = SSEAccumulator()
+        >>> parser.feed(b'data: {"type": "token", "content": "Hel')
+        >>> parser.feed(b'lo"}\\n\\ndata: [DONE]\\n\\n')
+        >>> parser.answer, parser.done
+        ('Hello', True)
+    """
+
+    def __init__(self):
+        self._buffer = bytearray()
+        self._answer: List[str] = []
+        self._thinking: List[str] = []
+        self._is_thinking = False
+        self.sources: List[str] = []
+        self.usage: Dict[str, int] = {}
+        self.token_events = 0
+        self.events = 0
+        self.fast_path_events = 0
+        self.malformed_events = 0
+        self.bytes_seen = 0
+        self.overflowed = False
+        self.done = False
+
+    @property
+    def answer(self) -> str:
+        return "".join(self._answer)
+
+    @property
+    def thinking(self) -> str:
+        return "".join(self._thinking)
+
+    def feed(self, chunk: bytes) -> None:
+        """업스트림 청크 추가 (완성된 줄만 처리, 나머지는 다음 청크까지 보관)"""
+        self.bytes_seen += len(chunk)
+        buffer = self._buffer
+        buffer += chunk
+        start = 0
+        while True:
+            end = buffer.find(b"\n", start)
+            if end < 0:
+                break
+            self._line(bytes(buffer[start:end]))
+            start = end + 1
+        if start:
+            del buffer[:start]
+        if len(buffer) > MAX_LINE_BYTES:
+            self.overflowed = True
+            buffer.clear()
+
+    def close(self) -> None:
+        """스트림 종료 - 줄바꿈 없이 끝난 마지막 줄 처리"""
+        if self._buffer:
+            self._line(bytes(self._buffer))
+            self._buffer.clear()
+
+    def _line(self, line: bytes) -> None:
+        if not line.startswith(b"data:"):
+            return  # 빈 줄(이벤트 구분), event:, id:, 주석
+        payload = line[5:].strip()
+        if not payload:
+            return
+        if payload == _DONE:
+            self.done = True
+            return
+
+        self.events += 1
+        match = _TOKEN_EVENT.match(payload)
+        if match:
+            self.fast_path_events += 1
+            self._token(_decode_string(match.group(1)))
+            return
+
+        # token 이외의 이벤트(또는 다른 형태의 token 이벤트)만 전체 파싱
+        try:
+            data = json.loads(payload)
+        except ValueError:
+            self.malformed_events += 1
+            return
+        if not isinstance(data, dict):
+            return
+
+        event_type = data.get("type")
+        if event_type == "token":
+            token = data.get("content", "")
+            if isinstance(token, str):
+                self._token(token)
+        elif event_type == "sources":
+            self._sources(data.get("sources") or [])
+        elif event_type == "final":
+            metadata = data.get("metadata")
+            self._usage(data.get("usage") or (metadata.get("usage") if isinstance(metadata, dict) else None))
+
+    def _token(self, token: str) -> None:
+        if not token:
+            return
+        self.token_events += 1
+        # Thinking 태그 감지 및 분리
+        if "<think>" in token:
+            self._is_thinking = True
+        if self._is_thinking:
+            self._thinking.append(token)
+            if "</think>" in token:
+                self._is_thinking = False
+        else:
+            self._answer.append(token)
+
+    def _sources(self, sources: List[Any]) -> None:
+        for source in sources:
+            # 각 source에서 파일명 추출
+            if isinstance(source, dict):
+                metadata = source.get("metadata")
+                filename = source.get("filename") or source.get("title") or (
+                    metadata.get("filename") if isinstance(metadata, dict) else None
+                )
+            else:
+                filename = source if isinstance(source, str) else None
+            if filename and filename not in self.sources:
+                self.sources.append(filename)
+
+    def _usage(self, usage: Any) -> None:
+        if not isinstance(usage, dict):
+            return
+        for key in USAGE_KEYS:
+            value = usage.get(key)
+            if isinstance(value, int) and not isinstance(value, bool):
+                self.usage[key] = value
+
+    def usage_metadata(self) -> Optional[Dict[str, int]]:
+        """
+        usage_history.usage_metadata에 저장할 토큰 수
+
+        final 이벤트의 usage(prompt/completion/total_tokens)가 있으면 그대로,
+        없으면 수신한 token 이벤트 수를 tokens로 기록
+        """
+        if self.usage:
+            return dict(self.usage)
+        if self.token_events:
+            return {"tokens": self.token_events}
+        return None
@@ -0,0 +1,229 @@
+"""
+토큰 기준 텍스트 청킹 유틸리티
+
+DocumentProcessor와 VectorizationService가 함께 사용하는 청커입니다.
+- 임베딩 모델(Qwen3-Embedding) 토큰 수 기준으로 청크 크기/겹침 계산
+- 문단 → 문장(한국어 종결어미 포함) 경계를 우선 유지
+- 텍스트를 한 번만 순회하는 generator (선형 시간)
+- 인용용 원문 오프셋(start, end) 제공
+"""
+import logging
+import re
+from collections import deque
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Callable, Deque, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# 문장 단위: 다음 경계까지의 텍스트 + 뒤따르는 공백
+# - 줄바꿈 (문단 경계는 _PARAGRAPH_BREAK로 별도 표시)
+# - 마침표/물음표/느낌표 (. ? ! 。 ？ ！) + 공백
+# - 마침표 없는 개조식 종결어미 (~함, ~임, ~음, ~됨, ~다, ~요) 뒤에 같은 줄에서 이어지는 항목 기호
+#   (HWP/PDF 추출 시 줄바꿈이 사라진 "... 제출함 - 기한 ..." 형태)
+_SENTENCE = re.compile(
+    r'[^\n]*?(?:[.?!。？！](?=\s)'
+    r'|[다요음함임됨](?=[^\S\n]+(?:[-·•※○●□■▶◦①-⑳]|\d{1,2}[.)]\s))'
+    r'|(?=\n)|$)\s*'
+)
+_PARAGRAPH_BREAK = re.compile(r'\n[^\S\n]*\n')
+_WORD = re.compile(r'\S+\s*')
+
+# 토크나이저가 없을 때의 토큰 수 추정 단위
+# 한글/한자 1글자 = 1토큰, 영숫자 4글자 = 1토큰, 기타 기호 1글자 = 1토큰 (보수적 추정)
+_ESTIMATE_UNITS = re.compile(r'[가-힣ㄱ-ㆎ㐀-鿿]|[A-Za-z0-9]+|\S')
+
+
+def estimate_tokens(text: str) -> int:
+    """토크나이저 없이 토큰 수 추정"""
+    count = 0
+    for unit in _ESTIMATE_UNITS.findall(text):
+        if len(unit) > 1:
+            count += (len(unit) + 3) // 4
+        else:
+            count += 1
+    return count
+
+
+@lru_cache(maxsize=4)
+def get_token_counter(tokenizer_path: Optional[str] = None) -> Callable[[str], int]:
+    """
+    토큰 수 계산 함수
+
+    Args:
+        tokenizer_path: HuggingFace tokenizer.json 경로 (임베딩 모델과 동일한 토크나이저)
+
+    Returns:
+        text -> 토큰 수 함수 (tokenizers 미설치 또는 경로 없음 시 estimate_tokens)
+    """
+    if tokenizer_path:
+        try:
+            from tokenizers import Tokenizer
+
+            tokenizer = Tokenizer.from_file(tokenizer_path)
+
+            def count(text: str) -> int:
+                return len(tokenizer.encode(text, add_special_tokens=False).ids)
+
+            return count
+        except ImportError:
+            logger.error("tokenizers not installed. Install with: pip install tokenizers")
+        except Exception as e:
+            logger.error(f"Failed to load tokenizer from {tokenizer_path}: {e}")
+    return estimate_tokens
+
+
+@dataclass
+class TextChunk:
+    """청크 (원문 오프셋 포함)"""
+    index: int
+    text: str
+    start: int  # 원문 기준 시작 위치
+    end: int  # 원문 기준 끝 위치 (exclusive)
+    token_count: int
+
+
+# (start, end, tokens, starts_paragraph)
+_Unit = Tuple[int, int, int, bool]
+
+
+class TextChunker:
+    """
+    토큰 기준 청커
+
+    문장 단위를 토큰 예산(max_tokens)까지 채워 청크를 만들고,
+    이전 청크의 마지막 문장들(overlap_tokens 이내)을 다음 청크 앞에 겹칩니다.
+    새 문단이 시작될 때 청크가 이미 절반 이상 찼으면 문단 경계에서 끊습니다.
+    """
+
+    def __init__(
+        self,
+        max_tokens: int = 512,
+        overlap_tokens: int = 64,
+        token_counter: Optional[Callable[[str], int]] = None,
+    ):
+        """
+        Args:
+            max_tokens: 청크당 최대 토큰 수
+            overlap_tokens: 인접 청크 간 겹치는 최대 토큰 수
+            token_counter: text -> 토큰 수 함수 (기본: estimate_tokens)
+        """
+        if overlap_tokens >= max_tokens:
+            raise ValueError("overlap_tokens must be smaller than max_tokens")
+        self.max_tokens = max_tokens
+        self.overlap_tokens = overlap_tokens
+        self.count_tokens = token_counter or estimate_tokens
+
+    def chunk(self, text: str) -> List[TextChunk]:
+        """텍스트 전체 청크 목록"""
+        return list(self.iter_chunks(text))
+
+    def iter_chunks(self, text: str) -> Iterator[TextChunk]:
+        """
+        텍스트를 청크로 분할 (generator)
+
+        Args:
+            text: 추출된 전체 텍스트
+
+        Yields:
+            TextChunk: 원문 오프셋이 포함된 청크
+        """
+        if not text:
+            return
+
+        window: Deque[_Unit] = deque()
+        window_tokens = 0
+        index = 0
+        fresh = False  # 마지막 청크 이후 새로 추가된 단위가 있는지
+
+        for unit in self._units(text):
+            _, _, tokens, starts_paragraph = unit
+            full = window_tokens + tokens > self.max_tokens
+            paragraph_break = starts_paragraph and window_tokens * 2 >= self.max_tokens
+            if window and fresh and (full or paragraph_break):
+                chunk = self._make_chunk(text, window, window_tokens, index)
+                if chunk is not None:
+                    yield chunk
+                    index += 1
+                # 겹침: 뒤쪽 문장들을 overlap_tokens 이내로 유지
+                kept: Deque[_Unit] = deque()
+                kept_tokens = 0
+                while window and kept_tokens + window[-1][2] <= self.overlap_tokens:
+                    last = window.pop()
+                    kept.appendleft(last)
+                    kept_tokens += last[2]
+                window, window_tokens = kept, kept_tokens
+                fresh = False
+            # 겹침 문장 + 새 문장이 예산을 넘으면 겹침을 앞에서부터 줄임
+            while window and window_tokens + tokens > self.max_tokens:
+                window_tokens -= window.popleft()[2]
+            window.append(unit)
+            window_tokens += tokens
+            fresh = True
+
+        if window and fresh:
+            chunk = self._make_chunk(text, window, window_tokens, index)
+            if chunk is not None:
+                yield chunk
+
+    @staticmethod
+    def _make_chunk(text: str, window: Deque[_Unit], tokens: int, index: int) -> Optional[TextChunk]:
+        start, end = window[0][0], window[-1][1]
+        raw = text[start:end]
+        stripped = raw.strip()
+        if not stripped:
+            return None
+        start += len(raw) - len(raw.lstrip())
+        return TextChunk(index=index, text=stripped, start=start, end=start + len(stripped), token_count=tokens)
+
+    def _units(self, text: str) -> Iterator[_Unit]:
+        """문장 단위 (예산을 넘는 문장은 어절 → 글자 단위로 분할)"""
+        paragraph_starts = {m.end() for m in _PARAGRAPH_BREAK.finditer(text)}
+        for match in _SENTENCE.finditer(text):
+            start, end = match.span()
+            if start == end:
+                continue
+            starts_paragraph = start in paragraph_starts
+            tokens = self.count_tokens(match.group())
+            if tokens <= self.max_tokens:
+                yield start, end, tokens, starts_paragraph
+                continue
+            for piece in self._split_oversized(text, start, end):
+                yield piece[0], piece[1], piece[2], starts_paragraph
+                starts_paragraph = False
+
+    def _split_oversized(self, text: str, start: int, end: int) -> Iterator[Tuple[int, int, int]]:
+        budget = self.max_tokens - self.overlap_tokens
+        piece_start, piece_tokens = start, 0
+        for word in _WORD.finditer(text, start, end):
+            tokens = self.count_tokens(word.group())
+            if tokens > budget:
+                # 공백 없는 긴 문자열: 글자 단위로 자름
+                if piece_tokens:
+                    yield piece_start, word.start(), piece_tokens
+                yield from self._split_chars(text, word.start(), word.end(), tokens, budget)
+                piece_start, piece_tokens = word.end(), 0
+                continue
+            if piece_tokens + tokens > budget:
+                yield piece_start, word.start(), piece_tokens
+                piece_start, piece_tokens = word.start(), 0
+            piece_tokens += tokens
+        if piece_tokens:
+            yield piece_start, end, piece_tokens
+
+    def _split_chars(self, text: str, start: int, end: int, tokens: int, budget: int) -> Iterator[Tuple[int, int, int]]:
+        step = max(1, (end - start) * budget // tokens)
+        for piece_start in range(start, end, step):
+            piece_end = min(piece_start + step, end)
+            yield piece_start, piece_end, self.count_tokens(text[piece_start:piece_end])
+
+
+def get_default_chunker() -> TextChunker:
+    """설정값 기반 공용 청커"""
+    from app.core.config import settings
+
+    return TextChunker(
+        max_tokens=settings.EMBEDDING_CHUNK_MAX_TOKENS,
+        overlap_tokens=settings.EMBEDDING_CHUNK_OVERLAP_TOKENS,
+        token_counter=get_token_counter(settings.EMBEDDING_TOKENIZER_PATH),
+    )
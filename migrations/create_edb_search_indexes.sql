@@ -0,0 +1,18 @@
+-- EDB 벡터 문서 카탈로그 제목 검색 인덱스 (pg_trgm)
+-- 관리자 > 벡터 문서 목록의 제목 검색 (ILIKE '%검색어%', similarity 정렬)
+-- app/routers/admin/vector_documents.py list_vector_documents
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+-- 운영 중 테이블 잠금을 피하기 위해 CONCURRENTLY 사용 (트랜잭션 블록 밖에서 실행)
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_doc_bas_lst_doc_title_nm_trgm
+    ON wisenut.doc_bas_lst USING gin (doc_title_nm gin_trgm_ops);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_doc_bas_lst_doc_rep_title_nm_trgm
+    ON wisenut.doc_bas_lst USING gin (doc_rep_title_nm gin_trgm_ops);
+
+-- 목록 기본 정렬 (use_yn = 'Y' ORDER BY reg_dt DESC)
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_doc_bas_lst_use_yn_reg_dt
+    ON wisenut.doc_bas_lst (use_yn, reg_dt DESC);
+
+COMMENT ON INDEX wisenut.idx_doc_bas_lst_doc_title_nm_trgm IS '문서 제목 부분 일치 검색 (pg_trgm)';
+COMMENT ON INDEX wisenut.idx_doc_bas_lst_doc_rep_title_nm_trgm IS '문서 대표 제목 부분 일치 검색 (pg_trgm)';
@@ -0,0 +1,68 @@
+"""add unique session/question index to usage_history
+
+기존 중복 행(같은 session_id + question, id가 가장 작은 행만 유지)은 인덱스 생성 전에
+usage_history_duplicates_archive 테이블로 복사한 뒤 usage_history에서 삭제합니다.
+downgrade 시 보관한 행을 usage_history로 되돌립니다.
+
+Revision ID: f2g3h4i5j6k7
+Revises: e1f2g3h4i5j6
+Create Date: 2025-11-03 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f2g3h4i5j6k7'
+down_revision: Union[str, None] = 'e1f2g3h4i5j6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # usage_writer는 INSERT ... ON CONFLICT DO NOTHING으로 중복을 거르므로
+    # 기존 SELECT 기반 중복 검사를 DB unique index로 대체 (fix_duplicates.sql 1~2단계와 동일한 정리 후 생성)
+    # 삭제할 중복 행은 먼저 보관 테이블로 복사 (downgrade 시 복원)
+    op.execute("""
+        CREATE TABLE IF NOT EXISTS usage_history_duplicates_archive
+        AS SELECT * FROM usage_history WITH NO DATA
+    """)
+    op.execute("""
+        INSERT INTO usage_history_duplicates_archive
+        SELECT u1.* FROM usage_history u1
+        WHERE u1.session_id NOT LIKE 'title_gen_%'
+          AND EXISTS (
+              SELECT 1 FROM usage_history u2
+              WHERE u2.session_id = u1.session_id
+                AND u2.question = u1.question
+                AND u2.id < u1.id
+          )
+    """)
+    op.execute("""
+        DELETE FROM usage_history u1
+        USING usage_history u2
+        WHERE u2.session_id = u1.session_id
+          AND u2.question = u1.question
+          AND u2.id < u1.id
+          AND u1.session_id NOT LIKE 'title_gen_%'
+    """)
+
+    # question은 TEXT라 btree 행 크기 제한(2704 bytes)을 넘을 수 있어 md5 해시로 인덱싱
+    op.execute("""
+        CREATE UNIQUE INDEX IF NOT EXISTS idx_unique_session_question
+        ON usage_history (session_id, md5(question))
+        WHERE session_id NOT LIKE 'title_gen_%'
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS idx_unique_session_question")
+    op.execute("""
+        INSERT INTO usage_history
+        SELECT * FROM usage_history_duplicates_archive
+        ON CONFLICT (id) DO NOTHING
+    """)
+    op.execute("DROP TABLE IF EXISTS usage_history_duplicates_archive")
@@ -0,0 +1,60 @@
+"""add pii_scan_jobs and content hash to pii_detection_results
+
+Revision ID: g3h4i5j6k7l8
+Revises: f2g3h4i5j6k7
+Create Date: 2025-11-04 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'g3h4i5j6k7l8'
+down_revision: Union[str, None] = 'f2g3h4i5j6k7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 일괄 검사 시 내용이 바뀌지 않은 문서는 재검사하지 않도록 검사 당시 내용 해시 저장
+    op.add_column(
+        'pii_detection_results',
+        sa.Column('content_hash', sa.String(length=64), nullable=True,
+                  comment='검사한 문서 내용의 SHA-256 (변경 없으면 재검사 생략)')
+    )
+    op.create_index(
+        'idx_pii_detection_results_document_id',
+        'pii_detection_results',
+        ['document_id', 'id']
+    )
+
+    op.create_table(
+        'pii_scan_jobs',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('status', sa.String(length=20), nullable=False, comment='작업 상태'),
+        sa.Column('last_document_id', sa.Integer(), nullable=False, server_default='0',
+                  comment='마지막으로 처리한 문서 ID (재개 위치)'),
+        sa.Column('total_documents', sa.Integer(), nullable=False, server_default='0',
+                  comment='시작 시점 전체 문서 수'),
+        sa.Column('scanned_count', sa.Integer(), nullable=False, server_default='0', comment='검사한 문서 수'),
+        sa.Column('skipped_count', sa.Integer(), nullable=False, server_default='0',
+                  comment='내용 변경 없어 생략한 문서 수'),
+        sa.Column('detected_count', sa.Integer(), nullable=False, server_default='0',
+                  comment='PII가 검출된 문서 수'),
+        sa.Column('error_message', sa.Text(), nullable=True, comment='실패 사유'),
+        sa.Column('finished_at', sa.DateTime(timezone=True), nullable=True, comment='종료 시각'),
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_pii_scan_jobs_id'), 'pii_scan_jobs', ['id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_pii_scan_jobs_id'), table_name='pii_scan_jobs')
+    op.drop_table('pii_scan_jobs')
+    op.drop_index('idx_pii_detection_results_document_id', table_name='pii_detection_results')
+    op.drop_column('pii_detection_results', 'content_hash')
@@ -0,0 +1,67 @@
+"""add usage rollup tables
+
+Revision ID: h4i5j6k7l8m9
+Revises: g3h4i5j6k7l8
+Create Date: 2025-11-05 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'h4i5j6k7l8m9'
+down_revision: Union[str, None] = 'g3h4i5j6k7l8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _rollup_columns(bucket: sa.types.TypeEngine, bucket_comment: str):
+    return [
+        sa.Column('bucket', bucket, nullable=False, comment=bucket_comment),
+        sa.Column('department', sa.String(length=100), nullable=False,
+                  comment='부서 (usage_metadata.department, 없으면 미분류)'),
+        sa.Column('model_name', sa.String(length=100), nullable=False, comment='모델명 (없으면 빈 문자열)'),
+        sa.Column('main_category', sa.String(length=50), nullable=False, comment='대분류 (없으면 미분류)'),
+        sa.Column('question_count', sa.Integer(), nullable=False, comment='질문 수'),
+        sa.Column('response_count', sa.Integer(), nullable=False, comment='응답 시간이 기록된 질문 수'),
+        sa.Column('response_time_sum', sa.Float(), nullable=False, comment='응답 시간 합 (밀리초)'),
+        sa.Column('token_sum', sa.BigInteger(), nullable=False, comment='토큰 사용량 합'),
+        sa.PrimaryKeyConstraint('bucket', 'department', 'model_name', 'main_category'),
+    ]
+
+
+def upgrade() -> None:
+    # 통계 API용 시간별 / 일별 집계 (app/services/usage_rollup.py가 last_id 이후 행을 가산)
+    # 배포 후 집계 워커가 last_id=0부터 자동으로 과거 데이터를 채움
+    op.create_table(
+        'usage_rollup_hourly',
+        *_rollup_columns(sa.DateTime(timezone=True), '집계 시간 (정시)')
+    )
+    op.create_table(
+        'usage_rollup_daily',
+        *_rollup_columns(sa.Date(), '집계 날짜')
+    )
+    op.create_table(
+        'usage_rollup_daily_users',
+        sa.Column('bucket', sa.Date(), nullable=False, comment='집계 날짜'),
+        sa.Column('user_id', sa.String(length=100), nullable=False, comment='사용자 식별자'),
+        sa.PrimaryKeyConstraint('bucket', 'user_id')
+    )
+    op.create_table(
+        'usage_rollup_state',
+        sa.Column('name', sa.String(length=50), nullable=False, comment='집계 이름'),
+        sa.Column('last_id', sa.BigInteger(), nullable=False, server_default='0',
+                  comment='마지막으로 집계한 usage_history.id'),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True, comment='마지막 집계 시각'),
+        sa.PrimaryKeyConstraint('name')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('usage_rollup_state')
+    op.drop_table('usage_rollup_daily_users')
+    op.drop_table('usage_rollup_daily')
+    op.drop_table('usage_rollup_hourly')
@@ -0,0 +1,34 @@
+"""add generated department column to usage_history
+
+Revision ID: i5j6k7l8m9n0
+Revises: h4i5j6k7l8m9
+Create Date: 2025-11-06 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'i5j6k7l8m9n0'
+down_revision: Union[str, None] = 'h4i5j6k7l8m9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 부서별 통계를 Python 루프 대신 GROUP BY로 집계하도록 usage_metadata.department를 컬럼으로 저장
+    # STORED 생성 컬럼 추가 시 테이블을 한 번 다시 쓰므로 트래픽이 적은 시간에 실행
+    op.add_column(
+        'usage_history',
+        sa.Column('department', sa.Text(), sa.Computed("usage_metadata ->> 'department'", persisted=True),
+                  nullable=True, comment='부서 (usage_metadata.department 생성 컬럼)')
+    )
+    op.create_index(op.f('ix_usage_history_department'), 'usage_history', ['department'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_usage_history_department'), table_name='usage_history')
+    op.drop_column('usage_history', 'department')
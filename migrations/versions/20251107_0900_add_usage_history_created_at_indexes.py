@@ -0,0 +1,31 @@
+"""add created_at indexes to usage_history
+
+Revision ID: j6k7l8m9n0o1
+Revises: i5j6k7l8m9n0
+Create Date: 2025-11-07 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'j6k7l8m9n0o1'
+down_revision: Union[str, None] = 'i5j6k7l8m9n0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 기간 필터 (created_at >= start AND created_at < end+1일) / 사용자·세션별 최신순 조회용
+    op.create_index('ix_usage_history_created_at', 'usage_history', ['created_at'], unique=False)
+    op.create_index('ix_usage_history_user_id_created_at', 'usage_history', ['user_id', 'created_at'], unique=False)
+    op.create_index('ix_usage_history_session_id_created_at', 'usage_history', ['session_id', 'created_at'],
+                    unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_usage_history_session_id_created_at', table_name='usage_history')
+    op.drop_index('ix_usage_history_user_id_created_at', table_name='usage_history')
+    op.drop_index('ix_usage_history_created_at', table_name='usage_history')
@@ -0,0 +1,85 @@
+"""add full-text and trigram search to documents
+
+Revision ID: k7l8m9n0o1p2
+Revises: j6k7l8m9n0o1
+Create Date: 2025-11-08 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'k7l8m9n0o1p2'
+down_revision: Union[str, None] = 'j6k7l8m9n0o1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# app/services/document_search.py search_tokens()와 같은 규칙
+# 영문/숫자 단어는 그대로, 3글자 이상 한글 포함 단어는 2글자씩 겹쳐 자름
+SEARCH_TOKENS_FUNCTION = r"""
+CREATE OR REPLACE FUNCTION search_tokens(input text) RETURNS text
+LANGUAGE sql IMMUTABLE PARALLEL SAFE AS $$
+    SELECT coalesce(string_agg(
+        CASE
+            WHEN word ~ '[가-힣]' AND length(word) > 2 THEN (
+                SELECT string_agg(substr(word, i, 2), ' ' ORDER BY i)
+                FROM generate_series(1, length(word) - 1) AS i
+            )
+            ELSE word
+        END, ' ' ORDER BY n), '')
+    FROM regexp_split_to_table(lower(coalesce(input, '')), '[^0-9a-z가-힣]+') WITH ORDINALITY AS t(word, n)
+    WHERE word <> ''
+$$;
+"""
+
+# 제목 A / 파일명·요약 B / 본문 C 가중치, 본문은 앞 200,000자만 색인 (tsvector 1MB 제한)
+TRIGGER_FUNCTION = """
+CREATE OR REPLACE FUNCTION documents_search_vector_update() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    NEW.search_vector :=
+        setweight(to_tsvector('simple', search_tokens(NEW.title)), 'A') ||
+        setweight(to_tsvector('simple', search_tokens(NEW.file_name)), 'B') ||
+        setweight(to_tsvector('simple', search_tokens(NEW.summary)), 'B') ||
+        setweight(to_tsvector('simple', search_tokens(left(NEW.content, 200000))), 'C');
+    RETURN NEW;
+END
+$$;
+"""
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.add_column('documents', sa.Column('search_vector', postgresql.TSVECTOR(), nullable=True))
+
+    op.execute(SEARCH_TOKENS_FUNCTION)
+    op.execute(TRIGGER_FUNCTION)
+    op.execute("""
+        CREATE TRIGGER documents_search_vector_trigger
+        BEFORE INSERT OR UPDATE OF title, file_name, summary, content ON documents
+        FOR EACH ROW EXECUTE FUNCTION documents_search_vector_update()
+    """)
+    # 기존 문서 색인 (트리거 실행)
+    op.execute("UPDATE documents SET title = title")
+
+    op.create_index('ix_documents_search_vector', 'documents', ['search_vector'], unique=False,
+                    postgresql_using='gin')
+    op.create_index('ix_documents_title_trgm', 'documents', ['title'], unique=False,
+                    postgresql_using='gin', postgresql_ops={'title': 'gin_trgm_ops'})
+    op.create_index('ix_documents_file_name_trgm', 'documents', ['file_name'], unique=False,
+                    postgresql_using='gin', postgresql_ops={'file_name': 'gin_trgm_ops'})
+
+
+def downgrade() -> None:
+    op.drop_index('ix_documents_file_name_trgm', table_name='documents')
+    op.drop_index('ix_documents_title_trgm', table_name='documents')
+    op.drop_index('ix_documents_search_vector', table_name='documents')
+    op.execute("DROP TRIGGER IF EXISTS documents_search_vector_trigger ON documents")
+    op.execute("DROP FUNCTION IF EXISTS documents_search_vector_update()")
+    op.execute("DROP FUNCTION IF EXISTS search_tokens(text)")
+    op.drop_column('documents', 'search_vector')
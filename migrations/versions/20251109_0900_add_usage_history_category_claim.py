@@ -0,0 +1,30 @@
+"""add category_claimed_at lease column to usage_history
+
+Revision ID: l8m9n0o1p2q3
+Revises: k7l8m9n0o1p2
+Create Date: 2025-11-09 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'l8m9n0o1p2q3'
+down_revision: Union[str, None] = 'k7l8m9n0o1p2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 분류 워커가 행을 선점한 시각 (선점 후 커밋하고 트랜잭션 밖에서 vLLM 호출, 리스 만료 시 재선점)
+    op.add_column('usage_history', sa.Column(
+        'category_claimed_at', sa.DateTime(timezone=True), nullable=True,
+        comment='분류 워커 선점 시각 (리스)'
+    ))
+
+
+def downgrade() -> None:
+    op.drop_column('usage_history', 'category_claimed_at')
@@ -0,0 +1,45 @@
+"""add rolled_up_category marker to usage_history
+
+Revision ID: m9n0o1p2q3r4
+Revises: l8m9n0o1p2q3
+Create Date: 2025-11-10 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'm9n0o1p2q3r4'
+down_revision: Union[str, None] = 'l8m9n0o1p2q3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 집계에 반영된 대분류 - id high-water mark 대신 행 단위로 집계 여부를 기록
+    # (늦게 커밋된 낮은 id 행 누락 방지, 집계 후 분류된 행 보정)
+    op.add_column('usage_history', sa.Column(
+        'rolled_up_category', sa.String(50), nullable=True,
+        comment='집계에 반영된 대분류 (NULL이면 미집계)'
+    ))
+
+    # 기존 high-water mark 이하 행은 현재 대분류로 집계된 것으로 간주
+    # (settle 이후 '미분류'로 집계되었다가 분류된 행은 scripts/rebuild_usage_rollups.py로 보정)
+    op.execute("""
+        UPDATE usage_history
+        SET rolled_up_category = COALESCE(main_category, '미분류')
+        WHERE id <= COALESCE((SELECT last_id FROM usage_rollup_state WHERE name = 'usage'), 0)
+    """)
+
+    op.create_index(
+        'ix_usage_history_rollup_pending', 'usage_history', ['id'], unique=False,
+        postgresql_where=sa.text('rolled_up_category IS NULL'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_usage_history_rollup_pending', table_name='usage_history')
+    op.drop_column('usage_history', 'rolled_up_category')
@@ -0,0 +1,42 @@
+"""
+사용 이력 집계(rollup) 재생성 스크립트
+
+사용법:
+    # 전체 재집계 (집계 테이블을 비우고 처음부터 다시 쌓음)
+    python -m scripts.rebuild_usage_rollups
+
+    # 기간 재집계 (해당 날짜의 집계만 다시 계산, 날짜는 STATS_TIMEZONE 기준)
+    python -m scripts.rebuild_usage_rollups --start 2025-10-01 --end 2025-10-31
+
+    # 밀린 집계만 따라잡기
+    python -m scripts.rebuild_usage_rollups --catch-up
+"""
+import argparse
+import asyncio
+from datetime import date
+
+from app.services.usage_rollup import usage_rollup
+
+
+async def main(args) -> None:
+    if args.catch_up:
+        total = await usage_rollup.catch_up()
+        print(f"✅ 집계 반영: {total}건 (last_id={usage_rollup.stats.last_id})")
+        return
+
+    start = date.fromisoformat(args.start) if args.start else None
+    end = date.fromisoformat(args.end) if args.end else None
+    if start and end and end < start:
+        raise SystemExit("종료 날짜는 시작 날짜보다 늦어야 합니다")
+
+    total = await usage_rollup.rebuild(start, end)
+    period = f"{start or '처음'} ~ {end or '현재'}" if (start or end) else "전체"
+    print(f"✅ 재집계 완료 ({period}): {total}건")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="usage_history 시간별/일별 집계 재생성")
+    parser.add_argument("--start", help="시작 날짜 (YYYY-MM-DD, 포함)")
+    parser.add_argument("--end", help="종료 날짜 (YYYY-MM-DD, 포함)")
+    parser.add_argument("--catch-up", action="store_true", help="재생성 없이 밀린 집계만 반영")
+    asyncio.run(main(parser.parse_args()))
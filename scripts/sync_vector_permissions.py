@@ -0,0 +1,33 @@
+"""
+문서 열람 권한 Qdrant payload 재동기화 스크립트
+
+RAG 검색은 point payload의 access_departments로 부서 권한을 필터링합니다.
+서버의 권한 동기화 워커는 시작 시 access_departments가 없는 point가 있을 때만 전체 재동기화하므로,
+이 스크립트는 워커를 끈 환경(VECTOR_PERMISSION_SYNC_ENABLED=false)이나
+동기화 대기열(프로세스 메모리)이 반영되기 전에 서버가 종료된 경우의 보정에 사용합니다.
+
+사용법:
+    # 전체 문서 재동기화 (payload 인덱스 생성 포함)
+    python -m scripts.sync_vector_permissions
+
+    # 특정 문서만
+    python -m scripts.sync_vector_permissions --document-id 12 --document-id 15
+"""
+import argparse
+import asyncio
+
+from app.services.vector_permission_sync import vector_permission_sync
+
+
+async def main(args) -> None:
+    if args.document_id:
+        total = await vector_permission_sync.sync_documents(args.document_id)
+    else:
+        total = await vector_permission_sync.sync_all()
+    print(f"✅ 권한 동기화 완료: {total}개 문서 (collection={vector_permission_sync.collection})")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="문서 열람 권한을 Qdrant payload(access_departments)에 반영")
+    parser.add_argument("--document-id", type=int, action="append", help="동기화할 문서 ID (여러 번 지정 가능)")
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,182 @@
+"""
+채팅 턴 저장 테스트
+단일 트랜잭션 / 다건 INSERT / 연결 종료 시 질문 저장 / 대화방 소유권 확인 캐시 검증
+"""
+import asyncio
+import json
+from unittest.mock import patch
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.models.chat_models import (
+    Conversation,
+    ConversationSummary,
+    ReferenceDocument,
+    SuggestedQuestion,
+)
+from app.schemas.chat_schemas import ChatRequest
+from app.services import chat_service
+from app.services.chat_service import (
+    RoomValidityCache,
+    generate_chat_stream,
+    room_validity_cache,
+    save_chat_turn,
+    validate_room_id,
+)
+
+SEARCH_RESULTS = [
+    {"metadata": {"title": f"문서{i}.pdf"}, "chunk_text": f"참조 내용 {i}", "score": 0.9 - i / 10}
+    for i in range(5)
+]
+
+
+@pytest_asyncio.fixture
+async def engine():
+    engine = create_async_engine("sqlite+aiosqlite://")
+    tables = [
+        ConversationSummary.__table__,
+        Conversation.__table__,
+        ReferenceDocument.__table__,
+        SuggestedQuestion.__table__,
+    ]
+    async with engine.begin() as conn:
+        await conn.run_sync(lambda sync_conn: ConversationSummary.metadata.create_all(sync_conn, tables=tables))
+    room_validity_cache.clear()
+    yield engine
+    room_validity_cache.clear()
+    await engine.dispose()
+
+
+@pytest_asyncio.fixture
+async def session(engine):
+    async with async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)() as session:
+        yield session
+
+
+async def scalar(session, sql, **params):
+    return (await session.execute(text(sql), params)).scalar()
+
+
+@pytest.mark.asyncio
+class TestSaveChatTurn:
+
+    async def test_single_commit_with_bulk_children(self, engine, session, count_queries):
+        with patch.object(session, "commit", wraps=session.commit) as commit:
+            with count_queries(engine) as statements:
+                cnvs_id = await save_chat_turn(
+                    session, "u1_room", "u1", "질문", answer="답변", token_count=3, response_time_ms=120,
+                    search_results=SEARCH_RESULTS, suggested_questions=["추천1", "추천2"], new_room=True,
+                )
+
+        assert commit.call_count == 1
+        # 대화방 + 메시지 + 참조 문서(executemany 1회) + 추천 질문(executemany 1회)
+        inserts = [s for s in statements if s.lstrip().upper().startswith("INSERT")]
+        assert len(inserts) == 4
+
+        assert await scalar(session, 'SELECT "USR_ID" FROM "USR_CNVS_SMRY" WHERE "CNVS_IDT_ID" = :r', r="u1_room") == "u1"
+        assert await scalar(session, 'SELECT "ANS_TXT" FROM "USR_CNVS" WHERE "CNVS_ID" = :c', c=cnvs_id) == "답변"
+        refs = (await session.execute(text(
+            'SELECT "REF_SEQ", "ATT_DOC_NM" FROM "USR_CNVS_REF_DOC_LST" WHERE "CNVS_ID" = :c ORDER BY "REF_SEQ"'
+        ), {"c": cnvs_id})).all()
+        assert [tuple(r) for r in refs] == [(i, f"문서{i}.pdf") for i in range(5)]
+        assert await scalar(session, 'SELECT COUNT(*) FROM "USR_CNVS_ADD_QUES_LST" WHERE "CNVS_ID" = :c', c=cnvs_id) == 2
+
+        # 새 대화방은 저장 후 캐시에 등록되어 다음 턴에서 COUNT 조회 생략
+        with count_queries(engine) as statements:
+            assert await validate_room_id("u1_room", "u1", session, use_cache=True)
+        assert statements == []
+
+    async def test_failure_rolls_back_whole_turn(self, session):
+        with pytest.raises(KeyError):
+            await save_chat_turn(
+                session, "u1_room", "u1", "질문", answer="답변",
+                search_results=[{"chunk_text": "제목 없음", "score": 0.5}], new_room=True,
+            )
+
+        assert await scalar(session, 'SELECT COUNT(*) FROM "USR_CNVS_SMRY"') == 0
+        assert await scalar(session, 'SELECT COUNT(*) FROM "USR_CNVS"') == 0
+        assert room_validity_cache.get("u1_room", "u1") is False
+
+    async def test_stream_writes_turn_once_after_response(self, session):
+        async def fake_stream(**kwargs):
+            for chunk in ("안녕", "하세요"):
+                yield chunk
+
+        with patch("app.services.chat_service.ai_service") as mock_ai, \
+                patch.object(session, "commit", wraps=session.commit) as commit:
+            mock_ai.stream_chat = fake_stream
+            events = [e async for e in generate_chat_stream(ChatRequest(message="질문"), "u1", session)]
+
+        assert commit.call_count == 1
+        assert events[-1] == "data: [DONE]\n\n"
+        assert await scalar(session, 'SELECT "ANS_TXT" FROM "USR_CNVS"') == "안녕하세요"
+
+    async def test_stream_error_keeps_question(self, session):
+        async def broken_stream(**kwargs):
+            yield "부분"
+            raise RuntimeError("upstream closed")
+
+        with patch("app.services.chat_service.ai_service") as mock_ai:
+            mock_ai.stream_chat = broken_stream
+            events = [e async for e in generate_chat_stream(ChatRequest(message="질문"), "u1", session)]
+
+        assert "error" in json.loads(events[-2][len("data: "):])
+        assert await scalar(session, 'SELECT COUNT(*) FROM "USR_CNVS_SMRY"') == 1
+        assert await scalar(session, 'SELECT "QUES_TXT" FROM "USR_CNVS" WHERE "ANS_TXT" IS NULL') == "질문"
+
+    async def test_client_disconnect_keeps_room_and_question(self, engine, session, monkeypatch):
+        async def slow_stream(**kwargs):
+            yield "부분"
+            await asyncio.sleep(10)
+            yield "나머지"
+
+        monkeypatch.setattr(
+            "app.core.database.AsyncSessionLocal",
+            async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+        )
+        with patch("app.services.chat_service.ai_service") as mock_ai:
+            mock_ai.stream_chat = slow_stream
+            stream = generate_chat_stream(ChatRequest(message="질문"), "u1", session)
+            room_created = json.loads((await stream.__anext__())[len("data: "):])
+            await stream.__anext__()
+            await stream.aclose()  # 응답 도중 클라이언트 연결 종료
+            await asyncio.gather(*chat_service._disconnect_saves)
+
+        room_id = room_created["room_id"]
+        assert await scalar(session, 'SELECT "USR_ID" FROM "USR_CNVS_SMRY" WHERE "CNVS_IDT_ID" = :r', r=room_id) == "u1"
+        assert await scalar(session, 'SELECT "QUES_TXT" FROM "USR_CNVS" WHERE "ANS_TXT" IS NULL') == "질문"
+        # 다음 턴에서 같은 room_id로 이어서 대화 가능
+        assert await validate_room_id(room_id, "u1", session, use_cache=False)
+
+
+class TestRoomValidityCache:
+
+    def test_owner_and_ttl(self):
+        cache = RoomValidityCache(ttl=60, max_size=2)
+        cache.add("room1", "u1")
+
+        assert cache.get("room1", "u1") is True
+        assert cache.get("room1", "u2") is False
+
+        cache.discard("room1")
+        assert cache.get("room1", "u1") is False
+
+    def test_expired_and_evicted(self):
+        cache = RoomValidityCache(ttl=60, max_size=2)
+        with patch("app.services.chat_service.time.monotonic", return_value=0):
+            cache.add("room1", "u1")
+            cache.add("room2", "u1")
+            cache.add("room3", "u1")
+        with patch("app.services.chat_service.time.monotonic", return_value=30):
+            assert cache.get("room1", "u1") is False  # 최대 개수 초과로 제거
+            assert cache.get("room3", "u1") is True
+        with patch("app.services.chat_service.time.monotonic", return_value=61):
+            assert cache.get("room3", "u1") is False
+
+    def test_disabled(self):
+        cache = RoomValidityCache(ttl=0)
+        cache.add("room1", "u1")
+        assert cache.get("room1", "u1") is False
@@ -11,7 +11,7 @@ from sqlalchemy.pool import NullPool
 
 from app.main import app
 from app.models.base import Base
-from app.core.database import get_db
+from app.core.database import get_db, get_analytics_db
 
 
 # Test database URL (use existing admin_db for testing)
@@ -59,6 +59,7 @@ async def client(db_session: AsyncSession) -> AsyncGenerator[AsyncClient, None]:
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_analytics_db] = override_get_db
 
     async with AsyncClient(
         transport=ASGITransport(app=app),
@@ -158,6 +159,7 @@ async def authenticated_client(
         return True
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_analytics_db] = override_get_db
     app.dependency_overrides[get_principal] = override_get_principal
     app.dependency_overrides[get_cerbos_client] = override_get_cerbos
 
@@ -169,3 +171,33 @@ async def authenticated_client(
         yield ac
 
     app.dependency_overrides.clear()
+
+
+@pytest.fixture
+def count_queries():
+    """
+    Count SQL statements executed on an engine
+
+    Usage:
+        with count_queries(engine) as statements:
+            ...
+        assert len(statements) == 3
+    """
+    from contextlib import contextmanager
+    from sqlalchemy import event
+
+    @contextmanager
+    def _count(engine):
+        statements = []
+        target = getattr(engine, "sync_engine", engine)
+
+        def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(target, "before_cursor_execute", before_cursor_execute)
+        try:
+            yield statements
+        finally:
+            event.remove(target, "before_cursor_execute", before_cursor_execute)
+
+    return _count
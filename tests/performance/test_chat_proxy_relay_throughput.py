@@ -0,0 +1,92 @@
+"""
+chat_proxy SSE 릴레이 부하 테스트 (가짜 로컬 SSE 업스트림)
+
+기존 경로 (줄마다 json.loads → 재직렬화 → 전달)와 릴레이 모드 (청크 그대로 전달 + 증분 파서)의
+CPU 1코어당 초당 토큰 수 비교. 업스트림은 프로세스 내 httpx MockTransport로 ds-api 형식 SSE를
+청크 단위로 흘려보내므로 네트워크 / LLM 지연 없이 프록시 CPU 비용만 측정합니다.
+
+실행:
+    pytest tests/performance/test_chat_proxy_relay_throughput.py -s
+    (RELAY_BENCH_STREAMS / RELAY_BENCH_TOKENS 로 동시 스트림 수 / 스트림당 토큰 수 조정)
+"""
+import asyncio
+import json
+import os
+import time
+
+import httpx
+import pytest
+
+from app.core.config import settings
+from app.routers import chat_proxy
+from app.routers.chat_proxy import ChatStreamRequest, chat_stream_proxy
+
+STREAMS = int(os.getenv("RELAY_BENCH_STREAMS", "50"))
+TOKENS_PER_STREAM = int(os.getenv("RELAY_BENCH_TOKENS", "400"))
+UPSTREAM_CHUNK_BYTES = 512  # ds-api 응답이 TCP에서 잘려 오는 크기 흉내
+
+
+def build_stream(tokens: int) -> bytes:
+    events = [{"type": "sources", "sources": [{"title": f"문서{i}.pdf", "score": 0.9} for i in range(5)]}]
+    events += [{"type": "token", "content": f"토큰{i} "} for i in range(tokens)]
+    events.append({"type": "final", "usage": {"prompt_tokens": 300, "completion_tokens": tokens, "total_tokens": 300 + tokens}})
+    body = "".join(f"data: {json.dumps(event, ensure_ascii=False)}\n\n" for event in events)
+    return (body + "data: [DONE]\n\n").encode("utf-8")
+
+
+@pytest.fixture
+def fake_upstream(monkeypatch):
+    stream = build_stream(TOKENS_PER_STREAM)
+
+    async def body():
+        for i in range(0, len(stream), UPSTREAM_CHUNK_BYTES):
+            yield stream[i:i + UPSTREAM_CHUNK_BYTES]
+
+    def handler(request):
+        return httpx.Response(200, content=body(), headers={"content-type": "text/event-stream"})
+
+    client = httpx.AsyncClient(
+        transport=httpx.MockTransport(handler),
+        limits=httpx.Limits(max_connections=STREAMS),
+    )
+    monkeypatch.setattr(chat_proxy.http_clients, "get", lambda name: client)
+    submitted = []
+    monkeypatch.setattr(chat_proxy.usage_writer, "submit", lambda **row: submitted.append(row))
+    return submitted
+
+
+async def run(relay: bool) -> float:
+    """STREAMS개 스트림을 동시에 끝까지 읽음 → CPU 1초당 토큰 수"""
+    settings.CHAT_PROXY_RELAY_MODE = relay
+
+    async def client(n):
+        request = ChatStreamRequest(message="질문", session_id=f"bench_{n}", user_id="bench", file_ids=["f"])
+        response = await chat_stream_proxy(request, db=None)
+        async for _ in response.body_iterator:
+            pass
+
+    cpu_started = time.process_time()
+    await asyncio.gather(*(client(n) for n in range(STREAMS)))
+    cpu_seconds = time.process_time() - cpu_started
+    return STREAMS * TOKENS_PER_STREAM / cpu_seconds
+
+
+@pytest.mark.slow
+@pytest.mark.asyncio
+async def test_relay_mode_tokens_per_core(fake_upstream, monkeypatch):
+    monkeypatch.setattr(settings, "CHAT_PROXY_RELAY_MODE", settings.CHAT_PROXY_RELAY_MODE)
+
+    await run(relay=True)  # 워밍업
+    legacy = await run(relay=False)
+    relay = await run(relay=True)
+
+    print(
+        f"\n{STREAMS}개 스트림 x {TOKENS_PER_STREAM}토큰 - "
+        f"기존 {legacy:,.0f} tokens/s/core → 릴레이 {relay:,.0f} tokens/s/core ({relay / legacy:.1f}배)"
+    )
+
+    # 두 경로 모두 같은 답변 / 토큰 수 저장
+    answers = {row["answer"] for row in fake_upstream}
+    assert len(answers) == 1
+    assert fake_upstream[-1]["usage_metadata"]["completion_tokens"] == TOKENS_PER_STREAM
+    assert relay > legacy * 1.5
@@ -0,0 +1,100 @@
+"""
+채팅 턴 저장 처리량 벤치마크 (로컬 PostgreSQL)
+
+기존 경로 (질문 INSERT 커밋 → 답변 UPDATE 커밋 → 참조 문서 행별 INSERT 커밋, 턴마다 COUNT 검증)와
+단일 트랜잭션 경로 (save_chat_turn + 대화방 확인 캐시)의 초당 턴 저장 수 비교
+
+실행:
+    pytest tests/performance/test_chat_turn_throughput.py -s
+    (BENCHMARK_DATABASE_URL 미지정 시 tests/conftest.py의 TEST_DATABASE_URL 사용)
+"""
+import asyncio
+import os
+import time
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.services.chat_service import (
+    create_room,
+    room_validity_cache,
+    save_answer,
+    save_chat_turn,
+    save_question,
+    save_reference_documents,
+    validate_room_id,
+)
+from tests.conftest import TEST_DATABASE_URL
+
+DATABASE_URL = os.getenv("BENCHMARK_DATABASE_URL", TEST_DATABASE_URL)
+CONCURRENCY = 16
+TURNS_PER_WORKER = 25
+ROOM_PREFIX = "bench_turn_"
+
+SEARCH_RESULTS = [
+    {"metadata": {"title": f"문서{i}.pdf"}, "chunk_text": "참조 내용 " * 50, "score": 0.9}
+    for i in range(5)
+]
+
+
+async def legacy_turn(db, room_id, user_id):
+    assert await validate_room_id(room_id, user_id, db)
+    cnvs_id = await save_question(db, room_id, "벤치마크 질문")
+    await save_answer(db, cnvs_id, "벤치마크 답변 " * 100, 200, 1500)
+    await save_reference_documents(db, cnvs_id, SEARCH_RESULTS)
+
+
+async def unit_of_work_turn(db, room_id, user_id):
+    assert await validate_room_id(room_id, user_id, db, use_cache=True)
+    await save_chat_turn(
+        db, room_id, user_id, "벤치마크 질문", answer="벤치마크 답변 " * 100,
+        token_count=200, response_time_ms=1500, search_results=SEARCH_RESULTS,
+        suggested_questions=["추천 질문 1", "추천 질문 2"],
+    )
+
+
+async def run(factory, turn, label):
+    """CONCURRENCY개 세션이 각자 대화방에서 TURNS_PER_WORKER턴 저장 → 초당 턴 수"""
+    async def worker(n):
+        room_id, user_id = f"{ROOM_PREFIX}{label}_{n}", f"bench_user_{n}"
+        async with factory() as db:
+            await create_room(db, room_id, user_id, "벤치마크")
+            for _ in range(TURNS_PER_WORKER):
+                await turn(db, room_id, user_id)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker(n) for n in range(CONCURRENCY)))
+    elapsed = time.perf_counter() - started
+    return CONCURRENCY * TURNS_PER_WORKER / elapsed
+
+
+async def cleanup(factory):
+    async with factory() as db:
+        rooms = f"SELECT \"CNVS_ID\" FROM \"USR_CNVS\" WHERE \"CNVS_IDT_ID\" LIKE '{ROOM_PREFIX}%'"
+        await db.execute(text(f'DELETE FROM "USR_CNVS_REF_DOC_LST" WHERE "CNVS_ID" IN ({rooms})'))
+        await db.execute(text(f'DELETE FROM "USR_CNVS_ADD_QUES_LST" WHERE "CNVS_ID" IN ({rooms})'))
+        await db.execute(text(f"DELETE FROM \"USR_CNVS\" WHERE \"CNVS_IDT_ID\" LIKE '{ROOM_PREFIX}%'"))
+        await db.execute(text(f"DELETE FROM \"USR_CNVS_SMRY\" WHERE \"CNVS_IDT_ID\" LIKE '{ROOM_PREFIX}%'"))
+        await db.commit()
+
+
+@pytest.mark.slow
+@pytest.mark.asyncio
+async def test_unit_of_work_turn_throughput():
+    engine = create_async_engine(DATABASE_URL, pool_size=CONCURRENCY, max_overflow=0)
+    factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    room_validity_cache.clear()
+    try:
+        await cleanup(factory)
+        legacy_tps = await run(factory, legacy_turn, "legacy")
+        uow_tps = await run(factory, unit_of_work_turn, "uow")
+    finally:
+        await cleanup(factory)
+        room_validity_cache.clear()
+        await engine.dispose()
+
+    print(f"\nlegacy: {legacy_tps:,.1f} turns/s, unit of work: {uow_tps:,.1f} turns/s "
+          f"(x{uow_tps / legacy_tps:.2f})")
+    # 커밋 3회 + 행별 INSERT 5회 + COUNT → 커밋 1회 + executemany 2회
+    assert uow_tps > legacy_tps
@@ -0,0 +1,87 @@
+"""
+부서별 통계 메모리 회귀 벤치마크
+
+부서별 집계를 DB GROUP BY(상위 N + 그 외)로 수행하므로
+usage_history 행 수가 10배로 늘어도 애플리케이션 메모리 사용량은 일정해야 합니다.
+(로컬 SQLite 파일 DB에 100만 건 이상 적재 후 tracemalloc 최고치 비교)
+"""
+import json
+import sqlite3
+import time
+import tracemalloc
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import create_engine, func
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.models import UsageHistory
+from app.routers.admin.statistics import OTHER_LABEL, build_top_n_query
+
+DEPARTMENTS = 150
+TOP_N = 20
+
+
+def seed_usage(path, rows: int) -> None:
+    """usage_history에 rows건 적재 (부서 150개, 일부는 부서 정보 없음)"""
+    engine = create_engine(f"sqlite:///{path}")
+    UsageHistory.metadata.create_all(engine, tables=[UsageHistory.__table__])
+    engine.dispose()
+
+    base = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+    def generate():
+        for i in range(rows):
+            metadata = json.dumps({"department": f"D{i % DEPARTMENTS:03d}"}) if i % 10 else None
+            created_at = (base + timedelta(seconds=i * 20)).isoformat(sep=" ")
+            yield (f"user{i % 5000}", "질문", 1000.0 + i % 500, metadata, 0, created_at, created_at)
+
+    conn = sqlite3.connect(path)
+    conn.executemany(
+        "INSERT INTO usage_history (user_id, question, response_time, usage_metadata, is_deleted, created_at, updated_at)"
+        " VALUES (?, ?, ?, ?, ?, ?, ?)",
+        generate(),
+    )
+    conn.commit()
+    conn.close()
+
+
+async def measure(path):
+    """부서별 집계 1회 실행 시 (결과, 메모리 최고치 bytes, 소요 시간)"""
+    engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+    query = build_top_n_query(func.coalesce(UsageHistory.department, "미분류"), [], TOP_N)
+    try:
+        async with engine.connect() as conn:
+            await conn.execute(query)  # 쿼리 컴파일 캐시 등 1회성 비용 제외
+            tracemalloc.start()
+            started = time.perf_counter()
+            rows = (await conn.execute(query)).all()
+            elapsed = time.perf_counter() - started
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+    finally:
+        await engine.dispose()
+    return rows, peak, elapsed
+
+
+@pytest.mark.slow
+@pytest.mark.asyncio
+async def test_department_stats_memory_is_constant(tmp_path):
+    small, large = 100_000, 1_100_000
+    results = {}
+    for size in (small, large):
+        path = tmp_path / f"usage_{size}.db"
+        seed_usage(path, size)
+        results[size] = await measure(path)
+
+    for size, (rows, peak, elapsed) in results.items():
+        print(f"\n{size:>9,} rows: peak {peak / 1024:.1f} KiB, {elapsed:.2f}s")
+        # 상위 N개 + 그 외 1행만 애플리케이션으로 전달
+        assert len(rows) == TOP_N + 1
+        assert rows[-1].key == OTHER_LABEL
+        assert sum(row.count for row in rows) == size
+        assert rows[0].key == "미분류"  # 부서 정보 없는 10%
+
+    small_peak, large_peak = results[small][1], results[large][1]
+    # 11배 많은 행에서도 메모리 최고치는 사실상 같음 (행 수에 비례하지 않음)
+    assert large_peak < small_peak * 1.5 + 64 * 1024
@@ -0,0 +1,95 @@
+"""
+동의어 치환 벤치마크 (10만 용어 사전)
+
+기존 경로 (쿼리마다 전체 동의어를 길이순 정렬 후 동의어별 부분 문자열 검사)와
+컴파일된 사전 (trie 최장 일치, 쿼리 1회 순회)의 쿼리당 치환 시간 비교
+
+실행:
+    pytest tests/performance/test_dictionary_throughput.py -s
+"""
+import random
+import re
+import time
+
+import pytest
+
+from app.services.dictionary_service import CompiledDictionary
+
+TERMS = 100_000
+QUERIES = 200
+LEGACY_QUERIES = 3
+SYLLABLES = [chr(code) for code in range(0xAC00, 0xAC00 + 400)]
+
+
+def build_cache(terms=TERMS, seed=7):
+    """용어 1개당 정식명칭 + 약칭 2개 (word_boundary 항목과 공백 무시 항목 혼합)"""
+    rng = random.Random(seed)
+    cache = {}
+    for i in range(terms):
+        formal = "".join(rng.choices(SYLLABLES, k=rng.randint(4, 8)))
+        flexible = i % 4 == 0
+        for synonym in (formal, formal[:2] + formal[-1], f"T{i}"):
+            cache[synonym.lower()] = {"formal_name": formal, "case_sensitive": False, "word_boundary": not flexible}
+    return cache
+
+
+def build_queries(cache, count=QUERIES, seed=11):
+    rng = random.Random(seed)
+    synonyms = list(cache)
+    queries = []
+    for _ in range(count):
+        words = ["".join(rng.choices(SYLLABLES, k=rng.randint(1, 4))) for _ in range(12)]
+        for _ in range(3):
+            words.insert(rng.randrange(len(words)), rng.choice(synonyms))
+        queries.append(" ".join(words) + "에 대해 알려줘")
+    return queries
+
+
+def legacy_replace(cache, query):
+    """기존 DictionaryService.replace_query 치환 루프 (DB/로그 제외)"""
+    replaced_query = query
+    for synonym in sorted(cache.keys(), key=len, reverse=True):
+        entry = cache[synonym]
+        formal_name = entry["formal_name"]
+        if formal_name.lower() == synonym.lower():
+            continue
+        if entry["word_boundary"]:
+            pattern = re.compile(re.escape(synonym), re.IGNORECASE)
+            if pattern.search(replaced_query):
+                replaced_query = pattern.sub(formal_name, replaced_query)
+        else:
+            synonym_no_space = synonym.replace(' ', '')
+            if synonym_no_space.lower() in replaced_query.replace(' ', '').lower():
+                flexible_pattern = '\\s*'.join([re.escape(char) for char in synonym_no_space])
+                pattern = re.compile(flexible_pattern, re.IGNORECASE)
+                replaced_query = pattern.sub(formal_name, replaced_query, count=1)
+    return replaced_query
+
+
+@pytest.mark.slow
+def test_compiled_dictionary_vs_legacy_scan():
+    cache = build_cache()
+    queries = build_queries(cache)
+
+    started = time.perf_counter()
+    compiled = CompiledDictionary(cache)
+    build_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    for query in queries[:LEGACY_QUERIES]:
+        legacy_replace(cache, query)
+    legacy_per_query = (time.perf_counter() - started) / LEGACY_QUERIES
+
+    started = time.perf_counter()
+    for query in queries:
+        compiled.replace(query)
+    compiled_per_query = (time.perf_counter() - started) / len(queries)
+
+    print(
+        f"\n동의어 {len(cache):,}개 - 컴파일 {build_seconds:.2f}s / "
+        f"기존 {legacy_per_query * 1000:.1f}ms/쿼리 → 컴파일 {compiled_per_query * 1000:.3f}ms/쿼리 "
+        f"({legacy_per_query / compiled_per_query:.0f}배)"
+    )
+
+    assert compiled_per_query < 0.001
+    assert compiled_per_query * 50 < legacy_per_query
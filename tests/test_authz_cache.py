@@ -0,0 +1,245 @@
+"""
+Cerbos 판정 캐시 테스트
+로컬 정책 평가기 / 캐시 적중 시 PDP 미호출 / 일괄 CheckResources / 정책 버전 무효화 검증
+"""
+import os
+import shutil
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from cerbos.sdk.model import Principal, Resource, ResourceAction, ResourceList
+from fastapi import HTTPException
+
+from app.dependencies import (
+    CachedCerbosClient,
+    DecisionCache,
+    check_resource_permission,
+    check_resources_permission,
+)
+from app.services.cerbos_local import LocalPolicyEvaluator
+
+POLICY_DIR = Path(__file__).resolve().parents[1] / "policies" / "policies"
+
+ADMIN = Principal(id="admin1", roles={"admin"}, attr={"department": "본사"})
+USER = Principal(id="user1", roles={"user"}, attr={"department": "본사"})
+
+
+def documents(count, department="본사"):
+    return [Resource(id=str(i), kind="document", attr={"department": department}) for i in range(count)]
+
+
+@pytest.fixture
+def evaluator():
+    return LocalPolicyEvaluator(str(POLICY_DIR))
+
+
+@pytest.fixture
+def cerbos(evaluator):
+    return CachedCerbosClient(evaluator, DecisionCache(ttl=30, max_size=1000), batch_size=50)
+
+
+@pytest.mark.asyncio
+class TestLocalPolicyEvaluator:
+
+    async def test_roles_and_conditions(self, evaluator):
+        async def allowed(principal, resource, action):
+            result = await evaluator.check_resources(
+                principal, ResourceList(resources=[ResourceAction(resource=resource, actions=[action])])
+            )
+            return result.results[0].is_allowed(action)
+
+        own = Resource(id="d1", kind="document", attr={"department": "본사"})
+        other = Resource(id="d2", kind="document", attr={"department": "지사"})
+
+        assert await allowed(ADMIN, other, "delete")
+        assert await allowed(USER, own, "read")
+        assert not await allowed(USER, other, "read")
+        assert not await allowed(USER, own, "delete")
+        # request.resource.id == request.principal.id 조건
+        assert await allowed(USER, Resource(id="user1", kind="user"), "read")
+        assert not await allowed(USER, Resource(id="user2", kind="user"), "read")
+        # 정책 없는 리소스는 거부
+        assert not await allowed(ADMIN, Resource(id="x", kind="unknown"), "read")
+
+
+@pytest.mark.asyncio
+class TestCachedCerbosClient:
+
+    async def test_cache_hit_skips_pdp(self, cerbos, evaluator):
+        resource = Resource(id="any", kind="notice")
+
+        assert await check_resource_permission(ADMIN, resource, "create", cerbos)
+        assert await check_resource_permission(ADMIN, resource, "create", cerbos)
+        assert evaluator.calls == 1
+        assert cerbos.cache.hits == 1
+
+        # 다른 역할/속성의 Principal은 별도 판정
+        with pytest.raises(HTTPException) as exc:
+            await check_resource_permission(USER, resource, "create", cerbos)
+        assert exc.value.status_code == 403
+        assert evaluator.calls == 2
+
+    async def test_batch_sends_only_misses_in_chunks(self, cerbos, evaluator):
+        rows = documents(60) + documents(60, department="지사")
+        for i, resource in enumerate(rows):
+            resource.id = str(i)
+
+        decisions = await check_resources_permission(USER, rows, "read", cerbos)
+
+        assert evaluator.calls == 3  # 120건 / 50건 단위
+        assert [decisions[str(i)] for i in range(120)] == [True] * 60 + [False] * 60
+
+        more = rows + [Resource(id="new", kind="document", attr={"department": "본사"})]
+        decisions = await check_resources_permission(USER, more, "read", cerbos)
+
+        assert evaluator.calls == 4
+        assert evaluator.checked_resources == 121
+        assert decisions["new"] is True
+
+    async def test_results_keep_request_order(self, cerbos):
+        await check_resources_permission(USER, documents(3), "read", cerbos)
+        mixed = [Resource(id="9", kind="document", attr={"department": "지사"})] + documents(3)
+
+        result = await cerbos.check_resources(
+            USER, ResourceList(resources=[ResourceAction(resource=r, actions=["read"]) for r in mixed])
+        )
+
+        assert [r.resource.id for r in result.results] == ["9", "0", "1", "2"]
+        assert [r.is_allowed("read") for r in result.results] == [False, True, True, True]
+
+    async def test_pdp_error_is_not_cached(self, cerbos, evaluator):
+        resource = Resource(id="any", kind="notice")
+        with patch.object(evaluator, "check_resources", side_effect=ConnectionError("pdp down")):
+            with pytest.raises(HTTPException) as exc:
+                await check_resource_permission(ADMIN, resource, "read", cerbos)
+        assert exc.value.status_code == 503
+
+        assert await check_resource_permission(ADMIN, resource, "read", cerbos)
+        assert evaluator.calls == 1
+
+    async def test_cache_hit_is_sub_millisecond(self, cerbos):
+        resource = Resource(id="any", kind="notice")
+        await check_resource_permission(ADMIN, resource, "read", cerbos)
+
+        iterations = 1000
+        started = time.perf_counter()
+        for _ in range(iterations):
+            await check_resource_permission(ADMIN, resource, "read", cerbos)
+        per_check = (time.perf_counter() - started) / iterations
+
+        assert per_check < 0.001
+
+
+class TestDecisionCache:
+
+    def test_ttl_expiry(self):
+        cache = DecisionCache(ttl=30)
+        key = ("p", "notice", "r", "read")
+        with patch("app.dependencies.time.monotonic", return_value=0):
+            cache.set(key, True)
+        with patch("app.dependencies.time.monotonic", return_value=29):
+            assert cache.get(key) is True
+        with patch("app.dependencies.time.monotonic", return_value=31):
+            assert cache.get(key) is None
+
+    def test_fixed_policy_version_change_clears(self):
+        cache = DecisionCache(ttl=30, policy_version="v1")
+        cache.set(("p", "notice", "r", "read"), True)
+
+        cache.set_policy_version("v1")
+        assert cache.get(("p", "notice", "r", "read")) is True
+
+        cache.set_policy_version("v2")
+        assert cache.get(("p", "notice", "r", "read")) is None
+        assert cache.invalidations == 1
+
+    def test_policy_file_change_clears(self, tmp_path):
+        shutil.copy(POLICY_DIR / "notice_policy.yaml", tmp_path)
+        cache = DecisionCache(ttl=30, policy_dir=str(tmp_path), check_interval=0)
+        key = ("p", "notice", "r", "read")
+        cache.get(key)  # 최초 지문 기록
+        cache.set(key, True)
+        assert cache.get(key) is True
+
+        policy = tmp_path / "notice_policy.yaml"
+        policy.write_text(policy.read_text(encoding="utf-8") + "\n", encoding="utf-8")
+        stat = policy.stat()
+        os.utime(policy, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        assert cache.get(key) is None
+
+    def test_max_size_evicts_oldest(self):
+        cache = DecisionCache(ttl=30, max_size=2)
+        for name in ("a", "b", "c"):
+            cache.set((name, "notice", "r", "read"), True)
+
+        assert cache.get(("a", "notice", "r", "read")) is None
+        assert cache.get(("c", "notice", "r", "read")) is True
+
+    def test_disabled(self):
+        cache = DecisionCache(ttl=0)
+        cache.set(("p", "notice", "r", "read"), True)
+        assert cache.get(("p", "notice", "r", "read")) is None
+
+
+class FakeUsageSession:
+    """usage_history 조회 쿼리를 기록하고 지정한 행을 돌려주는 세션"""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.queries = []
+
+    async def execute(self, query):
+        self.queries.append(str(query.compile(compile_kwargs={"literal_binds": True})))
+        rows = self.rows
+
+        class Result:
+            def scalars(self):
+                return self
+
+            def all(self):
+                return rows
+
+        return Result()
+
+
+@pytest.mark.asyncio
+class TestUsageListPermission:
+    """사용 이력 목록 - usage_history:read 판정은 캐시, 권한이 없으면 403"""
+
+    def history(self, row_id, user_id):
+        from datetime import datetime
+        from app.models import UsageHistory
+
+        return UsageHistory(id=row_id, user_id=user_id, question="q", created_at=datetime(2025, 11, 1))
+
+    async def list_for(self, principal, rows, cerbos):
+        from fastapi import Response
+        from app.routers.admin.usage import list_usage_history
+
+        session = FakeUsageSession(rows)
+        items = await list_usage_history(
+            Response(), skip=0, limit=10, user_id=None, search=None, model_name=None,
+            start_date=None, end_date=None, cursor=None, db=session, principal=principal, cerbos=cerbos
+        )
+        return items, session.queries
+
+    async def test_admin_sees_all_with_cached_decision(self, cerbos, evaluator):
+        rows = [self.history(1, "user1"), self.history(2, "user2")]
+        with patch.object(evaluator, "check_resources", wraps=evaluator.check_resources) as pdp:
+            items, [query] = await self.list_for(ADMIN, rows, cerbos)
+            await self.list_for(ADMIN, rows, cerbos)
+
+        assert [h.id for h in items] == [1, 2]
+        assert "usage_history.user_id =" not in query
+        assert pdp.call_count == 1
+
+    async def test_denied_principal_gets_403(self, cerbos):
+        from fastapi import HTTPException
+
+        with pytest.raises(HTTPException) as exc_info:
+            await self.list_for(USER, [self.history(1, "user1")], cerbos)
+
+        assert exc_info.value.status_code == 403
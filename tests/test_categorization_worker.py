@@ -0,0 +1,252 @@
+"""
+Conversation Categorization Worker 테스트
+질문 해시 캐시 / 중복 질문 1회 분류 / 선점 후 커밋 / bulk UPDATE / backfill keyset 검증
+"""
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy.sql import Select, Update
+
+from app.services.categorization_worker import ConversationCategorizer, normalize_question
+
+
+class FakeResult:
+    def __init__(self, rows=None, scalar=None, rowcount=None):
+        self._rows = rows or []
+        self._scalar = scalar
+        self.rowcount = rowcount
+
+    def all(self):
+        return self._rows
+
+    def scalar(self):
+        return self._scalar
+
+
+class FakeSession:
+    """usage_history 미분류 행을 메모리에서 흉내내는 AsyncSession 대역"""
+
+    def __init__(self, store):
+        self.store = store
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def _pending(self):
+        return [row for row in self.store["rows"] if row["main_category"] is None]
+
+    async def execute(self, stmt):
+        params = stmt.compile().params
+        if isinstance(stmt, Update) and "category_claimed_at" in params:
+            # 선점 (리스 기록)
+            ids = next(value for value in params.values() if isinstance(value, list))
+            self.store["claims"].append(ids)
+            for row in self.store["rows"]:
+                if row["id"] in ids:
+                    row["claimed_at"] = params["category_claimed_at"]
+            return FakeResult(rowcount=len(ids))
+        if isinstance(stmt, Update):
+            self.store["updates"].append(stmt)
+            ids = next(value for value in params.values() if isinstance(value, list))
+            count = 0
+            for row in self._pending():
+                if row["id"] in ids:
+                    row["main_category"] = params["main_category"]
+                    row["sub_category"] = params["sub_category"]
+                    count += 1
+            return FakeResult(rowcount=count)
+
+        assert isinstance(stmt, Select)
+        pending = self._pending()
+        if len(stmt.selected_columns) == 1:
+            # 가장 오래된 미분류 행 (lag)
+            return FakeResult(scalar=min((row["created_at"] for row in pending), default=None))
+
+        lease_expired = params["category_claimed_at_1"]
+        pending = [row for row in pending if row["claimed_at"] is None or row["claimed_at"] < lease_expired]
+        after_id = params.get("id_1")
+        if after_id is not None:
+            pending = [row for row in pending if row["id"] > after_id]
+        pending.sort(key=lambda row: row["id"], reverse="DESC" in str(stmt))
+        limit = params["param_1"]
+        return FakeResult(rows=[
+            SimpleNamespace(id=row["id"], question=row["question"], answer=row["answer"])
+            for row in pending[:limit]
+        ])
+
+    async def commit(self):
+        self.store["commits"] += 1
+
+
+def make_row(row_id, question):
+    return {
+        "id": row_id,
+        "question": question,
+        "answer": "답변",
+        "main_category": None,
+        "sub_category": None,
+        "claimed_at": None,
+        "created_at": datetime.utcnow() - timedelta(minutes=row_id),
+    }
+
+
+class FakeRollup:
+    """분류 기록 시 사용 집계 보정 호출을 기록하는 UsageRollupService 대역"""
+
+    def __init__(self, store):
+        self.store = store
+
+    async def recategorize(self, session, ids):
+        self.store["recategorized"].append(sorted(ids))
+        return 0
+
+
+@pytest.fixture
+def store():
+    return {"rows": [], "updates": [], "claims": [], "commits": 0, "calls": [], "recategorized": []}
+
+
+@pytest.fixture
+def make_categorizer(store):
+    async def fake_classify(question, answer):
+        store["calls"].append(question)
+        if "포장" in question:
+            return "기술분야", "도로/시설"
+        return "경영분야", "관리/인사"
+
+    def factory(**kwargs):
+        kwargs.setdefault("classify", fake_classify)
+        kwargs.setdefault("rollup", FakeRollup(store))
+        return ConversationCategorizer(session_factory=lambda: FakeSession(store), **kwargs)
+    return factory
+
+
+class TestConversationCategorizer:
+    """배치 분류 워커 테스트"""
+
+    def test_normalize_question(self):
+        """대소문자, 공백, 끝 문장부호 차이는 같은 질문으로 취급"""
+        assert normalize_question("  도로  포장 기준은?? ") == normalize_question("도로 포장 기준은")
+        assert normalize_question("KPI 평가") == normalize_question("kpi 평가.")
+
+    @pytest.mark.asyncio
+    async def test_duplicate_questions_classified_once(self, make_categorizer, store):
+        """같은 배치 내 정규화 기준 동일 질문은 LLM 1회 호출"""
+        store["rows"] = [
+            make_row(1, "도로 포장 기준은?"),
+            make_row(2, "도로 포장 기준은"),
+            make_row(3, "  도로 포장 기준은 "),
+            make_row(4, "채용 일정"),
+        ]
+        categorizer = make_categorizer()
+
+        result = await categorizer.run_once()
+
+        assert result == {"fetched": 4, "updated": 4, "last_id": 4}
+        assert len(store["calls"]) == 2
+        assert categorizer.stats.cache_hits == 2
+        assert all(row["main_category"] for row in store["rows"])
+
+    @pytest.mark.asyncio
+    async def test_cache_reused_across_batches(self, make_categorizer, store):
+        """이전 배치에서 분류한 질문은 다음 배치에서 캐시로 처리"""
+        store["rows"] = [make_row(1, "도로 포장 기준")]
+        categorizer = make_categorizer()
+        await categorizer.run_once()
+
+        store["rows"].append(make_row(2, "도로 포장 기준?"))
+        await categorizer.run_once()
+
+        assert store["calls"] == ["도로 포장 기준"]
+        assert store["rows"][1]["sub_category"] == "도로/시설"
+
+    @pytest.mark.asyncio
+    async def test_bulk_update_per_category(self, make_categorizer, store):
+        """(대분류, 소분류)별로 UPDATE 1회 + 배치당 커밋 2회 (선점 / 결과 기록)"""
+        store["rows"] = [make_row(i, f"포장 질문 {i}") for i in range(1, 6)]
+        store["rows"] += [make_row(i, f"인사 질문 {i}") for i in range(6, 9)]
+        categorizer = make_categorizer()
+
+        await categorizer.run_once()
+
+        assert len(store["updates"]) == 2
+        assert store["claims"] == [list(range(8, 0, -1))]
+        assert store["commits"] == 2
+        # 이미 '미분류'로 집계된 행 보정은 결과 기록과 같은 트랜잭션에서
+        assert store["recategorized"] == [list(range(1, 9))]
+
+    @pytest.mark.asyncio
+    async def test_claim_committed_before_classify(self, make_categorizer, store):
+        """vLLM 호출 전에 선점을 커밋해 행 잠금 / 트랜잭션을 유지하지 않음"""
+        seen = []
+
+        async def classify(question, answer):
+            seen.append((store["commits"], [row["claimed_at"] is not None for row in store["rows"]]))
+            return "경영분야", "관리/인사"
+
+        store["rows"] = [make_row(1, "질문")]
+        categorizer = make_categorizer(classify=classify)
+
+        await categorizer.run_once()
+
+        assert seen == [(1, [True])]
+        assert store["commits"] == 2
+
+    @pytest.mark.asyncio
+    async def test_claimed_rows_skipped_until_lease_expires(self, make_categorizer, store):
+        """다른 워커가 선점한 행은 리스가 만료될 때까지 건너뜀"""
+        store["rows"] = [make_row(1, "질문 1"), make_row(2, "질문 2")]
+        store["rows"][0]["claimed_at"] = datetime.now(timezone.utc)
+        store["rows"][1]["claimed_at"] = datetime.now(timezone.utc) - timedelta(hours=1)
+        categorizer = make_categorizer(claim_lease=600)
+
+        result = await categorizer.run_once()
+
+        assert result["fetched"] == 1
+        assert store["calls"] == ["질문 2"]
+        assert store["rows"][0]["main_category"] is None
+
+    @pytest.mark.asyncio
+    async def test_classify_failure_marks_unclassified(self, make_categorizer, store):
+        """분류 함수 예외 시 미분류로 기록하고 캐시하지 않음"""
+        async def broken(question, answer):
+            raise RuntimeError("vLLM down")
+
+        store["rows"] = [make_row(1, "질문")]
+        categorizer = make_categorizer(classify=broken)
+
+        await categorizer.run_once()
+
+        assert store["rows"][0]["main_category"] == "미분류"
+        assert categorizer.stats.failures == 1
+        assert categorizer.metrics()["cache_size"] == 0
+
+    @pytest.mark.asyncio
+    async def test_backfill_walks_keyset(self, make_categorizer, store):
+        """backfill은 id 오름차순 keyset으로 끝까지 순회"""
+        store["rows"] = [make_row(i, f"질문 {i}") for i in range(1, 8)]
+        categorizer = make_categorizer(batch_size=3)
+
+        total = await categorizer.backfill()
+
+        assert total == 7
+        assert categorizer.stats.batches == 3
+        assert store["calls"] == [f"질문 {i}" for i in range(1, 8)]
+
+    @pytest.mark.asyncio
+    async def test_metrics_snapshot(self, make_categorizer, store):
+        """처리량 / lag 메트릭 노출"""
+        store["rows"] = [make_row(1, "질문 1"), make_row(2, "질문 2")]
+        categorizer = make_categorizer(batch_size=1)
+
+        await categorizer.run_once()
+        metrics = categorizer.metrics()
+
+        assert metrics["categorized"] == 1
+        assert metrics["llm_calls"] == 1
+        assert metrics["lag_seconds"] > 0
+        assert metrics["running"] is False
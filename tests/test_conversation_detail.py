@@ -0,0 +1,122 @@
+"""
+대화 상세 조회 테스트
+메시지 수와 관계없이 고정 횟수 조회 (N+1 제거) 검증
+"""
+from datetime import datetime, timedelta, timezone
+
+import pytest
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.models import UsageHistory
+from app.models.chat_models import (
+    Conversation,
+    ConversationSummary,
+    ReferenceDocument,
+    SuggestedQuestion,
+)
+from app.routers.chat.history import get_conversation_detail
+from app.routers.chat_proxy import get_session_messages
+
+ROOM_ID = "u1_20251020090000000000"
+TURNS = 50
+BASE = datetime(2025, 10, 20, 9, 0)
+
+
+@pytest_asyncio.fixture
+async def engine():
+    engine = create_async_engine("sqlite+aiosqlite://")
+    tables = [
+        ConversationSummary.__table__,
+        Conversation.__table__,
+        ReferenceDocument.__table__,
+        SuggestedQuestion.__table__,
+        UsageHistory.__table__,
+    ]
+    async with engine.begin() as conn:
+        await conn.run_sync(lambda sync_conn: UsageHistory.metadata.create_all(sync_conn, tables=tables))
+    yield engine
+    await engine.dispose()
+
+
+@pytest_asyncio.fixture
+async def session(engine):
+    async with async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)() as session:
+        yield session
+
+
+async def seed_room(session):
+    session.add(ConversationSummary(cnvs_idt_id=ROOM_ID, cnvs_smry_txt="요약", usr_id="u1", use_yn="Y", reg_dt=BASE))
+    for i in range(TURNS):
+        answer = f"답변{i}" if i % 10 else None  # 10턴마다 답변 없는 질문
+        conversation = Conversation(
+            cnvs_idt_id=ROOM_ID, ques_txt=f"질문{i}", ans_txt=answer, tkn_use_cnt=i,
+            use_yn="Y", reg_dt=BASE + timedelta(minutes=i),
+        )
+        session.add(conversation)
+        await session.flush()
+        if answer:
+            for seq in (2, 1):
+                session.add(ReferenceDocument(
+                    cnvs_id=conversation.cnvs_id, ref_seq=seq, att_doc_nm=f"문서{i}-{seq}",
+                    doc_chnk_txt="청크", smlt_rte=0.5, reg_dt=BASE,
+                ))
+            if i % 2:
+                session.add(SuggestedQuestion(
+                    cnvs_id=conversation.cnvs_id, add_ques_seq=1, add_ques_txt=f"추천{i}", reg_dt=BASE,
+                ))
+    # 삭제된 메시지의 참조 문서는 포함되지 않아야 함
+    deleted = Conversation(cnvs_idt_id=ROOM_ID, ques_txt="삭제됨", ans_txt="삭제됨", use_yn="N", reg_dt=BASE)
+    session.add(deleted)
+    await session.flush()
+    session.add(ReferenceDocument(
+        cnvs_id=deleted.cnvs_id, ref_seq=1, att_doc_nm="삭제", doc_chnk_txt="", smlt_rte=0.1, reg_dt=BASE,
+    ))
+    await session.commit()
+
+
+@pytest.mark.asyncio
+class TestConversationDetailQueries:
+
+    async def test_detail_uses_fixed_number_of_queries(self, engine, session, count_queries):
+        await seed_room(session)
+
+        with count_queries(engine) as statements:
+            detail = await get_conversation_detail(ROOM_ID, current_user={"user_id": "u1"}, db=session)
+
+        # 소유권 확인 1 + 메시지 / 참조 문서 / 추천 질문 3
+        assert len(statements) == 4
+        assert detail["total_messages"] == TURNS + TURNS - TURNS // 10
+
+        answers = [m for m in detail["messages"] if m["role"] == "assistant"]
+        first, second = answers[0], answers[1]
+        assert [r["doc_name"] for r in first["references"]] == ["문서1-1", "문서1-2"]
+        assert first["suggested_questions"] == ["추천1"]
+        assert second["suggested_questions"] is None
+        assert all(r["doc_name"] != "삭제" for m in answers for r in m["references"])
+
+    async def test_empty_room_skips_child_queries(self, engine, session, count_queries):
+        session.add(ConversationSummary(cnvs_idt_id=ROOM_ID, cnvs_smry_txt="요약", usr_id="u1", use_yn="Y", reg_dt=BASE))
+        await session.commit()
+
+        with count_queries(engine) as statements:
+            detail = await get_conversation_detail(ROOM_ID, current_user={"user_id": "u1"}, db=session)
+
+        assert detail["messages"] == []
+        assert len(statements) == 2
+
+    async def test_session_messages_single_query(self, engine, session, count_queries):
+        base = datetime(2025, 10, 20, tzinfo=timezone.utc)
+        for i in range(TURNS):
+            session.add(UsageHistory(
+                user_id="u1", session_id="s1", question=f"q{i}", answer=f"a{i}",
+                is_deleted=False, created_at=base + timedelta(seconds=i),
+            ))
+        await session.commit()
+
+        with count_queries(engine) as statements:
+            result = await get_session_messages("s1", db=session)
+
+        assert len(statements) == 1
+        assert [m["question"] for m in result["messages"]][:3] == ["q0", "q1", "q2"]
+        assert len(result["messages"]) == TURNS
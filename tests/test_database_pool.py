@@ -0,0 +1,73 @@
+"""
+데이터베이스 엔진 팩토리 / 풀 메트릭 테스트
+"""
+import asyncio
+
+import pytest
+from sqlalchemy import exc, text
+
+from app.core import database
+from app.core.database import TimedQueuePool, create_engine, pool_stats
+
+
+@pytest.mark.asyncio
+class TestEngineFactory:
+
+    async def test_asyncpg_engine_sets_server_timeouts_and_cache(self, monkeypatch):
+        captured = {}
+
+        def fake_create_async_engine(url, **kwargs):
+            captured.update(kwargs)
+            return object()
+
+        monkeypatch.setattr(database, "create_async_engine", fake_create_async_engine)
+
+        create_engine(
+            "postgresql+asyncpg://u:p@db/admin_db",
+            name="analytics",
+            pool_size=5,
+            max_overflow=2,
+            statement_timeout_ms=300000,
+            lock_timeout_ms=1000,
+            prepared_statement_cache_size=256,
+        )
+
+        assert captured["poolclass"] is TimedQueuePool
+        assert (captured["pool_size"], captured["max_overflow"]) == (5, 2)
+        assert captured["pool_pre_ping"] is True
+        assert captured["echo"] is False
+        server_settings = captured["connect_args"]["server_settings"]
+        assert server_settings["statement_timeout"] == "300000"
+        assert server_settings["lock_timeout"] == "1000"
+        assert captured["connect_args"]["prepared_statement_cache_size"] == 256
+
+    async def test_pool_stats_track_checkout_wait_and_timeouts(self):
+        engine = create_engine("sqlite+aiosqlite://", name="pool-test", pool_size=1, max_overflow=0, pool_timeout=0.2)
+        try:
+            async with engine.connect() as conn:
+                await conn.execute(text("SELECT 1"))
+                stats = pool_stats(engine, "pool-test")
+                assert stats["checked_out"] == 1
+
+                async def second_checkout():
+                    async with engine.connect():
+                        pass
+
+                with pytest.raises(exc.TimeoutError):
+                    await second_checkout()
+
+            stats = pool_stats(engine, "pool-test")
+            assert stats["checked_out"] == 0
+            assert stats["checkouts"] == 1
+            assert stats["timeouts"] == 1
+
+            # 반환 후에는 대기 없이 획득
+            await asyncio.wait_for(second_checkout(), timeout=1)
+            assert pool_stats(engine, "pool-test")["checkouts"] == 2
+        finally:
+            await engine.dispose()
+
+    async def test_environment_presets(self, monkeypatch):
+        monkeypatch.setattr(database.settings, "ENVIRONMENT", "development")
+        assert database._pool_size(None, None) == database.POOL_PRESETS["development"]
+        assert database._pool_size(7, None) == (7, database.POOL_PRESETS["development"][1])
@@ -0,0 +1,95 @@
+"""
+날짜 범위 필터 테스트
+KST 기준 반열린 범위 변환 / created_at 인덱스 사용 (EXPLAIN) 검증
+"""
+from datetime import date, datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import func, insert, select, text
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import UsageHistory
+from app.utils.date_range import date_range_filter, day_range, day_start
+
+
+class TestDayRange:
+
+    def test_day_start_is_kst_midnight_in_utc(self):
+        assert day_start(date(2025, 10, 20)) == datetime(2025, 10, 19, 15, 0, tzinfo=timezone.utc)
+        assert day_start(date(2025, 10, 20), "UTC") == datetime(2025, 10, 20, tzinfo=timezone.utc)
+
+    def test_day_range_is_half_open(self):
+        lower, upper = day_range(date(2025, 10, 20), date(2025, 10, 21))
+
+        assert lower == datetime(2025, 10, 19, 15, 0, tzinfo=timezone.utc)
+        assert upper == datetime(2025, 10, 21, 15, 0, tzinfo=timezone.utc)
+        assert upper - lower == timedelta(days=2)
+
+    def test_open_bounds(self):
+        assert day_range(None, None) == (None, None)
+        assert date_range_filter(UsageHistory.created_at, None, None) == []
+        assert len(date_range_filter(UsageHistory.created_at, date(2025, 10, 20), None)) == 1
+
+    def test_filter_compares_column_without_function(self):
+        filters = date_range_filter(UsageHistory.created_at, date(2025, 10, 20), date(2025, 10, 20))
+        sql = str(select(UsageHistory.id).where(*filters).compile(
+            dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}
+        ))
+
+        assert "date(" not in sql.lower()
+        assert "usage_history.created_at >= '2025-10-19 15:00:00+00:00'" in sql
+        assert "usage_history.created_at < '2025-10-20 15:00:00+00:00'" in sql
+
+
+async def explain(session: AsyncSession, query) -> str:
+    sql = query.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True})
+    result = await session.execute(text(f"EXPLAIN {sql}"))
+    return "\n".join(row[0] for row in result)
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+class TestCreatedAtIndexes:
+    """로컬 PostgreSQL (alembic upgrade head 적용) 필요"""
+
+    @pytest.fixture
+    async def seeded(self, db_session: AsyncSession):
+        base = datetime(2025, 10, 1, tzinfo=timezone.utc)
+        await db_session.execute(insert(UsageHistory), [
+            {
+                "user_id": f"explain-user{i % 50}",
+                "session_id": f"explain-session{i % 200}",
+                "question": "질문",
+                "is_deleted": False,
+                "created_at": base + timedelta(minutes=i * 7),
+                "updated_at": base + timedelta(minutes=i * 7),
+            }
+            for i in range(5000)
+        ])
+        await db_session.execute(text("ANALYZE usage_history"))
+        # 적은 행 수에서도 플래너가 인덱스 사용 가능 여부를 드러내도록
+        await db_session.execute(text("SET LOCAL enable_seqscan = off"))
+        return db_session
+
+    async def test_date_range_uses_created_at_index(self, seeded):
+        query = select(func.count(UsageHistory.id)).where(
+            *date_range_filter(UsageHistory.created_at, date(2025, 10, 5), date(2025, 10, 6))
+        )
+
+        assert "ix_usage_history_created_at" in await explain(seeded, query)
+
+    async def test_user_range_uses_composite_index(self, seeded):
+        query = select(UsageHistory.id).where(
+            UsageHistory.user_id == "explain-user7",
+            *date_range_filter(UsageHistory.created_at, date(2025, 10, 5), date(2025, 10, 6)),
+        )
+
+        assert "ix_usage_history_user_id_created_at" in await explain(seeded, query)
+
+    async def test_session_history_uses_composite_index(self, seeded):
+        query = select(UsageHistory.id).where(
+            UsageHistory.session_id == "explain-session3"
+        ).order_by(UsageHistory.created_at)
+
+        assert "ix_usage_history_session_id_created_at" in await explain(seeded, query)
@@ -0,0 +1,140 @@
+"""
+동의어 사전 서비스 테스트
+최장 일치 치환/확장 / 대소문자·띄어쓰기 옵션 / Redis 버전 기반 사전 교체 검증
+"""
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from app.services.dictionary_service import CompiledDictionary, DictionaryService
+
+
+def entry(formal_name, case_sensitive=False, word_boundary=True):
+    return {"formal_name": formal_name, "case_sensitive": case_sensitive, "word_boundary": word_boundary}
+
+
+CACHE = {
+    "육군본부": entry("육군본부"),
+    "육본": entry("육군본부"),
+    "기획재정부": entry("기획재정부"),
+    "기재부": entry("기획재정부"),
+    "기재": entry("기술재단"),
+    "ai": entry("인공지능"),
+    "도로공사": entry("한국도로공사", word_boundary=False),
+    "KEC": entry("한국도로공사", case_sensitive=True),
+}
+
+
+@pytest.fixture
+def compiled():
+    return CompiledDictionary(CACHE)
+
+
+class FakeRedis:
+    def __init__(self):
+        self.values = {}
+
+    async def get(self, key):
+        return self.values.get(key)
+
+    async def incr(self, key):
+        self.values[key] = int(self.values.get(key, 0)) + 1
+        return self.values[key]
+
+
+class TestCompiledDictionary:
+
+    def test_replace_longest_match(self, compiled):
+        assert compiled.replace("기재부와 육본 예산")[0] == "기획재정부와 육군본부 예산"
+        assert compiled.replace("기재 담당")[0] == "기술재단 담당"
+
+    def test_formal_name_is_not_rewritten(self, compiled):
+        # "육군본부"가 그대로 남고 그 안의 짧은 동의어도 치환되지 않음
+        text, replacements = compiled.replace("육군본부 소속 기획재정부")
+        assert text == "육군본부 소속 기획재정부"
+        assert replacements == []
+
+    def test_no_cascading_replacement(self):
+        compiled = CompiledDictionary({"가": entry("나"), "나": entry("다")})
+        assert compiled.replace("가 나")[0] == "나 다"
+
+    def test_case_options(self, compiled):
+        assert compiled.replace("AI 정책")[0] == "인공지능 정책"
+        assert compiled.replace("KEC 본사")[0] == "한국도로공사 본사"
+        assert compiled.replace("kec 본사")[0] == "kec 본사"
+
+    def test_whitespace_insensitive_entry(self, compiled):
+        assert compiled.replace("도로 공사 일정, 도로공사")[0] == "한국도로공사 일정, 도로공사"
+        # 띄어쓰기 구분 항목은 공백이 다르면 일치하지 않음
+        assert compiled.replace("육 본")[0] == "육 본"
+        assert compiled.replace("육본, 육본")[0] == "육군본부, 육군본부"
+
+    def test_expand(self, compiled):
+        assert compiled.expand("육본에 대해 알려줘")[0] == "육본(육군본부)에 대해 알려줘"
+        assert compiled.expand("육본 육본")[0] == "육본(육군본부) 육본"
+        # 정식명칭이 이미 있으면 병기하지 않음
+        assert compiled.expand("육본 즉 육군본부")[0] == "육본 즉 육군본부"
+        assert compiled.expand("Ai 시대")[0] == "Ai(인공지능) 시대"
+
+
+@pytest.mark.asyncio
+class TestDictionaryService:
+
+    def make_service(self, redis=None):
+        service = DictionaryService(redis_url="redis://fake" if redis else None, version_check_interval=0)
+        service.redis._client = redis
+        loads = []
+
+        async def fake_load(db, version=None):
+            loads.append(version)
+            service._compiled = CompiledDictionary(CACHE if len(loads) == 1 else {"육본": entry("육군 본부")}, version)
+            service._cache_loaded = True
+
+        return service, loads, fake_load
+
+    async def test_loads_once_and_strips_html(self):
+        service, loads, fake_load = self.make_service()
+        with patch.object(service, "load_dictionaries", side_effect=fake_load):
+            assert await service.replace_query("<b>육본</b> 위치", db=None) == "육군본부 위치"
+            assert await service.replace_query("기재부", db=None) == "기획재정부"
+        assert loads == [None]
+
+    async def test_version_change_swaps_dictionary(self):
+        redis = FakeRedis()
+        service, loads, fake_load = self.make_service(redis)
+        with patch.object(service, "load_dictionaries", side_effect=fake_load):
+            assert await service.replace_query("육본", db=None) == "육군본부"
+            assert await service.replace_query("육본", db=None) == "육군본부"
+            assert loads == [0]
+
+            # 다른 워커에서 사전 수정
+            await redis.incr("dictionary:version")
+            assert await service.replace_query("육본", db=None) == "육군 본부"
+        assert loads == [0, 1]
+        assert service.compiled.version == 1
+
+    async def test_notify_changed_bumps_version_and_invalidates(self):
+        redis = FakeRedis()
+        service, loads, fake_load = self.make_service(redis)
+        with patch.object(service, "load_dictionaries", side_effect=fake_load):
+            await service.replace_query("육본", db=None)
+            await service.notify_changed()
+            assert redis.values["dictionary:version"] == 1
+            await service.replace_query("육본", db=None)
+        assert loads == [0, 1]
+
+    async def test_load_from_db_rows(self):
+        service = DictionaryService()
+        result = AsyncMock()
+        result.all = lambda: [
+            ("육군본부", "육본", None, " ", None, "Army HQ", None, False, True),
+            ("한국도로공사", "도로공사", None, None, None, None, "KEC", True, False),
+        ]
+        db = AsyncMock()
+        db.execute.return_value = result
+
+        await service.load_dictionaries(db)
+
+        assert set(service.compiled.entries) == {"육군본부", "육본", "army hq", "한국도로공사", "도로공사", "KEC"}
+        assert await service.replace_query("army hq 와 도로 공사", db) == "육군본부 와 한국도로공사"
+        assert db.execute.await_count == 1
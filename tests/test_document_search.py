@@ -0,0 +1,153 @@
+"""
+문서 검색 테스트
+한글 bigram 토큰 / 스니펫 강조 / 검색 쿼리 구성 / 인덱스 사용 및 LIKE 대비 성능 (PostgreSQL) 검증
+"""
+import time
+
+import pytest
+from sqlalchemy import func, select, text
+from sqlalchemy.dialects.postgresql import asyncpg
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.document import Document
+from app.services.document_search import (
+    build_search_filter,
+    build_search_query,
+    highlight,
+    search_documents,
+    search_tokens,
+)
+
+
+def compile_sql(query) -> str:
+    return str(query.compile(dialect=asyncpg.dialect(), compile_kwargs={"literal_binds": True}))
+
+
+class TestSearchTokens:
+
+    def test_hangul_words_split_into_bigrams(self):
+        assert search_tokens("도로공사 Manual 2025") == ["도로", "로공", "공사", "manual", "2025"]
+
+    def test_short_words_and_punctuation(self):
+        assert search_tokens("교량, 점검!") == ["교량", "점검"]
+        assert search_tokens("터널 A-1") == ["터널", "a", "1"]
+        assert search_tokens("  %%  ") == []
+        assert search_tokens(None) == []
+
+
+class TestHighlight:
+
+    def test_marks_query_and_merges_overlapping_bigrams(self):
+        assert highlight("한국도로공사 안전관리 지침", "도로공사") == "한국<mark>도로공사</mark> 안전관리 지침"
+
+    def test_escapes_html_outside_and_inside_marks(self):
+        assert highlight("<b>교량</b> & 터널", "교량") == "&lt;b&gt;<mark>교량</mark>&lt;/b&gt; &amp; 터널"
+
+    def test_case_insensitive_keeps_original_text(self):
+        assert highlight("Safety Manual v2", "manual") == "Safety <mark>Manual</mark> v2"
+
+    def test_empty(self):
+        assert highlight(None, "교량") is None
+        assert highlight("", "교량") == ""
+
+
+class TestSearchQuery:
+
+    def test_filter_uses_tsquery_and_trigram_ilike(self):
+        sql = compile_sql(select(Document.id).where(build_search_filter("도로공사 50%")))
+
+        assert "documents.search_vector @@ to_tsquery('simple'::regconfig, '도로 & 로공 & 공사 & 50')" in sql
+        assert "documents.title ILIKE '%도로공사 50!%%' ESCAPE '!'" in sql
+        assert "documents.content" not in sql
+
+    def test_blank_query_has_no_filter(self):
+        assert build_search_filter("   ") is None
+
+    def test_search_query_ranks_and_builds_snippet(self):
+        sql = compile_sql(build_search_query("교량 점검", limit=5))
+
+        assert "ts_rank_cd(documents.search_vector" in sql
+        assert "substr(documents.content" in sql
+        assert "ORDER BY rank DESC, documents.id DESC" in sql
+        # 본문 LIKE 전체 스캔 없음
+        assert "documents.content LIKE" not in sql
+        assert "documents.content ILIKE" not in sql
+
+
+async def explain(session: AsyncSession, query) -> str:
+    result = await session.execute(text(f"EXPLAIN {compile_sql(query)}"))
+    return "\n".join(row[0] for row in result)
+
+
+async def seed_documents(session: AsyncSession, count: int):
+    """generate_series로 문서 대량 생성 (db_session 종료 시 롤백)"""
+    await session.execute(text("""
+        INSERT INTO documents (document_id, title, document_type, status, content, summary, file_name,
+                               created_at, updated_at)
+        SELECT
+            'search-bench-' || n,
+            CASE WHEN n % 1000 = 0 THEN '교량 점검 매뉴얼 ' || n ELSE '업무 기준 문서 ' || n END,
+            'MANUAL', 'ACTIVE',
+            repeat('일반 업무 처리 절차와 보고 양식에 관한 내용입니다. ', 20) ||
+                CASE WHEN n % 500 = 0 THEN ' 교량 점검 주기는 반기 1회로 한다.' ELSE '' END,
+            NULL,
+            'doc_' || n || '.pdf',
+            now(), now()
+        FROM generate_series(1, :count) AS n
+    """), {"count": count})
+    await session.execute(text("ANALYZE documents"))
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+class TestDocumentSearchPostgres:
+    """로컬 PostgreSQL (alembic upgrade head 적용) 필요"""
+
+    async def test_trigger_indexes_and_ranks(self, db_session: AsyncSession):
+        await seed_documents(db_session, 5000)
+
+        results = await search_documents(db_session, "교량 점검", limit=20)
+
+        assert results
+        # 제목 일치 문서가 본문만 일치하는 문서보다 앞
+        assert "교량 점검" in results[0][0].title
+        assert results[0][1] >= results[-1][1]
+        assert "<mark>교량</mark>" in results[-1][2]
+
+    async def test_search_uses_gin_indexes(self, db_session: AsyncSession):
+        await seed_documents(db_session, 5000)
+        await db_session.execute(text("SET LOCAL enable_seqscan = off"))
+
+        plan = await explain(db_session, select(Document.id).where(build_search_filter("교량 점검")))
+
+        assert "ix_documents_search_vector" in plan
+        assert "ix_documents_title_trgm" in plan
+
+    @pytest.mark.slow
+    async def test_faster_than_like_scan(self, db_session: AsyncSession):
+        await seed_documents(db_session, 500_000)
+
+        like_query = select(Document.id).where(
+            Document.title.contains("교량 점검") | Document.content.contains("교량 점검")
+        ).limit(10)
+
+        started = time.perf_counter()
+        await db_session.execute(like_query)
+        like_elapsed = time.perf_counter() - started
+
+        started = time.perf_counter()
+        await db_session.execute(build_search_query("교량 점검", limit=10))
+        search_elapsed = time.perf_counter() - started
+
+        print(f"\nLIKE: {like_elapsed * 1000:,.1f} ms, full-text: {search_elapsed * 1000:,.1f} ms")
+        assert search_elapsed < like_elapsed
+
+    async def test_count_matches_filter(self, db_session: AsyncSession):
+        await seed_documents(db_session, 5000)
+
+        total = (await db_session.execute(
+            select(func.count()).select_from(Document).where(build_search_filter("교량 점검"))
+        )).scalar()
+
+        # 제목 일치 5건 + 본문 일치 10건 (중복 5건)
+        assert total == 10
@@ -0,0 +1,142 @@
+"""
+EDB 커넥션 풀 테스트
+지연 생성 / 획득 대기 메트릭 / 의존성 첫 쿼리 시 획득·반환 / 연결 실패(503) 처리 검증
+"""
+import asyncio
+
+import pytest
+from fastapi import HTTPException
+
+from app.core import edb
+from app.core.edb import EDBPool
+
+
+class FakeConnection:
+    async def fetchval(self, query, *args):
+        return 1
+
+
+class FakePool:
+    def __init__(self, fail: bool = False):
+        self.fail = fail
+        self.acquired = 0
+        self.released = 0
+        self.closed = False
+
+    async def acquire(self, timeout=None):
+        if self.fail:
+            raise asyncio.TimeoutError()
+        self.acquired += 1
+        return FakeConnection()
+
+    async def release(self, conn):
+        self.released += 1
+
+    async def close(self):
+        self.closed = True
+
+    def get_size(self):
+        return 2
+
+    def get_idle_size(self):
+        return 2 - (self.acquired - self.released)
+
+
+@pytest.fixture
+def fake_pool(monkeypatch):
+    pool = FakePool()
+    calls = []
+
+    async def fake_create_pool(**kwargs):
+        calls.append(kwargs)
+        return pool
+
+    monkeypatch.setattr(edb.asyncpg, "create_pool", fake_create_pool)
+    pool.calls = calls
+    return pool
+
+
+@pytest.mark.asyncio
+class TestEDBPool:
+
+    async def test_pool_created_once_lazily(self, fake_pool):
+        pool = EDBPool("db", 5444, "AGENAI", "u", "p", min_size=1, max_size=4, statement_cache_size=128)
+        assert "size" not in pool.metrics()
+
+        await asyncio.gather(*(pool.get_pool() for _ in range(5)))
+
+        assert len(fake_pool.calls) == 1
+        assert fake_pool.calls[0]["max_size"] == 4
+        assert fake_pool.calls[0]["statement_cache_size"] == 128
+
+    async def test_acquire_context_releases_and_records_wait(self, fake_pool):
+        pool = EDBPool("db", 5444, "AGENAI", "u", "p")
+
+        async with pool.acquire() as conn:
+            assert await conn.fetchval("SELECT 1") == 1
+            assert pool.metrics()["idle"] == 1
+
+        metrics = pool.metrics()
+        assert fake_pool.released == 1
+        assert metrics["acquisitions"] == 1
+        assert metrics["idle"] == 2
+        assert metrics["failures"] == 0
+
+    async def test_health_check(self, fake_pool):
+        pool = EDBPool("db", 5444, "AGENAI", "u", "p")
+
+        result = await pool.health_check()
+
+        assert result["status"] == "healthy"
+        assert result["latency_ms"] >= 0
+
+    async def test_close(self, fake_pool):
+        pool = EDBPool("db", 5444, "AGENAI", "u", "p")
+        await pool.get_pool()
+
+        await pool.close()
+
+        assert fake_pool.closed is True
+        assert "size" not in pool.metrics()
+
+
+@pytest.mark.asyncio
+class TestGetEdbDependency:
+
+    async def test_connection_acquired_on_first_query_and_returned(self, fake_pool, monkeypatch):
+        monkeypatch.setattr(edb, "edb_pool", EDBPool("db", 5444, "AGENAI", "u", "p"))
+
+        dependency = edb.get_edb()
+        conn = await dependency.__anext__()
+        assert fake_pool.acquired == 0  # 입력 검증 실패 요청은 EDB를 쓰지 않음
+
+        assert await conn.fetchval("SELECT 1") == 1
+        assert await conn.fetchval("SELECT 1") == 1
+        with pytest.raises(StopAsyncIteration):
+            await dependency.__anext__()
+
+        assert fake_pool.acquired == 1
+        assert fake_pool.released == 1
+
+    async def test_unused_connection_not_acquired(self, fake_pool, monkeypatch):
+        monkeypatch.setattr(edb, "edb_pool", EDBPool("db", 5444, "AGENAI", "u", "p"))
+
+        dependency = edb.get_edb()
+        await dependency.__anext__()
+        with pytest.raises(StopAsyncIteration):
+            await dependency.__anext__()
+
+        assert fake_pool.acquired == 0
+        assert fake_pool.released == 0
+
+    async def test_acquire_failure_raises_503(self, fake_pool, monkeypatch):
+        fake_pool.fail = True
+        pool = EDBPool("db", 5444, "AGENAI", "u", "p", acquire_timeout=0.1)
+        monkeypatch.setattr(edb, "edb_pool", pool)
+
+        conn = await edb.get_edb().__anext__()
+        with pytest.raises(HTTPException) as exc_info:
+            await conn.fetchval("SELECT 1")
+
+        assert exc_info.value.status_code == 503
+        assert pool.metrics()["failures"] == 1
@@ -0,0 +1,170 @@
+"""
+임베딩 캐시 테스트
+키 정규화 / float16 직렬화 / LRU / Redis 계층 / 장애 시 로컬 캐시 동작 검증
+"""
+import pytest
+
+from app.services.embedding_cache import (
+    EmbeddingCache,
+    cache_key,
+    decode_vector,
+    encode_vector,
+)
+
+
+class FakeRedis:
+    """mget / pipeline set만 흉내내는 Redis"""
+
+    def __init__(self, fail: bool = False):
+        self.data = {}
+        self.fail = fail
+        self.ttls = {}
+
+    async def mget(self, keys):
+        if self.fail:
+            raise ConnectionError("redis down")
+        return [self.data.get(key) for key in keys]
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+
+class FakePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.ops = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def set(self, key, value, ex=None):
+        self.ops.append((key, value, ex))
+
+    async def execute(self):
+        if self.redis.fail:
+            raise ConnectionError("redis down")
+        for key, value, ex in self.ops:
+            self.redis.data[key] = value
+            self.redis.ttls[key] = ex
+
+
+class Embedder:
+    def __init__(self):
+        self.calls = []
+
+    async def __call__(self, texts):
+        self.calls.append(list(texts))
+        return [[float(len(t)), 0.5, -0.25] for t in texts]
+
+
+def make_cache(redis=None, **kwargs) -> EmbeddingCache:
+    cache = EmbeddingCache(redis_url="redis://test" if redis else None, **kwargs)
+    cache.redis._client = redis
+    return cache
+
+
+class TestEncoding:
+
+    def test_key_normalizes_whitespace_and_unicode(self):
+        assert cache_key("m", "  연차  휴가\n규정 ") == cache_key("m", "연차 휴가 규정")
+        assert cache_key("m", "연차") != cache_key("other", "연차")
+
+    def test_float16_roundtrip_is_compact(self):
+        vector = [0.1234, -0.5, 0.0, 0.999]
+        data = encode_vector(vector, "float16")
+
+        assert len(data) == 1 + 2 * len(vector)
+        assert decode_vector(data) == pytest.approx(vector, abs=1e-3)
+        assert decode_vector(encode_vector(vector, "float32")) == pytest.approx(vector, abs=1e-6)
+
+    def test_out_of_range_falls_back_to_float32(self):
+        data = encode_vector([1e6, 1.0], "float16")
+        assert decode_vector(data) == [1e6, 1.0]
+
+
+@pytest.mark.asyncio
+class TestEmbeddingCache:
+
+    async def test_only_misses_are_embedded_once(self):
+        cache = make_cache()
+        embed = Embedder()
+
+        first = await cache.get_or_embed("m", ["a", "bb", "a"], embed)
+        second = await cache.get_or_embed("m", ["bb", "ccc"], embed)
+
+        assert embed.calls == [["a", "bb"], ["ccc"]]
+        assert [v[0] for v in first] == [1.0, 2.0, 1.0]
+        assert [v[0] for v in second] == [2.0, 3.0]
+        metrics = cache.metrics()
+        assert (metrics["local_hits"], metrics["misses"]) == (1, 3)
+
+    async def test_lru_evicts_oldest(self):
+        cache = make_cache(local_size=2)
+        embed = Embedder()
+
+        await cache.get_or_embed("m", ["a", "bb"], embed)
+        await cache.get_or_embed("m", ["a"], embed)  # a 최근 사용
+        await cache.get_or_embed("m", ["ccc"], embed)  # bb 제거
+        await cache.get_or_embed("m", ["a", "bb"], embed)
+
+        assert embed.calls[-1] == ["bb"]
+
+    async def test_redis_tier_shared_between_processes(self):
+        redis = FakeRedis()
+        writer, reader = make_cache(redis, ttl=60), make_cache(redis)
+        embed = Embedder()
+
+        await writer.get_or_embed("m", ["공유 청크"], embed)
+        [vector] = await reader.get_or_embed("m", ["공유 청크"], embed)
+
+        assert len(embed.calls) == 1
+        assert vector == pytest.approx([5.0, 0.5, -0.25])
+        assert reader.metrics()["redis_hits"] == 1
+        assert set(redis.ttls.values()) == {60}
+
+    async def test_redis_failure_degrades_to_local(self):
+        cache = make_cache(FakeRedis(fail=True))
+        embed = Embedder()
+
+        await cache.get_or_embed("m", ["a"], embed)
+        await cache.get_or_embed("m", ["a"], embed)
+
+        assert len(embed.calls) == 1
+        metrics = cache.metrics()
+        assert metrics["local_hits"] == 1
+        assert metrics["redis_errors"] == 1  # 이후 재시도 전까지 Redis 생략
+
+    async def test_disabled_cache_always_embeds(self):
+        cache = make_cache(enabled=False)
+        embed = Embedder()
+
+        await cache.get_or_embed("m", ["a"], embed)
+        await cache.get_or_embed("m", ["a"], embed)
+
+        assert len(embed.calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_document_processor_uses_shared_embedding_client(monkeypatch):
+    """문서 처리 임베딩도 요청마다 클라이언트를 만들지 않고 공유 embedding 클라이언트 사용"""
+    import httpx
+    from app.services import document_processor as module
+
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(200, json={"data": [{"embedding": [0.5, 0.25]}]})
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    names = []
+    monkeypatch.setattr(module.http_clients, "get", lambda name: names.append(name) or client)
+
+    processor = module.DocumentProcessor(embedding_endpoint="http://embed/v1")
+    assert await processor._request_embeddings(["본문"]) == [[0.5, 0.25]]
+
+    assert names == ["embedding"]
+    assert str(requests[0].url) == "http://embed/v1/embeddings"
@@ -0,0 +1,105 @@
+"""
+Upstream HTTP Client Registry 테스트
+업스트림별 공유 커넥션 풀 재사용 및 풀 메트릭 검증
+"""
+import httpx
+import pytest
+
+from app.core.http_client import UpstreamClientRegistry, UpstreamConfig
+
+
+@pytest.fixture
+def registry():
+    return UpstreamClientRegistry({
+        "ds_api": UpstreamConfig(max_connections=2, max_keepalive_connections=1),
+        "cerbos": UpstreamConfig(max_connections=5, max_keepalive_connections=2, timeout=5.0),
+    })
+
+
+@pytest.fixture
+def fake_upstream(monkeypatch):
+    """실제 네트워크 대신 고정 응답을 돌려주는 전송 계층"""
+    async def handle(self, request):
+        return httpx.Response(200, stream=httpx.ByteStream(b'data: {"type": "token"}\n\n'))
+
+    monkeypatch.setattr(httpx.AsyncHTTPTransport, "handle_async_request", handle)
+
+
+class TestUpstreamClientRegistry:
+    """업스트림 클라이언트 레지스트리 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_client_is_reused_per_upstream(self, registry):
+        """같은 업스트림은 같은 클라이언트(커넥션 풀)를 공유"""
+        assert registry.get("ds_api") is registry.get("ds_api")
+        assert registry.get("ds_api") is not registry.get("cerbos")
+        await registry.aclose()
+
+    def test_unknown_upstream_raises(self, registry):
+        """등록되지 않은 업스트림은 KeyError"""
+        with pytest.raises(KeyError):
+            registry.get("unknown")
+
+    @pytest.mark.asyncio
+    async def test_client_recreated_after_close(self, registry):
+        """aclose() 이후 조회 시 새 클라이언트 생성"""
+        client = registry.get("ds_api")
+        await registry.aclose()
+
+        assert client.is_closed
+        assert registry.get("ds_api") is not client
+        await registry.aclose()
+
+    @pytest.mark.asyncio
+    async def test_timeout_from_config(self, registry):
+        """업스트림 설정의 타임아웃이 클라이언트 기본값으로 적용"""
+        assert registry.get("cerbos").timeout.read == 5.0
+        await registry.aclose()
+
+    @pytest.mark.asyncio
+    async def test_stream_tracks_in_flight(self, registry, fake_upstream):
+        """스트리밍 응답은 본문이 닫힐 때까지 in-flight로 집계"""
+        client = registry.get("ds_api")
+
+        async with client.stream("POST", "http://ds-api.test/v1/chat/") as response:
+            assert registry.metrics()["ds_api"]["in_flight"] == 1
+            async for _ in response.aiter_bytes():
+                pass
+
+        metrics = registry.metrics()["ds_api"]
+        assert metrics["in_flight"] == 0
+        assert metrics["peak_in_flight"] == 1
+        assert metrics["total_requests"] == 1
+        await registry.aclose()
+
+    @pytest.mark.asyncio
+    async def test_saturation_counter(self, registry, fake_upstream):
+        """max_connections에 도달한 상태에서 들어온 요청은 saturated로 집계"""
+        client = registry.get("ds_api")
+
+        async with client.stream("GET", "http://ds-api.test/a"):
+            async with client.stream("GET", "http://ds-api.test/b"):
+                async with client.stream("GET", "http://ds-api.test/c"):
+                    metrics = registry.metrics()["ds_api"]
+                    assert metrics["in_flight"] == 3
+                    assert metrics["saturated_requests"] == 1
+
+        assert registry.metrics()["ds_api"]["in_flight"] == 0
+        await registry.aclose()
+
+    @pytest.mark.asyncio
+    async def test_transport_error_counted(self, registry, monkeypatch):
+        """전송 오류는 errors로 집계되고 in-flight는 복구"""
+        async def fail(self, request):
+            raise httpx.ConnectError("connection refused")
+
+        monkeypatch.setattr(httpx.AsyncHTTPTransport, "handle_async_request", fail)
+        client = registry.get("cerbos")
+
+        with pytest.raises(httpx.ConnectError):
+            await client.post("http://cerbos.test/api/check", json={})
+
+        metrics = registry.metrics()["cerbos"]
+        assert metrics["errors"] == 1
+        assert metrics["in_flight"] == 0
+        await registry.aclose()
@@ -0,0 +1,181 @@
+"""
+IP 허용 목록 테스트
+CIDR longest-prefix 판정 / 규칙별 카운터 / 버전 기반 재적재 / 미들웨어 요청당 DB 조회 없음 검증
+"""
+from unittest.mock import patch
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.middleware.ip_filter import IPFilterMiddleware
+from app.services.ip_allowlist import IPAllowlist, PrefixTree, parse_network
+
+RULES = [
+    (1, "10.10.0.0/16", True),  # 본사 대역
+    (2, "10.10.5.7", False),  # 대역 내 차단 예외
+    (3, "192.168.0.10", True),
+    (4, "2001:db8::/32", True),
+    (5, "not-an-ip", True),  # 잘못된 항목은 건너뜀
+]
+
+
+class CountingLoader:
+    def __init__(self, rows):
+        self.rows = rows
+        self.calls = 0
+
+    async def __call__(self):
+        self.calls += 1
+        return list(self.rows)
+
+
+class FakeRedis:
+    def __init__(self):
+        self.values = {}
+        self.published = []
+
+    async def get(self, key):
+        return self.values.get(key)
+
+    async def incr(self, key):
+        self.values[key] = int(self.values.get(key, 0)) + 1
+        return self.values[key]
+
+    async def publish(self, channel, message):
+        self.published.append((channel, message))
+
+
+def make_allowlist(rows=RULES, redis=None):
+    loader = CountingLoader(rows)
+    allowlist = IPAllowlist(redis_url="redis://fake" if redis else None, loader=loader)
+    allowlist.redis._client = redis
+    return allowlist, loader
+
+
+class TestPrefixTree:
+
+    def test_longest_prefix_wins(self):
+        allowlist, _ = make_allowlist()
+        allowlist.load(RULES)
+
+        assert allowlist.match("10.10.200.1").id == 1
+        assert allowlist.match("10.10.5.7").id == 2
+        assert allowlist.match("10.11.0.1") is None
+        assert allowlist.match("2001:db8:1::5").id == 4
+        assert allowlist.match("2001:db9::1") is None
+
+    def test_ipv4_mapped_ipv6(self):
+        allowlist, _ = make_allowlist()
+        allowlist.load(RULES)
+
+        assert allowlist.match("::ffff:192.168.0.10").id == 3
+
+    def test_default_route(self):
+        tree = PrefixTree(32)
+        tree.insert(parse_network("0.0.0.0/0"), "any")
+
+        assert tree.longest_match(int.from_bytes(bytes([8, 8, 8, 8]), "big")) == "any"
+
+    def test_parse_network_rejects_host_bits(self):
+        with pytest.raises(ValueError):
+            parse_network("10.10.0.1/16")
+
+
+class TestIsAllowed:
+
+    def test_decisions_and_counters(self):
+        allowlist, _ = make_allowlist()
+        allowlist.load(RULES)
+
+        assert allowlist.is_allowed("10.10.1.1")
+        assert allowlist.is_allowed("10.10.1.2")
+        assert not allowlist.is_allowed("10.10.5.7")
+        assert not allowlist.is_allowed("172.16.0.1")
+        assert not allowlist.is_allowed("unknown")
+
+        rules = {rule["id"]: rule for rule in allowlist.rule_metrics()}
+        assert 5 not in rules
+        assert rules[1]["hits"] == 2 and rules[1]["denies"] == 0
+        assert rules[2]["denies"] == 1
+        metrics = allowlist.metrics()
+        assert (metrics["allowed"], metrics["denied"], metrics["unmatched"], metrics["invalid"]) == (2, 3, 1, 1)
+
+    def test_reload_keeps_counters_for_unchanged_rules(self):
+        allowlist, _ = make_allowlist()
+        allowlist.load(RULES)
+        allowlist.is_allowed("10.10.1.1")
+        allowlist.is_allowed("192.168.0.10")
+
+        allowlist.load([(1, "10.10.0.0/16", True), (3, "192.168.0.0/24", True)])
+
+        rules = {rule["id"]: rule for rule in allowlist.rule_metrics()}
+        assert rules[1]["hits"] == 1
+        assert rules[3]["hits"] == 0  # 대역이 바뀐 규칙은 새로 집계
+        assert allowlist.is_allowed("192.168.0.99")
+
+
+@pytest.mark.asyncio
+class TestRefresh:
+
+    async def test_reload_only_when_version_changes(self):
+        redis = FakeRedis()
+        allowlist, loader = make_allowlist(redis=redis)
+
+        await allowlist.ensure_loaded()
+        await allowlist.ensure_loaded()
+        assert loader.calls == 1
+        assert allowlist.version == 0
+
+        assert await allowlist.refresh() is False
+        assert loader.calls == 1
+
+        # 다른 워커에서 규칙 변경
+        redis.values["ip_allowlist:version"] = 3
+        assert await allowlist.refresh() is True
+        assert loader.calls == 2
+        assert allowlist.version == 3
+
+    async def test_notify_changed_bumps_version_and_publishes(self):
+        redis = FakeRedis()
+        allowlist, loader = make_allowlist(rows=[(1, "10.0.0.1", True)], redis=redis)
+        await allowlist.ensure_loaded()
+
+        loader.rows = [(1, "10.0.0.1", True), (2, "10.0.0.0/8", True)]
+        await allowlist.notify_changed()
+
+        assert redis.published == [("ip_allowlist:invalidate", 1)]
+        assert allowlist.version == 1
+        assert allowlist.is_allowed("10.2.3.4")
+
+    async def test_without_redis_always_reloads(self):
+        allowlist, loader = make_allowlist()
+        await allowlist.ensure_loaded()
+
+        assert await allowlist.refresh() is True
+        assert loader.calls == 2
+
+
+class TestIPFilterMiddleware:
+
+    def test_no_rule_lookup_per_request(self):
+        allowlist, loader = make_allowlist()
+        app = FastAPI()
+        app.add_middleware(IPFilterMiddleware)
+
+        @app.get("/api/ping")
+        async def ping():
+            return {"ok": True}
+
+        with patch("app.middleware.ip_filter.ip_allowlist", allowlist):
+            client = TestClient(app)
+            for i in range(20):
+                response = client.get("/api/ping", headers={"X-Forwarded-For": f"10.10.3.{i}"})
+                assert response.status_code == 200
+            blocked = client.get("/api/ping", headers={"X-Forwarded-For": "10.10.5.7"})
+            skipped = client.get("/health", headers={"X-Forwarded-For": "172.16.0.1"})
+
+        assert blocked.status_code == 403
+        assert "허용 목록" in blocked.json()["detail"]
+        assert skipped.status_code == 404  # 차단되지 않고 라우팅됨
+        assert loader.calls == 1
@@ -0,0 +1,90 @@
+"""
+키워드 분류 오토마톤 테스트
+Aho-Corasick 매칭 / 기존 분류 결과와의 동일성 / 규칙 교체 검증
+"""
+import random
+
+import pytest
+
+from app.services import categorization
+from app.services.categorization import (
+    KEYWORD_RULES,
+    categorize_by_keywords,
+    categorize_many,
+    reload_keyword_rules,
+)
+from app.utils.keyword_matcher import KeywordAutomaton
+
+
+def legacy_categorize(question, answer):
+    text = (question + " " + answer).lower()
+    scores = {}
+    for main_cat, sub_cats in KEYWORD_RULES.items():
+        for sub_cat, keywords in sub_cats.items():
+            score = sum(1 for keyword in keywords if keyword.lower() in text)
+            if score > 0:
+                scores[(main_cat, sub_cat)] = score
+    if scores:
+        return max(scores.items(), key=lambda x: x[1])[0]
+    return "미분류", "없음"
+
+
+@pytest.fixture
+def restore_rules():
+    yield
+    reload_keyword_rules(KEYWORD_RULES)
+
+
+class TestKeywordAutomaton:
+    """오토마톤 매칭 테스트"""
+
+    def test_overlapping_keywords(self):
+        """접두/접미/포함 관계 키워드를 모두 찾음"""
+        automaton = KeywordAutomaton([(k, k) for k in ["he", "she", "his", "hers"]])
+        assert automaton.find("ushers") == {"he", "she", "hers"}
+
+    def test_nested_korean_keywords(self):
+        automaton = KeywordAutomaton([("안전", "a"), ("안전점검", "b"), ("점검", "c")])
+        assert automaton.count_labels("교량 안전점검 결과") == {"a": 1, "b": 1, "c": 1}
+
+    def test_case_insensitive_and_distinct_count(self):
+        """대소문자 무시, 같은 키워드 반복은 1회로 계산"""
+        automaton = KeywordAutomaton([("ITS", "교통"), ("CCTV", "교통")])
+        assert automaton.count_labels("its its cctv") == {"교통": 2}
+        assert automaton.count_labels("해당 없음") == {}
+
+    def test_shared_keyword_counts_for_every_label(self):
+        automaton = KeywordAutomaton([("보수", "관리/인사"), ("보수", "도로/시설")])
+        assert automaton.count_labels("노면 보수") == {"관리/인사": 1, "도로/시설": 1}
+
+
+class TestKeywordCategorization:
+    """키워드 분류 결과 테스트"""
+
+    def test_matches_legacy_loop(self):
+        """기존 키워드 루프와 동일한 결과 (동점 처리 포함)"""
+        rng = random.Random(7)
+        keywords = [k for subs in KEYWORD_RULES.values() for kws in subs.values() for k in kws]
+        filler = ["질문", "답변", "관련", "규정", "the", "with"]
+        for _ in range(300):
+            words = [rng.choice(filler + keywords) for _ in range(rng.randint(0, 30))]
+            question = " ".join(words[:5])
+            answer = " ".join(words[5:])
+            assert categorize_by_keywords(question, answer) == legacy_categorize(question, answer)
+
+    def test_categorize_many_preserves_order(self):
+        results = categorize_many([
+            ("하이패스 미납 요금", ""),
+            ("터널 균열 보강", "교량 점검"),
+            ("오늘 날씨", "맑음"),
+        ])
+        assert results == [("경영분야", "고객/통행료"), ("기술분야", "도로/시설"), ("미분류", "없음")]
+
+    def test_reload_keyword_rules(self, restore_rules):
+        """규칙 교체 후 새 키워드로 분류"""
+        reload_keyword_rules({"기타": {"지역본부": ["제주"]}})
+        assert categorize_by_keywords("제주 지사 문의", "") == ("기타", "지역본부")
+        assert categorize_by_keywords("하이패스 요금", "") == ("미분류", "없음")
+
+        reload_keyword_rules(KEYWORD_RULES)
+        assert len(categorization._keyword_automaton) > 100
@@ -0,0 +1,153 @@
+"""
+커서 페이지네이션 테스트
+커서 인코딩 / (created_at, id) 기준 앞뒤 이동 / 대화 목록 API 적용 검증
+"""
+from datetime import datetime, timedelta, timezone
+
+import pytest
+import pytest_asyncio
+from fastapi import HTTPException
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.models import UsageHistory
+from app.models.chat_models import ConversationSummary
+from app.models.user import User
+from app.routers.admin.conversations import get_conversations_simple
+from app.routers.chat.history import PaginationRequest, get_conversation_list
+from app.utils.pagination import (
+    Cursor,
+    apply_keyset,
+    build_keyset_page,
+    decode_cursor,
+    encode_cursor,
+)
+
+BASE = datetime(2025, 10, 20, 9, 0, tzinfo=timezone.utc)
+
+
+@pytest_asyncio.fixture
+async def session():
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as conn:
+        await conn.run_sync(lambda sync_conn: UsageHistory.metadata.create_all(
+            sync_conn, tables=[UsageHistory.__table__, ConversationSummary.__table__, User.__table__]
+        ))
+    async with async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)() as session:
+        # 같은 시각 행을 섞어 id로 순서가 갈리는지 확인
+        for i in range(7):
+            session.add(UsageHistory(
+                user_id="u1", question=f"q{i}", is_deleted=False,
+                created_at=BASE + timedelta(minutes=i // 2),
+            ))
+        await session.commit()
+        yield session
+    await engine.dispose()
+
+
+async def fetch_page(session, cursor=None, limit=3, descending=True):
+    query = apply_keyset(
+        select(UsageHistory), UsageHistory.created_at, UsageHistory.id, cursor, limit, descending
+    )
+    rows = (await session.execute(query)).scalars().all()
+    return build_keyset_page(rows, limit, lambda row: (row.created_at, row.id), cursor)
+
+
+def ids(page):
+    return [row.id for row in page.items]
+
+
+class TestCursorEncoding:
+
+    def test_round_trip(self):
+        token = encode_cursor(BASE, 42, backward=True)
+
+        assert decode_cursor(token) == Cursor(BASE, 42, backward=True)
+        assert decode_cursor(None) is None
+
+    def test_naive_timestamp_round_trip(self):
+        naive = datetime(2025, 10, 20, 9, 0)
+        assert decode_cursor(encode_cursor(naive, 1)).created_at == naive
+
+    @pytest.mark.parametrize("token", ["not-a-cursor", encode_cursor(BASE, 1)[:-4], "e30"])
+    def test_invalid_cursor_is_400(self, token):
+        with pytest.raises(HTTPException) as exc_info:
+            decode_cursor(token)
+        assert exc_info.value.status_code == 400
+
+
+@pytest.mark.asyncio
+class TestKeysetNavigation:
+
+    async def test_forward_pages_cover_all_rows_once(self, session):
+        first = await fetch_page(session)
+        second = await fetch_page(session, decode_cursor(first.next_cursor))
+        third = await fetch_page(session, decode_cursor(second.next_cursor))
+
+        assert ids(first) == [7, 6, 5]
+        assert ids(second) == [4, 3, 2]
+        assert ids(third) == [1]
+        assert first.prev_cursor is None
+        assert third.next_cursor is None
+
+    async def test_backward_returns_previous_page_in_order(self, session):
+        first = await fetch_page(session)
+        second = await fetch_page(session, decode_cursor(first.next_cursor))
+
+        back = await fetch_page(session, decode_cursor(second.prev_cursor))
+
+        assert ids(back) == ids(first)
+        assert back.prev_cursor is None
+        assert ids(await fetch_page(session, decode_cursor(back.next_cursor))) == ids(second)
+
+    async def test_ascending(self, session):
+        first = await fetch_page(session, descending=False)
+        second = await fetch_page(session, decode_cursor(first.next_cursor), descending=False)
+
+        assert ids(first) == [1, 2, 3]
+        assert ids(second) == [4, 5, 6]
+
+
+@pytest.mark.asyncio
+class TestConversationListCursor:
+
+    async def test_history_list_pages_with_cursor(self, session):
+        for i in range(5):
+            session.add(ConversationSummary(
+                cnvs_idt_id=f"u1_room{i}", cnvs_smry_txt=f"요약{i}", usr_id="u1", use_yn="Y",
+                reg_dt=datetime(2025, 10, 20, 9, i),
+            ))
+        session.add(ConversationSummary(
+            cnvs_idt_id="u2_room", cnvs_smry_txt="다른 사용자", usr_id="u2", use_yn="Y",
+            reg_dt=datetime(2025, 10, 20, 10, 0),
+        ))
+        await session.commit()
+        user = {"user_id": "u1"}
+
+        first = await get_conversation_list(PaginationRequest(page_size=2), current_user=user, db=session)
+        second = await get_conversation_list(
+            PaginationRequest(page_size=2, cursor=first["next_cursor"]), current_user=user, db=session
+        )
+        by_page = await get_conversation_list(PaginationRequest(page=2, page_size=2), current_user=user, db=session)
+
+        assert [c["cnvs_idt_id"] for c in first["conversations"]] == ["u1_room4", "u1_room3"]
+        assert [c["cnvs_idt_id"] for c in second["conversations"]] == ["u1_room2", "u1_room1"]
+        # 기존 page 방식도 동일 결과 + 커서 제공
+        assert by_page["conversations"] == second["conversations"]
+        assert by_page["prev_cursor"] is not None
+        assert first["total"] == 2
+
+    async def test_admin_conversations_cursor_keeps_response_shape(self, session):
+        params = dict(start=None, end=None, main_category=None, sub_category=None, page=1, limit=4,
+                      sort_by="created_at", order="desc", count="exact", db=session)
+
+        first = await get_conversations_simple(cursor=None, **params)
+        second = await get_conversations_simple(cursor=first.next_cursor, **params)
+
+        assert [item.id for item in first.items] == [7, 6, 5, 4]
+        assert [item.id for item in second.items] == [3, 2, 1]
+        assert (second.total, second.total_pages, second.next_cursor) == (7, 2, None)
+
+        with pytest.raises(HTTPException) as exc_info:
+            await get_conversations_simple(cursor=first.next_cursor, **(params | {"sort_by": "id"}))
+        assert exc_info.value.status_code == 400
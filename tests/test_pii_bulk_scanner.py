@@ -0,0 +1,161 @@
+"""
+문서 일괄 PII 검사 테스트
+keyset 배치 / 내용 해시 기반 생략 / 배치 INSERT / 체크포인트 재개 검증
+"""
+import json
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy.sql import Insert, Select
+
+from app.models.pii_detection import PIIScanJobStatus
+from app.services.pii_bulk_scanner import PIIBulkScanner, scan_contents
+from app.services.pii_scanner import content_hash
+
+
+class FakeResult:
+    def __init__(self, rows):
+        self._rows = rows
+
+    def all(self):
+        return self._rows
+
+
+class FakeSession:
+    """documents / pii_detection_results / pii_scan_jobs를 메모리에서 흉내내는 AsyncSession 대역"""
+
+    def __init__(self, store):
+        self.store = store
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def get(self, model, job_id):
+        return self.store["jobs"].get(job_id)
+
+    async def execute(self, stmt, params=None):
+        if isinstance(stmt, Insert):
+            self.store["inserts"].append(list(params))
+            self.store["results"].extend(params)
+            return FakeResult([])
+
+        assert isinstance(stmt, Select)
+        compiled = stmt.compile()
+        if "documents" in str(compiled):
+            after = compiled.params["id_1"]
+            limit = compiled.params["param_1"]
+            docs = sorted((d for d in self.store["documents"] if d.id > after), key=lambda d: d.id)
+            return FakeResult(docs[:limit])
+
+        # 문서별 최근 content_hash
+        latest = {}
+        for row in self.store["results"]:
+            latest[row["document_id"]] = row["content_hash"]
+        return FakeResult(list(latest.items()))
+
+    async def commit(self):
+        self.store["commits"] += 1
+
+
+def make_job(job_id=1, last_document_id=0):
+    return SimpleNamespace(
+        id=job_id,
+        status=PIIScanJobStatus.RUNNING.value,
+        last_document_id=last_document_id,
+        scanned_count=0,
+        skipped_count=0,
+        detected_count=0,
+        finished_at=None,
+    )
+
+
+@pytest.fixture
+def store():
+    documents = [
+        SimpleNamespace(id=i, content=f"문서 {i} 연락처 010-1234-{i:04d}" if i % 2 else f"문서 {i}")
+        for i in range(1, 11)
+    ]
+    return {"documents": documents, "results": [], "inserts": [], "commits": 0, "jobs": {1: make_job()}}
+
+
+@pytest.fixture
+def scanner(store):
+    executor = ThreadPoolExecutor(max_workers=2)
+    yield PIIBulkScanner(
+        session_factory=lambda: FakeSession(store),
+        batch_size=4,
+        workers=2,
+        executor=executor,
+    )
+    executor.shutdown()
+
+
+class TestScanContents:
+    """프로세스 풀 작업 함수 테스트"""
+
+    def test_detects_and_serializes_masked_values(self):
+        [(document_id, digest, pii_data, has_pii)] = scan_contents([(1, "연락처 010-1234-5678", None)])
+
+        assert document_id == 1
+        assert digest == content_hash("연락처 010-1234-5678")
+        assert has_pii is True
+        assert "010-1234-5678" not in pii_data
+        assert json.loads(pii_data)[0]["type"] == "phone_number"
+
+    def test_unchanged_content_is_skipped(self):
+        text = "연락처 010-1234-5678"
+        [(_, _, pii_data, has_pii)] = scan_contents([(1, text, content_hash(text))])
+
+        assert pii_data is None
+        assert has_pii is False
+
+
+class TestPIIBulkScanner:
+    """일괄 검사 작업 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_run_scans_all_documents_in_batches(self, scanner, store):
+        """keyset 배치마다 1회 INSERT + 체크포인트 커밋"""
+        await scanner.run(1)
+
+        job = store["jobs"][1]
+        assert job.status == PIIScanJobStatus.COMPLETED.value
+        assert job.scanned_count == 10
+        assert job.detected_count == 5
+        assert job.last_document_id == 10
+        assert [len(batch) for batch in store["inserts"]] == [4, 4, 2]
+        assert store["commits"] == 4  # 3 배치 + 완료
+
+    @pytest.mark.asyncio
+    async def test_resume_from_checkpoint(self, scanner, store):
+        """체크포인트 이후 문서만 검사"""
+        store["jobs"][1] = make_job(last_document_id=8)
+
+        await scanner.run(1)
+
+        assert [row["document_id"] for row in store["results"]] == [9, 10]
+
+    @pytest.mark.asyncio
+    async def test_rescan_skips_unchanged_documents(self, scanner, store):
+        """내용이 바뀌지 않은 문서는 재검사 / 재저장하지 않음"""
+        await scanner.run(1)
+        store["documents"][0].content = "변경된 내용 hong@example.com"
+        store["jobs"][2] = make_job(job_id=2)
+
+        await scanner.run(2)
+
+        job = store["jobs"][2]
+        assert job.scanned_count == 1
+        assert job.skipped_count == 9
+        assert store["results"][-1]["document_id"] == 1
+
+    @pytest.mark.asyncio
+    async def test_cancelled_job_stops(self, scanner, store):
+        store["jobs"][1].status = PIIScanJobStatus.CANCELLED.value
+
+        assert await scanner.run_batch(1) is False
+        assert store["inserts"] == []
@@ -113,6 +113,47 @@ class TestPIIDetector:
         high_confidence_matches = [m for m in matches if m.confidence >= 0.7]
         assert len(high_confidence_matches) == 0
 
+    def test_checksums_adjust_confidence(self, detector):
+        """Luhn / 주민번호 검증번호 통과 여부에 따라 신뢰도 차등"""
+        card_valid = detector.detect("4111-1111-1111-1111")[0]
+        card_invalid = detector.detect("4111-1111-1111-1112")[0]
+        assert card_valid.confidence > card_invalid.confidence
+        assert card_invalid.confidence < 0.7
+
+        rrn_valid = detector.detect("900101-1234568")[0]
+        rrn_invalid = detector.detect("900101-1234567")[0]
+        assert rrn_valid.confidence == 1.0
+        assert rrn_invalid.confidence >= 0.9
+
+    def test_matches_do_not_overlap(self, detector):
+        """카드번호 안의 숫자열이 전화번호/주민번호로 중복 검출되지 않음"""
+        matches = detector.detect("카드 1234567890123456, 휴대폰 01012345678")
+
+        assert [m.pii_type for m in matches] == [PIIType.CREDIT_CARD, PIIType.PHONE_NUMBER]
+        for prev, cur in zip(matches, matches[1:]):
+            assert prev.end_pos <= cur.start_pos
+
+    def test_address_does_not_swallow_following_pii(self, detector):
+        """주소 매치는 같은 줄 몇 어절로 제한되어 뒤따르는 PII를 가리지 않음"""
+        text = "서울특별시 강남구 테헤란로 123\n연락처 010-1234-5678"
+        types = [m.pii_type for m in detector.detect(text)]
+        assert types == [PIIType.ADDRESS, PIIType.PHONE_NUMBER]
+
+    def test_mask_multiple_matches(self, detector):
+        """여러 PII를 한 번에 마스킹, 나머지 텍스트는 보존"""
+        text = "A 901234-1234567 B hong@example.com C 010-1234-5678 D"
+        assert detector.mask(text) == "A 901234-******* B h***@example.com C 010-****-5678 D"
+
+    def test_detect_stream_matches_detect(self, detector):
+        """청크 경계에 걸친 PII도 전체 검사와 같은 결과"""
+        text = ("일반 문장입니다. " * 40 + "연락처 010-1234-5678, hong@example.com, 901234-1234567\n") * 20
+
+        expected = [(m.pii_type, m.value, m.start_pos, m.end_pos) for m in detector.detect(text)]
+        for size in (1, 7, 64, 1000):
+            chunks = (text[i:i + size] for i in range(0, len(text), size))
+            streamed = [(m.pii_type, m.value, m.start_pos, m.end_pos) for m in detector.detect_stream(chunks)]
+            assert streamed == expected, f"chunk size {size}"
+
 
 @pytest.mark.asyncio
 class TestPIIDocumentScanner:
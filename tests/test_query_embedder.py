@@ -0,0 +1,94 @@
+"""
+RAG 질의 임베딩 테스트
+TTL/LRU 캐시 / single-flight 병합 / 마이크로 배치 검증
+"""
+import asyncio
+
+import pytest
+
+from app.services.query_embedder import QueryEmbedder
+
+
+class Embedder:
+    def __init__(self, delay: float = 0.01, fail: bool = False):
+        self.calls = []
+        self.delay = delay
+        self.fail = fail
+
+    async def __call__(self, texts):
+        self.calls.append(list(texts))
+        await asyncio.sleep(self.delay)
+        if self.fail:
+            raise ValueError("embedding server down")
+        return [[float(len(t))] for t in texts]
+
+
+@pytest.mark.asyncio
+class TestQueryEmbedder:
+
+    async def test_identical_concurrent_queries_share_one_call(self):
+        embed = Embedder()
+        embedder = QueryEmbedder(embed, batch_window=0.002)
+
+        results = await asyncio.gather(*(embedder.embed("연차 휴가 규정") for _ in range(20)))
+
+        assert embed.calls == [["연차 휴가 규정"]]
+        assert all(r == [8.0] for r in results)
+        assert embedder.metrics()["coalesced"] == 19
+
+    async def test_distinct_queries_are_micro_batched(self):
+        embed = Embedder()
+        embedder = QueryEmbedder(embed, batch_window=0.005, max_batch=4)
+
+        queries = [f"질문 {i}" for i in range(10)]
+        results = await asyncio.gather(*(embedder.embed(q) for q in queries))
+
+        assert [len(c) for c in embed.calls] == [4, 4, 2]
+        assert results == [[float(len(q))] for q in queries]
+        assert embedder.metrics()["avg_batch_size"] == pytest.approx(10 / 3, abs=0.01)
+
+    async def test_cache_hit_and_ttl_expiry(self):
+        embed = Embedder(delay=0)
+        embedder = QueryEmbedder(embed, ttl=0.05, batch_window=0)
+
+        await embedder.embed("출장비 정산")
+        await embedder.embed("  출장비   정산 ")  # 정규화 후 같은 질의
+        assert len(embed.calls) == 1
+        assert embedder.metrics()["hits"] == 1
+
+        await asyncio.sleep(0.06)
+        await embedder.embed("출장비 정산")
+        assert len(embed.calls) == 2
+
+    async def test_lru_bound(self):
+        embed = Embedder(delay=0)
+        embedder = QueryEmbedder(embed, max_size=2, batch_window=0)
+
+        for q in ("a", "b", "a", "c", "a", "b"):
+            await embedder.embed(q)
+
+        assert [c[0] for c in embed.calls] == ["a", "b", "c", "b"]
+
+    async def test_failure_propagates_to_all_waiters_and_is_not_cached(self):
+        embed = Embedder(fail=True)
+        embedder = QueryEmbedder(embed, batch_window=0.002)
+
+        results = await asyncio.gather(*(embedder.embed(q) for q in ("x", "x", "y")), return_exceptions=True)
+
+        assert all(isinstance(r, ValueError) for r in results)
+        assert len(embed.calls) == 1
+
+        embed.fail = False
+        assert await embedder.embed("x") == [1.0]
+
+    async def test_cancelled_caller_does_not_cancel_shared_request(self):
+        embed = Embedder(delay=0.02)
+        embedder = QueryEmbedder(embed, batch_window=0)
+
+        first = asyncio.create_task(embedder.embed("공유"))
+        second = asyncio.create_task(embedder.embed("공유"))
+        await asyncio.sleep(0.005)
+        first.cancel()
+
+        assert await second == [2.0]
+        assert len(embed.calls) == 1
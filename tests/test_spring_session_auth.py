@@ -0,0 +1,227 @@
+"""
+Spring 세션 인증 테스트
+Redis 세션 해시 해석 / 세션 캐시(부정 캐시 포함) / keyspace 이벤트 무효화 / API 대체 검증
+"""
+import json
+import time
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from fastapi import HTTPException
+
+from app.middleware.spring_session_auth import (
+    SessionCache,
+    SpringSessionAuth,
+    UnsupportedSessionFormat,
+    decode_session_value,
+    extract_user_info,
+)
+
+SECURITY_CONTEXT = {
+    "@class": "org.springframework.security.core.context.SecurityContextImpl",
+    "authentication": {
+        "@class": "org.springframework.security.authentication.UsernamePasswordAuthenticationToken",
+        "authorities": ["java.util.Collections$UnmodifiableRandomAccessList", [
+            {"@class": "org.springframework.security.core.authority.SimpleGrantedAuthority", "authority": "ROLE_ADMIN"},
+            {"@class": "org.springframework.security.core.authority.SimpleGrantedAuthority", "authority": "ROLE_USER"},
+        ]],
+        "authenticated": True,
+        "principal": {
+            "@class": "org.springframework.security.core.userdetails.User",
+            "username": "kim",
+            "password": None,
+            "authorities": ["java.util.Collections$UnmodifiableSet", [
+                {"@class": "org.springframework.security.core.authority.SimpleGrantedAuthority", "authority": "ROLE_ADMIN"},
+            ]],
+        },
+    },
+}
+
+
+def session_hash(attributes, last_accessed_ms=None, max_inactive=1800):
+    last_accessed_ms = int(time.time() * 1000) if last_accessed_ms is None else last_accessed_ms
+    data = {
+        b"creationTime": json.dumps(last_accessed_ms).encode(),
+        b"lastAccessedTime": json.dumps(last_accessed_ms).encode(),
+        b"maxInactiveInterval": json.dumps(max_inactive).encode(),
+    }
+    for name, value in attributes.items():
+        data[f"sessionAttr:{name}".encode()] = value if isinstance(value, bytes) else json.dumps(value).encode()
+    return data
+
+
+class FakeRedis:
+    def __init__(self):
+        self.hashes = {}
+        self.calls = 0
+
+    async def hgetall(self, key):
+        self.calls += 1
+        return dict(self.hashes.get(key, {}))
+
+
+def make_auth(redis=None, **cache_kwargs):
+    auth = SpringSessionAuth(redis_url="redis://fake" if redis else None, cache=SessionCache(**cache_kwargs))
+    auth.redis._client = redis
+    return auth
+
+
+class TestDecode:
+
+    def test_jackson_wrappers_are_removed(self):
+        value = decode_session_value(json.dumps(SECURITY_CONTEXT).encode())
+
+        assert "@class" not in value
+        assert value["authentication"]["authorities"][0] == {"authority": "ROLE_ADMIN"}
+
+    def test_plain_string(self):
+        assert decode_session_value(b"kim") == "kim"
+
+    def test_java_serialization_without_javaobj(self):
+        with patch.dict("sys.modules", {"javaobj": None}):
+            with pytest.raises(UnsupportedSessionFormat):
+                decode_session_value(b"\xac\xed\x00\x05t\x00\x03kim")
+
+    def test_extract_user_info(self):
+        context = decode_session_value(json.dumps(SECURITY_CONTEXT).encode())
+        info = extract_user_info({"SPRING_SECURITY_CONTEXT": context, "department": "본사"})
+
+        assert info["user_id"] == "kim"
+        assert info["roles"] == ["ADMIN"]
+        assert info["department"] == "본사"
+        assert info["authenticated"] is True
+
+    def test_anonymous_session(self):
+        assert extract_user_info({"department": "본사"}) is None
+
+
+@pytest.mark.asyncio
+class TestRedisValidation:
+
+    async def test_reads_session_hash_and_caches(self):
+        redis = FakeRedis()
+        redis.hashes["spring:session:sessions:abc"] = session_hash(
+            {"SPRING_SECURITY_CONTEXT": SECURITY_CONTEXT, "email": "kim@ex.co.kr"}
+        )
+        auth = make_auth(redis)
+
+        with patch.object(auth, "validate_session_via_api", AsyncMock()) as api:
+            first = await auth.get_current_user("abc")
+            second = await auth.get_current_user("abc")
+
+        assert first["user_id"] == second["user_id"] == "kim"
+        assert first["email"] == "kim@ex.co.kr"
+        assert redis.calls == 1
+        api.assert_not_called()
+
+    async def test_missing_session_is_negative_cached(self):
+        redis = FakeRedis()
+        auth = make_auth(redis)
+
+        for _ in range(3):
+            with pytest.raises(HTTPException) as exc:
+                await auth.get_current_user("gone")
+            assert exc.value.status_code == 401
+
+        assert redis.calls == 1
+        assert auth.cache.negative_hits == 2
+
+    async def test_expired_session_hash(self):
+        redis = FakeRedis()
+        redis.hashes["spring:session:sessions:old"] = session_hash(
+            {"SPRING_SECURITY_CONTEXT": SECURITY_CONTEXT},
+            last_accessed_ms=int(time.time() * 1000) - 3600_000,
+        )
+        auth = make_auth(redis)
+
+        with pytest.raises(HTTPException) as exc:
+            await auth.get_current_user("old")
+        assert exc.value.status_code == 401
+
+    async def test_unsupported_format_falls_back_to_api(self):
+        redis = FakeRedis()
+        redis.hashes["spring:session:sessions:jdk"] = session_hash(
+            {"SPRING_SECURITY_CONTEXT": b"\xac\xed\x00\x05sr\x00"}
+        )
+        auth = make_auth(redis)
+        api = AsyncMock(return_value={"authenticated": True, "user_id": "lee", "roles": ["USER"]})
+
+        with patch.dict("sys.modules", {"javaobj": None}), \
+                patch.object(auth, "validate_session_via_api", api):
+            assert (await auth.get_current_user("jdk"))["user_id"] == "lee"
+            assert (await auth.get_current_user("jdk"))["user_id"] == "lee"
+
+        api.assert_awaited_once_with("jdk")
+        assert auth.api_fallbacks == 1
+
+    async def test_redis_error_falls_back_to_api(self):
+        redis = FakeRedis()
+        redis.hgetall = AsyncMock(side_effect=ConnectionError("redis down"))
+        auth = make_auth(redis)
+        api = AsyncMock(return_value={"authenticated": True, "user_id": "lee", "roles": []})
+
+        with patch.object(auth, "validate_session_via_api", api):
+            await auth.get_current_user("s1")
+            auth.cache.clear()
+            await auth.get_current_user("s1")
+
+        assert redis.hgetall.await_count == 1  # 재시도 대기 중에는 Redis 건너뜀
+        assert api.await_count == 2
+        assert auth.redis_errors == 1
+
+    async def test_api_outage_is_not_cached(self):
+        auth = make_auth()
+        api = AsyncMock(side_effect=HTTPException(status_code=503, detail="down"))
+
+        with patch.object(auth, "validate_session_via_api", api):
+            for _ in range(2):
+                with pytest.raises(HTTPException):
+                    await auth.get_current_user("s1")
+
+        assert api.await_count == 2
+
+
+@pytest.mark.asyncio
+class TestInvalidation:
+
+    async def test_keyspace_events_invalidate_cached_session(self):
+        redis = FakeRedis()
+        redis.hashes["spring:session:sessions:abc"] = session_hash({"SPRING_SECURITY_CONTEXT": SECURITY_CONTEXT})
+        auth = make_auth(redis)
+        await auth.get_current_user("abc")
+
+        # 로그아웃: Spring이 세션 해시를 삭제
+        del redis.hashes["spring:session:sessions:abc"]
+        assert auth.handle_keyspace_event(b"spring:session:sessions:expires:abc") == "abc"
+
+        with pytest.raises(HTTPException):
+            await auth.get_current_user("abc")
+        assert auth.cache.invalidations == 1
+
+    async def test_unrelated_keys_are_ignored(self):
+        auth = make_auth(FakeRedis())
+
+        assert auth.handle_keyspace_event(b"embedding:abc") is None
+        assert auth.handle_keyspace_event(b"spring:session:index:x") is None
+
+
+class TestSessionCache:
+
+    def test_ttls(self):
+        cache = SessionCache(ttl=5, negative_ttl=2)
+        with patch("app.middleware.spring_session_auth.time.monotonic", return_value=0):
+            cache.put("ok", {"user_id": "kim"})
+            cache.put("bad", None)
+        with patch("app.middleware.spring_session_auth.time.monotonic", return_value=3):
+            assert cache.get("ok") == (True, {"user_id": "kim"})
+            assert cache.get("bad") == (False, None)
+        with patch("app.middleware.spring_session_auth.time.monotonic", return_value=6):
+            assert cache.get("ok") == (False, None)
+
+    def test_max_size(self):
+        cache = SessionCache(max_size=2)
+        for name in ("a", "b", "c"):
+            cache.put(name, {"user_id": name})
+
+        assert cache.get("a") == (False, None)
+        assert cache.get("c")[0] is True
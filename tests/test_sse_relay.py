@@ -0,0 +1,128 @@
+"""
+SSE 릴레이 테스트
+증분 파서(청크 경계 / 이스케이프 / thinking 분리 / sources / usage) / chat_proxy 릴레이 모드 바이트 동일성 검증
+"""
+import json
+
+import httpx
+import pytest
+
+from app.core.config import settings
+from app.routers import chat_proxy
+from app.routers.chat_proxy import ChatStreamRequest, chat_stream_proxy
+from app.utils.sse_relay import SSEAccumulator
+
+
+def sse(*events):
+    lines = []
+    for event in events:
+        data = event if isinstance(event, str) else json.dumps(event, ensure_ascii=False)
+        lines.append(f"data: {data}\n\n")
+    return "".join(lines).encode("utf-8")
+
+
+STREAM = sse(
+    {"type": "sources", "sources": [{"title": "규정.pdf"}, {"metadata": {"filename": "지침.hwp"}}, "규정.pdf"]},
+    {"type": "token", "content": "<think>검토"},
+    {"type": "token", "content": " 중</think>"},
+    {"type": "token", "content": "안녕"},
+    {"type": "token", "content": "하세요 \"도로\"\n"},
+    {"content": "!", "type": "token"},
+    {"type": "final", "usage": {"prompt_tokens": 12, "completion_tokens": 5, "total_tokens": 17}},
+    "[DONE]",
+)
+
+
+def feed_in_pieces(data, size):
+    parser = SSEAccumulator()
+    for i in range(0, len(data), size):
+        parser.feed(data[i:i + size])
+    parser.close()
+    return parser
+
+
+class TestSSEAccumulator:
+
+    @pytest.mark.parametrize("size", [1, 3, 7, 64, 100000])
+    def test_chunk_boundaries_do_not_matter(self, size):
+        parser = feed_in_pieces(STREAM, size)
+
+        assert parser.answer == '안녕하세요 "도로"\n!'
+        assert parser.thinking == "<think>검토 중</think>"
+        assert parser.sources == ["규정.pdf", "지침.hwp"]
+        assert parser.usage_metadata() == {"prompt_tokens": 12, "completion_tokens": 5, "total_tokens": 17}
+        assert parser.done
+
+    def test_token_events_use_fast_path(self):
+        parser = feed_in_pieces(STREAM, 64)
+
+        assert parser.token_events == 5
+        assert parser.fast_path_events == 4  # 키 순서가 다른 이벤트만 전체 파싱
+
+    def test_token_count_without_usage(self):
+        parser = feed_in_pieces(sse({"type": "token", "content": "a"}, {"type": "token", "content": "b"}), 5)
+
+        assert parser.usage_metadata() == {"tokens": 2}
+
+    def test_crlf_comments_and_malformed_lines(self):
+        data = b': keep-alive\r\nevent: message\r\ndata: {"type": "token", "content": "x"}\r\n\r\ndata: {broken\r\n\r\n'
+        parser = feed_in_pieces(data, 4)
+
+        assert parser.answer == "x"
+        assert parser.malformed_events == 1
+
+    def test_last_line_without_newline(self):
+        parser = SSEAccumulator()
+        parser.feed(b'data: {"type": "token", "content": "end"}')
+        assert parser.answer == ""
+        parser.close()
+        assert parser.answer == "end"
+
+
+@pytest.mark.asyncio
+class TestChatProxyRelay:
+
+    @pytest.fixture
+    def upstream(self, monkeypatch):
+        async def body():
+            for i in range(0, len(STREAM), 50):
+                yield STREAM[i:i + 50]
+
+        def handler(request):
+            return httpx.Response(200, content=body(), headers={"content-type": "text/event-stream"})
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        monkeypatch.setattr(chat_proxy.http_clients, "get", lambda name: client)
+
+        submitted = []
+        monkeypatch.setattr(chat_proxy.usage_writer, "submit", lambda **row: submitted.append(row))
+        return submitted
+
+    async def stream(self):
+        request = ChatStreamRequest(message="질문", session_id="s1", user_id="u1", file_ids=["f1"])
+        response = await chat_stream_proxy(request, db=None)
+        chunks = [chunk async for chunk in response.body_iterator]
+        return chunks
+
+    async def test_relay_forwards_upstream_bytes_unchanged(self, upstream, monkeypatch):
+        monkeypatch.setattr(settings, "CHAT_PROXY_RELAY_MODE", True)
+
+        chunks = await self.stream()
+
+        assert b"".join(chunks) == STREAM
+        [row] = upstream
+        assert row["answer"] == '안녕하세요 "도로"\n!'
+        assert row["thinking_content"] == "검토 중"
+        assert row["referenced_documents"] == ["규정.pdf", "지침.hwp"]
+        assert row["usage_metadata"]["total_tokens"] == 17
+
+    async def test_legacy_mode_saves_same_answer(self, upstream, monkeypatch):
+        monkeypatch.setattr(settings, "CHAT_PROXY_RELAY_MODE", False)
+
+        chunks = await self.stream()
+
+        assert chunks[-1] == "data: [DONE]\n\n"
+        [row] = upstream
+        assert row["answer"] == '안녕하세요 "도로"\n!'
+        assert row["thinking_content"] == "검토 중"
+        assert row["referenced_documents"] == ["규정.pdf", "지침.hwp"]
@@ -0,0 +1,98 @@
+"""
+토큰 기준 텍스트 청커 테스트
+원문 오프셋 / 토큰 예산 / 겹침 / 문단·문장 경계 검증
+"""
+import pytest
+
+from app.utils.text_chunker import TextChunker, estimate_tokens, get_token_counter
+
+
+def char_counter(text: str) -> int:
+    """공백 제외 글자 수 = 토큰 수 (테스트용 결정적 토크나이저)"""
+    return sum(1 for c in text if not c.isspace())
+
+
+class TestEstimateTokens:
+    """토크나이저 없는 토큰 수 추정"""
+
+    def test_hangul_and_alnum(self):
+        assert estimate_tokens("가나다") == 3
+        assert estimate_tokens("embedding") == 3  # 9글자 / 4 올림
+        assert estimate_tokens("Qwen3 임베딩, 512") == 2 + 3 + 1 + 1
+
+    def test_missing_tokenizer_falls_back_to_estimate(self):
+        assert get_token_counter(None) is estimate_tokens
+        assert get_token_counter("/nonexistent/tokenizer.json") is estimate_tokens
+
+
+class TestTextChunker:
+    """공용 청커 테스트"""
+
+    def test_offsets_point_into_source(self):
+        text = "첫 문장입니다. 두 번째 문장이에요! 세 번째\n다음 줄임\n\n새 문단 시작. " * 30
+        chunker = TextChunker(max_tokens=40, overlap_tokens=8, token_counter=char_counter)
+
+        chunks = chunker.chunk(text)
+
+        assert len(chunks) > 1
+        assert [c.index for c in chunks] == list(range(len(chunks)))
+        for chunk in chunks:
+            assert text[chunk.start:chunk.end] == chunk.text
+            assert chunk.text == chunk.text.strip()
+
+    def test_token_budget_respected(self):
+        text = "\n".join(f"{i}번 항목은 처리 완료됨. 담당자 확인 필요." for i in range(200))
+        chunker = TextChunker(max_tokens=50, overlap_tokens=10, token_counter=char_counter)
+
+        for chunk in chunker.iter_chunks(text):
+            assert chunk.token_count <= 50
+            assert char_counter(chunk.text) <= 50
+
+    def test_overlap_repeats_trailing_sentences(self):
+        text = " ".join(f"문장{i:02d}." for i in range(40))  # 문장당 5토큰
+        chunker = TextChunker(max_tokens=20, overlap_tokens=10, token_counter=char_counter)
+
+        chunks = chunker.chunk(text)
+
+        for prev, cur in zip(chunks, chunks[1:]):
+            assert cur.start < prev.end  # 겹침
+            overlap = text[cur.start:prev.end]
+            assert 0 < char_counter(overlap) <= 10
+        assert chunks[-1].text.endswith("문장39.")
+
+    def test_splits_on_sentence_boundaries(self):
+        text = "보고서를 제출함 - 기한 준수 요망 1. 세부 일정은 별첨. 질문이 있나요? 없습니다."
+        chunker = TextChunker(max_tokens=12, overlap_tokens=0, token_counter=char_counter)
+
+        texts = [c.text for c in chunker.chunk(text)]
+
+        assert texts[0] == "보고서를 제출함"
+        for chunk_text in texts:
+            # 어절 중간에서 끊기지 않음
+            assert chunk_text.endswith(("함", "망", "1.", "별첨.", "?", "니다."))
+
+    def test_breaks_at_paragraph_when_half_full(self):
+        text = "가" * 30 + ".\n\n" + "나" * 10 + "."
+        chunker = TextChunker(max_tokens=50, overlap_tokens=0, token_counter=char_counter)
+
+        texts = [c.text for c in chunker.chunk(text)]
+
+        assert texts == ["가" * 30 + ".", "나" * 10 + "."]
+
+    def test_oversized_sentence_is_split(self):
+        text = "가" * 2000
+        chunker = TextChunker(max_tokens=512, overlap_tokens=64)
+
+        chunks = chunker.chunk(text)
+
+        assert "".join(c.text for c in chunks) == text
+        assert all(c.token_count <= 512 for c in chunks)
+        assert len(chunks) == 5
+
+    def test_empty_text(self):
+        assert TextChunker().chunk("") == []
+        assert TextChunker().chunk(" \n\n ") == []
+
+    def test_overlap_must_be_smaller_than_budget(self):
+        with pytest.raises(ValueError):
+            TextChunker(max_tokens=10, overlap_tokens=10)
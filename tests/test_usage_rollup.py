@@ -0,0 +1,216 @@
+"""
+사용 이력 집계(rollup) 테스트
+행 단위 증분 집계 / settle 대기 / 집계 후 분류 보정 / 집계 + tail 조회 / 기간 재집계 검증
+"""
+from datetime import date, datetime, timedelta, timezone
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.models import (
+    UsageHistory,
+    UsageRollupDaily,
+    UsageRollupDailyUser,
+    UsageRollupHourly,
+    UsageRollupState,
+)
+from app.services.usage_rollup import UsageRollupService, group_rollups
+
+TABLES = [
+    UsageHistory.__table__,
+    UsageRollupHourly.__table__,
+    UsageRollupDaily.__table__,
+    UsageRollupDailyUser.__table__,
+    UsageRollupState.__table__,
+]
+
+# 2025-10-20 23:30 KST = 2025-10-20 14:30 UTC
+BASE = datetime(2025, 10, 20, 14, 30, tzinfo=timezone.utc)
+
+
+@pytest_asyncio.fixture
+async def session_factory():
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as conn:
+        await conn.run_sync(lambda sync_conn: UsageHistory.metadata.create_all(sync_conn, tables=TABLES))
+    yield async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    await engine.dispose()
+
+
+async def add_usage(factory, *rows):
+    async with factory() as session:
+        for row in rows:
+            session.add(UsageHistory(question="질문", is_deleted=False, **row))
+        await session.commit()
+
+
+def recent(**row):
+    """tail 범위 안의 최근 행 (BASE는 tail_seconds 밖)"""
+    return row | {"created_at": datetime.now(timezone.utc) - timedelta(minutes=5)}
+
+
+def usage(user_id="u1", minutes=0, response_time=1000.0, model="ex-GPT", category="경영분야", metadata=None):
+    return {
+        "user_id": user_id,
+        "created_at": BASE + timedelta(minutes=minutes),
+        "response_time": response_time,
+        "model_name": model,
+        "main_category": category,
+        "usage_metadata": metadata,
+    }
+
+
+@pytest.mark.asyncio
+class TestUsageRollup:
+
+    async def test_incremental_rollup_by_kst_buckets(self, session_factory):
+        service = UsageRollupService(session_factory=session_factory, batch_size=2)
+        await add_usage(
+            session_factory,
+            usage("u1", 0, 1000.0, metadata={"department": "도로처", "total_tokens": 120}),
+            usage("u1", 10, 3000.0, metadata={"department": "도로처", "tokens": 80}),
+            usage("u2", 40, None, model=None, category=None),  # 00:10 KST → 다음 날
+        )
+
+        assert await service.catch_up() == 3
+
+        async with session_factory() as session:
+            daily = (await session.execute(select(UsageRollupDaily).order_by(UsageRollupDaily.bucket))).scalars().all()
+            state = (await session.execute(select(UsageRollupState))).scalar_one()
+
+        assert state.last_id == 3
+        assert [(d.bucket, d.department, d.model_name, d.main_category) for d in daily] == [
+            (date(2025, 10, 20), "도로처", "ex-GPT", "경영분야"),
+            (date(2025, 10, 21), "미분류", "", "미분류"),
+        ]
+        assert (daily[0].question_count, daily[0].response_count) == (2, 2)
+        assert daily[0].response_time_sum == 4000.0
+        assert daily[0].token_sum == 200
+        assert (daily[1].question_count, daily[1].response_count) == (1, 0)
+
+        # 이후 행만 가산
+        await add_usage(session_factory, usage("u3", 5, 2000.0, metadata={"department": "도로처"}))
+        assert await service.catch_up() == 1
+        async with session_factory() as session:
+            rows = await service.fetch(session, "daily", date(2025, 10, 20), date(2025, 10, 20))
+            users = await service.fetch_daily_user_counts(session, date(2025, 10, 20), date(2025, 10, 21))
+        assert rows[0].totals.question_count == 3
+        assert rows[0].totals.average_response_time == 2000.0
+        assert users == {date(2025, 10, 20): 2, date(2025, 10, 21): 1}
+
+    async def test_waits_for_categorizer_before_rolling_up(self, session_factory):
+        service = UsageRollupService(session_factory=session_factory, settle_seconds=300)
+        now = datetime.now(timezone.utc)
+        await add_usage(
+            session_factory,
+            usage("u1", category="기술분야") | {"created_at": now - timedelta(seconds=10)},
+            usage("u2", category=None) | {"created_at": now - timedelta(seconds=5)},
+            usage("u3", category="기술분야") | {"created_at": now},
+        )
+
+        result = await service.run_once()
+
+        # 분류 대기 중인 2번 행만 건너뛰고 다음 주기에 집계
+        assert result == {"rolled_up": 2, "last_id": 3}
+        async with session_factory() as session:
+            row = await session.get(UsageHistory, 2)
+            assert row.rolled_up_category is None
+
+    async def test_late_committed_lower_id_is_rolled_up(self, session_factory):
+        """높은 id가 먼저 집계된 뒤 커밋된 낮은 id 행도 누락 없이 집계"""
+        service = UsageRollupService(session_factory=session_factory)
+        async with session_factory() as session:
+            session.add(UsageHistory(id=5, question="질문", is_deleted=False, **usage("u1", 0)))
+            await session.commit()
+        assert await service.catch_up() == 1
+
+        async with session_factory() as session:
+            session.add(UsageHistory(id=3, question="질문", is_deleted=False, **usage("u2", 1)))
+            await session.commit()
+        assert await service.catch_up() == 1
+
+        async with session_factory() as session:
+            rows = await service.fetch(session, "daily")
+        assert sum(r.totals.question_count for r in rows) == 2
+
+    async def test_recategorize_moves_unknown_rollup_to_new_category(self, session_factory):
+        """settle 이후 '미분류'로 집계된 행이 분류되면 이전 bucket에서 빼고 새 대분류에 더함"""
+        service = UsageRollupService(session_factory=session_factory)
+        await add_usage(session_factory, usage("u1", 0, category=None), usage("u2", 1, category="경영분야"))
+        await service.catch_up()
+
+        async with session_factory() as session:
+            row = await session.get(UsageHistory, 1)
+            row.main_category = "기술분야"
+            await session.flush()
+            assert await service.recategorize(session, [1, 2]) == 1
+            await session.commit()
+
+        async with session_factory() as session:
+            daily = (await session.execute(select(UsageRollupDaily))).scalars().all()
+            hourly = await service.fetch(session, "hourly")
+            row = await session.get(UsageHistory, 1)
+        assert sorted((d.main_category, d.question_count) for d in daily) == [("경영분야", 1), ("기술분야", 1)]
+        assert {r.main_category for r in hourly} == {"경영분야", "기술분야"}
+        assert row.rolled_up_category == "기술분야"
+
+    async def test_tail_is_bounded_by_time(self, session_factory):
+        """조회 시 합산하는 미집계 행은 tail_seconds 이내로 제한"""
+        service = UsageRollupService(session_factory=session_factory, tail_seconds=3600)
+        await add_usage(session_factory, usage("u1", 0), recent(**usage("u2", 0)))
+
+        async with session_factory() as session:
+            users = await service.fetch_users(session)
+        assert users == {"u2"}
+
+    async def test_fetch_merges_unrolled_tail(self, session_factory):
+        service = UsageRollupService(session_factory=session_factory)
+        await add_usage(session_factory, usage("u1", 0), usage("u2", 5))
+        await service.catch_up()
+        await add_usage(session_factory, usage("u1", 20, 4000.0), usage("u4", 20, model="other"))
+        service.tail_seconds = (datetime.now(timezone.utc) - BASE).total_seconds() + 3600
+
+        async with session_factory() as session:
+            hourly = await service.fetch(session, "hourly", date(2025, 10, 20), date(2025, 10, 20))
+            users = await service.fetch_users(session, date(2025, 10, 20), date(2025, 10, 20))
+            user_counts = await service.fetch_daily_user_counts(session, date(2025, 10, 20), date(2025, 10, 20))
+
+        by_model = group_rollups(hourly, lambda r: r.model_name)
+        assert by_model["ex-GPT"].question_count == 3
+        assert by_model["ex-GPT"].average_response_time == 2000.0
+        assert by_model["other"].question_count == 1
+        assert {service.local_hour(r.bucket) for r in hourly} == {23}
+        assert users == {"u1", "u2", "u4"}
+        assert user_counts == {date(2025, 10, 20): 3}
+
+    async def test_rebuild_range_recomputes_rolled_up_rows(self, session_factory):
+        service = UsageRollupService(session_factory=session_factory)
+        await add_usage(session_factory, usage("u1", 0), usage("u2", 60 * 24))
+        await service.catch_up()
+
+        # 집계 이후 분류가 바뀐 행 보정
+        async with session_factory() as session:
+            row = await session.get(UsageHistory, 1)
+            row.main_category = "기술분야"
+            await session.commit()
+
+        assert await service.rebuild(date(2025, 10, 20), date(2025, 10, 20)) == 1
+
+        async with session_factory() as session:
+            rows = await service.fetch(session, "daily")
+        by_key = group_rollups(rows, lambda r: (r.bucket, r.main_category))
+        assert set(by_key) == {(date(2025, 10, 20), "기술분야"), (date(2025, 10, 21), "경영분야")}
+        assert all(totals.question_count == 1 for totals in by_key.values())
+
+    async def test_full_rebuild_resets_high_water_mark(self, session_factory):
+        service = UsageRollupService(session_factory=session_factory, batch_size=1)
+        await add_usage(session_factory, usage("u1", 0), usage("u2", 1), usage("u3", 2))
+        await service.catch_up()
+
+        assert await service.rebuild() == 3
+
+        async with session_factory() as session:
+            rows = await service.fetch(session, "daily")
+        assert sum(r.totals.question_count for r in rows) == 3
@@ -0,0 +1,307 @@
+"""
+Usage History Write-Behind 테스트
+스트리밍 종료 후 usage_history 배치 저장 / backpressure / spill 파일 복구 검증
+"""
+import asyncio
+import json
+import os
+
+import pytest
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.dialects.postgresql import Insert
+from sqlalchemy.exc import IntegrityError
+
+from app.services.usage_writer import UsageWriteBehind, process_spill_path
+
+
+class FakeResult:
+    def __init__(self, rows=None, rowcount=None):
+        self._rows = rows or []
+        self.rowcount = rowcount
+
+    def fetchall(self):
+        return self._rows
+
+
+class FakeSession:
+    """INSERT 문과 커밋 횟수를 기록하는 AsyncSession 대역"""
+
+    def __init__(self, store, fail=False):
+        self.store = store
+        self.fail = fail
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def execute(self, stmt):
+        if self.fail:
+            raise ConnectionError("database unavailable")
+        if isinstance(stmt, Insert):
+            questions = {
+                value for row in (stmt._multi_values[0] if stmt._multi_values else [])
+                for column, value in row.items() if getattr(column, "name", column) == "question"
+            }
+            if questions & self.store["reject"]:
+                raise IntegrityError("INSERT INTO usage_history", {}, Exception("check violation"))
+            self.store["inserts"].append(stmt)
+            count = len(stmt._multi_values[0]) if stmt._multi_values else 1
+            self.store["rows"] += count
+            return FakeResult(rowcount=count)
+        # 기존 세션 조회
+        return FakeResult(rows=[(sid,) for sid in self.store["existing_sessions"]])
+
+    async def commit(self):
+        self.store["commits"] += 1
+
+
+@pytest.fixture
+def store():
+    return {"inserts": [], "rows": 0, "commits": 0, "existing_sessions": [], "fail": False, "reject": set()}
+
+
+@pytest.fixture
+def make_writer(store, tmp_path):
+    def factory(**kwargs):
+        kwargs.setdefault("flush_interval", 0.01)
+        kwargs.setdefault("spill_path", str(tmp_path / "spill.jsonl"))
+        return UsageWriteBehind(
+            session_factory=lambda: FakeSession(store, fail=store["fail"]),
+            **kwargs
+        )
+    return factory
+
+
+async def wait_until(predicate, timeout=2.0):
+    deadline = asyncio.get_event_loop().time() + timeout
+    while not predicate():
+        if asyncio.get_event_loop().time() > deadline:
+            raise AssertionError("condition not met in time")
+        await asyncio.sleep(0.01)
+
+
+class TestUsageWriteBehind:
+    """write-behind 기록기 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_rows_are_batched_into_single_insert(self, make_writer, store):
+        """여러 대화가 하나의 다건 INSERT + 1회 커밋으로 저장"""
+        writer = make_writer(batch_size=50)
+        writer.start()
+        for i in range(10):
+            writer.submit(user_id="u1", session_id=f"s{i}", question=f"질문 {i}", answer="답변")
+
+        await wait_until(lambda: store["rows"] == 10)
+        await writer.stop()
+
+        assert len(store["inserts"]) == 1
+        assert store["commits"] == 1
+        assert writer.stats.inserted == 10
+
+    @pytest.mark.asyncio
+    async def test_insert_uses_on_conflict_do_nothing(self, make_writer, store):
+        """중복은 DB unique index + ON CONFLICT DO NOTHING으로 무시"""
+        writer = make_writer()
+        writer.start()
+        writer.submit(user_id="u1", session_id="s1", question="q", answer="a")
+        await wait_until(lambda: store["inserts"])
+        await writer.stop()
+
+        sql = str(store["inserts"][0].compile(dialect=postgresql.dialect()))
+        assert "ON CONFLICT DO NOTHING" in sql
+
+    @pytest.mark.asyncio
+    async def test_duplicates_in_batch_are_collapsed(self, make_writer, store):
+        """같은 배치 내 (session_id, question) 중복은 한 번만 INSERT"""
+        writer = make_writer()
+        writer.submit(user_id="u1", session_id="s1", question="q", answer="a1")
+        writer.submit(user_id="u1", session_id="s1", question="q", answer="a2")
+
+        await wait_until(lambda: store["rows"] >= 1)
+        await writer.stop()
+
+        assert store["rows"] == 1
+        assert writer.stats.duplicates == 1
+
+    @pytest.mark.asyncio
+    async def test_first_turn_gets_title(self, make_writer, store):
+        """새 세션 첫 턴에만 제목 생성, 카테고리는 분류 워커 몫으로 NULL 유지"""
+        store["existing_sessions"] = ["old_session"]
+        writer = make_writer()
+        captured = []
+
+        original = writer._flush
+
+        async def spy(batch):
+            await original(batch)
+            captured.extend(batch)
+
+        writer._flush = spy
+        writer.submit(user_id="u1", session_id="new_session", question="고속도로 포장 보수 기준", answer="a")
+        writer.submit(user_id="u1", session_id="new_session", question="두 번째 질문", answer="a")
+        writer.submit(user_id="u1", session_id="old_session", question="기존 세션 질문", answer="a")
+
+        await wait_until(lambda: len(captured) == 3)
+        await writer.stop()
+
+        by_question = {row["question"]: row for row in captured}
+        assert by_question["고속도로 포장 보수 기준"]["conversation_title"]
+        assert by_question["두 번째 질문"]["conversation_title"] is None
+        assert by_question["기존 세션 질문"]["conversation_title"] is None
+        assert all(row["main_category"] is None for row in captured)
+
+    @pytest.mark.asyncio
+    async def test_queue_full_spills_to_disk(self, make_writer, tmp_path):
+        """큐가 가득 차면 요청을 막지 않고 spill 파일에 기록 (backpressure)"""
+        writer = make_writer(queue_size=2)
+        # flusher가 소비하지 않는 상태를 재현
+        writer._queue = asyncio.Queue(maxsize=2)
+        writer._task = asyncio.get_event_loop().create_future()
+
+        for i in range(5):
+            writer.submit(user_id="u1", session_id="s1", question=f"q{i}", answer="a")
+
+        lines = open(writer.spill_path, encoding="utf-8").read().splitlines()
+        assert len(lines) == 3
+        assert json.loads(lines[0])["question"] == "q2"
+        assert writer.stats.spilled == 3
+
+    @pytest.mark.asyncio
+    async def test_flush_failure_spills_and_replays(self, make_writer, store, tmp_path):
+        """DB 저장 실패 시 spill 후, 재시작하면 spill 파일을 재적재하여 저장"""
+        store["fail"] = True
+        writer = make_writer()
+        writer.submit(user_id="u1", session_id="s1", question="q", answer="a")
+        await wait_until(lambda: writer.stats.flush_failures >= 1)
+        await writer.stop()
+
+        spill = writer.spill_path
+        assert os.path.exists(spill)
+
+        store["fail"] = False
+        writer = make_writer()
+        writer.start()
+        await wait_until(lambda: store["rows"] == 1)
+        await writer.stop()
+
+        assert writer.stats.replayed == 1
+        assert not os.path.exists(spill)
+
+    @pytest.mark.asyncio
+    async def test_leftover_replay_file_is_replayed(self, make_writer, store, tmp_path):
+        """rename과 삭제 사이 종료로 남은 .replay 파일도 재시작 시 재적재 후 삭제"""
+        store["fail"] = True
+        writer = make_writer()
+        writer.submit(user_id="u1", session_id="s1", question="q1", answer="a")
+        await wait_until(lambda: writer.stats.flush_failures >= 1)
+        await writer.stop()
+        spill = writer.spill_path
+        os.replace(spill, f"{spill}.replay")
+
+        store["fail"] = True
+        writer = make_writer()
+        writer.submit(user_id="u1", session_id="s2", question="q2", answer="a")
+        await wait_until(lambda: writer.stats.flush_failures >= 1)
+        await writer.stop()
+
+        store["fail"] = False
+        writer = make_writer()
+        writer.start()
+        await wait_until(lambda: store["rows"] == 2)
+        await writer.stop()
+
+        assert writer.stats.replayed == 2
+        assert not os.path.exists(spill)
+        assert not os.path.exists(f"{spill}.replay")
+
+    @pytest.mark.asyncio
+    async def test_replay_file_kept_until_rows_flushed(self, make_writer, store):
+        """재적재한 행이 저장되기 전에는 replay 파일을 지우지 않음 (도중 종료 시 유실 방지)"""
+        writer = make_writer()
+        row = {"user_id": "u1", "session_id": "s1", "question": "q", "answer": "a",
+               "conversation_title": "t", "created_at": "2025-11-01T00:00:00+00:00"}
+        with open(writer.spill_path, "w", encoding="utf-8") as f:
+            f.write(json.dumps(row) + "\n")
+
+        writer._replay_spill()
+        assert writer.pending == 1
+        assert os.path.exists(f"{writer.spill_path}.replay")
+        assert not os.path.exists(writer.spill_path)
+
+        writer.start()
+        await wait_until(lambda: store["rows"] == 1)
+        await writer.stop()
+
+        assert not os.path.exists(f"{writer.spill_path}.replay")
+
+    @pytest.mark.asyncio
+    async def test_rejected_row_is_dead_lettered(self, make_writer, store):
+        """데이터 오류 배치는 분할 재시도 - 나머지 행은 저장, 문제 행만 .dead 파일로 격리"""
+        store["reject"] = {"q3"}
+        writer = make_writer(batch_size=50, flush_interval=5.0)
+        for i in range(8):
+            writer.submit(user_id="u1", session_id=f"s{i}", question=f"q{i}", answer="a")
+
+        await writer.stop()
+
+        assert store["rows"] == 7
+        assert writer.stats.dead_lettered == 1
+        assert writer.stats.flush_failures == 0
+        assert not os.path.exists(writer.spill_path)
+        dead = open(f"{writer.spill_path}.dead", encoding="utf-8").read().splitlines()
+        assert [json.loads(line)["question"] for line in dead] == ["q3"]
+
+    def test_spill_file_is_per_process(self, make_writer, tmp_path):
+        """워커 프로세스마다 다른 spill 파일 사용"""
+        writer = make_writer()
+
+        assert writer.spill_path == str(tmp_path / f"spill.{os.getpid()}.jsonl")
+        assert process_spill_path("/tmp/usage.jsonl", pid=42) == "/tmp/usage.42.jsonl"
+
+    @pytest.mark.asyncio
+    async def test_orphan_spill_of_exited_worker_is_adopted(self, make_writer, store, tmp_path, monkeypatch):
+        """종료된 워커의 spill 파일은 재시작한 워커가 인수하여 저장"""
+        monkeypatch.setattr("app.services.usage_writer._pid_alive", lambda pid: False)
+        row = {"user_id": "u1", "session_id": "s1", "question": "q", "answer": "a",
+               "conversation_title": "t", "created_at": "2025-11-01T00:00:00+00:00"}
+        orphan = tmp_path / "spill.999999.jsonl"
+        orphan.write_text(json.dumps(row) + "\n", encoding="utf-8")
+        (tmp_path / "spill.999999.jsonl.dead").write_text("{}\n", encoding="utf-8")
+
+        writer = make_writer()
+        writer.start()
+        await wait_until(lambda: store["rows"] == 1)
+        await writer.stop()
+
+        assert not orphan.exists()
+        assert (tmp_path / "spill.999999.jsonl.dead").exists()  # dead-letter 파일은 재적재하지 않음
+        assert not any(".replay" in name for name in os.listdir(tmp_path))
+
+    @pytest.mark.asyncio
+    async def test_stop_drains_pending_rows(self, make_writer, store):
+        """종료 시 큐에 남은 행을 모두 저장"""
+        writer = make_writer(flush_interval=5.0, batch_size=3)
+        for i in range(7):
+            writer.submit(user_id="u1", session_id=f"s{i}", question="q", answer="a")
+
+        await writer.stop()
+
+        assert store["rows"] == 7
+        assert writer.pending == 0
+
+    @pytest.mark.asyncio
+    async def test_metrics_snapshot(self, make_writer, store):
+        """flush 지연시간 메트릭 노출"""
+        writer = make_writer()
+        writer.submit(user_id="u1", session_id="s1", question="q", answer="a")
+        await wait_until(lambda: writer.stats.batches == 1)
+
+        metrics = writer.metrics()
+        await writer.stop()
+
+        assert metrics["running"] is True
+        assert metrics["inserted"] == 1
+        assert metrics["avg_flush_ms"] >= 0
+        assert metrics["queue_capacity"] == writer.queue_size
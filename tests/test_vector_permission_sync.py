@@ -0,0 +1,315 @@
+"""
+벡터 권한 동기화 테스트
+권한 변경 → Qdrant set_payload batch / payload 인덱스 생성 / 시작 시 backfill / 검색 필터 크기가 문서 수와 무관한지 검증
+"""
+import asyncio
+import json
+
+import httpx
+import pytest
+from sqlalchemy.sql import Select
+
+from app.services import ai_service as ai_module
+from app.services import vector_permission_sync as module
+from app.services.ai_service import AIService
+from app.services.vector_permission_sync import VectorPermissionSync
+
+
+class FakeResult:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def all(self):
+        return self.rows
+
+
+class FakeSession:
+    """DocumentPermission (document_id, department_id) 행을 돌려주는 세션 (문서별 / 부서별 조회)"""
+
+    def __init__(self, permissions, document_ids=()):
+        self.permissions = permissions
+        self.document_ids = list(document_ids)
+        self.queries = 0
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def execute(self, stmt):
+        assert isinstance(stmt, Select)
+        self.queries += 1
+        params = stmt.compile().params
+        if "documents" in {t.name for t in stmt.get_final_froms()}:
+            last_id = next(v for k, v in params.items() if k.startswith("id_"))
+            limit = next(v for k, v in params.items() if k.startswith("param_"))
+            return FakeResult([(i,) for i in self.document_ids if i > last_id][:limit])
+        requested = next((v for v in params.values() if isinstance(v, list)), None)
+        if requested is None:
+            # 부서가 열람 가능한 문서 ID 조회
+            department_id = next(v for k, v in params.items() if k.startswith("department_id"))
+            return FakeResult([(row[0],) for row in self.permissions if row[1] == department_id])
+        return FakeResult([row for row in self.permissions if row[0] in requested])
+
+
+@pytest.fixture
+def missing_points():
+    """access_departments가 없는 point 수 (points/count 응답)"""
+    return {"count": 3}
+
+
+@pytest.fixture
+def qdrant(monkeypatch, missing_points):
+    """Qdrant 요청을 기록하는 가짜 업스트림"""
+    calls = []
+
+    async def handler(request):
+        calls.append((request.method, request.url.path, json.loads(request.content) if request.content else None))
+        if request.url.path.endswith("/points/count"):
+            return httpx.Response(200, json={"result": {"count": missing_points["count"]}})
+        if request.url.path.endswith("/points/search"):
+            return httpx.Response(200, json={"result": [
+                {"score": 0.9, "payload": {"chunk_text": "본문", "document_id": 1, "metadata": {"title": "t"}}}
+            ]})
+        return httpx.Response(200, json={"status": "ok", "result": {}})
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(module.http_clients, "get", lambda name: client)
+    monkeypatch.setattr(ai_module.http_clients, "get", lambda name: client)
+    return calls
+
+
+def batch_payloads(calls):
+    """points/batch 요청의 set_payload 연산 목록"""
+    return [
+        operation["set_payload"]
+        for _, path, body in calls if path.endswith("/points/batch")
+        for operation in body["operations"]
+    ]
+
+
+def make_sync(session):
+    return VectorPermissionSync(
+        session_factory=lambda: session, qdrant_url="http://qdrant", collection="docs", batch_size=2
+    )
+
+
+@pytest.mark.asyncio
+class TestVectorPermissionSync:
+
+    async def test_mark_dirty_patches_payload_by_document_filter(self, qdrant):
+        session = FakeSession(permissions=[(1, 10), (1, 20), (2, 10)])
+        sync = make_sync(session)
+
+        sync.mark_dirty([1, 3])
+        sync.mark_dirty([1])
+        assert await sync.flush() == 2
+
+        # 문서별 set_payload를 points/batch 요청 하나로
+        assert qdrant == [
+            ("POST", "/collections/docs/points/batch", {"operations": [
+                {"set_payload": {
+                    "payload": {"access_departments": [10, 20]},
+                    "filter": {"must": [{"key": "document_id", "match": {"value": 1}}]},
+                }},
+                # 권한이 모두 회수된 문서는 빈 목록 (검색되지 않음)
+                {"set_payload": {
+                    "payload": {"access_departments": []},
+                    "filter": {"must": [{"key": "document_id", "match": {"value": 3}}]},
+                }},
+            ]}),
+        ]
+        assert session.queries == 1
+        assert sync.metrics()["requests"] == 1
+        assert sync.metrics()["pending"] == 0
+
+    async def test_failed_sync_is_requeued(self, monkeypatch):
+        sync = make_sync(FakeSession(permissions=[]))
+
+        async def broken(access):
+            raise httpx.ConnectError("qdrant down")
+
+        monkeypatch.setattr(sync, "set_documents_access", broken)
+        sync.mark_dirty([5])
+        with pytest.raises(httpx.ConnectError):
+            await sync.flush()
+
+        assert sync.metrics()["pending"] == 1
+
+    async def test_sync_all_creates_indexes_and_walks_documents(self, qdrant):
+        session = FakeSession(permissions=[(1, 10), (3, 30)], document_ids=[1, 2, 3])
+        sync = make_sync(session)
+
+        assert await sync.sync_all() == 3
+
+        indexes = [body for method, path, body in qdrant if path.endswith("/index")]
+        assert indexes == [
+            {"field_name": "access_departments", "field_schema": "integer"},
+            {"field_name": "document_id", "field_schema": "integer"},
+        ]
+        payloads = [op["payload"]["access_departments"] for op in batch_payloads(qdrant)]
+        assert payloads == [[10], [], [30]]
+        # 문서 조회 배치(batch_size=2)당 Qdrant 요청 1회
+        assert sum(path.endswith("/points/batch") for _, path, _ in qdrant) == 2
+        assert sync.backfilled
+
+    async def test_worker_backfills_on_start(self, qdrant):
+        session = FakeSession(permissions=[(1, 10)], document_ids=[1])
+        sync = make_sync(session)
+
+        sync.start()
+        for _ in range(20):
+            if sync.backfilled:
+                break
+            await asyncio.sleep(0.01)
+        await sync.stop()
+
+        paths = [path for _, path, _ in qdrant]
+        assert paths[:3] == [
+            "/collections/docs/index",
+            "/collections/docs/index",
+            "/collections/docs/points/count",
+        ]
+        assert "/collections/docs/points/batch" in paths
+        assert sync.metrics()["full_syncs"] == 1
+        assert sync.backfilled
+
+    async def test_start_skips_full_sync_when_nothing_missing(self, qdrant, missing_points):
+        missing_points["count"] = 0
+        sync = make_sync(FakeSession(permissions=[(1, 10)], document_ids=[1, 2, 3]))
+
+        assert await sync.backfill() == 0
+
+        assert [path for _, path, _ in qdrant] == [
+            "/collections/docs/index",
+            "/collections/docs/index",
+            "/collections/docs/points/count",
+        ]
+        assert sync.metrics()["full_syncs"] == 0
+        assert sync.backfilled
+
+
+@pytest.mark.asyncio
+class TestSearchFilter:
+
+    async def test_department_filter_is_single_condition(self, qdrant, monkeypatch):
+        service = AIService()
+
+        async def embed(text):
+            return [0.1, 0.2]
+
+        monkeypatch.setattr(service, "_get_embedding", embed)
+        monkeypatch.setattr(module.vector_permission_sync, "backfilled", True)
+
+        results = await service._search_documents(
+            "질문", search_scope=["manual"], user_department_id=10, db=object()
+        )
+
+        [(_, path, body)] = qdrant
+        assert path.endswith("/points/search")
+        assert body["filter"] == {"must": [
+            {"key": "access_departments", "match": {"value": 10}},
+            {"key": "metadata.document_type", "match": {"any": ["manual"]}},
+        ]}
+        assert results[0]["document_id"] == 1
+
+    async def test_points_without_field_use_document_ids_before_backfill(self, qdrant, monkeypatch):
+        service = AIService()
+
+        async def embed(text):
+            return [0.1, 0.2]
+
+        monkeypatch.setattr(service, "_get_embedding", embed)
+        monkeypatch.setattr(module.vector_permission_sync, "backfilled", False)
+
+        await service._search_documents(
+            "질문", user_department_id=10, db=FakeSession(permissions=[(1, 10), (2, 10)])
+        )
+
+        [(_, _, body)] = qdrant
+        assert body["filter"] == {"must": [{"should": [
+            {"key": "access_departments", "match": {"value": 10}},
+            {"must": [
+                {"is_empty": {"key": "access_departments"}},
+                {"key": "document_id", "match": {"any": [1, 2]}},
+            ]},
+        ]}]}
+
+    async def test_no_readable_documents_before_backfill(self, qdrant, monkeypatch):
+        service = AIService()
+
+        async def embed(text):
+            return [0.1, 0.2]
+
+        monkeypatch.setattr(service, "_get_embedding", embed)
+        monkeypatch.setattr(module.vector_permission_sync, "backfilled", False)
+
+        assert await service._search_documents("질문", user_department_id=10, db=FakeSession(permissions=[])) == []
+        assert qdrant == []
+
+
+class FakeScalarResult:
+    def __init__(self, value):
+        self.value = value
+
+    def scalar_one_or_none(self):
+        return self.value
+
+
+class FakeAdminSession:
+    """document_permissions 라우터용 세션 (조회 결과 고정)"""
+
+    def __init__(self, permission):
+        self.permission = permission
+        self.committed = False
+
+    async def execute(self, stmt):
+        return FakeScalarResult(self.permission)
+
+    async def delete(self, obj):
+        pass
+
+    async def commit(self):
+        self.committed = True
+
+    async def refresh(self, obj, attribute_names=None):
+        pass
+
+
+@pytest.mark.asyncio
+class TestAdminPermissionEndpoints:
+    """관리자 문서 권한 API 변경도 Qdrant 동기화 대기열에 반영"""
+
+    @pytest.fixture
+    def dirty(self, monkeypatch):
+        from app.routers.admin import document_permissions
+
+        marked = []
+        monkeypatch.setattr(document_permissions.vector_permission_sync, "mark_dirty", marked.extend)
+        return marked
+
+    async def test_update_marks_document_dirty(self, dirty):
+        from app.models.document_permission import DocumentPermission
+        from app.routers.admin.document_permissions import update_document_permission
+        from app.schemas.document_permission import DocumentPermissionUpdate
+
+        permission = DocumentPermission(id=1, document_id=7, department_id=10, can_read=True)
+        session = FakeAdminSession(permission)
+
+        await update_document_permission(1, DocumentPermissionUpdate(can_read=False), db=session, principal=None)
+
+        assert session.committed
+        assert permission.can_read is False
+        assert dirty == [7]
+
+    async def test_delete_marks_document_dirty(self, dirty):
+        from app.models.document_permission import DocumentPermission
+        from app.routers.admin.document_permissions import delete_document_permission
+
+        session = FakeAdminSession(DocumentPermission(id=1, document_id=7, department_id=10))
+
+        await delete_document_permission(1, db=session, principal=None)
+
+        assert session.committed
+        assert dirty == [7]
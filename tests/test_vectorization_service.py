@@ -0,0 +1,156 @@
+"""
+Vectorization Service 테스트
+임베딩 병렬 배치 / Qdrant 배치 upsert + 최종 wait 배리어 / DocumentVector 일괄 INSERT 검증
+"""
+import asyncio
+import json
+
+import httpx
+import pytest
+from sqlalchemy.sql import Insert, Select
+
+from app.services import vectorization_service as module
+from app.services.embedding_cache import EmbeddingCache
+from app.services.vectorization_service import VectorizationService
+from app.utils.text_chunker import TextChunk
+
+
+class FakeResult:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def all(self):
+        return self.rows
+
+
+class FakeSession:
+    def __init__(self, permissions=()):
+        self.inserts = []
+        self.added = []
+        self.commits = 0
+        self.permissions = list(permissions)  # (document_id, department_id)
+        self.selects = 0
+
+    async def execute(self, stmt, params=None):
+        if isinstance(stmt, Select):
+            # 열람 가능 부서 조회
+            self.selects += 1
+            return FakeResult(self.permissions)
+        assert isinstance(stmt, Insert)
+        self.inserts.append(params)
+
+    def add(self, obj):
+        self.added.append(obj)
+
+    async def commit(self):
+        self.commits += 1
+
+
+@pytest.fixture
+def upstream(monkeypatch):
+    """임베딩 / Qdrant 요청을 기록하는 가짜 업스트림"""
+    calls = {"embeddings": [], "upserts": [], "in_flight": 0, "peak": 0}
+
+    async def handler(request):
+        if request.url.path.endswith("/embeddings"):
+            calls["in_flight"] += 1
+            calls["peak"] = max(calls["peak"], calls["in_flight"])
+            await asyncio.sleep(0.01)
+            calls["in_flight"] -= 1
+            texts = json.loads(request.content)["input"]
+            calls["embeddings"].append(texts)
+            return httpx.Response(200, json={"data": [{"embedding": [float(len(t)), 0.0]} for t in texts]})
+        calls["upserts"].append({
+            "wait": request.url.params.get("wait"),
+            "points": json.loads(request.content)["points"],
+        })
+        return httpx.Response(200, json={"status": "ok"})
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(module.http_clients, "get", lambda name: client)
+    return calls
+
+
+@pytest.fixture
+def service():
+    svc = VectorizationService(collection_name="test-collection")
+    svc.embed_batch_size = 4
+    svc.embed_concurrency = 2
+    svc.upsert_batch_size = 10
+    svc.embedding_cache = EmbeddingCache(redis_url=None)
+    return svc
+
+
+class TestVectorizationService:
+    """벡터화 파이프라인 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_embed_chunks_preserves_order_with_bounded_concurrency(self, service, upstream):
+        chunks = [f"chunk-{'x' * i}" for i in range(13)]
+
+        embeddings = await service.embed_chunks(chunks)
+
+        assert [e[0] for e in embeddings] == [float(len(c)) for c in chunks]
+        assert len(upstream["embeddings"]) == 4  # 4 + 4 + 4 + 1
+        assert upstream["peak"] <= 2
+
+    @pytest.mark.asyncio
+    async def test_upsert_batches_with_final_wait_barrier(self, service, upstream):
+        chunks = [TextChunk(index=i, text=f"c{i}", start=i * 3, end=i * 3 + 2, token_count=2) for i in range(25)]
+        point_ids = await service.store_vectors_in_qdrant(1, chunks, [[0.1, 0.2]] * 25, {"title": "t"})
+
+        assert [len(u["points"]) for u in upstream["upserts"]] == [10, 10, 5]
+        assert [u["wait"] for u in upstream["upserts"]] == ["false", "false", "true"]
+        assert point_ids == [p["id"] for u in upstream["upserts"] for p in u["points"]]
+        last = upstream["upserts"][2]["points"][-1]["payload"]
+        assert (last["chunk_index"], last["char_start"], last["char_end"]) == (24, 72, 74)
+        assert "access_departments" not in last
+
+    @pytest.mark.asyncio
+    async def test_vectorize_document_bulk_inserts_metadata(self, service, upstream):
+        db = FakeSession(permissions=[(7, 2), (7, 5)])
+
+        run = await service.vectorize_document(7, "가" * 2000, db, metadata={"title": "매뉴얼"})
+
+        [rows] = db.inserts
+        assert db.added == []
+        assert db.commits == 1
+        assert [row["chunk_index"] for row in rows] == list(range(len(rows)))
+        assert all(row["document_id"] == 7 for row in rows)
+        assert rows[0]["chunk_metadata"] == {"title": "매뉴얼", "char_start": 0, "char_end": len(rows[0]["chunk_text"])}
+        assert run["chunks"] == len(rows)
+        assert run["chunks_per_sec"] > 0
+        assert service.metrics()["documents"] == 1
+        # 열람 가능 부서를 1회 조회해 모든 point payload에 기록
+        assert db.selects == 1
+        assert all(
+            point["payload"]["access_departments"] == [2, 5]
+            for upsert in upstream["upserts"] for point in upsert["points"]
+        )
+        # 내용이 같은 청크는 한 번만 임베딩
+        assert sum(len(texts) for texts in upstream["embeddings"]) == len({row["chunk_text"] for row in rows})
+
+    @pytest.mark.asyncio
+    async def test_reindexing_unchanged_document_hits_cache(self, service, upstream):
+        text = "\n\n".join(f"{i}번 조항 내용입니다. " * 30 for i in range(6))
+        await service.vectorize_document(7, text, FakeSession())
+        embedded = sum(len(texts) for texts in upstream["embeddings"])
+
+        await service.vectorize_document(7, text, FakeSession())
+
+        assert sum(len(texts) for texts in upstream["embeddings"]) == embedded
+        assert service.embedding_cache.metrics()["local_hits"] == embedded
+
+    @pytest.mark.asyncio
+    async def test_failure_records_failed_vector(self, service, monkeypatch):
+        async def broken(texts):
+            raise ValueError("임베딩 생성 실패: down")
+
+        monkeypatch.setattr(service, "get_embeddings", broken)
+        db = FakeSession()
+
+        with pytest.raises(ValueError):
+            await service.vectorize_document(7, "본문", db)
+
+        assert db.added[0].status.value == "FAILED"
+        assert service.metrics()["failures"] == 1